@@ -0,0 +1,80 @@
+"""
+Shared FastAPI dependencies.
+
+Override these with ``app.dependency_overrides`` to plug fake backends into
+the API, e.g. ``tests.fakes.FakeRetriever``, ``FakeTranslator`` and
+``FakeLLM``. ``get_orchestrator`` is built from the others, so overriding
+any of them is enough.
+"""
+
+from typing import Optional
+
+from fastapi import Depends
+
+from app.config import settings
+from app.llm import get_llm_client
+from app.pipeline import (
+    CorpusSourceFinder,
+    CrossEncoderReranker,
+    FallbackLLM,
+    IdentityTranslator,
+    LLMBackend,
+    ProviderLLM,
+    Reranker,
+    Retriever,
+    SourceFinder,
+    Translator,
+    VectorStoreRetriever,
+    VerificationOrchestrator,
+)
+
+_retriever = VectorStoreRetriever()
+_fallback_llm = FallbackLLM()
+_translator = IdentityTranslator()
+_source_finder = CorpusSourceFinder()
+_reranker = CrossEncoderReranker()
+
+
+def get_retriever() -> Retriever:
+    """Evidence retriever used by the verification endpoints."""
+    return _retriever
+
+
+def get_llm() -> LLMBackend:
+    """LLM backend used by the verification endpoints: the providers, if any is configured."""
+    client = get_llm_client()
+    return ProviderLLM(client) if client is not None else _fallback_llm
+
+
+def get_translator() -> Translator:
+    """Query translator used for cross-lingual retrieval."""
+    return _translator
+
+
+def get_source_finder() -> SourceFinder:
+    """Original-source lookup used for mistranslation detection."""
+    return _source_finder
+
+
+def get_reranker() -> Optional[Reranker]:
+    """Cross-encoder reranking of retrieved passages, unless disabled in settings."""
+    return _reranker if settings.rerank_enabled else None
+
+
+def get_orchestrator(
+    retriever: Retriever = Depends(get_retriever),
+    llm: LLMBackend = Depends(get_llm),
+    translator: Translator = Depends(get_translator),
+    source_finder: SourceFinder = Depends(get_source_finder),
+    reranker: Optional[Reranker] = Depends(get_reranker),
+) -> VerificationOrchestrator:
+    """Verification pipeline wired to the current backends."""
+    return VerificationOrchestrator(
+        retriever,
+        llm,
+        translator,
+        cross_lingual_languages=settings.cross_lingual_languages_list,
+        source_finder=source_finder,
+        reranker=reranker,
+        rerank_candidates=settings.rerank_candidates,
+    )
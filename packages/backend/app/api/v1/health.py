@@ -3,16 +3,29 @@ Health check endpoints.
 """
 
 import time
-from typing import Literal
+from datetime import datetime, timezone
+from typing import Dict, Literal, Optional
 
 from fastapi import APIRouter
 from pydantic import BaseModel
 
+from app.health import ProbeResult, get_health_monitor
+from app.nlp.tokenizer import is_tokenizer_ready
+
 router = APIRouter()
 
 # Track startup time
 _startup_time = time.time()
 
+# Seconds from startup until the NLP models finished loading
+_startup_duration: Optional[float] = None
+
+
+def mark_startup_complete() -> None:
+    """Record that background warm-up has finished."""
+    global _startup_duration
+    _startup_duration = time.time() - _startup_time
+
 
 class ServiceStatus(BaseModel):
     """Individual service status."""
@@ -22,6 +35,32 @@ class ServiceStatus(BaseModel):
     cache: bool = False
 
 
+class ProbeStatus(BaseModel):
+    """Latest background probe of one dependency."""
+
+    healthy: bool
+    latency_ms: Optional[float] = None
+    last_checked: Optional[datetime] = None
+    last_success: Optional[datetime] = None
+    error: Optional[str] = None
+    circuit: Literal["closed", "open", "half_open"] = "closed"
+
+
+def _timestamp(value: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value, tz=timezone.utc) if value is not None else None
+
+
+def _probe_status(result: ProbeResult) -> ProbeStatus:
+    return ProbeStatus(
+        healthy=result.healthy,
+        latency_ms=round(result.latency_ms, 2) if result.latency_ms is not None else None,
+        last_checked=_timestamp(result.last_checked),
+        last_success=_timestamp(result.last_success),
+        error=result.error,
+        circuit=result.circuit,
+    )
+
+
 class HealthResponse(BaseModel):
     """Health check response model."""
 
@@ -29,6 +68,9 @@ class HealthResponse(BaseModel):
     version: str
     uptime: float
     services: ServiceStatus
+    nlp_ready: bool
+    startup_time: Optional[float] = None
+    probes: Dict[str, ProbeStatus] = {}
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -37,15 +79,18 @@ async def health_check() -> HealthResponse:
     Check API health status.
 
     Returns the current health status of the API and its dependent services.
+    Dependencies are probed in the background, so this never waits on them.
     """
     # Calculate uptime
     uptime = time.time() - _startup_time
 
-    # Check services (placeholder - will implement actual checks)
+    probes = get_health_monitor().snapshot()
+    cache = probes.get("cache")
     services = ServiceStatus(
-        llm=True,  # TODO: Actual LLM health check
-        vector_db=True,  # TODO: Actual Pinecone health check
-        cache=True,  # TODO: Actual Redis health check
+        llm=any(result.healthy for name, result in probes.items() if name.startswith("llm.")),
+        vector_db=probes["vector_db"].healthy if "vector_db" in probes else False,
+        # Without a shared backend the in-process cache tier still works
+        cache=cache.healthy if cache is not None else True,
     )
 
     # Determine overall status
@@ -64,6 +109,9 @@ async def health_check() -> HealthResponse:
         version="0.1.0",
         uptime=uptime,
         services=services,
+        nlp_ready=is_tokenizer_ready(),
+        startup_time=_startup_duration,
+        probes={name: _probe_status(result) for name, result in probes.items()},
     )
 
 
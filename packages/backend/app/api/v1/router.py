@@ -4,10 +4,11 @@ API v1 router - aggregates all v1 endpoints.
 
 from fastapi import APIRouter
 
-from app.api.v1 import health, verify, search
+from app.api.v1 import health, scan, search, verify
 
 api_router = APIRouter()
 
 api_router.include_router(health.router, tags=["Health"])
 api_router.include_router(verify.router, prefix="/verify", tags=["Verification"])
 api_router.include_router(search.router, prefix="/search", tags=["Search"])
+api_router.include_router(scan.router, prefix="/scan", tags=["Scan"])
@@ -0,0 +1,105 @@
+"""
+Page scan endpoint for the extension's passive-detection mode.
+"""
+
+import asyncio
+from typing import List
+
+from fastapi import APIRouter
+from pydantic import BaseModel, Field
+
+from app.scan import BlockScan, block_hash, get_scan_sessions, scan_blocks
+
+router = APIRouter()
+
+
+class ScanBlock(BaseModel):
+    """One text block of a page."""
+
+    id: str = Field(..., min_length=1, max_length=256)
+    text: str = Field(..., max_length=20_000)
+
+
+class ScanRequest(BaseModel):
+    """Page scan request model."""
+
+    session_id: str = Field(..., min_length=1, max_length=128)
+    blocks: List[ScanBlock] = Field(..., max_length=5_000)
+    min_confidence: float = Field(default=0.6, ge=0, le=1)
+    reset: bool = False
+
+
+class HighlightSpan(BaseModel):
+    """A claim-like sentence, as character offsets into its block's text."""
+
+    start: int
+    end: int
+    type: str
+    confidence: float
+
+
+class ScannedBlock(BaseModel):
+    """Scan result for one new or changed block."""
+
+    id: str
+    hash: str
+    highlights: List[HighlightSpan]
+    translated: bool
+
+
+class ScanResponse(BaseModel):
+    """Page scan response model."""
+
+    session_id: str
+    results: List[ScannedBlock]
+    unchanged: List[str]
+    scanned: int
+
+
+def _to_scanned_block(block: ScanBlock, hash_: str, scan: BlockScan) -> ScannedBlock:
+    """Convert a scan result into an API block result."""
+    return ScannedBlock(
+        id=block.id,
+        hash=hash_,
+        highlights=[HighlightSpan(**highlight._asdict()) for highlight in scan.highlights],
+        translated=scan.translated,
+    )
+
+
+@router.post("", response_model=ScanResponse)
+async def scan_page(request: ScanRequest) -> ScanResponse:
+    """
+    Highlight claim-like sentences in a page's text blocks.
+
+    Only blocks this session has not been sent before with the same ID and
+    text are scanned and returned in ``results``; the IDs of the rest are
+    listed in ``unchanged``, and the client keeps the highlights it already
+    has for them. An edited block has a new hash and is scanned again, and a
+    different ``min_confidence`` rescans every block. ``reset`` forgets the
+    session's blocks first, e.g. after a navigation.
+    """
+    sessions = get_scan_sessions()
+    if request.reset:
+        sessions.reset(request.session_id)
+    session = sessions.get(request.session_id)
+    session.use_threshold(request.min_confidence)
+
+    hashes = [block_hash(block.text) for block in request.blocks]
+    keys = [(block.id, hash_) for block, hash_ in zip(request.blocks, hashes)]
+    positions = session.unseen(keys)
+    fresh = set(positions)
+
+    scans = await asyncio.to_thread(
+        scan_blocks, [request.blocks[i].text for i in positions], request.min_confidence
+    )
+    session.add(keys[i] for i in positions)
+
+    return ScanResponse(
+        session_id=request.session_id,
+        results=[
+            _to_scanned_block(request.blocks[i], hashes[i], scan)
+            for i, scan in zip(positions, scans)
+        ],
+        unchanged=[block.id for i, block in enumerate(request.blocks) if i not in fresh],
+        scanned=len(positions),
+    )
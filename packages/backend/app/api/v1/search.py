@@ -2,14 +2,28 @@
 Search API endpoints.
 """
 
+import asyncio
+import logging
 from typing import List, Optional
-import uuid
 
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
 
+from app.config import settings
+from app.credibility import CredibilityRegistry, get_credibility_registry
+from app.embeddings import get_embedding_service
+from app.lexical import get_lexical_index, lexical_tokens, reciprocal_rank_fusion
+from app.nlp.tokenizer import is_tokenizer_ready
+from app.rerank import get_reranker
+from app.vectorstore import LocalVectorStore, VectorMatch, VectorStore, get_vector_store
+
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Candidates taken from each ranking per requested result, for fusion and reranking
+_FUSION_DEPTH = 3
+
 
 class SearchRequest(BaseModel):
     """Search request model."""
@@ -31,6 +45,7 @@ class SearchResult(BaseModel):
     language: str
     published_at: Optional[str] = None
     relevance_score: float = Field(ge=0, le=1)
+    credibility_score: float = Field(ge=0, le=1)
 
 
 class SearchResponse(BaseModel):
@@ -41,34 +56,133 @@ class SearchResponse(BaseModel):
     query: str
 
 
+def _to_search_result(match: VectorMatch, registry: CredibilityRegistry) -> SearchResult:
+    """Convert a vector store match into an API search result, scored by its outlet."""
+    meta = match.metadata
+    url, source = meta.get("url", ""), meta.get("source", "")
+    return SearchResult(
+        id=match.id,
+        title=meta.get("title", ""),
+        snippet=meta.get("snippet", ""),
+        url=url,
+        source=source,
+        language=meta.get("language", "unknown"),
+        published_at=meta.get("published_at"),
+        relevance_score=min(max(match.score, 0.0), 1.0),
+        credibility_score=registry.score(url, source, default=settings.credibility_default_score),
+    )
+
+
+async def _lexical_ranking(
+    request: SearchRequest, sources: Optional[List[str]], depth: int
+) -> List[str]:
+    """IDs of the best BM25 matches, or none while the index or tokenizer isn't ready."""
+    index = get_lexical_index()
+    if len(index) == 0 or not is_tokenizer_ready():
+        return []
+
+    def search() -> List[str]:
+        tokens = lexical_tokens(request.query)
+        hits = index.search(tokens, depth, request.languages, sources)
+        return [doc_id for doc_id, _ in hits]
+
+    return await asyncio.to_thread(search)
+
+
+async def _vector_matches(
+    store: VectorStore, request: SearchRequest, sources: Optional[List[str]], depth: int
+) -> List[VectorMatch]:
+    """Nearest neighbours of the query embedding."""
+    # Nothing indexed yet: skip loading the embedding model
+    if isinstance(store, LocalVectorStore) and len(store) == 0:
+        return []
+
+    embedder = await get_embedding_service()
+    query_vector = await embedder.embed(request.query)
+    return await asyncio.to_thread(
+        store.query,
+        query_vector,
+        depth,
+        request.languages,
+        sources,
+    )
+
+
+async def _fuse(
+    store: VectorStore, matches: List[VectorMatch], lexical_ids: List[str]
+) -> List[VectorMatch]:
+    """Fuse both rankings, scoring each document relative to one ranked first in both."""
+    rrf_k = settings.lexical_rrf_k
+    fused = reciprocal_rank_fusion([[m.id for m in matches], lexical_ids], k=rrf_k)
+
+    # Lexical-only hits carry no metadata yet; the vector store holds it
+    by_id = {match.id: match for match in matches}
+    missing = [doc_id for doc_id, _ in fused if doc_id not in by_id]
+    if missing:
+        fetched = await asyncio.to_thread(store.fetch, missing)
+        by_id.update((match.id, match) for match in fetched)
+
+    best_possible = 2.0 / (rrf_k + 1)
+    return [
+        VectorMatch(id=doc_id, score=score / best_possible, metadata=by_id[doc_id].metadata)
+        for doc_id, score in fused
+        if doc_id in by_id
+    ]
+
+
+async def _rerank(query: str, matches: List[VectorMatch], limit: int) -> List[VectorMatch]:
+    """The ``limit`` best candidates by cross-encoder relevance, or by first-stage rank."""
+    if not settings.rerank_enabled or not matches:
+        return matches[:limit]
+    try:
+        reranker = await get_reranker()
+        passages = [
+            (match.id, f"{match.metadata.get('title', '')}\n{match.metadata.get('snippet', '')}")
+            for match in matches
+        ]
+        ranked = await reranker.rerank(query, passages, limit)
+    except Exception as exc:
+        logger.warning("Reranking failed, keeping first-stage order: %s", exc)
+        return matches[:limit]
+    return [
+        VectorMatch(id=matches[index].id, score=score, metadata=matches[index].metadata)
+        for index, score in ranked
+    ]
+
+
 @router.post("", response_model=SearchResponse)
 async def search_sources(request: SearchRequest) -> SearchResponse:
     """
-    Search for relevant sources using semantic search.
+    Search for relevant sources using hybrid lexical and semantic search.
 
     This endpoint:
-    1. Generates embeddings for the query
-    2. Searches the vector database
-    3. Retrieves and ranks relevant documents
-    4. Returns matching results
+    1. Searches the vector database with the query embedding
+    2. Searches the BM25 index with the query's terms, concurrently
+    3. Fuses both rankings by reciprocal rank
+    4. Reranks the fused candidates with the cross-encoder
+    5. Returns the best results, scored by calibrated relevance
+
+    With reranking disabled, results are scored by cosine similarity, or by
+    their fused score when there were lexical results. ``sources`` may name
+    outlets by name, alias or domain; each matches every spelling the
+    credibility registry knows for the outlet.
     """
-    # TODO: Implement actual vector search
-    # For MVP, return mock response
-
-    mock_results = [
-        SearchResult(
-            id=str(uuid.uuid4()),
-            title="相关搜索结果",
-            snippet="这是一个示例搜索结果的摘要...",
-            url="https://example.com/article/1",
-            source="示例来源",
-            language="zh-CN",
-            relevance_score=0.92,
-        ),
-    ]
+    store = get_vector_store()
+    registry = get_credibility_registry()
+    depth = request.limit * _FUSION_DEPTH
+    sources = registry.expand_sources(request.sources) if request.sources else None
+
+    matches, lexical_ids = await asyncio.gather(
+        _vector_matches(store, request, sources, depth),
+        _lexical_ranking(request, sources, depth),
+    )
+    if lexical_ids:
+        matches = await _fuse(store, matches, lexical_ids)
+    matches = await _rerank(request.query, matches[:depth], request.limit)
+    results = [_to_search_result(match, registry) for match in matches]
 
     return SearchResponse(
-        results=mock_results,
-        total=len(mock_results),
+        results=results,
+        total=len(results),
         query=request.query,
     )
@@ -2,13 +2,34 @@
 Verification API endpoints.
 """
 
-from datetime import datetime
-from typing import List, Literal, Optional
+import asyncio
+import json
+import logging
 import uuid
+from datetime import datetime, timezone
+from typing import Annotated, Any, AsyncIterator, List, Literal, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from app.api.deps import get_orchestrator
+from app.cache import get_verification_cache, make_cache_key
+from app.config import settings
+from app.credibility import CredibilityRegistry, get_credibility_registry
+from app.dedup import ClaimMatch, get_claim_index
+from app.nlp.claim_extractor import ExtractedClaim, extract_claims_batch_async
+from app.nlp.script import language_variants
+from app.nlp.tokenizer import is_tokenizer_ready
+from app.pipeline import (
+    OriginalSourceMatch,
+    RetrievedEvidence,
+    VerificationOrchestrator,
+    VerificationOutcome,
+)
+
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -18,6 +39,7 @@ class VerifyOptions(BaseModel):
     cross_lingual: bool = True
     max_sources: int = Field(default=5, ge=1, le=20)
     force_refresh: bool = False
+    max_latency_ms: Optional[int] = Field(default=None, ge=100, le=60_000)
 
 
 class VerifyRequest(BaseModel):
@@ -38,6 +60,7 @@ class Evidence(BaseModel):
     snippet: str
     published_at: Optional[str] = None
     credibility_score: float = Field(ge=0, le=1)
+    relevance_score: float = Field(ge=0, le=1)
     language: str
 
 
@@ -63,11 +86,144 @@ class VerifyResponse(BaseModel):
     mistranslation_detected: bool
     mistranslation_details: Optional[str] = None
     original_source: Optional[OriginalSource] = None
+    partial: bool = False
+    cluster_id: Optional[str] = None
     created_at: str
 
 
+class BatchVerifyRequest(BaseModel):
+    """Batch claim extraction request model."""
+
+    texts: List[Annotated[str, Field(max_length=2000)]] = Field(
+        ..., min_length=1, max_length=500
+    )
+    language: str = Field(default="zh-CN")
+
+
+class BatchVerifyItem(BaseModel):
+    """Claims extracted from a single text of a batch."""
+
+    index: int
+    claims: List[ExtractedClaim]
+
+
+class BatchVerifyResponse(BaseModel):
+    """Batch claim extraction response model."""
+
+    results: List[BatchVerifyItem]
+    total_claims: int
+
+
+def _to_evidence(item: RetrievedEvidence, registry: CredibilityRegistry) -> Evidence:
+    """Convert a retrieved passage into an API evidence item, scored by its outlet."""
+    return Evidence(
+        id=item.id,
+        source=item.source,
+        source_url=item.source_url,
+        title=item.title,
+        snippet=item.snippet,
+        published_at=item.published_at,
+        credibility_score=registry.score(
+            item.source_url, item.source, default=settings.credibility_default_score
+        ),
+        relevance_score=min(max(item.score, 0.0), 1.0),
+        language=item.language,
+    )
+
+
+def _to_original_source(match: OriginalSourceMatch) -> OriginalSource:
+    """Convert an aligned source sentence into the API original source."""
+    return OriginalSource(
+        url=match.url,
+        title=match.title,
+        language=match.language,
+        excerpt=match.excerpt,
+    )
+
+
+def build_response(request: VerifyRequest, outcome: VerificationOutcome) -> VerifyResponse:
+    """Assemble the API response from a pipeline outcome."""
+    original = outcome.original_source
+    details = "；".join(original.discrepancies) if original else ""
+    registry = get_credibility_registry()
+    return VerifyResponse(
+        id=str(uuid.uuid4()),
+        verdict=outcome.verdict,
+        confidence=outcome.confidence,
+        summary=outcome.summary,
+        evidence_chain=[_to_evidence(item, registry) for item in outcome.evidence],
+        original_claim=request.text,
+        language=request.language,
+        mistranslation_detected=bool(original and original.discrepancies),
+        mistranslation_details=details or None,
+        original_source=_to_original_source(original) if original else None,
+        partial=outcome.partial,
+        created_at=datetime.now(timezone.utc).isoformat(),
+    )
+
+
+def _budget(options: VerifyOptions) -> Optional[float]:
+    """Overall latency budget in seconds requested by the client, if any."""
+    return options.max_latency_ms / 1000 if options.max_latency_ms else None
+
+
+async def run_verification(
+    request: VerifyRequest,
+    orchestrator: VerificationOrchestrator,
+) -> VerifyResponse:
+    """
+    Run the verification pipeline for a request, bypassing the cache.
+    """
+    options = request.options or VerifyOptions()
+    outcome = await orchestrator.run(
+        request.text,
+        request.language,
+        options.max_sources,
+        cross_lingual=options.cross_lingual,
+        budget=_budget(options),
+    )
+    return build_response(request, outcome)
+
+
+async def claim_cluster(text: str) -> Optional[ClaimMatch]:
+    """
+    Near-duplicate cluster of a text, or None if clustering is disabled.
+
+    Also None while jieba is still loading, so requests never wait for it;
+    such requests fall back to exact-text caching.
+    """
+    index = get_claim_index()
+    if index is None or not is_tokenizer_ready():
+        return None
+    return await asyncio.to_thread(index.assign, text)
+
+
+def verification_cache_key(request: VerifyRequest, cluster: Optional[ClaimMatch] = None) -> str:
+    """
+    Cache key for a request: language, result-affecting options and either the
+    near-duplicate cluster or the normalized text.
+
+    Chinese requests are keyed by both script variants, since their texts
+    are folded to Simplified before matching.
+    """
+    options = request.options or VerifyOptions()
+    return make_cache_key(
+        f"cluster:{cluster.cluster_id}" if cluster is not None else request.text,
+        ",".join(language_variants(request.language)),
+        options.model_dump(exclude={"force_refresh", "max_latency_ms"}),
+    )
+
+
+def for_request(cached: VerifyResponse, request: VerifyRequest) -> VerifyResponse:
+    """A result cached for a near-duplicate, reporting this request's own text."""
+    return cached.model_copy(update={"original_claim": request.text})
+
+
 @router.post("", response_model=VerifyResponse)
-async def verify_claim(request: VerifyRequest) -> VerifyResponse:
+async def verify_claim(
+    request: VerifyRequest,
+    orchestrator: VerificationOrchestrator = Depends(get_orchestrator),
+) -> VerifyResponse:
     """
     Verify a claim using RAG-powered fact-checking.
 
@@ -77,40 +233,132 @@ async def verify_claim(request: VerifyRequest) -> VerifyResponse:
     3. Retrieves relevant evidence from multiple sources
     4. Analyzes the claim using LLM
     5. Returns a verdict with supporting evidence
+
+    Chinese texts that look translated are also aligned to their original in
+    the local source corpus; numbers or entities that differ from it set
+    ``mistranslation_detected`` and are listed in ``mistranslation_details``.
+
+    Results are cached by near-duplicate cluster (or normalized text),
+    language and options, so lightly edited copies of a claim reuse one
+    verdict; concurrent requests for the same cluster share a single pipeline
+    run. Stages that miss their deadline (``options.max_latency_ms`` or the
+    server defaults) yield a ``partial`` ``unverified`` response, which is not
+    cached.
     """
-    # TODO: Implement actual RAG pipeline
-    # For MVP, return mock response
-
-    # Generate unique ID
-    verification_id = str(uuid.uuid4())
-
-    # Mock evidence
-    mock_evidence = [
-        Evidence(
-            id=str(uuid.uuid4()),
-            source="示例新闻网",
-            source_url="https://example.com/news/1",
-            title="相关新闻报道",
-            snippet="这是一个示例证据摘要，展示了相关的事实信息...",
-            credibility_score=0.85,
-            language=request.language,
-        ),
-    ]
-
-    # Mock response
-    response = VerifyResponse(
-        id=verification_id,
-        verdict="unverified",
-        confidence=0.65,
-        summary=f"该声明目前无法完全验证。输入文本：'{request.text[:50]}...'",
-        evidence_chain=mock_evidence,
-        original_claim=request.text,
-        language=request.language,
-        mistranslation_detected=False,
-        created_at=datetime.utcnow().isoformat(),
+    options = request.options or VerifyOptions()
+    cluster = await claim_cluster(request.text)
+    # Set when this request runs the pipeline itself, so its JSON isn't parsed back
+    computed: Optional[VerifyResponse] = None
+
+    async def compute() -> str:
+        nonlocal computed
+        computed = await run_verification(request, orchestrator)
+        if cluster is not None:
+            computed.cluster_id = cluster.cluster_id
+        return computed.model_dump_json()
+
+    value = await get_verification_cache().get_or_compute(
+        verification_cache_key(request, cluster),
+        compute,
+        result_id=lambda value: computed.id,
+        force_refresh=options.force_refresh,
+        cacheable=lambda value: not computed.partial,
+    )
+    response = computed if computed is not None else VerifyResponse.model_validate_json(value)
+    return for_request(response, request)
+
+
+def format_sse(event: str, data: Any) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/stream")
+async def verify_stream(
+    request: VerifyRequest,
+    orchestrator: VerificationOrchestrator = Depends(get_orchestrator),
+) -> StreamingResponse:
+    """
+    Verify a claim, streaming progress as Server-Sent Events.
+
+    Events, in order:
+    - ``claims``: claims extracted from the text
+    - ``evidence``: one per evidence item, as each retrieval completes
+    - ``original_source``: the aligned original of a translated text, if found
+    - ``summary``: incremental LLM summary text (``delta``)
+    - ``verdict``: the final ``VerifyResponse``
+
+    A cached result is sent as a single ``verdict`` event. Failures are
+    reported as an ``error`` event before the stream closes.
+    """
+    options = request.options or VerifyOptions()
+    cache = get_verification_cache()
+    cluster = await claim_cluster(request.text)
+    key = verification_cache_key(request, cluster)
+
+    async def events() -> AsyncIterator[str]:
+        if not options.force_refresh:
+            cached = await cache.get(key)
+            if cached is not None:
+                response = for_request(VerifyResponse.model_validate_json(cached), request)
+                yield format_sse("verdict", response.model_dump(mode="json"))
+                return
+
+        try:
+            async for event in orchestrator.stream(
+                request.text,
+                request.language,
+                options.max_sources,
+                cross_lingual=options.cross_lingual,
+                budget=_budget(options),
+            ):
+                if event.type == "outcome":
+                    response = build_response(request, event.data["outcome"])
+                    if cluster is not None:
+                        response.cluster_id = cluster.cluster_id
+                    if not response.partial:
+                        await cache.set(key, response.model_dump_json(), response.id)
+                    yield format_sse("verdict", response.model_dump(mode="json"))
+                else:
+                    yield format_sse(event.type, event.data)
+        except Exception:
+            # The exception text may name internal hosts or keys; log it, don't send it
+            logger.exception("Streaming verification failed")
+            yield format_sse("error", {"detail": "Verification failed"})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
-    return response
+
+@router.post("/batch", response_model=BatchVerifyResponse)
+async def verify_batch(request: BatchVerifyRequest) -> BatchVerifyResponse:
+    """
+    Extract verifiable claims from many texts at once.
+
+    Used by the extension's passive-detection mode to submit a whole feed.
+    Segmentation runs in the NLP process pool, so the event loop stays free;
+    results are returned in input order. Each claim carries the ID of its
+    near-duplicate cluster, so copies of one claim across a feed can be
+    collapsed and matched to ``/verify`` results.
+    """
+    batch = await extract_claims_batch_async(request.texts, language=request.language)
+
+    index = get_claim_index()
+    if index is not None and is_tokenizer_ready():
+        claims = [claim for claims in batch for claim in claims]
+        matches = await asyncio.to_thread(index.assign_many, [claim.text for claim in claims])
+        for claim, match in zip(claims, matches):
+            claim.cluster_id = match.cluster_id if match is not None else None
+
+    results = [BatchVerifyItem(index=i, claims=claims) for i, claims in enumerate(batch)]
+
+    return BatchVerifyResponse(
+        results=results,
+        total_claims=sum(len(item.claims) for item in results),
+    )
 
 
 @router.get("/{verification_id}", response_model=VerifyResponse)
@@ -118,8 +366,10 @@ async def get_verification(verification_id: str) -> VerifyResponse:
     """
     Get a previous verification result by ID.
     """
-    # TODO: Implement cache/database lookup
-    raise HTTPException(
-        status_code=404,
-        detail=f"Verification {verification_id} not found",
-    )
+    cached = await get_verification_cache().get_by_id(verification_id)
+    if cached is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Verification {verification_id} not found",
+        )
+    return VerifyResponse.model_validate_json(cached)
@@ -0,0 +1,56 @@
+"""Verification result cache module."""
+
+from typing import Optional
+
+from app.cache.backends import CacheBackend, InMemoryBackend, RedisBackend
+from app.cache.keys import make_cache_key, normalize_claim_text
+from app.cache.lru import TTLCache
+from app.cache.verification import VerificationCache
+from app.config import settings
+from app.health.probes import CircuitBreaker
+
+_cache: Optional[VerificationCache] = None
+
+
+def get_verification_cache() -> VerificationCache:
+    """Get the shared verification cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        backend: Optional[CacheBackend]
+        if settings.cache_backend == "redis":
+            backend = RedisBackend(settings.redis_url)
+        elif settings.cache_backend == "memory":
+            backend = InMemoryBackend()
+        else:
+            backend = None
+        _cache = VerificationCache(
+            backend,
+            ttl=settings.cache_ttl_seconds,
+            l1_max_entries=settings.cache_l1_max_entries,
+            l1_ttl=settings.cache_l1_ttl_seconds,
+            breaker=CircuitBreaker(
+                settings.cache_breaker_threshold, settings.cache_breaker_reset_seconds
+            ),
+        )
+    return _cache
+
+
+async def close_verification_cache() -> None:
+    """Close the shared cache, if it was created."""
+    global _cache
+    if _cache is not None:
+        await _cache.close()
+        _cache = None
+
+
+__all__ = [
+    "CacheBackend",
+    "InMemoryBackend",
+    "RedisBackend",
+    "TTLCache",
+    "VerificationCache",
+    "close_verification_cache",
+    "get_verification_cache",
+    "make_cache_key",
+    "normalize_claim_text",
+]
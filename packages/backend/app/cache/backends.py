@@ -0,0 +1,78 @@
+"""
+Shared (second-tier) cache backends.
+"""
+
+import time
+from typing import Dict, Optional, Protocol, Tuple
+
+
+class CacheBackend(Protocol):
+    """Async key/value store with expiry, as used by the verification cache."""
+
+    async def get(self, key: str) -> Optional[str]: ...
+
+    async def set(self, key: str, value: str, ttl: int) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def ping(self) -> bool: ...
+
+    async def close(self) -> None: ...
+
+
+class InMemoryBackend:
+    """Process-local stand-in for Redis, for tests and single-node development."""
+
+    def __init__(self) -> None:
+        self._data: Dict[str, Tuple[float, str]] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.time():
+            del self._data[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        self._data[key] = (time.time() + ttl, value)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    async def ping(self) -> bool:
+        return True
+
+    async def close(self) -> None:
+        self._data.clear()
+
+
+class RedisBackend:
+    """Redis backend using a pooled ``redis.asyncio`` client."""
+
+    def __init__(self, url: str, timeout: float = 0.5) -> None:
+        import redis.asyncio as redis
+
+        self._client = redis.from_url(
+            url,
+            decode_responses=True,
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout,
+        )
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        await self._client.set(key, value, ex=ttl)
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(key)
+
+    async def ping(self) -> bool:
+        return bool(await self._client.ping())
+
+    async def close(self) -> None:
+        await self._client.aclose()
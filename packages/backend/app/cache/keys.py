@@ -0,0 +1,56 @@
+"""
+Cache key generation.
+"""
+
+import hashlib
+import json
+import re
+from typing import Any, Dict, Optional
+
+from app.nlp.script import normalize_script
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_claim_text(text: str) -> str:
+    """
+    Normalize claim text so trivially different copies share a cache key.
+
+    Applies NFKC (full-width to half-width), folds Traditional characters to
+    Simplified, lowercases Latin letters and collapses whitespace.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Normalized text
+    """
+    text = normalize_script(text)
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+def make_cache_key(
+    text: str,
+    language: str,
+    options: Optional[Dict[str, Any]] = None,
+    prefix: str = "verify",
+) -> str:
+    """
+    Build a cache key from normalized text, language and request options.
+
+    Args:
+        text: Claim text
+        language: Language code
+        options: Options that change the result (e.g. ``max_sources``)
+        prefix: Key namespace
+
+    Returns:
+        Key of the form ``<prefix>:<sha256 hex>``
+    """
+    payload = json.dumps(
+        [normalize_claim_text(text), language, options or {}],
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return f"{prefix}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
@@ -0,0 +1,59 @@
+"""
+Bounded in-process LRU cache with per-entry TTL.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    LRU cache that also expires entries after ``ttl`` seconds.
+
+    Not thread-safe; meant to be used from the event loop thread.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[str, Tuple[float, V]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Optional[V]:
+        """Return the value and mark it most recently used, or None if missing/expired."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= self._clock():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: V, ttl: Optional[float] = None) -> None:
+        """Insert or replace a value, evicting the least recently used entry if full."""
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._data[key] = (self._clock() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._data.clear()
@@ -0,0 +1,249 @@
+"""
+Two-tier verification result cache with single-flight computation.
+
+Tier 1 is a bounded in-process LRU/TTL map; tier 2 is a shared backend
+(Redis in production). Reads fall through L1 -> L2 and promote L2 hits into
+L1. Concurrent misses for the same key within a worker share one
+computation, so a burst of requests for a viral claim triggers a single
+pipeline run per worker. Backend calls go through a circuit breaker: once
+the backend keeps failing (Redis down), the cache serves from L1 alone
+until the reset timeout passes, instead of adding a backend timeout to
+every read and write.
+
+Values are ``CacheEntry`` records whose ``value`` holds the JSON-serialized
+result. ``access_count`` counts the reads served from either tier: an L1 hit
+increments this worker's copy, and an L2 hit also writes the incremented
+count back, so the shared copy counts every read that reached the backend.
+L1 hits are not written back, which would cost a backend call per hit.
+
+If the request computing a value is cancelled (its client disconnected),
+the requests waiting on it are not: the first one to notice computes the
+value itself and the rest wait on it instead.
+"""
+
+import asyncio
+import logging
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, Optional
+
+from app.cache.backends import CacheBackend
+from app.cache.lru import TTLCache
+from app.health.probes import OPEN, CircuitBreaker
+from app.metrics import record_cache_lookup
+from app.models.schemas import CacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+class VerificationCache:
+    """
+    Cache of JSON-serialized verification results, addressable by key and by ID.
+
+    Args:
+        backend: Shared second-tier backend, or None for L1 only
+        ttl: Lifetime of stored results in seconds
+        l1_max_entries: Maximum entries kept in process
+        l1_ttl: Maximum lifetime of an L1 entry, bounding staleness across workers
+        breaker: Skips the backend while it keeps failing (default: 3 failures, 30 s)
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend],
+        ttl: int = 86_400,
+        l1_max_entries: int = 10_000,
+        l1_ttl: float = 300.0,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.breaker = breaker or CircuitBreaker()
+        self._l1: TTLCache[CacheEntry] = TTLCache(l1_max_entries, l1_ttl)
+        self._ids: TTLCache[str] = TTLCache(l1_max_entries, l1_ttl)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _id_key(result_id: str) -> str:
+        return f"verify:id:{result_id}"
+
+    def _backend_failed(self, action: str, key: str, exc: Exception) -> None:
+        # Read the state rather than ``allow()``, which would claim a half-open trial
+        was_open = self.breaker.state == OPEN
+        self.breaker.record_failure()
+        logger.warning("Cache backend %s failed for %s: %s", action, key, exc)
+        if not was_open and self.breaker.state == OPEN:
+            logger.warning(
+                "Cache backend unavailable; serving from memory for %.0fs",
+                self.breaker.reset_timeout,
+            )
+
+    async def _backend_get(self, key: str) -> Optional[str]:
+        if self.backend is None or not self.breaker.allow():
+            return None
+        try:
+            value = await self.backend.get(key)
+        except Exception as exc:  # a cache outage must not fail the request
+            self._backend_failed("read", key, exc)
+            return None
+        self.breaker.record_success()
+        return value
+
+    async def _backend_set(self, key: str, value: str, ttl: int) -> None:
+        if self.backend is None or not self.breaker.allow():
+            return
+        try:
+            await self.backend.set(key, value, ttl)
+        except Exception as exc:
+            self._backend_failed("write", key, exc)
+            return
+        self.breaker.record_success()
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Look up a serialized result by cache key.
+
+        Args:
+            key: Key from ``make_cache_key``
+
+        Returns:
+            The JSON value, or None on a miss
+        """
+        entry = self._l1.get(key)
+        if entry is None:
+            raw = await self._backend_get(key)
+            if raw is None:
+                self.misses += 1
+                record_cache_lookup("verification", hit=False)
+                return None
+            entry = CacheEntry.model_validate_json(raw)
+            if entry.expires_at.tzinfo is None:  # stored before timestamps carried UTC
+                entry.expires_at = entry.expires_at.replace(tzinfo=timezone.utc)
+            remaining = (entry.expires_at - datetime.now(timezone.utc)).total_seconds()
+            if remaining <= 0:
+                self.misses += 1
+                record_cache_lookup("verification", hit=False)
+                return None
+            entry.access_count += 1
+            self._l1.set(key, entry, remaining)
+            await self._backend_set(key, entry.model_dump_json(), math.ceil(remaining))
+        else:
+            entry.access_count += 1
+
+        self.hits += 1
+        record_cache_lookup("verification", hit=True)
+        return entry.value
+
+    async def get_by_id(self, result_id: str) -> Optional[str]:
+        """
+        Look up a serialized result by the ID of the result itself.
+
+        Args:
+            result_id: ID assigned to the result when it was stored
+
+        Returns:
+            The JSON value, or None if unknown or expired
+        """
+        id_key = self._id_key(result_id)
+        key = self._ids.get(id_key) or await self._backend_get(id_key)
+        if key is None:
+            return None
+        return await self.get(key)
+
+    async def set(self, key: str, value: str, result_id: Optional[str] = None) -> None:
+        """
+        Store a serialized result in both tiers.
+
+        Args:
+            key: Key from ``make_cache_key``
+            value: JSON-serialized result
+            result_id: Optional result ID to index for ``get_by_id``
+        """
+        now = datetime.now(timezone.utc)
+        entry = CacheEntry(
+            key=key,
+            value=value,
+            created_at=now,
+            expires_at=now + timedelta(seconds=self.ttl),
+        )
+        self._l1.set(key, entry)
+        await self._backend_set(key, entry.model_dump_json(), self.ttl)
+
+        if result_id is not None:
+            id_key = self._id_key(result_id)
+            self._ids.set(id_key, key)
+            await self._backend_set(id_key, key, self.ttl)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[str]],
+        result_id: Callable[[str], Optional[str]] = lambda value: None,
+        force_refresh: bool = False,
+        cacheable: Callable[[str], bool] = lambda value: True,
+    ) -> str:
+        """
+        Return the cached value, or compute it once for all concurrent callers.
+
+        A caller cancelled while computing does not cancel the callers
+        waiting for it; one of them computes the value instead.
+
+        Args:
+            key: Key from ``make_cache_key``
+            compute: Coroutine factory producing the JSON value on a miss
+            result_id: Extracts the result ID from a computed value for indexing
+            force_refresh: Skip the cache read and recompute
+            cacheable: Whether a computed value may be stored (it is still
+                shared with concurrent waiters either way)
+
+        Returns:
+            The JSON value
+        """
+        if not force_refresh:
+            cached = await self.get(key)
+            if cached is not None:
+                return cached
+
+        while True:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Only the leader was cancelled: lead the next attempt or follow it
+                if asyncio.current_task().cancelling() or not inflight.cancelled():
+                    raise
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+            if cacheable(value):
+                await self.set(key, value, result_id(value))
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Waiters receive the exception; mark it retrieved for the leader
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from either tier."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    async def close(self) -> None:
+        """Close the shared backend."""
+        if self.backend is not None:
+            await self.backend.close()
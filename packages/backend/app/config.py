@@ -25,24 +25,131 @@ class Settings(BaseSettings):
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
+    workers: int = 1  # processes forked by python -m app.serve; 0 = one per CPU core
+    preload_embeddings: bool = True  # load the embedding model before forking workers
+    memory_report_seconds: float = 60.0  # log worker memory this long after start; 0 = off
 
     # LLM APIs
     claude_api_key: str = ""
     openai_api_key: str = ""
+    llm_providers: str = "claude,openai"  # failover order; providers without a key are skipped
+    claude_model: str = "claude-3-5-haiku-latest"
+    claude_base_url: str = "https://api.anthropic.com"
+    openai_model: str = "gpt-4o-mini"
+    openai_base_url: str = "https://api.openai.com"
+    llm_timeout_seconds: float = 30.0
+    llm_max_concurrency: int = 16  # per provider
+    llm_max_attempts: int = 3  # per provider, before failing over
+    llm_cache_max_entries: int = 10_000
+    llm_cache_ttl_seconds: float = 86_400.0
 
     # Vector Database
     pinecone_api_key: str = ""
     pinecone_environment: str = "us-east-1"
     pinecone_index: str = "xiaochaguan"
+    vector_store_backend: str = "local"  # local | pinecone
+    vector_store_path: str = ".cache/vector_store"  # local snapshot directory
+    vector_store_dim: int = 384
+    vector_store_dtype: str = "float16"
+    vector_store_nprobe: int = 8
+
+    # Lexical search, fused with vector results by reciprocal rank
+    lexical_index_path: str = ".cache/lexical_index"  # snapshot directory; empty = not persisted
+    lexical_bm25_k1: float = 1.2
+    lexical_bm25_b: float = 0.75
+    lexical_rrf_k: int = 60  # rank offset; larger values flatten the fused ranking
 
     # Cache
     redis_url: str = "redis://localhost:6379"
+    cache_backend: str = "redis"  # redis | memory | none
+    cache_ttl_seconds: int = 86_400
+    cache_l1_max_entries: int = 10_000
+    cache_l1_ttl_seconds: float = 300.0
+    cache_breaker_threshold: int = 3  # consecutive backend failures before using L1 only
+    cache_breaker_reset_seconds: float = 30.0  # then retry the backend after this long
 
     # Embedding
     embedding_model: str = "paraphrase-multilingual-MiniLM-L12-v2"
+    embedding_backend: str = "torch"  # torch | int8 | onnx
+    embedding_batch_size: int = 32
+    embedding_batch_wait_ms: float = 5.0
+    embedding_cache_path: str = ".cache/embeddings"  # empty = no on-disk cache
+    embedding_cache_capacity: int = 100_000
+
+    # Cross-encoder reranking of retrieved passages
+    rerank_enabled: bool = True
+    rerank_model: str = "cross-encoder/mmarco-mMiniLMv2-L12-H384-v1"
+    rerank_backend: str = "torch"  # torch | int8
+    rerank_batch_size: int = 16  # pairs per forward pass
+    rerank_max_length: int = 256  # tokens per (claim, passage) pair
+    rerank_candidates: int = 50  # passages retrieved per claim and language for reranking
+    rerank_patience: int = 1  # batches that leave the top results unchanged before stopping
+    rerank_cache_max_entries: int = 100_000  # (claim, passage) scores; 0 = no cache
+    rerank_cache_ttl_seconds: float = 86_400.0
+    rerank_calibration_slope: float = 1.0  # Platt scaling of raw scores
+    rerank_calibration_intercept: float = 0.0
+
+    # Source credibility
+    credibility_registry_path: str = ""  # versioned JSON registry; empty = the bundled one
+    credibility_reload_seconds: float = 30.0  # how often the file is checked; 0 = never reload
+    credibility_default_score: float = 0.5  # score of outlets not in the registry
+
+    # NLP
+    jieba_cache_path: str = ""  # empty = jieba's default temp-dir cache
+
+    # NLP worker pool
+    nlp_pool_workers: int = 0  # 0 = one per CPU core, split between app.serve workers
+    nlp_pool_chunksize: int = 16
+
+    # Verification pipeline (timeouts in milliseconds)
+    pipeline_budget_ms: int = 8_000  # overall budget when the request sets none
+    pipeline_extraction_timeout_ms: int = 1_000
+    pipeline_retrieval_timeout_ms: int = 3_000
+    pipeline_llm_timeout_ms: int = 6_000
+    cross_lingual_languages: str = "en"  # searched in addition to the request language
+
+    # Bulk ingestion (python -m app.ingest)
+    ingest_checkpoint_dir: str = ".cache/ingest"  # resume state; empty = no checkpoints
+    ingest_nlp_workers: int = 2  # chunking/annotation processes
+    ingest_embed_workers: int = 2  # embedding processes, sharing the CPU cores
+    ingest_batch_articles: int = 64
+    ingest_chunk_chars: int = 500
+    ingest_dedup_capacity: int = 1 << 26  # content-hash slots, 8 bytes each
+    ingest_checkpoint_every: int = 200_000  # chunks between checkpoints
+
+    # Near-duplicate claim clustering
+    dedup_enabled: bool = True
+    dedup_index_capacity: int = 200_000  # claims kept, about 80 bytes each
+    dedup_threshold: float = 0.7  # estimated Jaccard similarity to share a cached verdict
+    dedup_index_path: str = ".cache/claim_index"  # snapshot directory; empty = not persisted
+
+    # Original-source lookup (mistranslation detection)
+    source_corpus_path: str = ""  # JSONL of source articles, indexed at startup if needed
+    source_index_path: str = ".cache/source_index"  # snapshot directory; empty = not persisted
+    source_languages: str = "en"  # languages originals are searched in
+    source_min_similarity: float = 0.6  # cosine similarity to count as the original
+    source_top_k: int = 5  # candidate sentences aligned per claim
+
+    # Page scanning (passive detection)
+    scan_max_sessions: int = 10_000
+    scan_session_ttl_seconds: float = 600.0
+    scan_session_max_blocks: int = 5_000  # blocks remembered per session
 
     # Rate Limiting
-    rate_limit_per_minute: int = 60
+    rate_limit_per_minute: int = 60  # 0 = no limit
+    rate_limit_burst: int = 0  # bucket size; 0 = one minute's worth
+    rate_limit_backend: str = "memory"  # memory (per worker) | redis (shared) | none
+    rate_limit_trusted_proxies: int = 0  # proxies appending to X-Forwarded-For; 0 = peer address
+
+    # Metrics
+    metrics_enabled: bool = True
+    metrics_dir: str = ""  # shared by uvicorn workers for aggregation; empty = per process
+
+    # Health probes
+    health_probe_interval_seconds: float = 10.0
+    health_probe_timeout_seconds: float = 1.0
+    health_breaker_threshold: int = 3  # consecutive failures that open the circuit
+    health_breaker_reset_seconds: float = 30.0  # skip probing an open circuit this long
 
     # CORS
     cors_origins: str = "http://localhost:3000,chrome-extension://*"
@@ -52,6 +159,21 @@ class Settings(BaseSettings):
         """Parse CORS origins string into list."""
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
+    @property
+    def llm_providers_list(self) -> List[str]:
+        """Parse LLM provider failover order into list."""
+        return [name.strip() for name in self.llm_providers.split(",") if name.strip()]
+
+    @property
+    def cross_lingual_languages_list(self) -> List[str]:
+        """Parse cross-lingual target languages into list."""
+        return [lang.strip() for lang in self.cross_lingual_languages.split(",") if lang.strip()]
+
+    @property
+    def source_languages_list(self) -> List[str]:
+        """Parse original-source languages into list."""
+        return [lang.strip() for lang in self.source_languages.split(",") if lang.strip()]
+
     @property
     def is_production(self) -> bool:
         """Check if running in production."""
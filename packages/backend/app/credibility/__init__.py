@@ -0,0 +1,87 @@
+"""Source credibility module: outlet scores, languages and bias labels by domain."""
+
+import logging
+import os
+import threading
+import time
+from typing import Optional, Tuple
+
+from app.config import settings
+from app.credibility.registry import (
+    BIAS_LABELS,
+    REGISTRY_FORMAT,
+    CredibilityRegistry,
+    SourceProfile,
+    url_host,
+)
+
+logger = logging.getLogger(__name__)
+
+BUNDLED_REGISTRY_PATH = os.path.join(os.path.dirname(__file__), "sources.json")
+
+_registry: Optional[CredibilityRegistry] = None
+_stamp: Optional[Tuple[int, int]] = None
+_checked_at = 0.0
+_reload_lock = threading.Lock()
+
+
+def _registry_path() -> str:
+    return settings.credibility_registry_path or BUNDLED_REGISTRY_PATH
+
+
+def _reload() -> None:
+    """Load the registry file again if its modification time or size changed."""
+    global _registry, _stamp, _checked_at
+    # One caller reloads; the others keep using the current registry meanwhile
+    if not _reload_lock.acquire(blocking=_registry is None):
+        return
+    try:
+        path = _registry_path()
+        _checked_at = time.monotonic()
+        try:
+            stat = os.stat(path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if stamp == _stamp and _registry is not None:
+                return
+            registry = CredibilityRegistry.load(path)
+        except (OSError, ValueError) as exc:
+            logger.warning("Could not load credibility registry %s: %s", path, exc)
+            if _registry is None:
+                _registry = CredibilityRegistry()
+            return
+        _registry, _stamp = registry, stamp
+        logger.info(
+            "Loaded credibility registry %s version %s (%d sources)",
+            path,
+            registry.version or "unversioned",
+            len(registry),
+        )
+    finally:
+        _reload_lock.release()
+
+
+def get_credibility_registry() -> CredibilityRegistry:
+    """
+    Get the shared credibility registry, loading it on first use.
+
+    Loads ``settings.credibility_registry_path``, or the bundled registry when
+    unset. Every ``settings.credibility_reload_seconds`` the file is checked
+    for changes and reloaded, so each worker picks up an edited registry
+    without restarting; a file that fails to load leaves the previous
+    registry in place.
+    """
+    interval = settings.credibility_reload_seconds
+    if _registry is None or (interval > 0 and time.monotonic() - _checked_at >= interval):
+        _reload()
+    return _registry
+
+
+__all__ = [
+    "BIAS_LABELS",
+    "BUNDLED_REGISTRY_PATH",
+    "CredibilityRegistry",
+    "REGISTRY_FORMAT",
+    "SourceProfile",
+    "get_credibility_registry",
+    "url_host",
+]
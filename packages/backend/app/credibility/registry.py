@@ -0,0 +1,216 @@
+"""
+Source credibility registry.
+
+Maps news outlets, by domain and by name, to a credibility score, the
+languages they publish in and a bias label. The registry is a versioned
+JSON file::
+
+    {
+      "format": 1,
+      "version": "2026.10.1",
+      "sources": [
+        {"name": "Reuters", "aliases": ["路透社"], "domains": ["reuters.com"],
+         "score": 0.92, "languages": ["en", "zh"], "bias": "center", "category": "wire"}
+      ]
+    }
+
+Domains are indexed as a reversed-label trie, flattened into one dict keyed
+by the path from the root: ``bbc.co.uk`` adds the nodes ``uk``, ``co.uk``
+and ``bbc.co.uk``. A host is matched by walking its labels right to left
+until the trie has no node for the suffix, keeping the deepest registered
+domain seen, so ``news.bbc.co.uk`` resolves to ``bbc.co.uk`` and a more
+specific entry such as ``factcheck.afp.com`` overrides ``afp.com``. The walk
+is bounded by the depth of the registry, not by the host, and resolved hosts
+are memoized, so a host seen before costs one dict lookup.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+REGISTRY_FORMAT = 1
+
+BIAS_LABELS = ("left", "center-left", "center", "center-right", "right", "state", "unrated")
+
+# Resolved hosts remembered before the memo is cleared
+_MEMO_ENTRIES = 1 << 16
+
+# Trie node that only leads to registered domains
+_INTERIOR = -1
+
+
+@dataclass(frozen=True)
+class SourceProfile:
+    """Credibility profile of one outlet."""
+
+    name: str
+    score: float
+    languages: Tuple[str, ...] = ()
+    bias: str = "unrated"
+    category: str = ""
+    domains: Tuple[str, ...] = ()
+    aliases: Tuple[str, ...] = ()
+
+
+def _authority(url: str) -> str:
+    """The ``user@host:port`` part of a URL, as written; a bare host is kept whole."""
+    _, separator, rest = url.partition("://")
+    return (rest if separator else url.lstrip("/")).partition("/")[0]
+
+
+def url_host(url: str) -> str:
+    """
+    Host of a URL, lowercased, without userinfo, port or trailing dot.
+
+    A bare host (``"www.reuters.com"``) is returned normalized as well.
+    """
+    host = _authority(url)
+    for separator in "?#":
+        host = host.partition(separator)[0]
+    host = host.rpartition("@")[2]
+    return host.partition(":")[0].rstrip(".").lower()
+
+
+def _profile(entry: Dict[str, Any]) -> SourceProfile:
+    """Validate one ``sources`` entry of a registry file."""
+    name = str(entry.get("name") or "").strip()
+    if not name:
+        raise ValueError(f"Registry source without a name: {entry!r}")
+    score = float(entry.get("score", -1))
+    if not 0.0 <= score <= 1.0:
+        raise ValueError(f"Score of {name!r} must be between 0 and 1, got {score}")
+    bias = entry.get("bias") or "unrated"
+    if bias not in BIAS_LABELS:
+        raise ValueError(f"Unknown bias label {bias!r} for {name!r}")
+    return SourceProfile(
+        name=name,
+        score=score,
+        languages=tuple(entry.get("languages") or ()),
+        bias=bias,
+        category=entry.get("category") or "",
+        domains=tuple(url_host(domain) for domain in entry.get("domains") or ()),
+        aliases=tuple(alias.strip() for alias in entry.get("aliases") or ()),
+    )
+
+
+class CredibilityRegistry:
+    """
+    Outlet credibility profiles, looked up by URL or by outlet name.
+
+    Lookups only read the index and the memo, so a registry can be shared by
+    threads; reloading builds a new registry instead of mutating this one.
+
+    Args:
+        profiles: One profile per outlet; domains and names must be unique
+        version: Version of the file the profiles came from
+    """
+
+    def __init__(self, profiles: Iterable[SourceProfile] = (), version: str = "") -> None:
+        self.version = version
+        self.profiles: List[SourceProfile] = []
+        self._nodes: Dict[str, int] = {}
+        self._names: Dict[str, int] = {}
+        self._memo: Dict[str, int] = {}
+        for profile in profiles:
+            self._add(profile)
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    def _add(self, profile: SourceProfile) -> None:
+        index = len(self.profiles)
+        self.profiles.append(profile)
+        for domain in profile.domains:
+            if self._nodes.get(domain, _INTERIOR) != _INTERIOR:
+                raise ValueError(f"Domain {domain!r} is registered twice")
+            labels = domain.split(".")
+            for depth in range(1, len(labels)):
+                self._nodes.setdefault(".".join(labels[-depth:]), _INTERIOR)
+            self._nodes[domain] = index
+        for name in (profile.name, *profile.aliases):
+            # Exact spellings as well, so metadata copied from the registry skips casefolding
+            for key in (name.casefold(), name):
+                if self._names.get(key, index) != index:
+                    raise ValueError(f"Outlet name {name!r} is registered twice")
+                self._names[key] = index
+
+    def _match(self, host: str) -> int:
+        """Index of the profile of the deepest registered suffix of ``host``, or -1."""
+        best = _INTERIOR
+        end = len(host)
+        while end > 0:
+            dot = host.rfind(".", 0, end)
+            node = self._nodes.get(host[dot + 1 :])
+            if node is None:
+                break
+            if node != _INTERIOR:
+                best = node
+            end = dot
+        return best
+
+    def lookup(self, url: str) -> Optional[SourceProfile]:
+        """Profile of the outlet a URL or host belongs to, if it is registered."""
+        # Memoized by the authority as written, so repeated hosts skip normalizing
+        authority = _authority(url)
+        index = self._memo.get(authority)
+        if index is None:
+            index = self._match(url_host(authority))
+            if len(self._memo) >= _MEMO_ENTRIES:
+                self._memo.clear()
+            self._memo[authority] = index
+        return self.profiles[index] if index != _INTERIOR else None
+
+    def lookup_outlet(self, name: str) -> Optional[SourceProfile]:
+        """Profile of an outlet by its name or an alias, case-insensitively."""
+        index = self._names.get(name)
+        if index is None:
+            index = self._names.get(name.strip().casefold())
+        return self.profiles[index] if index is not None else None
+
+    def resolve(self, url: str = "", source: str = "") -> Optional[SourceProfile]:
+        """Profile by URL, falling back to the outlet name when the URL isn't registered."""
+        profile = self.lookup(url) if url else None
+        if profile is None and source:
+            profile = self.lookup_outlet(source)
+        return profile
+
+    def score(self, url: str = "", source: str = "", default: float = 0.5) -> float:
+        """Credibility score by URL or outlet name, or ``default`` for unknown outlets."""
+        profile = self.lookup(url) if url else None
+        if profile is None and source:
+            profile = self.lookup_outlet(source)
+        return profile.score if profile is not None else default
+
+    def expand_sources(self, sources: Iterable[str]) -> List[str]:
+        """
+        Every spelling of the requested sources, for filtering on ``source`` metadata.
+
+        A requested outlet name, alias or domain expands to the outlet's name,
+        aliases and domains; unregistered values are kept as they are.
+        """
+        expanded: Dict[str, None] = {}
+        for value in sources:
+            expanded[value] = None
+            profile = self.lookup_outlet(value)
+            if profile is None and "." in value and " " not in value.strip():
+                profile = self.lookup(value)
+            if profile is not None:
+                for spelling in (profile.name, *profile.aliases, *profile.domains):
+                    expanded[spelling] = None
+        return list(expanded)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CredibilityRegistry":
+        """Build a registry from a parsed registry file."""
+        if data.get("format") != REGISTRY_FORMAT:
+            raise ValueError(
+                f"Unsupported registry format {data.get('format')!r}, expected {REGISTRY_FORMAT}"
+            )
+        profiles = [_profile(entry) for entry in data.get("sources") or ()]
+        return cls(profiles, version=str(data.get("version") or ""))
+
+    @classmethod
+    def load(cls, path: str) -> "CredibilityRegistry":
+        """Load a registry file."""
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
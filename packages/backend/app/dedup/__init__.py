@@ -0,0 +1,67 @@
+"""Near-duplicate claim clustering module."""
+
+import logging
+import os
+from typing import Optional
+
+from app.config import settings
+from app.dedup.index import ClaimIndex, ClaimMatch
+from app.dedup.minhash import ClaimFeatures, MinHasher, claim_features, estimate_similarity
+
+logger = logging.getLogger(__name__)
+
+_index: Optional[ClaimIndex] = None
+
+
+def get_claim_index() -> Optional[ClaimIndex]:
+    """
+    Get the shared claim index, or None when ``DEDUP_ENABLED`` is false.
+
+    Restores the snapshot at ``settings.dedup_index_path`` when one exists
+    in the current format with the configured capacity.
+    """
+    global _index
+    if _index is None and settings.dedup_enabled:
+        path = settings.dedup_index_path
+        if path and os.path.exists(os.path.join(path, "manifest.json")):
+            try:
+                restored = ClaimIndex.restore(path, threshold=settings.dedup_threshold)
+            except ValueError as exc:
+                logger.warning("Ignoring claim index snapshot: %s", exc)
+            else:
+                if restored.capacity == settings.dedup_index_capacity:
+                    _index = restored
+                else:
+                    logger.warning("Ignoring claim index snapshot with a different capacity")
+        if _index is None:
+            _index = ClaimIndex(
+                capacity=settings.dedup_index_capacity,
+                threshold=settings.dedup_threshold,
+            )
+    return _index
+
+
+def save_claim_index() -> None:
+    """
+    Snapshot the index to ``settings.dedup_index_path``, if configured.
+
+    A failed snapshot is logged rather than raised, so the shutdown steps
+    after it still run.
+    """
+    if _index is not None and settings.dedup_index_path:
+        try:
+            _index.snapshot(settings.dedup_index_path)
+        except OSError as exc:
+            logger.warning("Claim index not saved to %s: %s", settings.dedup_index_path, exc)
+
+
+__all__ = [
+    "ClaimFeatures",
+    "ClaimIndex",
+    "ClaimMatch",
+    "MinHasher",
+    "claim_features",
+    "estimate_similarity",
+    "get_claim_index",
+    "save_claim_index",
+]
@@ -0,0 +1,230 @@
+"""
+Memory-bounded MinHash LSH index mapping claims to near-duplicate clusters.
+
+Signatures are split into bands of four bytes; two claims become candidates
+when any band is equal, which for 8 bands finds claims with Jaccard
+similarity 0.7 about 90% of the time and 0.9 almost always, while unrelated
+claims essentially never collide. Candidates are then confirmed by the
+similarity estimated from the full signature and by equal guards.
+
+Everything lives in fixed-size numpy arrays, so memory is set by
+``capacity`` (about 80 bytes per claim plus the bucket heads) and does not
+grow with traffic. The arrays form a ring: once full, each new claim
+overwrites the oldest one. Each band's buckets are linked lists threaded
+through a ``next`` array; a chain is followed only while insertion sequence
+numbers keep decreasing, which cuts it at the first overwritten entry without
+ever unlinking anything.
+
+A cluster's ID is the fingerprint of the claim that founded it. Identical
+claims thus get the same cluster ID in every worker and after a restart,
+which keeps cache keys derived from it shareable through Redis.
+"""
+
+import json
+import os
+import threading
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.dedup.minhash import ClaimFeatures, MinHasher, claim_features, estimate_similarity
+
+# 2: guards also cover named entities
+SNAPSHOT_VERSION = 2
+
+# Bytes of the signature per LSH band
+ROWS_PER_BAND = 4
+
+# Chain entries examined per band; near-identical variants of one viral claim
+# can share a bucket by the thousand, and the newest ones are as good as any
+MAX_CHAIN = 64
+
+
+class ClaimMatch(NamedTuple):
+    """Cluster assignment of one claim."""
+
+    cluster_id: str  # 16 hex digits
+    similarity: float  # estimated Jaccard similarity to the matched claim (1.0 if new)
+    new_cluster: bool
+
+
+class ClaimIndex:
+    """
+    Near-duplicate claim index.
+
+    Args:
+        capacity: Maximum claims kept; the oldest are overwritten beyond this
+        num_perm: Signature length, a multiple of 4
+        threshold: Minimum estimated Jaccard similarity to join a cluster
+        seed: MinHash seed
+    """
+
+    def __init__(
+        self,
+        capacity: int = 200_000,
+        num_perm: int = 32,
+        threshold: float = 0.7,
+        seed: int = 1,
+    ) -> None:
+        if num_perm % ROWS_PER_BAND:
+            raise ValueError(f"num_perm must be a multiple of {ROWS_PER_BAND}")
+        self.capacity = capacity
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm, seed)
+        self.bands = num_perm // ROWS_PER_BAND
+        num_buckets = 1 << max(10, (capacity - 1).bit_length())
+        self._mask = num_buckets - 1
+        self._lock = threading.Lock()
+
+        self._signatures = np.zeros((capacity, num_perm), dtype=np.uint8)
+        self._guards = np.zeros(capacity, dtype=np.uint32)
+        self._clusters = np.zeros(capacity, dtype=np.uint64)
+        self._seqs = np.full(capacity, -1, dtype=np.int64)
+        self._next = np.full((self.bands, capacity), -1, dtype=np.int32)
+        self._heads = np.full((self.bands, num_buckets), -1, dtype=np.int32)
+        self._inserted = 0
+
+    def __len__(self) -> int:
+        return min(self._inserted, self.capacity)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the index arrays."""
+        arrays = (
+            self._signatures, self._guards, self._clusters, self._seqs, self._next, self._heads
+        )
+        return sum(array.nbytes for array in arrays)
+
+    def _band_keys(self, signature: np.ndarray) -> np.ndarray:
+        return signature.view("<u4")
+
+    def _candidates(self, keys: List[int]) -> List[int]:
+        candidates = set()
+        heads, nexts, seqs = self._heads, self._next, self._seqs
+        stored_keys = self._signatures.view("<u4")
+        for band, key in enumerate(keys):
+            slot = int(heads[band, key & self._mask])
+            previous = self._inserted
+            for _ in range(MAX_CHAIN):
+                if slot < 0:
+                    break
+                seq = int(seqs[slot])
+                if seq >= previous:  # overwritten since it was linked here
+                    break
+                if slot not in candidates and stored_keys[slot, band] == key:
+                    candidates.add(slot)
+                previous = seq
+                slot = int(nexts[band, slot])
+        return list(candidates)
+
+    def _best_match(self, signature: np.ndarray, guard: int) -> Tuple[int, float]:
+        candidates = self._candidates(self._band_keys(signature).tolist())
+        if not candidates:
+            return -1, 0.0
+        slots = np.array(candidates, dtype=np.int64)
+        similarities = estimate_similarity(signature, self._signatures[slots])
+        similarities[self._guards[slots] != guard] = 0.0
+        best = int(np.argmax(similarities))
+        return int(slots[best]), float(similarities[best])
+
+    def _insert(self, signature: np.ndarray, guard: int, cluster: int) -> None:
+        slot = self._inserted % self.capacity
+        self._signatures[slot] = signature
+        self._guards[slot] = guard
+        self._clusters[slot] = cluster
+        self._seqs[slot] = self._inserted
+        bands = np.arange(self.bands)
+        buckets = self._band_keys(signature).astype(np.int64) & self._mask
+        self._next[:, slot] = self._heads[bands, buckets]
+        self._heads[bands, buckets] = slot
+        self._inserted += 1
+
+    def assign_features(self, features: ClaimFeatures) -> Optional[ClaimMatch]:
+        """
+        Map a claim to its cluster, founding a new cluster if none matches.
+
+        Exact copies of an indexed claim are not stored again unless that
+        claim is about to be overwritten, so a flood of one viral text takes
+        a single slot while staying in the index.
+
+        Args:
+            features: Output of ``claim_features``
+
+        Returns:
+            The assignment, or None if the claim has no word tokens
+        """
+        if not features.tokens:
+            return None
+        signature = self.hasher.signature(features.tokens)
+        with self._lock:
+            slot, similarity = self._best_match(signature, features.guard)
+            if slot >= 0 and similarity >= self.threshold:
+                cluster = int(self._clusters[slot])
+                age = self._inserted - int(self._seqs[slot])
+                if similarity < 1.0 or age > self.capacity // 2:
+                    self._insert(signature, features.guard, cluster)
+                return ClaimMatch(f"{cluster:016x}", similarity, False)
+
+            self._insert(signature, features.guard, features.fingerprint)
+            return ClaimMatch(f"{features.fingerprint:016x}", 1.0, True)
+
+    def assign(self, text: str) -> Optional[ClaimMatch]:
+        """Normalize and tokenize a claim, then map it to its cluster."""
+        return self.assign_features(claim_features(text))
+
+    def assign_many(self, texts: Sequence[str]) -> List[Optional[ClaimMatch]]:
+        """``assign`` for several claims, in order."""
+        return [self.assign(text) for text in texts]
+
+    def snapshot(self, path: str) -> None:
+        """Write the index to ``path`` (a directory), replacing any previous snapshot."""
+        with self._lock:
+            tmp = f"{path}.tmp{os.getpid()}"
+            os.makedirs(tmp, exist_ok=True)
+            for name in ("signatures", "guards", "clusters", "seqs", "next", "heads"):
+                np.save(os.path.join(tmp, f"{name}.npy"), getattr(self, f"_{name}"))
+            manifest = {
+                "version": SNAPSHOT_VERSION,
+                "capacity": self.capacity,
+                "num_perm": self.hasher.num_perm,
+                "seed": self.hasher.seed,
+                "threshold": self.threshold,
+                "inserted": self._inserted,
+            }
+            with open(os.path.join(tmp, "manifest.json"), "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+
+            if os.path.isdir(path):
+                old = f"{path}.old{os.getpid()}"
+                os.replace(path, old)
+                os.replace(tmp, path)
+                for name in os.listdir(old):
+                    os.remove(os.path.join(old, name))
+                os.rmdir(old)
+            else:
+                os.replace(tmp, path)
+
+    @classmethod
+    def restore(cls, path: str, threshold: Optional[float] = None) -> "ClaimIndex":
+        """
+        Load a snapshot written by ``snapshot``.
+
+        Args:
+            path: Snapshot directory
+            threshold: Similarity threshold to use instead of the saved one
+        """
+        with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest["version"] != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported claim index snapshot version {manifest['version']}")
+
+        index = cls(
+            capacity=manifest["capacity"],
+            num_perm=manifest["num_perm"],
+            threshold=manifest["threshold"] if threshold is None else threshold,
+            seed=manifest["seed"],
+        )
+        for name in ("signatures", "guards", "clusters", "seqs", "next", "heads"):
+            setattr(index, f"_{name}", np.load(os.path.join(path, f"{name}.npy")))
+        index._inserted = manifest["inserted"]
+        return index
@@ -0,0 +1,139 @@
+"""
+Claim normalization and MinHash signatures over jieba tokens.
+
+Copies of a viral claim differ in punctuation, emoji, spacing, full-width
+characters and the odd edited word. ``claim_features`` reduces a claim to the
+set of its word tokens with all of that stripped, and ``MinHasher`` turns the
+set into a short signature whose per-position agreement estimates the
+Jaccard similarity of two claims.
+
+Signatures keep only the lowest 8 bits of each minimum (b-bit MinHash), so a
+32-permutation signature is 32 bytes; equal bytes by chance (1/256) are
+corrected for when estimating similarity.
+
+Numbers, negations and named entities decide what a claim asserts, yet are
+single tokens that barely move the similarity: "特朗普签署了法案" and
+"拜登签署了法案" share most of their words. They are summarized separately in
+a guard value, and claims whose guards differ are never treated as
+duplicates. Entities are the known ones of ``app.sources.facts``, keyed
+across languages and aliases, so "世卫组织" and "WHO" still agree.
+"""
+
+import hashlib
+import unicodedata
+import zlib
+from typing import List, NamedTuple, Sequence
+
+import numpy as np
+
+# Characters and words that negate a Chinese or English clause
+NEGATION_CHARS = frozenset("不没未非无否别莫勿")
+NEGATION_WORDS = frozenset({"not", "no", "never", "none", "n't", "cannot"})
+
+# Probability that two unrelated 8-bit minima agree
+_CHANCE = 1 / 256
+
+
+class ClaimFeatures(NamedTuple):
+    """What near-duplicate detection needs from one claim."""
+
+    tokens: List[str]  # distinct normalized tokens, in first-seen order
+    guard: int  # hash of the claim's numbers, negation count and named entities
+    fingerprint: int  # 64-bit hash of the normalized token sequence
+
+
+def _clean_token(token: str) -> str:
+    # Keep letters, digits and marks; keep "." and "," only between digits (3.5, 1,000)
+    kept = []
+    for i, char in enumerate(token):
+        category = unicodedata.category(char)[0]
+        if category in "LNM":
+            kept.append(char)
+        elif char in ".," and 0 < i < len(token) - 1:
+            if token[i - 1].isdigit() and token[i + 1].isdigit():
+                kept.append(char)
+    return "".join(kept)
+
+
+def claim_features(text: str) -> ClaimFeatures:
+    """
+    Normalize a claim and split it into word tokens.
+
+    Applies NFKC, folds Traditional characters to Simplified, lowercases,
+    segments with jieba and drops punctuation, symbols, emoji and whitespace.
+    The guard covers the claim's numbers, its negation count and the known
+    named entities it mentions.
+
+    Args:
+        text: Claim text
+
+    Returns:
+        ClaimFeatures; ``tokens`` is empty if nothing word-like remains
+    """
+    from app.nlp.script import normalize_script
+    from app.nlp.tokenizer import tokenize_chinese
+    from app.sources.facts import extract_entities
+
+    folded = normalize_script(text)
+    normalized = folded.lower()
+    sequence = [token for token in map(_clean_token, tokenize_chinese(normalized)) if token]
+
+    numbers = sorted(token for token in sequence if any(char.isdigit() for char in token))
+    negations = sum(
+        token in NEGATION_WORDS or sum(char in NEGATION_CHARS for char in token)
+        for token in sequence
+    )
+    # Before lowercasing: short aliases such as "US" only count in capitals
+    entities = sorted(extract_entities(folded))
+    guard = zlib.crc32(f"{' '.join(numbers)}|{negations}|{' '.join(entities)}".encode("utf-8"))
+    digest = hashlib.blake2b(" ".join(sequence).encode("utf-8"), digest_size=8).digest()
+    return ClaimFeatures(
+        tokens=list(dict.fromkeys(sequence)),
+        guard=guard,
+        fingerprint=int.from_bytes(digest, "big"),
+    )
+
+
+class MinHasher:
+    """
+    b-bit MinHash over token sets using multiply-shift hashing.
+
+    Args:
+        num_perm: Number of hash functions, i.e. signature length in bytes
+        seed: Seed of the hash functions; signatures are only comparable
+            between hashers with equal ``num_perm`` and ``seed``
+    """
+
+    def __init__(self, num_perm: int = 32, seed: int = 1) -> None:
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.seed = seed
+        # (a * x + b) >> 32 over 64-bit words is a universal family for 32-bit x
+        self._a = rng.integers(1, 2**63, num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, num_perm, dtype=np.uint64)
+
+    def signature(self, tokens: Sequence[str]) -> np.ndarray:
+        """
+        Signature of a non-empty token set.
+
+        Returns:
+            uint8 array of length ``num_perm``
+        """
+        hashes = np.array([zlib.crc32(token.encode("utf-8")) for token in tokens], dtype=np.uint64)
+        values = (hashes[:, None] * self._a + self._b) >> np.uint64(32)
+        return (values.min(axis=0) & np.uint64(0xFF)).astype(np.uint8)
+
+
+def estimate_similarity(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Estimated Jaccard similarity between signature ``a`` and each row of ``b``.
+
+    Args:
+        a: One signature
+        b: One signature or a matrix of signatures
+
+    Returns:
+        Similarities in [0, 1], with the chance agreement of 8-bit minima removed
+    """
+    agreement = (np.asarray(b) == a).mean(axis=-1)
+    return np.clip((agreement - _CHANCE) / (1 - _CHANCE), 0.0, 1.0)
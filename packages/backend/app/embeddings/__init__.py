@@ -0,0 +1,21 @@
+"""Text embedding module."""
+
+from app.embeddings.batcher import MicroBatcher
+from app.embeddings.cache import EmbeddingCache
+from app.embeddings.model import EmbeddingModel
+from app.embeddings.service import (
+    EmbeddingService,
+    close_embedding_service,
+    get_embedding_service,
+    preload_embedding_service,
+)
+
+__all__ = [
+    "EmbeddingCache",
+    "EmbeddingModel",
+    "EmbeddingService",
+    "MicroBatcher",
+    "close_embedding_service",
+    "get_embedding_service",
+    "preload_embedding_service",
+]
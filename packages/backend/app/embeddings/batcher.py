@@ -0,0 +1,109 @@
+"""
+Async micro-batcher.
+
+Concurrent callers each submit one text; the batcher collects them for up to
+``max_wait_ms`` or ``max_batch_size`` items, whichever comes first, and runs
+the encoder once for the whole batch in a worker thread.
+"""
+
+import asyncio
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+EncodeFn = Callable[[List[str]], np.ndarray]
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-item requests into batched encoder calls."""
+
+    def __init__(
+        self,
+        encode: EncodeFn,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ) -> None:
+        self._encode = encode
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue[Tuple[str, asyncio.Future]]] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def _ensure_started(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        return self._queue
+
+    async def submit(self, text: str) -> np.ndarray:
+        """
+        Queue one text for encoding and wait for its vector.
+
+        Args:
+            text: Text to encode
+
+        Returns:
+            The embedding vector
+        """
+        queue = self._ensure_started()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await queue.put((text, future))
+        return await future
+
+    async def submit_many(self, texts: Sequence[str]) -> List[np.ndarray]:
+        """Queue several texts; they may be split across or merged into batches."""
+        return list(await asyncio.gather(*(self.submit(text) for text in texts)))
+
+    async def _collect(self, queue: asyncio.Queue) -> List[Tuple[str, asyncio.Future]]:
+        """Wait for the first item, then gather more until the batch is full or stale."""
+        batch = [await queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            # Drain whatever is already queued without waiting
+            while len(batch) < self.max_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            if len(batch) >= self.max_batch_size:
+                break
+
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            batch = await self._collect(queue)
+            pending = [(text, future) for text, future in batch if not future.cancelled()]
+            if not pending:
+                continue
+
+            try:
+                vectors = await asyncio.to_thread(self._encode, [text for text, _ in pending])
+            except Exception as exc:  # propagate to every waiter in the batch
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            for (_, future), vector in zip(pending, vectors):
+                if not future.done():
+                    future.set_result(vector)
+
+    async def close(self) -> None:
+        """Stop the background worker; the next submit starts afresh in its own event loop."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        self._queue = None
@@ -0,0 +1,197 @@
+"""
+Content-addressed embedding cache backed by memory-mapped float16 arrays.
+
+Layout under ``path``:
+    vectors.f16   (capacity, dim) float16 rows
+    keys.bin      (capacity, 16) uint8 content hashes, row-aligned with vectors
+    writes.bin    one int64: rows written so far, across every process
+    meta.json     model name, dimension and capacity
+    .lock         lock file guarding the three arrays
+
+Rows are written in ring order, so once the cache is full the oldest entry is
+overwritten. Both arrays are mmap'd, which keeps resident memory small and lets
+several worker processes share one cache: the write counter lives in the
+shared files rather than in any one process, writers allocate rows while
+holding the lock exclusively, and readers hold it shared. Each process keeps
+its own key -> row index and catches it up on the rows other processes wrote
+since it last looked, so a row reused by another worker is never read under
+its old key.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+KEY_SIZE = 16
+_LOCK_FILE = ".lock"
+
+
+def content_hash(text: str, model_name: str) -> bytes:
+    """
+    Hash a text together with the model that embeds it.
+
+    Args:
+        text: Input text
+        model_name: Embedding model identifier
+
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    digest = hashlib.blake2b(digest_size=KEY_SIZE)
+    digest.update(model_name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.strip().encode("utf-8"))
+    return digest.digest()
+
+
+class EmbeddingCache:
+    """Persistent text -> vector cache with a fixed number of float16 slots."""
+
+    def __init__(self, path: str, model_name: str, dim: int, capacity: int = 100_000) -> None:
+        self.path = path
+        self.model_name = model_name
+        self.dim = dim
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._lock_file = None
+        self._lock_pid = 0
+
+        os.makedirs(path, exist_ok=True)
+        with self._locked(fcntl.LOCK_EX):
+            meta = self._read_meta()
+            expected = {"model": model_name, "dim": dim, "capacity": capacity}
+            # A changed model or shape makes the stored vectors meaningless
+            fresh = meta != expected or not os.path.exists(self._file("writes.bin"))
+            mode = "w+" if fresh else "r+"
+
+            self._vectors = np.memmap(
+                self._file("vectors.f16"), dtype=np.float16, mode=mode, shape=(capacity, dim)
+            )
+            self._keys = np.memmap(
+                self._file("keys.bin"), dtype=np.uint8, mode=mode, shape=(capacity, KEY_SIZE)
+            )
+            self._writes = np.memmap(
+                self._file("writes.bin"), dtype=np.int64, mode=mode, shape=(1,)
+            )
+            if fresh:
+                self._writes[0] = 0
+                self._flush_arrays()
+                self._write_meta(expected)
+
+            self._index: Dict[bytes, int] = {}
+            self._row_keys: Dict[int, bytes] = {}
+            self._synced = 0
+            self._sync()
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _read_meta(self) -> dict:
+        try:
+            with open(self._file("meta.json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_meta(self, meta: dict) -> None:
+        tmp = self._file("meta.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp, self._file("meta.json"))
+
+    @contextmanager
+    def _locked(self, operation: int) -> Iterator[None]:
+        """Hold the cache lock, shared for reading or exclusive for writing."""
+        # flock belongs to the open file, which a forked child shares with its
+        # parent, so every process opens the lock file for itself
+        if self._lock_pid != os.getpid():
+            if self._lock_file is not None:
+                self._lock_file.close()
+            self._lock_file = open(self._file(_LOCK_FILE), "a")
+            self._lock_pid = os.getpid()
+        fcntl.flock(self._lock_file, operation)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _sync(self) -> None:
+        """Index the rows written by any process since this one last looked."""
+        writes = int(self._writes[0])
+        for count in range(max(self._synced, writes - self.capacity), writes):
+            row = count % self.capacity
+            old_key = self._row_keys.get(row)
+            if old_key is not None and self._index.get(old_key) == row:
+                del self._index[old_key]
+            key = self._keys[row].tobytes()
+            self._index[key] = row
+            self._row_keys[row] = key
+        self._synced = writes
+
+    def __len__(self) -> int:
+        with self._lock, self._locked(fcntl.LOCK_SH):
+            self._sync()
+            return len(self._index)
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """Return the cached float32 vector for ``text``, or None."""
+        return self.get_many([text])[0]
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up several texts at once.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            One float32 vector or None per text, in input order
+        """
+        keys = [content_hash(text, self.model_name) for text in texts]
+        results: List[Optional[np.ndarray]] = []
+        with self._lock, self._locked(fcntl.LOCK_SH):
+            self._sync()
+            for key in keys:
+                row = self._index.get(key)
+                results.append(
+                    None if row is None else np.asarray(self._vectors[row], dtype=np.float32)
+                )
+        return results
+
+    def put_many(self, texts: Sequence[str], vectors: np.ndarray) -> None:
+        """
+        Store vectors for several texts, evicting the oldest rows when full.
+
+        Texts already cached, by this or another process, keep their row.
+
+        Args:
+            texts: Input texts
+            vectors: Array of shape (len(texts), dim)
+        """
+        keys = [content_hash(text, self.model_name) for text in texts]
+        with self._lock, self._locked(fcntl.LOCK_EX):
+            self._sync()
+            for key, vector in zip(keys, vectors):
+                if key in self._index:
+                    continue
+                row = self._synced % self.capacity
+                self._vectors[row] = vector
+                self._keys[row] = np.frombuffer(key, dtype=np.uint8)
+                self._writes[0] = self._synced + 1
+                self._sync()
+
+    def _flush_arrays(self) -> None:
+        self._vectors.flush()
+        self._keys.flush()
+        self._writes.flush()
+
+    def flush(self) -> None:
+        """Write the mapped arrays back to disk."""
+        with self._lock, self._locked(fcntl.LOCK_SH):
+            self._flush_arrays()
@@ -0,0 +1,78 @@
+"""
+Sentence-transformers model loading for CPU inference.
+
+Backends:
+    torch  - plain float32 PyTorch model
+    int8   - PyTorch with dynamic int8 quantization of the Linear layers
+    onnx   - ONNX Runtime (requires sentence-transformers >= 3.2 with onnx extras)
+
+``sentence_transformers`` and ``torch`` are imported lazily so the API can start
+without paying for them. No network access is needed once the model files are
+in the local Hugging Face cache, or when ``EMBEDDING_MODEL`` points at a local
+directory; set ``HF_HUB_OFFLINE=1`` to forbid downloads entirely.
+"""
+
+from typing import Any, List
+
+import numpy as np
+
+EMBEDDING_BACKENDS = ("torch", "int8", "onnx")
+
+
+class EmbeddingModel:
+    """A loaded sentence-transformers model with a batch ``encode`` method."""
+
+    def __init__(self, model_name: str, backend: str = "torch", batch_size: int = 32) -> None:
+        if backend not in EMBEDDING_BACKENDS:
+            raise ValueError(
+                f"Unknown embedding backend {backend!r}; expected one of {EMBEDDING_BACKENDS}"
+            )
+        self.model_name = model_name
+        self.backend = backend
+        self.batch_size = batch_size
+        self._model = self._load()
+
+    def _load(self) -> Any:
+        from sentence_transformers import SentenceTransformer
+
+        if self.backend == "onnx":
+            try:
+                return SentenceTransformer(self.model_name, device="cpu", backend="onnx")
+            except TypeError as exc:
+                raise RuntimeError(
+                    "The onnx embedding backend requires sentence-transformers >= 3.2"
+                ) from exc
+
+        model = SentenceTransformer(self.model_name, device="cpu")
+        if self.backend == "int8":
+            import torch
+
+            model = torch.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        model.eval()
+        return model
+
+    @property
+    def dim(self) -> int:
+        """Embedding dimension."""
+        return int(self._model.get_sentence_embedding_dimension())
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode a batch of texts in one forward pass per ``batch_size`` chunk.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            float32 array of shape (len(texts), dim), L2-normalized
+        """
+        vectors = self._model.encode(
+            texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        return np.asarray(vectors, dtype=np.float32)
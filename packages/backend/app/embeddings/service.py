@@ -0,0 +1,157 @@
+"""
+Embedding service: cache lookup, then micro-batched encoding of the misses.
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.config import settings
+from app.embeddings.batcher import MicroBatcher
+from app.embeddings.cache import EmbeddingCache
+from app.embeddings.model import EmbeddingModel
+from app.metrics import CACHE_LOOKUPS, time_stage
+
+
+class EmbeddingService:
+    """
+    Embed texts with caching and request batching.
+
+    ``model`` is anything with ``model_name``, ``dim`` and a batch
+    ``encode(List[str]) -> np.ndarray`` method, so tests and benchmarks can
+    plug in a fake encoder.
+    """
+
+    def __init__(
+        self,
+        model: EmbeddingModel,
+        cache: Optional[EmbeddingCache] = None,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ) -> None:
+        self.model = model
+        self.cache = cache
+        self._batcher = MicroBatcher(model.encode, max_batch_size, max_wait_ms)
+
+    @property
+    def dim(self) -> int:
+        """Embedding dimension."""
+        return self.model.dim
+
+    async def embed(self, text: str) -> np.ndarray:
+        """
+        Embed a single text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            float32 vector of shape (dim,)
+        """
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed several texts, reusing cached vectors and encoding each miss once.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            float32 array of shape (len(texts), dim), in input order
+        """
+        with time_stage("embedding"):
+            return await self._embed_many(texts)
+
+    async def _embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        result = np.empty((len(texts), self.dim), dtype=np.float32)
+        cached = self.cache.get_many(texts) if self.cache is not None else [None] * len(texts)
+
+        # Group rows by text so duplicates inside one call are encoded once
+        missing: Dict[str, List[int]] = {}
+        for row, (text, vector) in enumerate(zip(texts, cached)):
+            if vector is None:
+                missing.setdefault(text, []).append(row)
+            else:
+                result[row] = vector
+
+        if self.cache is not None:
+            misses = sum(len(rows) for rows in missing.values())
+            CACHE_LOOKUPS.labels("embedding", "hit").inc(len(texts) - misses)
+            CACHE_LOOKUPS.labels("embedding", "miss").inc(misses)
+
+        if missing:
+            unique = list(missing)
+            vectors = np.stack(await self._batcher.submit_many(unique))
+            if self.cache is not None:
+                self.cache.put_many(unique, vectors)
+            for text, vector in zip(unique, vectors):
+                result[missing[text]] = vector
+
+        return result
+
+    async def close(self) -> None:
+        """Stop the batcher and persist the cache."""
+        await self._batcher.close()
+        if self.cache is not None:
+            self.cache.flush()
+
+
+_service: Optional[EmbeddingService] = None
+_service_lock: Optional[asyncio.Lock] = None
+
+
+def _build_service() -> EmbeddingService:
+    model = EmbeddingModel(
+        settings.embedding_model,
+        backend=settings.embedding_backend,
+        batch_size=settings.embedding_batch_size,
+    )
+    cache = None
+    if settings.embedding_cache_path:
+        cache = EmbeddingCache(
+            settings.embedding_cache_path,
+            model_name=f"{settings.embedding_model}:{settings.embedding_backend}",
+            dim=model.dim,
+            capacity=settings.embedding_cache_capacity,
+        )
+    return EmbeddingService(
+        model,
+        cache,
+        max_batch_size=settings.embedding_batch_size,
+        max_wait_ms=settings.embedding_batch_wait_ms,
+    )
+
+
+async def get_embedding_service() -> EmbeddingService:
+    """Get the shared embedding service, loading the model on first use."""
+    global _service, _service_lock
+    if _service is None:
+        if _service_lock is None:
+            _service_lock = asyncio.Lock()
+        async with _service_lock:
+            if _service is None:
+                _service = await asyncio.to_thread(_build_service)
+    return _service
+
+
+def preload_embedding_service() -> EmbeddingService:
+    """
+    Load the shared embedding service outside any event loop.
+
+    For a parent process that loads the model once before forking workers;
+    the service starts its batching task lazily, in each worker's own loop.
+    """
+    global _service
+    if _service is None:
+        _service = _build_service()
+    return _service
+
+
+async def close_embedding_service() -> None:
+    """Shut down the shared embedding service, if it was started."""
+    global _service
+    if _service is not None:
+        await _service.close()
+        _service = None
@@ -0,0 +1,73 @@
+"""Dependency health monitoring module."""
+
+import asyncio
+from typing import Awaitable, Callable, List, Optional
+
+from app.config import settings
+from app.health.probes import CircuitBreaker, HealthMonitor, Probe, ProbeResult
+
+_monitor: Optional[HealthMonitor] = None
+
+
+async def _check_vector_store() -> bool:
+    from app.vectorstore import get_vector_store
+
+    # Counting is a cheap round trip for Pinecone and free for the local store
+    await asyncio.to_thread(lambda: len(get_vector_store()))
+    return True
+
+
+def _build_probes() -> List[Probe]:
+    """One probe per configured dependency; unconfigured ones are not probed."""
+    from app.cache import get_verification_cache
+    from app.llm import get_llm_client
+
+    def probe(name: str, check: Callable[[], Awaitable[bool]]) -> Probe:
+        return Probe(
+            name,
+            check,
+            timeout=settings.health_probe_timeout_seconds,
+            breaker=CircuitBreaker(
+                settings.health_breaker_threshold, settings.health_breaker_reset_seconds
+            ),
+        )
+
+    probes = [probe("vector_db", _check_vector_store)]
+    backend = get_verification_cache().backend
+    if backend is not None:
+        probes.append(probe("cache", backend.ping))
+    client = get_llm_client()
+    for provider in client.providers if client is not None else ():
+        probes.append(
+            probe(
+                f"llm.{provider.name}",
+                lambda provider=provider: provider.ping(settings.health_probe_timeout_seconds),
+            )
+        )
+    return probes
+
+
+def get_health_monitor() -> HealthMonitor:
+    """Get the shared health monitor, creating it on first use."""
+    global _monitor
+    if _monitor is None:
+        _monitor = HealthMonitor(_build_probes(), interval=settings.health_probe_interval_seconds)
+    return _monitor
+
+
+async def close_health_monitor() -> None:
+    """Stop background probing, if it was started."""
+    global _monitor
+    if _monitor is not None:
+        await _monitor.stop()
+        _monitor = None
+
+
+__all__ = [
+    "CircuitBreaker",
+    "HealthMonitor",
+    "Probe",
+    "ProbeResult",
+    "close_health_monitor",
+    "get_health_monitor",
+]
@@ -0,0 +1,201 @@
+"""
+Background dependency probes with circuit breakers.
+
+Each dependency is probed on an interval by one background task, and the
+latest result is kept in memory so the health endpoint can answer without
+touching any dependency. A probe that keeps failing opens its circuit: the
+dependency is reported down without being probed until the reset timeout has
+passed, after which a single trial probe decides whether the circuit closes
+again. A dead dependency therefore costs at most one probe timeout per reset
+period, and never any latency on the health route itself.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit
+        reset_timeout: Seconds the circuit stays open before a trial call
+        clock: Monotonic time source (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_started: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return OPEN
+
+    def allow(self) -> bool:
+        """
+        Whether a call may be attempted now.
+
+        A half-open circuit lets a single caller through as the trial call and
+        refuses the rest until it records its outcome, or until another reset
+        timeout has passed in case it never does.
+        """
+        state = self.state
+        if state != HALF_OPEN:
+            return state == CLOSED
+        now = self._clock()
+        if self._trial_started is not None and now - self._trial_started < self.reset_timeout:
+            return False
+        self._trial_started = now
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_started = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._trial_started = None
+        # A failed trial call re-opens at once; otherwise wait for the threshold
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+
+
+@dataclass
+class ProbeResult:
+    """Latest state of one dependency."""
+
+    # Assumed up until the first probe, as the health route reported before probing
+    healthy: bool = True
+    latency_ms: Optional[float] = None
+    last_checked: Optional[float] = None  # Unix time
+    last_success: Optional[float] = None  # Unix time
+    error: Optional[str] = None
+    circuit: str = CLOSED
+
+
+class Probe:
+    """
+    One dependency check guarded by a timeout and a circuit breaker.
+
+    Args:
+        name: Dependency name, e.g. ``"cache"`` or ``"llm.claude"``
+        check: Coroutine function returning True when the dependency is usable
+        timeout: Seconds before a check counts as failed
+        breaker: Circuit breaker for this dependency
+    """
+
+    def __init__(
+        self,
+        name: str,
+        check: Callable[[], Awaitable[bool]],
+        timeout: float = 1.0,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        self.name = name
+        self.check = check
+        self.timeout = timeout
+        self.breaker = breaker or CircuitBreaker()
+        self.result = ProbeResult()
+
+    async def run(self) -> ProbeResult:
+        """Probe once (unless the circuit is open) and update ``result``."""
+        result = self.result
+        if not self.breaker.allow():
+            result.healthy = False
+            result.circuit = self.breaker.state
+            return result
+
+        start = time.perf_counter()
+        try:
+            healthy = bool(await asyncio.wait_for(self.check(), self.timeout))
+            error = None if healthy else "check failed"
+        except asyncio.TimeoutError:
+            healthy, error = False, f"timed out after {self.timeout:g}s"
+        except Exception as exc:  # noqa: BLE001 - any failure means unhealthy
+            healthy, error = False, repr(exc)[:200]
+
+        now = time.time()
+        result.latency_ms = (time.perf_counter() - start) * 1000
+        result.last_checked = now
+        result.healthy = healthy
+        result.error = error
+        if healthy:
+            result.last_success = now
+            self.breaker.record_success()
+        else:
+            if result.circuit == CLOSED:
+                logger.warning("Health probe %s failed: %s", self.name, error)
+            self.breaker.record_failure()
+        result.circuit = self.breaker.state
+        return result
+
+
+class HealthMonitor:
+    """
+    Runs probes concurrently on an interval in a background task.
+
+    Args:
+        probes: Probes to run
+        interval: Seconds between probe rounds
+    """
+
+    def __init__(self, probes: Sequence[Probe], interval: float = 10.0) -> None:
+        self.probes = {probe.name: probe for probe in probes}
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def probe_all(self) -> Dict[str, ProbeResult]:
+        """Run one probe round and return the results."""
+        await asyncio.gather(*(probe.run() for probe in self.probes.values()))
+        return self.snapshot()
+
+    def snapshot(self) -> Dict[str, ProbeResult]:
+        """Latest result of every probe, without probing."""
+        return {name: probe.result for name, probe in self.probes.items()}
+
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                await self.probe_all()
+            except Exception:  # noqa: BLE001 - keep probing whatever happens
+                logger.exception("Health probe round failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start probing in the background; the first round runs at once."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        """Cancel the background task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
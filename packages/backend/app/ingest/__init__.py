@@ -0,0 +1,19 @@
+"""Bulk evidence ingestion module."""
+
+from app.ingest.chunker import Chunk, chunk_hash, chunk_spans, prepare_articles
+from app.ingest.pipeline import EmbeddingEncoder, Ingestor, IngestStats
+from app.ingest.reader import Article, read_articles
+from app.ingest.seen import HashSet
+
+__all__ = [
+    "Article",
+    "Chunk",
+    "EmbeddingEncoder",
+    "HashSet",
+    "IngestStats",
+    "Ingestor",
+    "chunk_hash",
+    "chunk_spans",
+    "prepare_articles",
+    "read_articles",
+]
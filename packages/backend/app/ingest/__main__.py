@@ -0,0 +1,75 @@
+"""
+Ingest crawler article dumps into the configured vector store and the
+lexical index.
+
+Usage:
+    python -m app.ingest dump.jsonl [more.parquet ...] [--checkpoint-dir .cache/ingest]
+        [--nlp-workers 2] [--embed-workers 2] [--batch-articles 64] [--chunk-chars 500]
+
+Interrupt with Ctrl-C at any time; rerunning the same command resumes.
+"""
+
+import argparse
+import logging
+import os
+import time
+
+from app.config import settings
+from app.ingest.pipeline import EmbeddingEncoder, Ingestor
+from app.lexical import get_lexical_index, save_lexical_index
+from app.vectorstore import get_vector_store, save_vector_store
+
+
+def _save_indexes() -> None:
+    save_vector_store()
+    save_lexical_index()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("paths", nargs="+", help=".jsonl or .parquet article dumps")
+    parser.add_argument("--checkpoint-dir", default=settings.ingest_checkpoint_dir)
+    parser.add_argument("--nlp-workers", type=int, default=settings.ingest_nlp_workers)
+    parser.add_argument("--embed-workers", type=int, default=settings.ingest_embed_workers)
+    parser.add_argument("--batch-articles", type=int, default=settings.ingest_batch_articles)
+    parser.add_argument("--chunk-chars", type=int, default=settings.ingest_chunk_chars)
+    parser.add_argument("--dedup-capacity", type=int, default=settings.ingest_dedup_capacity)
+    parser.add_argument(
+        "--checkpoint-every", type=int, default=settings.ingest_checkpoint_every
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    # Split the cores between embedding workers instead of letting each use all of them
+    threads = max(1, (os.cpu_count() or 1) // max(args.embed_workers, 1))
+    ingestor = Ingestor(
+        get_vector_store(),
+        snapshot=_save_indexes,
+        checkpoint_dir=args.checkpoint_dir or None,
+        encoder_factory=EmbeddingEncoder(threads),
+        chunk_chars=args.chunk_chars,
+        batch_articles=args.batch_articles,
+        nlp_workers=args.nlp_workers,
+        embed_workers=args.embed_workers,
+        dedup_capacity=args.dedup_capacity,
+        checkpoint_every=args.checkpoint_every,
+        lexical=get_lexical_index(),
+    )
+
+    for path in args.paths:
+        started = time.monotonic()
+        before = ingestor.stats.chunks
+        stats = ingestor.run(path)
+        elapsed = time.monotonic() - started
+        print(
+            f"✅ {path}: {stats.chunks - before:,} chunks in {elapsed:.0f}s "
+            f"(total {stats.articles:,} articles, {stats.chunks:,} chunks, "
+            f"{stats.duplicates:,} duplicates skipped)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Article chunking and per-chunk annotation.
+
+Chunks are runs of whole sentences up to ``max_chars`` characters; a
+sentence longer than that becomes a chunk of its own, cut at ``max_chars``.
+Each chunk is annotated with its language (``detect_language``), keywords
+(``extract_keywords``) and BM25 terms (``lexical_tokens``), and identified by
+a hash of its normalized text, so the same passage crawled twice maps to one
+record.
+
+``prepare_articles`` is the CPU-bound step of ingestion and runs in the NLP
+process pool.
+"""
+
+import hashlib
+import unicodedata
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+from app.ingest.reader import Article
+from app.lexical.tokens import lexical_tokens
+from app.nlp.claim_extractor import sentence_spans
+from app.nlp.language_detector import detect_language
+from app.nlp.tokenizer import extract_keywords
+
+
+@dataclass
+class Chunk:
+    """A passage ready to embed, with its vector store record ID, metadata and BM25 terms."""
+
+    id: str
+    hash: int
+    text: str
+    metadata: Dict[str, Any]
+    tokens: List[str]
+
+
+def chunk_hash(text: str) -> int:
+    """
+    64-bit content hash of a chunk, insensitive to width variants and spacing.
+
+    Never 0, which marks empty slots in ``HashSet``.
+    """
+    normalized = " ".join(unicodedata.normalize("NFKC", text).split())
+    digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+def chunk_spans(text: str, max_chars: int = 500) -> Iterator[Tuple[int, int]]:
+    """
+    Pack consecutive sentences into chunks of at most ``max_chars`` characters.
+
+    Args:
+        text: Article text
+        max_chars: Chunk size limit
+
+    Yields:
+        ``(start, end)`` offsets of each chunk in ``text``
+    """
+    chunk_start = chunk_end = None
+    for start, end in sentence_spans(text, min_length=1):
+        if chunk_start is not None and end - chunk_start > max_chars:
+            yield chunk_start, chunk_end
+            chunk_start = None
+        if chunk_start is None:
+            chunk_start = start
+        chunk_end = end
+        while chunk_end - chunk_start > max_chars:
+            yield chunk_start, chunk_start + max_chars
+            chunk_start += max_chars
+    if chunk_start is not None:
+        yield chunk_start, chunk_end
+
+
+def prepare_articles(
+    articles: Sequence[Article], max_chars: int = 500, keywords: int = 5
+) -> List[Chunk]:
+    """
+    Chunk and annotate a batch of articles.
+
+    Args:
+        articles: Articles to chunk
+        max_chars: Chunk size limit
+        keywords: Keywords stored per chunk
+
+    Returns:
+        Chunks of every article, in order
+    """
+    chunks = []
+    for article in articles:
+        for index, (start, end) in enumerate(chunk_spans(article.text, max_chars)):
+            text = article.text[start:end]
+            content_hash = chunk_hash(text)
+            chunks.append(
+                Chunk(
+                    id=f"{content_hash:016x}",
+                    hash=content_hash,
+                    text=text,
+                    metadata={
+                        "language": article.language or detect_language(text)[0],
+                        "source": article.source,
+                        "url": article.url,
+                        "title": article.title,
+                        "snippet": text,
+                        "published_at": article.published_at,
+                        "keywords": [word for word, _ in extract_keywords(text, keywords)],
+                        "article_id": article.id,
+                        "chunk": index,
+                    },
+                    tokens=lexical_tokens(text),
+                )
+            )
+    return chunks
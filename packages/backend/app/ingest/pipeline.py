@@ -0,0 +1,342 @@
+"""
+Bulk ingestion of article dumps into the vector store and, optionally, the
+lexical index.
+
+Stages, each fed in file order:
+
+    read (main process) -> chunk + annotate (NLP process pool)
+        -> dedup (main) -> embed (embedding process pool) -> upsert (main)
+
+At most ``max_in_flight`` batches wait at each pool, so a slow stage holds
+back reading instead of letting batches pile up in memory: resident memory
+stays flat for any dump size (apart from the vector store itself, which for
+the local backend holds every vector).
+
+Progress is checkpointed every ``checkpoint_every`` chunks and on Ctrl-C: the
+store is snapshotted, then the set of ingested content hashes and the resume
+position of the last stored batch are written. A rerun with the same
+checkpoint directory resumes from there. Chunks are keyed by content hash, so
+upserts replayed after a crash overwrite rather than duplicate records.
+"""
+
+import json
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.ingest.chunker import Chunk, prepare_articles
+from app.ingest.reader import Article, read_articles
+from app.ingest.seen import HashSet
+from app.lexical.index import LexicalIndex
+from app.nlp.worker_pool import create_pool
+from app.vectorstore import VectorStore
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILE = "checkpoint.json"
+SEEN_FILE = "seen.npy"
+
+
+@dataclass
+class IngestStats:
+    """Running totals of an ingestion, kept across resumed runs."""
+
+    articles: int = 0
+    chunks: int = 0
+    duplicates: int = 0
+
+
+# ---------------------------------------------------------------------------
+# Embedding workers
+# ---------------------------------------------------------------------------
+
+
+class EmbeddingEncoder:
+    """
+    Picklable factory for the configured embedding model.
+
+    Called once in every embedding worker, so the model is loaded there
+    rather than pickled across.
+
+    Args:
+        threads: Torch intra-op threads per worker (0 = leave torch's default)
+    """
+
+    def __init__(self, threads: int = 0) -> None:
+        self.threads = threads
+
+    def __call__(self) -> Any:
+        from app.config import settings
+        from app.embeddings import EmbeddingModel
+
+        if self.threads:
+            import torch
+
+            torch.set_num_threads(self.threads)
+        return EmbeddingModel(
+            settings.embedding_model,
+            backend=settings.embedding_backend,
+            batch_size=settings.embedding_batch_size,
+        )
+
+
+_encoder: Any = None
+
+
+def _init_encoder(factory: Callable[[], Any]) -> None:
+    """Initializer run once in every embedding worker."""
+    global _encoder
+    _encoder = factory()
+
+
+def _encode(texts: List[str]) -> np.ndarray:
+    # float16 halves what is pickled back to the main process
+    return _encoder.encode(texts).astype(np.float16)
+
+
+class _InlineExecutor(Executor):
+    """Runs submitted calls immediately in the calling process (``workers=0``)."""
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+
+def _batched(
+    items: Iterator[Tuple[int, Article]], size: int
+) -> Iterator[List[Tuple[int, Article]]]:
+    batch: List[Tuple[int, Article]] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Prepared:
+    position: int
+    articles: int
+    chunks: Future
+
+
+@dataclass
+class _Embedding:
+    position: int
+    articles: int
+    chunks: List[Chunk]
+    duplicates: int
+    vectors: Optional[Future]
+
+
+class Ingestor:
+    """
+    Stream article dumps into a vector store.
+
+    Args:
+        store: Destination vector store
+        snapshot: Persists the store at checkpoints (e.g. ``save_vector_store``)
+            and the lexical index, if one is given
+        checkpoint_dir: Directory for resume state; None disables checkpointing
+        encoder_factory: Picklable callable returning an object with a batch
+            ``encode(List[str]) -> np.ndarray``; defaults to the configured model
+        chunk_chars: Chunk size limit in characters
+        keywords: Keywords stored per chunk
+        batch_articles: Articles per pipeline batch
+        nlp_workers: Chunking processes (0 = in the main process)
+        embed_workers: Embedding processes (0 = in the main process)
+        max_in_flight: Batches queued per stage before reading pauses
+        dedup_capacity: Slots of the content-hash set
+        checkpoint_every: Chunks stored between checkpoints
+        lexical: BM25 index that receives every stored chunk's terms
+    """
+
+    def __init__(
+        self,
+        store: VectorStore,
+        snapshot: Optional[Callable[[], None]] = None,
+        checkpoint_dir: Optional[str] = None,
+        encoder_factory: Optional[Callable[[], Any]] = None,
+        chunk_chars: int = 500,
+        keywords: int = 5,
+        batch_articles: int = 64,
+        nlp_workers: int = 0,
+        embed_workers: int = 0,
+        max_in_flight: int = 4,
+        dedup_capacity: int = 1 << 25,
+        checkpoint_every: int = 100_000,
+        lexical: Optional[LexicalIndex] = None,
+    ) -> None:
+        self.store = store
+        self.lexical = lexical
+        self.snapshot = snapshot
+        self.checkpoint_dir = checkpoint_dir
+        self.encoder_factory = encoder_factory or EmbeddingEncoder()
+        self.chunk_chars = chunk_chars
+        self.keywords = keywords
+        self.batch_articles = batch_articles
+        self.nlp_workers = nlp_workers
+        self.embed_workers = embed_workers
+        self.max_in_flight = max_in_flight
+        self.checkpoint_every = checkpoint_every
+
+        self.stats = IngestStats()
+        self.positions: Dict[str, int] = {}
+        self.seen = HashSet(dedup_capacity)
+        self._pending: Set[int] = set()
+        self._since_checkpoint = 0
+        self._load_checkpoint()
+
+    # ------------------------------------------------------------------
+    # Checkpoints
+    # ------------------------------------------------------------------
+
+    def _load_checkpoint(self) -> None:
+        if not self.checkpoint_dir:
+            return
+        path = os.path.join(self.checkpoint_dir, CHECKPOINT_FILE)
+        if not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        self.positions = state["positions"]
+        self.stats = IngestStats(**state["stats"])
+        self.seen = HashSet.load(os.path.join(self.checkpoint_dir, SEEN_FILE))
+        logger.info("Resuming ingestion: %s", self.stats)
+
+    def checkpoint(self) -> None:
+        """Snapshot the store, then record the hashes and positions stored so far."""
+        self._since_checkpoint = 0
+        if self.snapshot is not None:
+            self.snapshot()
+        if not self.checkpoint_dir:
+            return
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        self.seen.save(os.path.join(self.checkpoint_dir, SEEN_FILE))
+        path = os.path.join(self.checkpoint_dir, CHECKPOINT_FILE)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump({"positions": self.positions, "stats": asdict(self.stats)}, f)
+        os.replace(f"{path}.tmp", path)
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    def _dedup(self, chunks: List[Chunk]) -> List[Chunk]:
+        """Drop chunks already stored or already on their way to the store."""
+        fresh = []
+        for chunk in chunks:
+            if chunk.hash not in self._pending and chunk.hash not in self.seen:
+                self._pending.add(chunk.hash)
+                fresh.append(chunk)
+        return fresh
+
+    def _embed_next(
+        self, prepared: Deque[_Prepared], embedding: Deque[_Embedding], embed_pool: Executor
+    ) -> None:
+        batch = prepared.popleft()
+        chunks = batch.chunks.result()
+        fresh = self._dedup(chunks)
+        vectors = embed_pool.submit(_encode, [chunk.text for chunk in fresh]) if fresh else None
+        embedding.append(
+            _Embedding(batch.position, batch.articles, fresh, len(chunks) - len(fresh), vectors)
+        )
+
+    def _store_next(self, source: str, embedding: Deque[_Embedding]) -> None:
+        batch = embedding.popleft()
+        if batch.vectors is not None:
+            ids = [chunk.id for chunk in batch.chunks]
+            metadata = [chunk.metadata for chunk in batch.chunks]
+            self.store.upsert(ids, batch.vectors.result(), metadata)
+            if self.lexical is not None:
+                self.lexical.upsert(ids, [chunk.tokens for chunk in batch.chunks], metadata)
+            for chunk in batch.chunks:
+                self.seen.add(chunk.hash)
+                self._pending.discard(chunk.hash)
+
+        self.positions[source] = batch.position
+        self.stats.articles += batch.articles
+        self.stats.chunks += len(batch.chunks)
+        self.stats.duplicates += batch.duplicates
+        self._since_checkpoint += len(batch.chunks)
+        if self._since_checkpoint >= self.checkpoint_every:
+            self.checkpoint()
+            logger.info("Ingestion checkpoint: %s", self.stats)
+
+    def run(self, path: str) -> IngestStats:
+        """
+        Ingest one dump, resuming where a previous run over it stopped.
+
+        Args:
+            path: ``.jsonl`` or ``.parquet`` dump
+
+        Returns:
+            Totals over every run sharing this checkpoint directory
+        """
+        source = os.path.abspath(path)
+        nlp_pool: Executor = (
+            create_pool(self.nlp_workers) if self.nlp_workers > 0 else _InlineExecutor()
+        )
+        embed_pool: Executor = (
+            ProcessPoolExecutor(
+                self.embed_workers, initializer=_init_encoder, initargs=(self.encoder_factory,)
+            )
+            if self.embed_workers > 0
+            else _InlineExecutor()
+        )
+        if self.embed_workers == 0:
+            _init_encoder(self.encoder_factory)
+
+        prepared: Deque[_Prepared] = deque()
+        embedding: Deque[_Embedding] = deque()
+        started = time.monotonic()
+        try:
+            articles = read_articles(path, self.positions.get(source, 0))
+            for batch in _batched(articles, self.batch_articles):
+                prepared.append(
+                    _Prepared(
+                        position=batch[-1][0],
+                        articles=len(batch),
+                        chunks=nlp_pool.submit(
+                            prepare_articles,
+                            [article for _, article in batch],
+                            self.chunk_chars,
+                            self.keywords,
+                        ),
+                    )
+                )
+                # Backpressure: wait on the oldest batch of a full stage before reading on
+                if len(prepared) >= self.max_in_flight:
+                    self._embed_next(prepared, embedding, embed_pool)
+                if len(embedding) >= self.max_in_flight:
+                    self._store_next(source, embedding)
+
+            while prepared:
+                self._embed_next(prepared, embedding, embed_pool)
+            while embedding:
+                self._store_next(source, embedding)
+        finally:
+            # Everything up to the last stored batch is consistent, even on Ctrl-C
+            self.checkpoint()
+            nlp_pool.shutdown(wait=True, cancel_futures=True)
+            embed_pool.shutdown(wait=True, cancel_futures=True)
+
+        logger.info("Ingested %s in %.1fs", path, time.monotonic() - started)
+        return self.stats
@@ -0,0 +1,102 @@
+"""
+Streaming readers for crawler article dumps.
+
+Both formats are read incrementally and every article comes with a resume
+position: the byte offset just past its line for JSONL, or its row number
+plus one for Parquet. Passing a saved position back to ``read_articles``
+continues right after that article without re-reading what came before.
+
+``pyarrow`` is imported only when a Parquet file is read.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Article:
+    """One crawled article."""
+
+    id: str
+    text: str
+    url: str = ""
+    title: str = ""
+    source: str = ""
+    published_at: Optional[str] = None
+    language: Optional[str] = None  # detected per chunk when missing
+
+
+def _to_article(record: Dict[str, Any], fallback_id: str) -> Optional[Article]:
+    """Map a crawler record to an ``Article``; records without text are skipped."""
+    text = record.get("text") or record.get("content") or ""
+    if not isinstance(text, str) or not text.strip():
+        return None
+    return Article(
+        id=str(record.get("id") or record.get("url") or fallback_id),
+        text=text,
+        url=record.get("url") or "",
+        title=record.get("title") or "",
+        source=record.get("source") or "",
+        published_at=record.get("published_at"),
+        language=record.get("language"),
+    )
+
+
+def _read_jsonl(path: str, position: int) -> Iterator[Tuple[int, Article]]:
+    with open(path, "rb") as f:
+        f.seek(position)
+        for line in f:
+            position += len(line)
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                logger.warning("Skipping malformed JSON line ending at byte %d", position)
+                continue
+            article = _to_article(record, f"{path}@{position}")
+            if article is not None:
+                yield position, article
+
+
+def _read_parquet(path: str, position: int, batch_size: int) -> Iterator[Tuple[int, Article]]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError("Reading Parquet dumps requires pyarrow") from exc
+
+    row = 0
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+        if row + batch.num_rows <= position:
+            row += batch.num_rows
+            continue
+        for record in batch.to_pylist():
+            row += 1
+            if row <= position:
+                continue
+            article = _to_article(record, f"{path}#{row}")
+            if article is not None:
+                yield row, article
+
+
+def read_articles(
+    path: str, position: int = 0, batch_size: int = 1_024
+) -> Iterator[Tuple[int, Article]]:
+    """
+    Stream the articles of a ``.jsonl`` or ``.parquet`` dump.
+
+    Args:
+        path: Dump file; ``.parquet`` files are read with pyarrow, anything else as JSONL
+        position: Resume position returned with a previously read article
+        batch_size: Rows decoded at a time from Parquet
+
+    Yields:
+        ``(resume_position, article)`` pairs in file order
+    """
+    if path.endswith(".parquet"):
+        return _read_parquet(path, position, batch_size)
+    return _read_jsonl(path, position)
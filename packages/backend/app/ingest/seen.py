@@ -0,0 +1,88 @@
+"""
+Fixed-size set of 64-bit content hashes.
+
+A Python set of tens of millions of ints takes several gigabytes and keeps
+growing; this open-addressing table is one preallocated ``uint64`` array
+(8 bytes per slot), so ingestion memory stays flat however many chunks pass
+through. It is saved alongside the ingestion checkpoint.
+"""
+
+import os
+
+import numpy as np
+
+# Past this load factor linear probing slows down sharply
+MAX_LOAD = 0.8
+
+
+class HashSet:
+    """
+    Open-addressing set of nonzero 64-bit hashes with linear probing.
+
+    Args:
+        capacity: Slots, rounded up to a power of two; holds ``MAX_LOAD`` of that
+    """
+
+    def __init__(self, capacity: int = 1 << 25) -> None:
+        size = 1 << max(capacity - 1, 1).bit_length()
+        self._slots = np.zeros(size, dtype=np.uint64)
+        self._mask = size - 1
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return len(self._slots)
+
+    @property
+    def nbytes(self) -> int:
+        return self._slots.nbytes
+
+    def _find(self, value: int) -> int:
+        """Slot holding ``value``, or the empty slot where it would go."""
+        slots = self._slots
+        slot = (value ^ (value >> 29)) & self._mask
+        while True:
+            current = int(slots[slot])
+            if current == 0 or current == value:
+                return slot
+            slot = (slot + 1) & self._mask
+
+    def __contains__(self, value: int) -> bool:
+        return int(self._slots[self._find(value)]) != 0
+
+    def add(self, value: int) -> bool:
+        """
+        Insert a hash.
+
+        Returns:
+            True if it was not in the set yet
+
+        Raises:
+            OverflowError: If the set is full to ``MAX_LOAD``
+        """
+        slot = self._find(value)
+        if self._slots[slot] != 0:
+            return False
+        if self._count >= MAX_LOAD * len(self._slots):
+            raise OverflowError(f"HashSet is full at {self._count:,} hashes; raise its capacity")
+        self._slots[slot] = value
+        self._count += 1
+        return True
+
+    def save(self, path: str) -> None:
+        """Write the table to ``path`` (a ``.npy`` file), replacing it atomically."""
+        tmp = f"{path}.tmp.npy"
+        np.save(tmp, self._slots)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "HashSet":
+        """Read a table written by ``save``."""
+        table = cls.__new__(cls)
+        table._slots = np.load(path)
+        table._mask = len(table._slots) - 1
+        table._count = int(np.count_nonzero(table._slots))
+        return table
@@ -0,0 +1,48 @@
+"""BM25 lexical search module, fused with vector search by reciprocal rank."""
+
+import os
+from typing import Optional
+
+from app.config import settings
+from app.lexical.fusion import reciprocal_rank_fusion
+from app.lexical.index import LexicalIndex
+from app.lexical.postings import decode_rows, encode_rows, varint_decode, varint_encode
+from app.lexical.tokens import STOPWORDS, lexical_tokens
+
+_index: Optional[LexicalIndex] = None
+
+
+def get_lexical_index() -> LexicalIndex:
+    """
+    Get the shared lexical index, creating it on first use.
+
+    Restores the snapshot at ``settings.lexical_index_path`` when one exists.
+    """
+    global _index
+    if _index is None:
+        path = settings.lexical_index_path
+        if path and os.path.exists(os.path.join(path, "manifest.json")):
+            _index = LexicalIndex.restore(path)
+        else:
+            _index = LexicalIndex(k1=settings.lexical_bm25_k1, b=settings.lexical_bm25_b)
+    return _index
+
+
+def save_lexical_index() -> None:
+    """Snapshot the lexical index to ``settings.lexical_index_path``, if configured."""
+    if _index is not None and settings.lexical_index_path:
+        _index.snapshot(settings.lexical_index_path)
+
+
+__all__ = [
+    "LexicalIndex",
+    "STOPWORDS",
+    "decode_rows",
+    "encode_rows",
+    "get_lexical_index",
+    "lexical_tokens",
+    "reciprocal_rank_fusion",
+    "save_lexical_index",
+    "varint_decode",
+    "varint_encode",
+]
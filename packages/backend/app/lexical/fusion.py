@@ -0,0 +1,29 @@
+"""
+Reciprocal-rank fusion.
+
+Each ranking contributes ``1 / (k + rank)`` to a document's fused score, with
+ranks starting at 1. Only ranks matter, so BM25 scores and cosine
+similarities can be combined without calibrating one against the other.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[str]], k: int = 60
+) -> List[Tuple[str, float]]:
+    """
+    Fuse several rankings of document IDs.
+
+    Args:
+        rankings: ID lists, each best first
+        k: Rank offset; larger values weigh the top ranks less
+
+    Returns:
+        ``(id, score)`` pairs, best first; ties keep first-seen order
+    """
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: -item[1])
@@ -0,0 +1,528 @@
+"""
+In-process BM25 inverted index.
+
+Documents are numbered by insertion row. New documents collect in a small
+in-memory tail; every ``segment_size`` documents the tail is sealed into an
+immutable segment, a CSR layout over sorted term IDs whose postings are
+delta-encoded varint rows (see ``app.lexical.postings``) plus a ``uint16``
+term frequency each. When more than ``max_segments`` segments exist they are
+merged into one, which also drops the postings of deleted documents.
+
+Queries decode only the postings of their own terms and score them with
+BM25 in a few numpy passes. Snapshots are ``.npy`` / JSON files; ``restore``
+memory-maps the postings.
+"""
+
+import json
+import math
+import os
+import threading
+from array import array
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.lexical.postings import decode_rows, varint_decode, varint_encode, varint_lengths
+
+SNAPSHOT_VERSION = 1
+
+_SEGMENT_ARRAYS = ("terms", "byte_offsets", "posting_offsets", "data", "tfs")
+
+_MAX_TF = np.iinfo(np.uint16).max
+
+# Queries matching more than 1 / _DENSE_FRACTION postings per row accumulate
+# scores densely instead of sorting
+_DENSE_FRACTION = 4
+
+# Postings expanded at a time while merging segments, bounding merge memory
+_MERGE_POSTINGS = 4_000_000
+
+
+class _Segment:
+    """Immutable postings of some rows, indexed by sorted term ID."""
+
+    def __init__(
+        self,
+        terms: np.ndarray,
+        byte_offsets: np.ndarray,
+        posting_offsets: np.ndarray,
+        data: np.ndarray,
+        tfs: np.ndarray,
+    ) -> None:
+        self.terms = terms
+        self.byte_offsets = byte_offsets
+        self.posting_offsets = posting_offsets
+        self.data = data
+        self.tfs = tfs
+
+    @classmethod
+    def build(cls, terms: np.ndarray, rows: np.ndarray, tfs: np.ndarray) -> "_Segment":
+        """Seal postings given as parallel arrays sorted by term, then row."""
+        starts = np.flatnonzero(np.r_[True, terms[1:] != terms[:-1]]) if len(terms) else terms
+        ends = np.r_[starts[1:], len(rows)].astype(np.int64)
+
+        # Gaps restart at every term: the first posting of a term stores its row
+        gaps = rows.astype(np.int64)
+        gaps[1:] -= rows[:-1]
+        gaps[starts] = rows[starts]
+        byte_ends = np.r_[0, np.cumsum(varint_lengths(gaps))]
+
+        return cls(
+            terms=terms[starts].astype(np.uint32),
+            byte_offsets=np.r_[0, byte_ends[ends]].astype(np.int64)[: len(starts) + 1],
+            posting_offsets=np.r_[starts, len(rows)].astype(np.int64),
+            data=varint_encode(gaps),
+            tfs=np.minimum(tfs, _MAX_TF).astype(np.uint16),
+        )
+
+    @classmethod
+    def concatenate(cls, parts: List["_Segment"]) -> "_Segment":
+        """Join segments covering consecutive, disjoint ranges of term IDs."""
+        byte_shift = np.cumsum([0] + [len(part.data) for part in parts])
+        posting_shift = np.cumsum([0] + [len(part.tfs) for part in parts])
+        return cls(
+            terms=np.concatenate([part.terms for part in parts]),
+            byte_offsets=np.concatenate(
+                [part.byte_offsets[:-1] + shift for part, shift in zip(parts, byte_shift)]
+                + [byte_shift[-1:]]
+            ),
+            posting_offsets=np.concatenate(
+                [part.posting_offsets[:-1] + shift for part, shift in zip(parts, posting_shift)]
+                + [posting_shift[-1:]]
+            ),
+            data=np.concatenate([part.data for part in parts]),
+            tfs=np.concatenate([part.tfs for part in parts]),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in _SEGMENT_ARRAYS)
+
+    def postings(self, term_id: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Rows and term frequencies of one term, or None if it does not occur."""
+        i = int(np.searchsorted(self.terms, term_id))
+        if i == len(self.terms) or self.terms[i] != term_id:
+            return None
+        rows = decode_rows(self.data[self.byte_offsets[i] : self.byte_offsets[i + 1]])
+        return rows, self.tfs[self.posting_offsets[i] : self.posting_offsets[i + 1]]
+
+    def expand(self, first_term: int, end_term: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Postings of the term IDs in ``[first_term, end_term)`` as (term, row, tf) arrays."""
+        lo, hi = np.searchsorted(self.terms, [first_term, end_term])
+        posting_offsets = self.posting_offsets[lo : hi + 1]
+        counts = np.diff(posting_offsets)
+        starts = posting_offsets[:-1] - posting_offsets[0]
+        totals = np.cumsum(
+            varint_decode(self.data[self.byte_offsets[lo] : self.byte_offsets[hi]]),
+            dtype=np.int64,
+        )
+        # Undo the running sum across term boundaries
+        before = np.where(starts > 0, totals[np.maximum(starts - 1, 0)], 0)
+        rows = totals - np.repeat(before, counts)
+        tfs = np.asarray(self.tfs[posting_offsets[0] : posting_offsets[-1]])
+        return np.repeat(self.terms[lo:hi], counts), rows, tfs
+
+
+class LexicalIndex:
+    """
+    BM25 index over pre-tokenized documents.
+
+    Args:
+        k1: BM25 term-frequency saturation
+        b: BM25 document-length normalization
+        segment_size: Documents buffered before they are sealed into a segment
+        max_segments: Segments kept before they are merged into one
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        segment_size: int = 100_000,
+        max_segments: int = 8,
+    ) -> None:
+        self.k1 = k1
+        self.b = b
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+        self._lock = threading.RLock()
+
+        self._vocabulary: Dict[str, int] = {}
+        self._df = np.zeros(0, dtype=np.int64)
+
+        self._size = 0
+        self._ids: List[str] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._lengths = np.zeros(0, dtype=np.uint32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._language_codes = np.zeros(0, dtype=np.int32)
+        self._source_codes = np.zeros(0, dtype=np.int32)
+        self._languages: Dict[str, int] = {}
+        self._sources: Dict[str, int] = {}
+
+        self._segments: List[_Segment] = []
+        # Buffered postings per term: rows and term frequencies as compact arrays
+        self._tail: Dict[int, Tuple[array, array]] = {}
+        self._tail_docs = 0
+
+    def __len__(self) -> int:
+        return len(self._row_by_id)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held in arrays: postings, document frequencies and per-document columns."""
+        columns = (self._df, self._lengths, self._alive, self._language_codes, self._source_codes)
+        return sum(segment.nbytes for segment in self._segments) + sum(
+            array.nbytes for array in columns
+        )
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _reserve(self, extra: int) -> None:
+        """Grow the row arrays geometrically so appends are amortized O(1)."""
+        needed = self._size + extra
+        capacity = len(self._lengths)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2, 1024)
+
+        def grow(array: np.ndarray) -> np.ndarray:
+            grown = np.zeros(new_capacity, dtype=array.dtype)
+            grown[: self._size] = array[: self._size]
+            return grown
+
+        self._lengths = grow(self._lengths)
+        self._alive = grow(self._alive)
+        self._language_codes = grow(self._language_codes)
+        self._source_codes = grow(self._source_codes)
+
+    def _term_id(self, term: str) -> int:
+        term_id = self._vocabulary.get(term)
+        if term_id is None:
+            term_id = len(self._vocabulary)
+            self._vocabulary[term] = term_id
+            if term_id >= len(self._df):
+                df = np.zeros(max(len(self._df) * 2, 1024), dtype=np.int64)
+                df[: len(self._df)] = self._df
+                self._df = df
+        return term_id
+
+    @staticmethod
+    def _code(codes: Dict[str, int], value: Any) -> int:
+        return codes.setdefault(str(value or ""), len(codes))
+
+    def upsert(
+        self,
+        ids: Sequence[str],
+        tokens: Sequence[Sequence[str]],
+        metadata: Sequence[Dict[str, Any]],
+    ) -> None:
+        """
+        Index documents, replacing any existing ones with the same ID.
+
+        Args:
+            ids: Document IDs, shared with the vector store
+            tokens: ``lexical_tokens`` of each document
+            metadata: Per-document metadata; ``language`` and ``source`` are
+                kept for filtering
+        """
+        with self._lock:
+            self.delete(ids)
+            self._reserve(len(ids))
+            for record_id, terms, meta in zip(ids, tokens, metadata):
+                row = self._size
+                self._size += 1
+                self._ids.append(record_id)
+                self._row_by_id[record_id] = row
+                self._lengths[row] = len(terms)
+                self._alive[row] = True
+                self._language_codes[row] = self._code(self._languages, meta.get("language"))
+                self._source_codes[row] = self._code(self._sources, meta.get("source"))
+
+                for term, tf in Counter(terms).items():
+                    term_id = self._term_id(term)
+                    self._df[term_id] += 1
+                    postings = self._tail.get(term_id)
+                    if postings is None:
+                        postings = self._tail[term_id] = (array("I"), array("H"))
+                    postings[0].append(row)
+                    postings[1].append(min(tf, _MAX_TF))
+                self._tail_docs += 1
+
+            if self._tail_docs >= self.segment_size:
+                self.flush()
+
+    def delete(self, ids: Sequence[str]) -> None:
+        """Remove documents by ID; their postings are dropped at the next merge."""
+        with self._lock:
+            for record_id in ids:
+                row = self._row_by_id.pop(record_id, None)
+                if row is not None:
+                    self._alive[row] = False
+
+    def flush(self) -> None:
+        """Seal the buffered documents into a segment, merging segments if there are too many."""
+        with self._lock:
+            if not self._tail:
+                return
+            # Rows are appended in ascending order, so each term's list is already sorted
+            term_ids = sorted(self._tail)
+            postings = [self._tail[term_id] for term_id in term_ids]
+            counts = [len(rows) for rows, _ in postings]
+            self._tail = {}
+            self._segments.append(
+                _Segment.build(
+                    np.repeat(np.array(term_ids, dtype=np.uint32), counts),
+                    np.concatenate([np.array(rows, dtype=np.int64) for rows, _ in postings]),
+                    np.concatenate([np.array(tfs, dtype=np.uint16) for _, tfs in postings]),
+                )
+            )
+            del postings
+            self._tail_docs = 0
+
+            if len(self._segments) > self.max_segments:
+                self.merge()
+
+    def merge(self) -> None:
+        """Merge all segments into one, dropping deleted documents' postings."""
+        with self._lock:
+            self._rewrite()
+
+    def _rewrite(self, remap: Optional[np.ndarray] = None) -> None:
+        """
+        Merge the segments into one, a slice of the vocabulary at a time.
+
+        Each slice holds about ``_MERGE_POSTINGS`` postings, so a merge needs
+        memory for the merged segment plus one slice rather than for every
+        posting in expanded form.
+
+        Args:
+            remap: New row number of every row, applied to the live postings
+        """
+        if not self._segments:
+            return
+        vocabulary_size = len(self._vocabulary)
+        cumulative = np.cumsum(self._df[:vocabulary_size])
+        cuts = np.arange(_MERGE_POSTINGS, cumulative[-1], _MERGE_POSTINGS)
+        bounds = np.unique(np.r_[0, np.searchsorted(cumulative, cuts), vocabulary_size])
+
+        parts, df = [], np.zeros(len(self._df), dtype=np.int64)
+        for first_term, end_term in zip(bounds[:-1], bounds[1:]):
+            pieces = [segment.expand(first_term, end_term) for segment in self._segments]
+            terms = np.concatenate([piece[0] for piece in pieces])
+            rows = np.concatenate([piece[1] for piece in pieces])
+            tfs = np.concatenate([piece[2] for piece in pieces])
+            del pieces
+
+            live = self._alive[rows]
+            terms, rows, tfs = terms[live], rows[live], tfs[live]
+            if remap is not None:
+                rows = remap[rows]
+            # Segments cover increasing rows, so the concatenation is row-ordered per term
+            order = np.argsort(terms, kind="stable")
+            parts.append(_Segment.build(terms[order], rows[order], tfs[order]))
+            df[first_term:end_term] = np.bincount(
+                terms - first_term, minlength=end_term - first_term
+            )
+
+        self._segments = [_Segment.concatenate(parts)]
+        for term_id, (tail_rows, _) in self._tail.items():
+            df[term_id] += len(tail_rows)
+        self._df = df
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _filter_mask(
+        self,
+        rows: np.ndarray,
+        languages: Optional[Sequence[str]],
+        sources: Optional[Sequence[str]],
+    ) -> np.ndarray:
+        mask = self._alive[rows]
+        if languages:
+            codes = [self._languages[v] for v in languages if v in self._languages]
+            mask &= np.isin(self._language_codes[rows], codes)
+        if sources:
+            codes = [self._sources[v] for v in sources if v in self._sources]
+            mask &= np.isin(self._source_codes[rows], codes)
+        return mask
+
+    def search(
+        self,
+        tokens: Sequence[str],
+        top_k: int = 10,
+        languages: Optional[Sequence[str]] = None,
+        sources: Optional[Sequence[str]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Return the ``top_k`` documents with the highest BM25 score.
+
+        Args:
+            tokens: ``lexical_tokens`` of the query
+            top_k: Number of results
+            languages: Only return documents whose ``language`` is in this list
+            sources: Only return documents whose ``source`` is in this list
+
+        Returns:
+            ``(id, score)`` pairs, best first
+        """
+        with self._lock:
+            term_ids = {self._vocabulary[t] for t in tokens if t in self._vocabulary}
+            if not term_ids or not len(self):
+                return []
+
+            # Deleted rows stay in the statistics until a merge, consistently with df
+            num_docs = self._size
+            average_length = max(float(self._lengths[: self._size].mean()), 1.0)
+
+            all_rows, all_scores = [], []
+            for term_id in term_ids:
+                df = int(self._df[term_id])
+                idf = math.log(1.0 + (num_docs - df + 0.5) / (df + 0.5))
+                postings = [segment.postings(term_id) for segment in self._segments]
+                if term_id in self._tail:
+                    tail_rows, tail_tfs = self._tail[term_id]
+                    postings.append(
+                        (np.array(tail_rows, dtype=np.int64), np.array(tail_tfs, dtype=np.uint16))
+                    )
+                for rows, tfs in filter(None, postings):
+                    tfs = tfs.astype(np.float32)
+                    norm = self.k1 * (1 - self.b + self.b * self._lengths[rows] / average_length)
+                    all_rows.append(rows)
+                    all_scores.append(idf * tfs * (self.k1 + 1) / (tfs + norm))
+
+            if not all_rows:
+                return []
+            rows = np.concatenate(all_rows)
+            scores = np.concatenate(all_scores)
+            keep = self._filter_mask(rows, languages, sources)
+            rows, scores = rows[keep], scores[keep]
+            if len(rows) == 0:
+                return []
+
+            if len(rows) * _DENSE_FRACTION > self._size:
+                # Frequent terms: summing into one slot per row beats sorting the postings
+                totals = np.bincount(rows, weights=scores, minlength=self._size)
+                rows = np.flatnonzero(totals)
+                totals = totals[rows]
+            else:
+                rows, inverse = np.unique(rows, return_inverse=True)
+                totals = np.bincount(inverse, weights=scores)
+            if len(rows) > top_k:
+                best = np.argpartition(-totals, top_k)[:top_k]
+                rows, totals = rows[best], totals[best]
+            order = np.argsort(-totals, kind="stable")
+            return [(self._ids[rows[i]], float(totals[i])) for i in order]
+
+    # ------------------------------------------------------------------
+    # Snapshot / restore
+    # ------------------------------------------------------------------
+
+    def _compact(self) -> None:
+        """Merge the segments into one and renumber live rows densely; the tail must be empty."""
+        live = np.flatnonzero(self._alive[: self._size])
+        if len(live) == self._size:
+            if len(self._segments) > 1:
+                self._rewrite()
+            return
+
+        self._rewrite(remap=np.cumsum(self._alive[: self._size]) - 1)
+        self._ids = [self._ids[row] for row in live]
+        self._row_by_id = {record_id: row for row, record_id in enumerate(self._ids)}
+        self._lengths = self._lengths[live]
+        self._language_codes = self._language_codes[live]
+        self._source_codes = self._source_codes[live]
+        self._alive = np.ones(len(live), dtype=bool)
+        self._size = len(live)
+
+    def snapshot(self, path: str) -> None:
+        """
+        Write the index to ``path`` (a directory), replacing any previous snapshot.
+
+        Buffered documents are sealed, all segments merged and deleted rows
+        compacted away first.
+        """
+        with self._lock:
+            self.flush()
+            self._compact()
+            tmp = f"{path}.tmp"
+            os.makedirs(tmp, exist_ok=True)
+
+            segment = self._segments[0] if self._segments else _Segment.build(
+                *(np.zeros(0, dtype=np.int64) for _ in range(3))
+            )
+            for name in _SEGMENT_ARRAYS:
+                np.save(os.path.join(tmp, f"{name}.npy"), getattr(segment, name))
+            np.save(os.path.join(tmp, "df.npy"), self._df[: len(self._vocabulary)])
+            np.save(os.path.join(tmp, "lengths.npy"), self._lengths[: self._size])
+            np.save(os.path.join(tmp, "alive.npy"), self._alive[: self._size])
+            np.save(os.path.join(tmp, "language_codes.npy"), self._language_codes[: self._size])
+            np.save(os.path.join(tmp, "source_codes.npy"), self._source_codes[: self._size])
+
+            with open(os.path.join(tmp, "ids.json"), "w", encoding="utf-8") as f:
+                json.dump(self._ids, f, ensure_ascii=False)
+            manifest = {
+                "version": SNAPSHOT_VERSION,
+                "k1": self.k1,
+                "b": self.b,
+                "segment_size": self.segment_size,
+                "max_segments": self.max_segments,
+                "vocabulary": list(self._vocabulary),
+                "languages": list(self._languages),
+                "sources": list(self._sources),
+            }
+            with open(os.path.join(tmp, "manifest.json"), "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False)
+
+            if os.path.isdir(path):
+                old = f"{path}.old"
+                os.replace(path, old)
+                os.replace(tmp, path)
+                for name in os.listdir(old):
+                    os.remove(os.path.join(old, name))
+                os.rmdir(old)
+            else:
+                os.replace(tmp, path)
+
+    @classmethod
+    def restore(cls, path: str) -> "LexicalIndex":
+        """Load a snapshot written by ``snapshot``, memory-mapping the postings."""
+        with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest["version"] != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported lexical index snapshot version {manifest['version']}")
+
+        index = cls(
+            k1=manifest["k1"],
+            b=manifest["b"],
+            segment_size=manifest["segment_size"],
+            max_segments=manifest["max_segments"],
+        )
+
+        def load(name: str, mmap: bool = False) -> np.ndarray:
+            return np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r" if mmap else None)
+
+        segment = _Segment(*(load(name, mmap=True) for name in _SEGMENT_ARRAYS))
+        if len(segment.terms):
+            index._segments = [segment]
+        index._vocabulary = {term: i for i, term in enumerate(manifest["vocabulary"])}
+        index._languages = {value: i for i, value in enumerate(manifest["languages"])}
+        index._sources = {value: i for i, value in enumerate(manifest["sources"])}
+        index._df = load("df")
+        index._lengths = load("lengths")
+        index._alive = load("alive")
+        index._language_codes = load("language_codes")
+        index._source_codes = load("source_codes")
+
+        with open(os.path.join(path, "ids.json"), encoding="utf-8") as f:
+            index._ids = json.load(f)
+        index._size = len(index._ids)
+        index._row_by_id = {
+            record_id: row for row, record_id in enumerate(index._ids) if index._alive[row]
+        }
+        return index
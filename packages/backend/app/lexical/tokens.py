@@ -0,0 +1,49 @@
+"""
+Tokens for lexical search.
+
+Numbers are kept whole together with a following percent sign or Chinese
+magnitude, so "30%" and "6.9亿" are single terms, the same strings
+``CLAIM_PATTERNS`` keys on. Runs of Han characters are segmented with
+``tokenize_chinese``; any other letters split on whitespace and punctuation.
+Everything is NFKC-normalized, folded to Simplified characters and lowercased
+first, so full-width digits and Latin letters match their ASCII forms and
+Traditional text matches Simplified.
+"""
+
+import re
+from typing import List
+
+from app.nlp.script import normalize_script
+from app.nlp.tokenizer import tokenize_chinese
+
+STOPWORDS = frozenset(
+    "的 了 是 在 和 与 及 也 就 都 而 或 被 把 这 那 有 之 "
+    "a an the of to and or in on at by for with as is are was were be been it that this".split()
+)
+
+_TOKEN = re.compile(
+    r"(?P<number>\d+(?:[.,]\d+)*(?:%|万亿|亿|万|千|百)?)"
+    r"|(?P<han>[㐀-鿿豈-﫿]+)"
+    r"|(?P<word>[^\W\d_]+)"
+)
+
+
+def lexical_tokens(text: str) -> List[str]:
+    """
+    Split text into BM25 terms.
+
+    Args:
+        text: Document or query text in any language
+
+    Returns:
+        Terms in order, stopwords removed
+    """
+    tokens: List[str] = []
+    for match in _TOKEN.finditer(normalize_script(text).lower()):
+        if match["han"]:
+            tokens.extend(t for t in tokenize_chinese(match["han"]) if t not in STOPWORDS)
+        elif match["number"]:
+            tokens.append(match["number"].replace(",", ""))
+        elif match["word"] not in STOPWORDS:
+            tokens.append(match["word"])
+    return tokens
@@ -0,0 +1,90 @@
+"""LLM provider client module."""
+
+from typing import List, Optional
+
+from app.config import settings
+from app.llm.client import LLMClient, request_hash
+from app.llm.prompts import Verdict, build_verdict_request, parse_verdict
+from app.llm.providers import (
+    AnthropicProvider,
+    LLMError,
+    LLMProvider,
+    LLMRequest,
+    LLMResponse,
+    OpenAIProvider,
+    RetryableLLMError,
+)
+
+_client: Optional[LLMClient] = None
+
+
+def _configured_providers() -> List[LLMProvider]:
+    """Providers from ``LLM_PROVIDERS`` that have an API key, in failover order."""
+    providers: List[LLMProvider] = []
+    common = {
+        "timeout": settings.llm_timeout_seconds,
+        "max_connections": settings.llm_max_concurrency,
+    }
+    for name in settings.llm_providers_list:
+        if name == "claude" and settings.claude_api_key:
+            providers.append(
+                AnthropicProvider(
+                    settings.claude_api_key,
+                    settings.claude_model,
+                    settings.claude_base_url,
+                    **common,
+                )
+            )
+        elif name == "openai" and settings.openai_api_key:
+            providers.append(
+                OpenAIProvider(
+                    settings.openai_api_key,
+                    settings.openai_model,
+                    settings.openai_base_url,
+                    **common,
+                )
+            )
+    return providers
+
+
+def get_llm_client() -> Optional[LLMClient]:
+    """Get the shared LLM client, or None if no provider has an API key."""
+    global _client
+    if _client is None:
+        providers = _configured_providers()
+        if not providers:
+            return None
+        _client = LLMClient(
+            providers,
+            max_concurrency=settings.llm_max_concurrency,
+            max_attempts=settings.llm_max_attempts,
+            cache_max_entries=settings.llm_cache_max_entries,
+            cache_ttl=settings.llm_cache_ttl_seconds,
+        )
+    return _client
+
+
+async def close_llm_client() -> None:
+    """Close the shared client's connection pools, if it was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+__all__ = [
+    "AnthropicProvider",
+    "LLMClient",
+    "LLMError",
+    "LLMProvider",
+    "LLMRequest",
+    "LLMResponse",
+    "OpenAIProvider",
+    "RetryableLLMError",
+    "Verdict",
+    "build_verdict_request",
+    "close_llm_client",
+    "get_llm_client",
+    "parse_verdict",
+    "request_hash",
+]
@@ -0,0 +1,190 @@
+"""
+LLM client: bounded concurrency, retries, failover, coalescing and caching.
+
+A completion request goes through these layers:
+
+1. Response cache - deterministic requests (``temperature == 0``) are cached
+   by request hash, so repeated verdict prompts are answered without a call.
+2. Coalescing - identical requests already in flight share one call.
+3. Failover - providers are tried in order; the next one is used once a
+   provider has exhausted its retries or failed permanently.
+4. Retries - retryable failures (429, 5xx, timeouts) are retried with
+   exponential backoff and jitter, honoring ``Retry-After`` when present.
+5. Concurrency - each provider allows at most ``max_concurrency`` requests at
+   once; backoff sleeps do not hold a slot.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Dict, List, Optional, Sequence
+
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from app.cache.lru import TTLCache
+from app.llm.providers import LLMError, LLMProvider, LLMRequest, LLMResponse, RetryableLLMError
+from app.metrics import LLM_REQUESTS, record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+
+def request_hash(request: LLMRequest) -> str:
+    """
+    Hash a request independently of the provider that will serve it.
+
+    Args:
+        request: Completion request
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps(
+        [request.system, request.prompt, request.max_tokens, request.temperature],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMClient:
+    """
+    Completion client over one or more providers.
+
+    Args:
+        providers: Providers in failover order
+        max_concurrency: Maximum in-flight requests per provider
+        max_attempts: Attempts per provider before failing over
+        max_backoff: Upper bound on a single backoff sleep in seconds
+        cache_max_entries: Maximum cached responses (0 disables the cache)
+        cache_ttl: Lifetime of a cached response in seconds
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[LLMProvider],
+        max_concurrency: int = 16,
+        max_attempts: int = 3,
+        max_backoff: float = 10.0,
+        cache_max_entries: int = 10_000,
+        cache_ttl: float = 86_400.0,
+    ) -> None:
+        if not providers:
+            raise ValueError("LLMClient needs at least one provider")
+        self.providers = list(providers)
+        self.max_attempts = max_attempts
+        self.max_backoff = max_backoff
+        self._backoff = wait_exponential_jitter(multiplier=0.5, max=max_backoff)
+        self._slots = {provider.name: asyncio.Semaphore(max_concurrency) for provider in providers}
+        self._cache: Optional[TTLCache[LLMResponse]] = (
+            TTLCache(cache_max_entries, cache_ttl) if cache_max_entries > 0 else None
+        )
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.calls = 0
+        self.retries = 0
+        self.failovers = 0
+        self.coalesced = 0
+        self.cache_hits = 0
+
+    def _wait(self, state: RetryCallState) -> float:
+        exc = state.outcome.exception() if state.outcome else None
+        if isinstance(exc, RetryableLLMError) and exc.retry_after is not None:
+            return min(exc.retry_after, self.max_backoff)
+        return self._backoff(state)
+
+    def _before_sleep(self, state: RetryCallState) -> None:
+        self.retries += 1
+        exc = state.outcome.exception() if state.outcome else None
+        logger.info("Retrying LLM request (attempt %d): %s", state.attempt_number, exc)
+
+    async def _call_provider(self, provider: LLMProvider, request: LLMRequest) -> LLMResponse:
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.max_attempts),
+            wait=self._wait,
+            retry=retry_if_exception_type(RetryableLLMError),
+            before_sleep=self._before_sleep,
+            reraise=True,
+        )
+        async for attempt in retrying:
+            with attempt:
+                async with self._slots[provider.name]:
+                    self.calls += 1
+                    try:
+                        response = await provider.complete(request)
+                    except RetryableLLMError:
+                        LLM_REQUESTS.labels(provider.name, "retryable_error").inc()
+                        raise
+                    except LLMError:
+                        LLM_REQUESTS.labels(provider.name, "error").inc()
+                        raise
+                    LLM_REQUESTS.labels(provider.name, "success").inc()
+                    return response
+        raise AssertionError("unreachable")  # reraise=True always raises on exhaustion
+
+    async def _complete_uncached(self, request: LLMRequest) -> LLMResponse:
+        errors: List[LLMError] = []
+        for index, provider in enumerate(self.providers):
+            if index:
+                self.failovers += 1
+            try:
+                return await self._call_provider(provider, request)
+            except LLMError as exc:
+                logger.warning("LLM provider %s failed: %s", provider.name, exc)
+                errors.append(exc)
+        raise errors[-1]
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        """
+        Complete a request, using the cache and sharing identical in-flight calls.
+
+        Args:
+            request: Completion request
+
+        Returns:
+            The response from the first provider that succeeded
+
+        Raises:
+            LLMError: If every provider failed; the last provider's error is raised
+        """
+        key = request_hash(request)
+        cacheable = self._cache is not None and request.temperature == 0
+        if cacheable:
+            cached = self._cache.get(key)
+            record_cache_lookup("llm", hit=cached is not None)
+            if cached is not None:
+                self.cache_hits += 1
+                return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await self._complete_uncached(request)
+            if cacheable:
+                self._cache.set(key, response)
+            future.set_result(response)
+            return response
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Waiters receive the exception; mark it retrieved for the leader
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def aclose(self) -> None:
+        """Close every provider's connection pool."""
+        await asyncio.gather(*(provider.aclose() for provider in self.providers))
@@ -0,0 +1,85 @@
+"""
+Verdict prompt construction and response parsing.
+"""
+
+import json
+import re
+from typing import NamedTuple, Sequence
+
+from app.llm.providers import LLMRequest
+from app.pipeline.types import RetrievedEvidence
+
+VERDICTS = ("true", "false", "partly_true", "unverified")
+
+# Kept byte-for-byte stable across requests: it is the cached prompt prefix
+VERDICT_SYSTEM_PROMPT = """你是一名严谨的事实核查员。根据给出的证据判断声明是否属实。
+
+规则：
+- 只依据提供的证据作判断；证据不足时结论为 "unverified"。
+- 注意翻译或转述造成的数字、人名、机构名差异。
+- 用声明所用的语言撰写简短摘要（不超过150字），并引用证据编号，如 [1]。
+
+只输出一个 JSON 对象，不要输出其他内容：
+{"verdict": "true" | "false" | "partly_true" | "unverified", "confidence": 0到1之间的小数, "summary": "摘要"}"""
+
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+
+
+class Verdict(NamedTuple):
+    """A parsed verdict."""
+
+    verdict: str
+    confidence: float
+    summary: str
+
+
+def build_verdict_request(
+    claim: str, evidence: Sequence[RetrievedEvidence], max_tokens: int = 512
+) -> LLMRequest:
+    """
+    Build a deterministic verdict request for a claim.
+
+    Args:
+        claim: Claim text
+        evidence: Evidence passages, most relevant first
+        max_tokens: Completion length limit
+
+    Returns:
+        Request with the shared system prompt and ``temperature=0``
+    """
+    lines = [f"声明：{claim}", "", "证据："]
+    if not evidence:
+        lines.append("（无）")
+    for i, item in enumerate(evidence, start=1):
+        lines.append(f"[{i}] {item.source}《{item.title}》({item.language}) {item.snippet}")
+    return LLMRequest(
+        system=VERDICT_SYSTEM_PROMPT,
+        prompt="\n".join(lines),
+        max_tokens=max_tokens,
+        temperature=0.0,
+    )
+
+
+def parse_verdict(text: str) -> Verdict:
+    """
+    Parse the model's JSON answer, tolerating surrounding prose or code fences.
+
+    Args:
+        text: Raw completion text
+
+    Returns:
+        The verdict; unparseable answers become ``unverified`` with the raw text as summary
+    """
+    match = _JSON_OBJECT.search(text)
+    try:
+        data = json.loads(match.group(0)) if match else {}
+    except ValueError:
+        data = {}
+    if not isinstance(data, dict) or data.get("verdict") not in VERDICTS:
+        return Verdict("unverified", 0.0, text.strip())
+
+    try:
+        confidence = min(max(float(data.get("confidence", 0.0)), 0.0), 1.0)
+    except (TypeError, ValueError):
+        confidence = 0.0
+    return Verdict(data["verdict"], confidence, str(data.get("summary", "")).strip())
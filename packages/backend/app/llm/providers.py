@@ -0,0 +1,247 @@
+"""
+HTTP clients for the LLM provider APIs.
+
+Each provider owns one long-lived ``httpx.AsyncClient`` whose connection pool
+is sized to the provider's concurrency limit, so keep-alive connections and
+TLS sessions are reused across requests instead of being set up per call.
+The official SDKs are not used: the two endpoints needed here are small, and
+talking HTTP directly keeps retries and pooling under our control.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import httpx
+
+# Statuses worth retrying: rate limiting, transient server errors and
+# Anthropic's 529 "overloaded"
+RETRYABLE_STATUSES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+
+class LLMError(Exception):
+    """A provider request failed."""
+
+    def __init__(self, message: str, provider: str = "", status: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.provider = provider
+        self.status = status
+
+
+class RetryableLLMError(LLMError):
+    """A provider request failed in a way that may succeed if retried."""
+
+    def __init__(
+        self,
+        message: str,
+        provider: str = "",
+        status: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        super().__init__(message, provider, status)
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class LLMRequest:
+    """
+    A provider-independent completion request.
+
+    ``system`` comes first in every provider payload and should be identical
+    across calls, so it forms a stable prefix for provider-side prompt caching.
+    """
+
+    system: str
+    prompt: str
+    max_tokens: int = 1024
+    temperature: float = 0.0
+
+
+@dataclass
+class LLMResponse:
+    """Text produced by a provider."""
+
+    text: str
+    provider: str
+    model: str
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None  # HTTP-date form; fall back to exponential backoff
+
+
+class LLMProvider(ABC):
+    """
+    Base class for a provider endpoint.
+
+    Args:
+        name: Provider name used in logs and errors
+        api_key: API key
+        model: Model identifier
+        base_url: API root, overridable to point at a mock server
+        timeout: Per-request timeout in seconds
+        max_connections: Connection pool size
+        transport: Optional custom httpx transport (e.g. for tests)
+    """
+
+    path = ""
+
+    def __init__(
+        self,
+        name: str,
+        api_key: str,
+        model: str,
+        base_url: str,
+        timeout: float = 30.0,
+        max_connections: int = 16,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.name = name
+        self.model = model
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=self._headers(api_key),
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 5.0)),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+
+    @abstractmethod
+    def _headers(self, api_key: str) -> Dict[str, str]:
+        """Authentication and version headers sent with every request."""
+
+    @abstractmethod
+    def _payload(self, request: LLMRequest) -> Dict[str, Any]:
+        """JSON body of the completion request."""
+
+    @abstractmethod
+    def _parse(self, body: Dict[str, Any]) -> str:
+        """Completion text from a successful response body."""
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        """
+        Send one completion request, without retrying.
+
+        Args:
+            request: Completion request
+
+        Returns:
+            The generated text
+
+        Raises:
+            RetryableLLMError: On timeouts, connection errors and retryable statuses
+            LLMError: On any other failure
+        """
+        try:
+            response = await self._client.post(self.path, json=self._payload(request))
+        except (httpx.TimeoutException, httpx.TransportError) as exc:
+            raise RetryableLLMError(f"{self.name}: {exc!r}", self.name) from exc
+
+        if response.status_code in RETRYABLE_STATUSES:
+            raise RetryableLLMError(
+                f"{self.name}: HTTP {response.status_code}",
+                self.name,
+                response.status_code,
+                _retry_after(response),
+            )
+        if response.status_code >= 400:
+            raise LLMError(
+                f"{self.name}: HTTP {response.status_code}: {response.text[:200]}",
+                self.name,
+                response.status_code,
+            )
+
+        try:
+            text = self._parse(response.json())
+        except (ValueError, KeyError, IndexError, TypeError) as exc:
+            raise LLMError(f"{self.name}: malformed response", self.name) from exc
+        return LLMResponse(text=text, provider=self.name, model=self.model)
+
+    async def ping(self, timeout: float = 2.0) -> bool:
+        """
+        Check that the API is reachable and accepts our key, without generating.
+
+        Lists the available models, which is free on both supported APIs.
+        Rate limiting still counts as reachable.
+
+        Args:
+            timeout: Request timeout in seconds
+
+        Returns:
+            True if the provider answered with a usable status
+        """
+        try:
+            response = await self._client.get("/v1/models", timeout=timeout)
+        except (httpx.TimeoutException, httpx.TransportError):
+            return False
+        return response.status_code < 500 and response.status_code not in (401, 403)
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        await self._client.aclose()
+
+
+class AnthropicProvider(LLMProvider):
+    """Anthropic Messages API."""
+
+    path = "/v1/messages"
+
+    def __init__(
+        self, api_key: str, model: str, base_url: str = "https://api.anthropic.com", **kwargs: Any
+    ) -> None:
+        super().__init__("claude", api_key, model, base_url, **kwargs)
+
+    def _headers(self, api_key: str) -> Dict[str, str]:
+        return {"x-api-key": api_key, "anthropic-version": "2023-06-01"}
+
+    def _payload(self, request: LLMRequest) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+            # Mark the shared system prompt as a cacheable prefix
+            "system": [
+                {"type": "text", "text": request.system, "cache_control": {"type": "ephemeral"}}
+            ],
+            "messages": [{"role": "user", "content": request.prompt}],
+        }
+
+    def _parse(self, body: Dict[str, Any]) -> str:
+        return "".join(block["text"] for block in body["content"] if block["type"] == "text")
+
+
+class OpenAIProvider(LLMProvider):
+    """OpenAI Chat Completions API (prefix caching is automatic there)."""
+
+    path = "/v1/chat/completions"
+
+    def __init__(
+        self, api_key: str, model: str, base_url: str = "https://api.openai.com", **kwargs: Any
+    ) -> None:
+        super().__init__("openai", api_key, model, base_url, **kwargs)
+
+    def _headers(self, api_key: str) -> Dict[str, str]:
+        return {"authorization": f"Bearer {api_key}"}
+
+    def _payload(self, request: LLMRequest) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+            "messages": [
+                {"role": "system", "content": request.system},
+                {"role": "user", "content": request.prompt},
+            ],
+        }
+
+    def _parse(self, body: Dict[str, Any]) -> str:
+        return body["choices"][0]["message"]["content"]
@@ -2,14 +2,70 @@
 XiaoChaGuan API - Main application entry point.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
+from app.api.v1.health import mark_startup_complete
 from app.api.v1.router import api_router
+from app.cache import close_verification_cache
 from app.config import settings
+from app.credibility import get_credibility_registry
+from app.dedup import get_claim_index, save_claim_index
+from app.embeddings import close_embedding_service
+from app.health import close_health_monitor, get_health_monitor
+from app.lexical import get_lexical_index
+from app.llm import close_llm_client
+from app.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_FLIGHT,
+    MetricsMiddleware,
+    render_metrics,
+)
+from app.nlp.script import warm_up_script_tables
+from app.nlp.tokenizer import initialize_tokenizer
+from app.nlp.worker_pool import shutdown_pool, warm_up_pool
+from app.ratelimit import RateLimitMiddleware, close_rate_limiter, get_rate_limiter
+from app.sources import get_source_finder, load_source_corpus
+
+
+async def warm_up() -> None:
+    """Load NLP models in the background so the server can accept requests at once."""
+    load_seconds = await asyncio.to_thread(initialize_tokenizer)
+    print(f"📚 Tokenizer loaded in {load_seconds:.2f}s")
+
+    # Build the Traditional/Simplified folding tables used on every request
+    await asyncio.to_thread(warm_up_script_tables)
+
+    # Start NLP workers so the first batch request doesn't pay for jieba loading
+    await asyncio.to_thread(warm_up_pool)
+
+    # Restore the near-duplicate claim index snapshot
+    await asyncio.to_thread(get_claim_index)
+
+    # Restore the BM25 index snapshot used by hybrid search
+    await asyncio.to_thread(get_lexical_index)
+
+    # Load the source credibility registry
+    await asyncio.to_thread(get_credibility_registry)
+
+    # Restore the original-source sentence index snapshot
+    await asyncio.to_thread(get_source_finder)
+
+    mark_startup_complete()
+    print("✅ Warm-up complete")
+
+    # Index the source corpus on first start; needs the embedding model, so it runs last
+    try:
+        indexed = await load_source_corpus()
+        if indexed:
+            print(f"🌐 Indexed {indexed} source sentences")
+    except Exception as exc:
+        print(f"⚠️ Source corpus not indexed: {exc}")
 
 
 @asynccontextmanager
@@ -20,10 +76,29 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     print(f"📍 Environment: {settings.app_env}")
     print(f"🔧 Debug mode: {settings.debug}")
 
+    # /ping and /health are served while models load
+    warm_up_task = asyncio.create_task(warm_up())
+
+    # Dependency probes; /health serves their latest results
+    get_health_monitor().start()
+
     yield
 
     # Shutdown
     print(f"👋 Shutting down {settings.app_name}...")
+    warm_up_task.cancel()
+    await close_health_monitor()
+    save_claim_index()
+    await close_embedding_service()
+    await close_verification_cache()
+    await close_llm_client()
+    await close_rate_limiter()
+    shutdown_pool()
+
+
+async def metrics(request: Request) -> PlainTextResponse:
+    """Prometheus scrape endpoint, aggregated over all workers."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
 
 
 def create_app() -> FastAPI:
@@ -37,6 +112,16 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Rate limiting; added before CORS so that 429 responses still get CORS headers
+    limiter = get_rate_limiter()
+    if limiter is not None:
+        app.add_middleware(
+            RateLimitMiddleware,
+            limiter=limiter,
+            exempt_paths=("/api/v1/health", "/api/v1/ping"),
+            trusted_proxies=settings.rate_limit_trusted_proxies,
+        )
+
     # Configure CORS
     app.add_middleware(
         CORSMiddleware,
@@ -46,6 +131,15 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Request metrics; outermost so rate-limited and CORS responses are counted too
+    if settings.metrics_enabled:
+        app.add_middleware(
+            MetricsMiddleware,
+            duration=HTTP_REQUEST_DURATION,
+            in_flight=HTTP_REQUESTS_IN_FLIGHT,
+        )
+        app.add_route("/metrics", metrics, include_in_schema=False)
+
     # Include API routes
     app.include_router(api_router, prefix="/api/v1")
 
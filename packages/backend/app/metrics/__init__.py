@@ -0,0 +1,108 @@
+"""Application metrics module."""
+
+import os
+import time
+from contextlib import ContextDecorator
+from typing import List
+
+from app.config import settings
+from app.metrics.middleware import MetricsMiddleware
+from app.metrics.registry import Counter, Gauge, Histogram, MetricsRegistry
+
+REGISTRY = MetricsRegistry(settings.metrics_dir or None)
+os.register_at_fork(after_in_child=REGISTRY.store.reset_after_fork)
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "xcg_http_request_duration_seconds",
+    "HTTP request latency by method, route template and status.",
+    ("method", "route", "status"),
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "xcg_http_requests_in_flight",
+    "HTTP requests currently being served.",
+)
+STAGE_DURATION = REGISTRY.histogram(
+    "xcg_stage_duration_seconds",
+    "Latency of pipeline stages.",
+    ("stage",),
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    "xcg_cache_lookups_total",
+    "Cache lookups by cache and result (hit or miss).",
+    ("cache", "result"),
+)
+LLM_REQUESTS = REGISTRY.counter(
+    "xcg_llm_requests_total",
+    "LLM provider calls by provider and outcome.",
+    ("provider", "outcome"),
+)
+
+
+class time_stage(ContextDecorator):  # noqa: N801 - used like a function
+    """
+    Record the duration of a block (or, as a decorator, of a sync function).
+
+    A plain class rather than ``@contextmanager``: it is entered for every
+    sentence tokenized, where a generator-based manager costs several times more.
+
+    Args:
+        stage: Stage label, e.g. ``"tokenization"``
+    """
+
+    def __init__(self, stage: str) -> None:
+        self._histogram = STAGE_DURATION.labels(stage)
+        self._start = 0.0
+
+    def _recreate_cm(self) -> "time_stage":
+        # A decorated function may run in several threads at once: time each call separately
+        timer = object.__new__(time_stage)
+        timer._histogram = self._histogram
+        return timer
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._histogram.observe(time.perf_counter() - self._start)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count one cache lookup."""
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def render_metrics() -> str:
+    """All metrics summed over workers, plus derived cache hit ratios."""
+    totals = REGISTRY.aggregate()
+    lookups = {}
+    for (name, labels, _), value in totals.items():
+        if name == CACHE_LOOKUPS.name:
+            cache, result = labels
+            hits, total = lookups.get(cache, (0.0, 0.0))
+            lookups[cache] = (hits + value * (result == "hit"), total + value)
+
+    extra: List[str] = [
+        "# HELP xcg_cache_hit_ratio Fraction of cache lookups that were hits.",
+        "# TYPE xcg_cache_hit_ratio gauge",
+    ]
+    for cache, (hits, total) in sorted(lookups.items()):
+        extra.append(f'xcg_cache_hit_ratio{{cache="{cache}"}} {hits / total if total else 0.0!r}')
+    return REGISTRY.render(totals, extra)
+
+
+__all__ = [
+    "CACHE_LOOKUPS",
+    "Counter",
+    "Gauge",
+    "HTTP_REQUESTS_IN_FLIGHT",
+    "HTTP_REQUEST_DURATION",
+    "Histogram",
+    "LLM_REQUESTS",
+    "MetricsMiddleware",
+    "MetricsRegistry",
+    "REGISTRY",
+    "STAGE_DURATION",
+    "record_cache_lookup",
+    "render_metrics",
+    "time_stage",
+]
@@ -0,0 +1,80 @@
+"""
+ASGI middleware recording per-route request latency and in-flight requests.
+"""
+
+import time
+from typing import Any, Awaitable, Callable, MutableMapping
+
+from app.metrics.registry import Gauge, Histogram
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+def route_template(scope: Scope) -> str:
+    """
+    The matched route's full path template, e.g. ``/api/v1/verify/{verification_id}``.
+
+    Routes of included routers only know the path relative to their router,
+    so the prefix is recovered from the request path by removing the part
+    the route itself rendered from its path parameters.
+    """
+    route = scope.get("route")
+    if route is None:
+        return "unmatched"
+    template = getattr(route, "path_format", None) or getattr(route, "path", "")
+    try:
+        rendered = template.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return template
+    path = scope.get("path", "")
+    if rendered and not path.endswith(rendered):
+        return template
+    return path[: len(path) - len(rendered)] + template
+
+
+class MetricsMiddleware:
+    """
+    Time every HTTP request, labelled by method, route template and status.
+
+    The route is the matched path template (``/api/v1/verify/{verification_id}``),
+    never the raw path, so IDs cannot blow up the number of series. Requests
+    that match no route are recorded as ``unmatched``. Streaming responses are
+    timed until the last body chunk has been sent.
+
+    Args:
+        app: Wrapped ASGI app
+        duration: Histogram labelled (method, route, status)
+        in_flight: Gauge of requests currently being served
+    """
+
+    def __init__(self, app: ASGIApp, duration: Histogram, in_flight: Gauge) -> None:
+        self.app = app
+        self.duration = duration
+        self.in_flight = in_flight
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.in_flight.dec()
+            self.duration.labels(
+                scope.get("method", ""), route_template(scope), str(status)
+            ).observe(time.perf_counter() - start)
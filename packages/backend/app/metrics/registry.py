@@ -0,0 +1,217 @@
+"""
+Counters, gauges and histograms with Prometheus text exposition.
+
+A small subset of the Prometheus client API (``labels(...).inc()``,
+``observe()``) over ``ValueStore``, so one process can expose the sum over
+all uvicorn workers without any cross-process locking on updates.
+"""
+
+import bisect
+import copy
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.metrics.store import SeriesKey, ValueStore
+
+# Seconds; spans sub-millisecond NLP stages up to slow LLM calls
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if value == int(value) else repr(value)
+
+
+class Metric:
+    """Base class: a named family of series distinguished by label values."""
+
+    type = ""
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._store = registry.store
+        self._children: Dict[Tuple[str, ...], "Metric"] = {}
+        self._labelvalues: Tuple[str, ...] = ()
+        registry.register(self)
+
+    def labels(self, *values: str, **kwargs: str) -> "Metric":
+        """Return the child series for the given label values."""
+        if kwargs:
+            values = tuple(kwargs[name] for name in self.labelnames)
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            child = copy.copy(self)
+            child._labelvalues = tuple(str(value) for value in values)
+            child._children = {}
+            self._children[values] = child
+        return child
+
+    def _key(self, suffix: str = "") -> SeriesKey:
+        return (self.name, self._labelvalues, suffix)
+
+
+class Counter(Metric):
+    """Monotonically increasing value."""
+
+    type = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._store.add(self._key(), amount)
+
+
+class Gauge(Metric):
+    """Value that goes up and down; summed across workers that are still alive."""
+
+    type = "gauge"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._store.add(self._key(), amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._store.add(self._key(), -amount)
+
+    def set(self, value: float) -> None:
+        self._store.set(self._key(), value)
+
+
+class Histogram(Metric):
+    """
+    Distribution of observations in fixed buckets.
+
+    Buckets are stored non-cumulatively (one write per observation) and
+    made cumulative when rendered.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(registry, name, documentation, labelnames)
+
+    def observe(self, value: float) -> None:
+        store = self._store
+        store.add(self._key(str(bisect.bisect_left(self.buckets, value))), 1.0)
+        store.add(self._key("sum"), value)
+
+
+class MetricsRegistry:
+    """
+    All metrics of the application, plus rendering of their aggregate.
+
+    Args:
+        directory: Shared multi-worker directory, or None for this process only
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        self.store = ValueStore(directory)
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Duplicate metric {metric.name}")
+        self._metrics[metric.name] = metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return Counter(self, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return Gauge(self, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return Histogram(self, name, documentation, labelnames, buckets)
+
+    def _outlives_process(self, key: SeriesKey) -> bool:
+        metric = self._metrics.get(key[0])
+        return metric is not None and metric.type != "gauge"
+
+    def aggregate(self) -> Dict[SeriesKey, float]:
+        """Sum every series over all workers; gauges only over live workers."""
+        # Counters and histograms of exited processes stay in the totals
+        self.store.merge_dead(self._outlives_process)
+        totals: Dict[SeriesKey, float] = defaultdict(float)
+        for _, alive, key, value in self.store.read_all():
+            metric = self._metrics.get(key[0])
+            if metric is None or (metric.type == "gauge" and not alive):
+                continue
+            totals[key] += value
+        return totals
+
+    def render(
+        self, totals: Optional[Dict[SeriesKey, float]] = None, extra: Iterable[str] = ()
+    ) -> str:
+        """
+        Render all metrics in the Prometheus text format (version 0.0.4).
+
+        Args:
+            totals: Result of ``aggregate()``, if the caller already has it
+            extra: Additional pre-rendered lines appended at the end
+        """
+        if totals is None:
+            totals = self.aggregate()
+        by_metric: Dict[str, Dict[Tuple[str, ...], Dict[str, float]]] = defaultdict(
+            lambda: defaultdict(dict)
+        )
+        for (name, labels, suffix), value in totals.items():
+            by_metric[name][labels][suffix] = value
+
+        lines: List[str] = []
+        for name, metric in self._metrics.items():
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.type}")
+            for labels, parts in sorted(by_metric.get(name, {}).items()):
+                if isinstance(metric, Histogram):
+                    lines.extend(_render_histogram(metric, labels, parts))
+                else:
+                    label_text = _format_labels(metric.labelnames, labels)
+                    lines.append(f"{name}{label_text} {_format_value(parts.get('', 0.0))}")
+        lines.extend(extra)
+        return "\n".join(lines) + "\n"
+
+
+def _render_histogram(
+    metric: Histogram, labels: Tuple[str, ...], parts: Dict[str, float]
+) -> List[str]:
+    lines = []
+    cumulative = 0.0
+    bounds = [*(repr(float(bound)) for bound in metric.buckets), "+Inf"]
+    for index, bound in enumerate(bounds):
+        cumulative += parts.get(str(index), 0.0)
+        label_text = _format_labels((*metric.labelnames, "le"), (*labels, bound))
+        lines.append(f"{metric.name}_bucket{label_text} {_format_value(cumulative)}")
+    label_text = _format_labels(metric.labelnames, labels)
+    lines.append(f"{metric.name}_sum{label_text} {parts.get('sum', 0.0)!r}")
+    lines.append(f"{metric.name}_count{label_text} {_format_value(cumulative)}")
+    return lines
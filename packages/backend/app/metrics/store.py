@@ -0,0 +1,223 @@
+"""
+Per-process metric value storage.
+
+Every process writes only to its own slots, so updates need no locks: the
+event loop thread is the only writer for request metrics, and stage timers
+running in worker threads touch disjoint series in practice (a lost update
+under a rare GIL switch mid-increment is acceptable for monitoring data).
+
+Without a directory, values live in process memory. With one (multi-worker
+deployments), each process maps two files named after its PID:
+
+    <pid>.values   float64 slots, updated in place through an mmap
+    <pid>.keys     append-only "slot<TAB>series-json" lines
+
+``read_all`` sums the files of every process, so any worker can serve the
+aggregate on ``/metrics``. Forked processes that exit (restarted workers,
+NLP pool processes) leave their files behind: ``merge_dead`` folds the
+values worth keeping into one ``merged.values``/``merged.keys`` pair and
+deletes the rest, so the directory doesn't grow with every fork and a
+reused PID never revives an old process's gauges. Merging and reading hold
+a lock file, so a scrape never sees a value both merged and in its old file.
+"""
+
+import fcntl
+import json
+import logging
+import mmap
+import os
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SLOT_SIZE = 8
+MERGED = "merged"
+_LOCK_FILE = ".lock"
+
+# (metric name, label values, suffix) - suffix is "" or a histogram part
+SeriesKey = Tuple[str, Tuple[str, ...], str]
+
+
+class ValueStore:
+    """
+    Float slots addressed by series key.
+
+    Args:
+        directory: Directory shared by all workers, or None for in-memory only
+        capacity: Maximum series per process; further series are dropped
+    """
+
+    def __init__(self, directory: Optional[str] = None, capacity: int = 8192) -> None:
+        self.directory = directory
+        self.capacity = capacity
+        self._open()
+
+    def _open(self) -> None:
+        self.pid = os.getpid()
+        self._slots: Dict[SeriesKey, int] = {}
+        self._full_warned = False
+        self._keys_file = None
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            values_path = os.path.join(self.directory, f"{self.pid}.values")
+            with open(values_path, "wb") as f:
+                f.truncate(self.capacity * SLOT_SIZE)
+            with open(values_path, "r+b") as f:
+                self._mmap = mmap.mmap(f.fileno(), self.capacity * SLOT_SIZE)
+            self._values = memoryview(self._mmap).cast("d")
+            self._keys_file = open(
+                os.path.join(self.directory, f"{self.pid}.keys"), "w", encoding="utf-8"
+            )
+        else:
+            self._values = memoryview(bytearray(self.capacity * SLOT_SIZE)).cast("d")
+
+    def reset_after_fork(self) -> None:
+        """Give a forked child its own slots instead of writing into the parent's."""
+        if self.pid != os.getpid():
+            self._open()
+
+    def _slot(self, key: SeriesKey) -> Optional[int]:
+        slot = self._slots.get(key)
+        if slot is not None:
+            return slot
+        if len(self._slots) >= self.capacity:
+            if not self._full_warned:
+                logger.warning("Metric store full (%d series); dropping %s", self.capacity, key)
+                self._full_warned = True
+            return None
+        slot = self._slots[key] = len(self._slots)
+        if self._keys_file is not None:
+            self._keys_file.write(f"{slot}\t{json.dumps(key, ensure_ascii=False)}\n")
+            self._keys_file.flush()
+        return slot
+
+    def add(self, key: SeriesKey, amount: float) -> None:
+        slot = self._slot(key)
+        if slot is not None:
+            self._values[slot] += amount
+
+    def set(self, key: SeriesKey, value: float) -> None:
+        slot = self._slot(key)
+        if slot is not None:
+            self._values[slot] = value
+
+    def _local(self) -> Iterator[Tuple[SeriesKey, float]]:
+        for key, slot in self._slots.items():
+            yield key, self._values[slot]
+
+    @contextmanager
+    def _locked(self, operation: int) -> Iterator[None]:
+        """Hold the directory's lock file, shared for reading or exclusive for merging."""
+        with open(os.path.join(self.directory, _LOCK_FILE), "a") as f:
+            fcntl.flock(f, operation)
+            yield
+
+    def _stems(self) -> List[str]:
+        """File name stems in the directory: PIDs, and ``MERGED`` once anything was merged."""
+        names = os.listdir(self.directory)
+        return [name[: -len(".keys")] for name in names if name.endswith(".keys")]
+
+    def _read_file(self, stem: str) -> List[Tuple[SeriesKey, float]]:
+        """Series of one file pair; empty if it is gone or not fully written yet."""
+        try:
+            with open(os.path.join(self.directory, f"{stem}.keys"), encoding="utf-8") as f:
+                lines = f.read().split("\n")[:-1]  # drop a partially written line
+            with open(os.path.join(self.directory, f"{stem}.values"), "rb") as f:
+                data = memoryview(f.read()).cast("d")
+        except (OSError, TypeError):
+            return []
+        series = []
+        for line in lines:
+            slot, raw = line.split("\t", 1)
+            name, labels, suffix = json.loads(raw)
+            series.append(((name, tuple(labels), suffix), data[int(slot)]))
+        return series
+
+    def read_all(self) -> Iterator[Tuple[int, bool, SeriesKey, float]]:
+        """
+        Yield ``(pid, alive, key, value)`` for every series of every process.
+
+        Merged values of exited processes come with PID 0, not alive. Only
+        this process is read when there is no shared directory.
+        """
+        if not self.directory:
+            for key, value in self._local():
+                yield self.pid, True, key, value
+            return
+
+        with self._locked(fcntl.LOCK_SH):
+            files = [(stem, self._read_file(stem)) for stem in self._stems()]
+        for stem, series in files:
+            pid = 0 if stem == MERGED else int(stem)
+            alive = pid != 0 and _pid_alive(pid)
+            for key, value in series:
+                yield pid, alive, key, value
+
+    def merge_dead(self, keep: Callable[[SeriesKey], bool]) -> int:
+        """
+        Fold the files of exited processes into the merged file and delete them.
+
+        Args:
+            keep: Whether a series outlives its process (counters do, gauges don't)
+
+        Returns:
+            Number of processes merged
+        """
+        if not self.directory:
+            return 0
+        with self._locked(fcntl.LOCK_EX):
+            dead = [s for s in self._stems() if s != MERGED and not _pid_alive(int(s))]
+            if not dead:
+                return 0
+            totals = dict(self._read_file(MERGED))
+            for stem in dead:
+                for key, value in self._read_file(stem):
+                    if keep(key):
+                        totals[key] = totals.get(key, 0.0) + value
+            self._write_merged(totals)
+            for stem in dead:
+                for suffix in (".keys", ".values"):
+                    try:
+                        os.remove(os.path.join(self.directory, stem + suffix))
+                    except FileNotFoundError:
+                        pass
+        return len(dead)
+
+    def _write_merged(self, totals: Dict[SeriesKey, float]) -> None:
+        base = os.path.join(self.directory, MERGED)
+        values = memoryview(bytearray(len(totals) * SLOT_SIZE)).cast("d")
+        with open(f"{base}.keys.tmp", "w", encoding="utf-8") as f:
+            for slot, (key, value) in enumerate(totals.items()):
+                values[slot] = value
+                f.write(f"{slot}\t{json.dumps(key, ensure_ascii=False)}\n")
+        with open(f"{base}.values.tmp", "wb") as f:
+            f.write(values)
+        os.replace(f"{base}.values.tmp", f"{base}.values")
+        os.replace(f"{base}.keys.tmp", f"{base}.keys")
+
+    def remove_other_files(self) -> None:
+        """
+        Delete every file in the directory but this process's own.
+
+        For a parent process about to start its workers: files left by an
+        earlier run would otherwise be summed in, and count as alive when
+        their PID is reused.
+        """
+        if not self.directory:
+            return
+        own = {f"{self.pid}.keys", f"{self.pid}.values", _LOCK_FILE}
+        with self._locked(fcntl.LOCK_EX):
+            for name in os.listdir(self.directory):
+                if name not in own:
+                    os.remove(os.path.join(self.directory, name))
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
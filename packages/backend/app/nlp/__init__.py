@@ -1,7 +1,16 @@
 """NLP processing module."""
 
-from app.nlp.claim_extractor import extract_claims
+from app.nlp.claim_extractor import extract_claims, extract_claims_batch
 from app.nlp.language_detector import detect_language
+from app.nlp.script import chinese_variant, fold_script, normalize_script
 from app.nlp.tokenizer import tokenize_chinese
 
-__all__ = ["extract_claims", "detect_language", "tokenize_chinese"]
+__all__ = [
+    "extract_claims",
+    "extract_claims_batch",
+    "detect_language",
+    "chinese_variant",
+    "fold_script",
+    "normalize_script",
+    "tokenize_chinese",
+]
@@ -2,13 +2,21 @@
 Claim extraction from text.
 """
 
+import asyncio
 import re
 import uuid
-from typing import List, Literal
+from concurrent.futures import Executor
+from functools import partial
+from typing import Iterator, List, Literal, Optional, Sequence, Tuple
 
 from pydantic import BaseModel
 
-from app.nlp.tokenizer import extract_keywords, extract_noun_phrases
+from app.config import settings
+from app.metrics import time_stage
+from app.nlp.pattern_classifier import Classification, PatternClassifier
+from app.nlp.script import fold_script
+from app.nlp.tokenizer import tokenize_sentence
+from app.nlp.worker_pool import get_pool, get_pool_size
 
 
 class ExtractedClaim(BaseModel):
@@ -20,11 +28,14 @@ class ExtractedClaim(BaseModel):
     entities: List[str]
     language: str
     confidence: float
+    start: int  # offset of the claim in the source text
+    end: int
+    cluster_id: Optional[str] = None  # near-duplicate cluster, when assigned
 
 
 # Patterns that indicate verifiable claims
 CLAIM_PATTERNS = [
-    (r"据.*?报道", "factual", 0.7),
+    (r"据.*?报[道导]", "factual", 0.7),  # 报导: Taiwan usage, 報導 folded
     (r"根据.*?(显示|表明|证明)", "factual", 0.8),
     (r"研究(表明|发现|显示)", "factual", 0.8),
     (r"专家(称|说|表示)", "quote", 0.6),
@@ -37,6 +48,8 @@ CLAIM_PATTERNS = [
     (r"(我认为|我觉得|在我看来)", "opinion", 0.4),
 ]
 
+CLAIM_CLASSIFIER = PatternClassifier(CLAIM_PATTERNS, default=("factual", 0.5))
+
 
 def detect_claim_type(text: str) -> tuple:
     """
@@ -45,11 +58,51 @@ def detect_claim_type(text: str) -> tuple:
     Returns:
         Tuple of (claim_type, confidence)
     """
-    for pattern, claim_type, confidence in CLAIM_PATTERNS:
-        if re.search(pattern, text):
-            return claim_type, confidence
+    return CLAIM_CLASSIFIER.first_match(text) or CLAIM_CLASSIFIER.default
+
+
+def classify_claim(text: str) -> Classification:
+    """
+    Report every claim pattern that matches the text.
+
+    Returns:
+        Classification with the aggregate type, noisy-OR score and all hits
+    """
+    return CLAIM_CLASSIFIER.classify(text)
+
+
+# A sentence ends at a run of terminators plus any closing quotes or brackets.
+# Chinese terminators always end a sentence. Latin ones do not when followed
+# by a letter or digit, so "3.5%", "example.com" and "?id=1" stay whole, nor
+# does a period after a lone capital, as in "U.S." or "J. Smith"; the sentence
+# body consumes those. Possessive quantifiers keep the scan linear.
+_PLAIN = r"[^。！？.!?]"
+_INNER = r"(?:[.!?](?=[A-Za-z0-9])|(?<=\b[A-Z])\.)"
+_SENTENCE = re.compile(
+    rf"\S{_PLAIN}*+(?:{_INNER}{_PLAIN}*+)*+[。！？.!?]*+[”’\"'」』）)\]】》〉]*+"
+)
+
+
+def sentence_spans(text: str, min_length: int = 10) -> Iterator[Tuple[int, int]]:
+    """
+    Lazily locate sentences in text.
+
+    Each span runs from the first non-space character through the sentence's
+    terminators and closing quotes or brackets, e.g. ``他说：“涨了3.5%。”``.
+    No substrings are created; slice ``text`` with the offsets when needed.
+
+    Args:
+        text: Input text
+        min_length: Minimum sentence length, terminators included
 
-    return "factual", 0.5  # Default
+    Yields:
+        ``(start, end)`` offsets into ``text``
+    """
+    # Stopping before trailing whitespace keeps it out of a final unterminated sentence
+    for match in _SENTENCE.finditer(text, 0, len(text.rstrip())):
+        start, end = match.span()
+        if end - start >= min_length:
+            yield start, end
 
 
 def split_sentences(text: str) -> List[str]:
@@ -62,12 +115,10 @@ def split_sentences(text: str) -> List[str]:
     Returns:
         List of sentences
     """
-    # Chinese sentence delimiters
-    delimiters = r"[。！？\.\!\?]"
-    sentences = re.split(delimiters, text)
-    return [s.strip() for s in sentences if s.strip() and len(s.strip()) >= 10]
+    return [text[start:end] for start, end in sentence_spans(text)]
 
 
+@time_stage("claim_extraction")
 def extract_claims(
     text: str,
     language: str = "zh-CN",
@@ -77,6 +128,11 @@ def extract_claims(
     """
     Extract verifiable claims from text.
 
+    Sentences, patterns and segmentation run on a copy of the text folded to
+    half-width Simplified characters (``fold_script``), so they work the same
+    on Traditional text; entities come out folded, claim texts as written.
+    Folding keeps the length, so offsets into the copy index the original.
+
     Args:
         text: Input text
         language: Language code
@@ -84,15 +140,16 @@ def extract_claims(
         max_length: Maximum claim length
 
     Returns:
-        List of extracted claims
+        List of extracted claims, with their offsets in ``text``
     """
     claims = []
-    sentences = split_sentences(text)
+    folded = fold_script(text)
 
-    for sentence in sentences:
-        # Skip if too short or too long
-        if len(sentence) < min_length or len(sentence) > max_length:
+    for start, end in sentence_spans(folded, min_length):
+        # Skip if too long
+        if end - start > max_length:
             continue
+        sentence = folded[start:end]
 
         # Detect claim type and confidence
         claim_type, confidence = detect_claim_type(sentence)
@@ -101,11 +158,14 @@ def extract_claims(
         if confidence < 0.4:
             continue
 
+        # Segment once; noun phrases and keywords share the result
+        tokenized = tokenize_sentence(sentence)
+
         # Extract entities (simplified - using noun phrases)
-        entities = extract_noun_phrases(sentence)
+        entities = tokenized.noun_phrases()
 
         # Extract keywords for additional context
-        keywords = extract_keywords(sentence, top_k=5)
+        keywords = tokenized.keywords(top_k=5)
         keyword_texts = [k[0] for k in keywords]
 
         # Combine entities and keywords, remove duplicates
@@ -113,12 +173,113 @@ def extract_claims(
 
         claim = ExtractedClaim(
             id=str(uuid.uuid4()),
-            text=sentence,
+            text=text[start:end],
             type=claim_type,
             entities=all_entities[:10],  # Limit to 10 entities
             language=language,
             confidence=confidence,
+            start=start,
+            end=end,
         )
         claims.append(claim)
 
     return claims
+
+
+def _extract_claims_chunk(
+    texts: Sequence[str],
+    language: str,
+    min_length: int,
+    max_length: int,
+) -> List[List[ExtractedClaim]]:
+    """Extract claims for a chunk of texts inside a worker process."""
+    return [extract_claims(text, language, min_length, max_length) for text in texts]
+
+
+def _chunk(texts: Sequence[str], size: int) -> List[Sequence[str]]:
+    """Split texts into consecutive chunks of at most ``size`` items."""
+    return [texts[i : i + size] for i in range(0, len(texts), size)]
+
+
+def extract_claims_batch(
+    texts: Sequence[str],
+    language: str = "zh-CN",
+    min_length: int = 10,
+    max_length: int = 500,
+    executor: Optional[Executor] = None,
+) -> List[List[ExtractedClaim]]:
+    """
+    Extract claims from many texts using the NLP process pool.
+
+    Args:
+        texts: Input texts
+        language: Language code
+        min_length: Minimum claim length
+        max_length: Maximum claim length
+        executor: Executor to use instead of the shared process pool
+
+    Returns:
+        One list of extracted claims per input text, in input order
+    """
+    if not texts:
+        return []
+
+    # A single text or a single worker is not worth the IPC round-trip
+    if executor is None and (len(texts) == 1 or get_pool_size() <= 1):
+        return _extract_claims_chunk(texts, language, min_length, max_length)
+
+    pool = executor or get_pool()
+    worker = partial(
+        _extract_claims_chunk,
+        language=language,
+        min_length=min_length,
+        max_length=max_length,
+    )
+
+    results: List[List[ExtractedClaim]] = []
+    for chunk_result in pool.map(worker, _chunk(texts, settings.nlp_pool_chunksize)):
+        results.extend(chunk_result)
+    return results
+
+
+async def extract_claims_batch_async(
+    texts: Sequence[str],
+    language: str = "zh-CN",
+    min_length: int = 10,
+    max_length: int = 500,
+) -> List[List[ExtractedClaim]]:
+    """
+    Async variant of :func:`extract_claims_batch` that never blocks the event loop.
+
+    Chunks are dispatched to the process pool concurrently and reassembled
+    in input order. A single text, or a batch when the pool has one worker,
+    is extracted in a thread instead, as the IPC round-trip isn't worth it.
+
+    Args:
+        texts: Input texts
+        language: Language code
+        min_length: Minimum claim length
+        max_length: Maximum claim length
+
+    Returns:
+        One list of extracted claims per input text, in input order
+    """
+    if not texts:
+        return []
+
+    if len(texts) == 1 or get_pool_size() <= 1:
+        return await asyncio.to_thread(
+            _extract_claims_chunk, texts, language, min_length, max_length
+        )
+
+    loop = asyncio.get_running_loop()
+    pool = get_pool()
+    chunk_results = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                pool, _extract_claims_chunk, chunk, language, min_length, max_length
+            )
+            for chunk in _chunk(texts, settings.nlp_pool_chunksize)
+        )
+    )
+    return [claims for chunk_result in chunk_results for claims in chunk_result]
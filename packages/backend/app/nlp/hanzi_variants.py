@@ -0,0 +1,181 @@
+"""
+Traditional to Simplified Chinese character pairs.
+
+One Simplified form per Traditional character, for folding text into one
+script rather than for publishing conversions: where a Traditional character
+maps to several Simplified ones depending on the word (乾, 著, 瞭), it is left
+out, and merged characters (髮 and 發, 後 and 后) fold together. Variant forms
+that Big5 lacks (爲, 裏, 衆) are included.
+
+``SIMPLIFIED_ONLY`` lists the Simplified forms that never occur in
+Traditional text (Big5 has no code for them), so counting them against the
+Traditional characters tells the two scripts apart.
+"""
+
+TRADITIONAL = (
+    "並亂亙亞佇佈佔併來侖侶侷俁係俠倀倆倉個們倖倫偉側偵偽傑傖傘備傢傭傳債傷傾僅僉僑僕"
+    "僥僨僱價儀儂億儈儉儐儔儕儘償優儲儷儺儻儼兇兌兒兗內兩冊凈凍凜凱別刪剄則剋剛剝剮創"
+    "劃劇劉劊劌劍劑勁動務勛勝勞勢勱勳勵勸勻匭匯匱區協卻厙厭厲參叄叢吳呂咼員唄唸問啞啟"
+    "喚喪喬單喲嗆嗇嗊嗎嗚嗩嗶嘆嘍嘔嘖嘗嘜嘩嘮嘯嘰嘵嘸噓噥噯噲噴噸噹嚀嚇嚌嚐嚕嚙嚥嚨嚮"
+    "嚳嚴囁囂囈囉囌囑囪圇國圍園圓圖團執堅堊堯報場塊塗塵塹墊墜墮墳墾壇壎壓壘壙壚壞壟壢"
+    "壩壯壺壽夠夢夥夾奧奩奪奮妝姦婁婦婭媧媯媽嫗嫵嫻嬋嬌嬙嬡嬤嬪嬰嬸孌孫學孿宮寢實寧審"
+    "寫寬寵寶將專尋對導尷屆屍屜屢屨屬岡峯峴島峽崗崢嵐嶄嶇嶢嶸嶺嶼嶽巒巔巖巰帥師帳帶幃"
+    "幗幘幟幣幫幬幹幾庫廁廂廄廈廕廚廟廠廢廣廬廳弒弳張強彆彈彌彎彙彥後徑從徠復徵徹恆恥"
+    "悅悵悶悽惡惱惲惻愛愜愨愴愾慄態慍慘慚慟慣慪慫慮慳慶慼慾憂憊憐憑憒憚憤憫憮憲憶懇應"
+    "懌懍懟懣懨懲懶懷懸懺懼懾戀戇戔戧戩戰戲戶拋挾捨捫掃掄掙掛採揀揚換揮損搖搗搶摑摟摯"
+    "摶摻撈撐撓撚撣撥撫撲撻撿擁擄擇擊擋擔據擠擬擯擰擱擲擴擷擺擻擾攄攏攔攖攙攛攜攝攢攣"
+    "攤攪攬敍敗敘敵數斂斃斕斬斷於昇時晉晝暈暉暢暫暱曄曆曉曖曠曬書會朧東枴柵桿梔梘條梟"
+    "棄棖棗棟棧棲椏椶楊楓楨業極榪榮榿構槍槓槤槧槨槳樁樂樅樑樓標樞樣樸樹樺橈橋機橢橫檉"
+    "檔檜檢檣檯檳檸檻櫂櫃櫓櫚櫛櫝櫟櫥櫧櫨櫪櫬櫳櫸櫻欄權欒欖欞歎歐歟歡歲歷歸歿殘殤殫殮"
+    "殯殲殺殼毀毆毿氈氌氣氫氬氳汙決沒沖況洩洶浹涇涼淒淚淥淨淪淵淺渙減渢渦測渾湊湞湧湯"
+    "溈準溝溫溼滄滅滌滎滙滬滯滲滷滸滻滾滿漁漚漢漣漬漲漸漿潁潑潔潛潤潯潰潿澀澆澇澗澠澤"
+    "澦澮澱濁濃濕濘濛濟濤濫濰濱濺濼濾瀅瀆瀉瀋瀏瀕瀘瀝瀟瀠瀦瀧瀨瀰瀲瀾灃灄灑灕灘灝灣灤"
+    "灩為烏烴無煉煒煙煩煬熒熗熱熾燁燄燈燉燒燙燜營燦燬燭燴燼燾爍爐爛爭爲爺爾牆牘牽犖犛"
+    "犢犧狀狹狽猙猶猻獁獃獄獅獎獨獮獰獲獵獷獸獺獻獼玀玁玨現琺琿瑋瑣瑤瑩瑪瑲璉璣璦璫環"
+    "璵璽瓊瓏瓔瓚甌甕產甦畝畢畫異當疇疊痙痠瘋瘍瘓瘞瘡瘧瘻療癆癇癉癒癘癟癡癢癤癥癧癩癬"
+    "癭癮癰癱癲發皚皰皺盃盜盞盡監盤盧盪眥眾睏睜睞瞞瞼矓矚矯砲硃硜硤硨硯碩碭碸確碼磑磚"
+    "磣磧磯磽礄礎礙礦礪礫礬礱祕祿禍禎禕禦禪禮禰禱秈稅稈稜稟種稱穀穌積穎穠穡穢穩穫窩窪"
+    "窮窯窵窶窺竄竅竇竊竪競筆筍筧箇箋箏節範築篋篔篤篩篳簀簍簑簞簡簣簫簹簽簾籃籌籙籜籟"
+    "籠籤籩籪籬籮籲粧粵糝糞糧糰糲糴糶糾紀紂約紅紆紇紈紉紋納紐紓純紗紙級紛紜紡紮細紳紹"
+    "紺絀終組絆絎結絕絛絝絞絡給絨絰統絲絹綁綃綆綈綌綏經綜綠綢綣綬維綱網綴綸綺綻綽綿緄"
+    "緇緊緋緒緗緘緙線緝緞締緡緣緦編緩緬緯緱緲練緻縈縉縊縋縐縗縛縝縞縟縣縫縭縮縱縷縹總"
+    "績繃繅繆繒織繕繚繞繡繩繪繫繯繳繹繼繽繾纈纊續纏纓纔纖纘纜缽罈罌罰罵罷羅羆羈羋羥義"
+    "羶習翬翹耬聖聞聯聰聲聳聵聶職聹聽聾肅脅脈脛脣脫脹腎腖腡腦腫腳腸膕膚膠膩膽膾膿臉臍"
+    "臏臘臚臟臠臢臥臨臺與興舉舊艙艤艦艫艱艷芻茲荊莊莖莢莧華萇萊萬萵葉葒葦葷蒓蒔蒞蒼蓀"
+    "蓋蓮蓯蓴蓽蔔蔞蔣蔥蔦蔭蕁蕆蕎蕒蕓蕕蕘蕢蕩蕪蕭蕷薈薊薌薑薔薟薦薩薴薺藍藎藝藥藪藶藹"
+    "藺蘀蘄蘆蘇蘊蘋蘚蘞蘢蘭蘺蘿處虛虜號虧虯蛺蜆蝕蝟蝦蝨蝸螄螞螢螻蟄蟈蟎蟣蟬蟯蟲蟶蟻蠅"
+    "蠆蠍蠐蠑蠔蠟蠣蠨蠱蠶蠻衆衊術衛衝袞裊裏補裝裡製複褌褘褲褳褸褻襉襖襝襠襤襪襬襯襲見"
+    "規覓視覘覡覦親覬覯覲覷覺覽觀觴觶觸訂訃計訊訌訐訒訓訕訖託記訛訝訟訣訥訪設許訴訶診"
+    "註詁詆詎詐詒詔評詘詛詞詠詡詢詣試詩詬詭詮詰話該詳詼詿誄誇誌認誑誒誕誘語誠誡誣誤誦"
+    "誨說説誰課誹誼調諂諄談請諍諏諑諒論諗諛諜諞諢諤諦諧諫諭諮諱諳諶諷諸諺諼諾謀謁謂謄"
+    "謅謊謎謐謔謖謗謙謚講謝謠謨謫謬謳謹謾譁證譎譏譖識譙譚譜譫譯議譴護譽譾讀變讎讒讓讕"
+    "讖讚讜讞豈豎豐豔豬貍貓貝貞負財貢貧貨販貪貫責貯貲貴貶買貸費貼貽貿賀賁賂賃賄賅資賈"
+    "賊賑賒賓賕賙賚賜賞賠賡賢賣賤賦質賬賭賴賵賺賻購賽賾贄贅贇贈贊贍贏贐贓贔贖贗贛趕趙"
+    "趨趲跡踐踴蹌蹕蹟蹠蹣蹤蹺躉躊躋躍躑躓躕躚躡躥躦躪軀車軋軌軍軒軔軛軟軸軺軻軼軾較輅"
+    "輇輈載輊輒輓輔輕輛輜輝輞輟輥輦輩輪輬輯輳輸輻輾輿轂轄轅轆轉轍轎轔轟轡轢轤辦辭辮辯"
+    "農迴逕這連週進遊運過達違遙遜遝遞遠適遲遷選遺遼邁還邇邊邏邐郟郵鄆鄉鄒鄔鄖鄧鄭鄰鄲"
+    "鄴鄶鄺酈醃醜醞醫醬釀釁釃釋釐釓釔釗釘釙針釣釤釦釧釩釵鈀鈁鈄鈈鈉鈍鈐鈑鈔鈕鈞鈣鈥鈦"
+    "鈮鈰鈴鈷鈸鈾鈿鉀鉅鉈鉉鉋鉍鉑鉕鉗鉛鉞鉤鉬鉭鉶鉸鉻銀銃銅銑銓銖銘銚銜銠銥銦銨銪銫銬"
+    "銳銷銻鋁鋃鋅鋇鋌鋏鋒鋤鋨鋪鋯鋰鋱鋶鋸鋼錁錄錆錐錕錘錙錚錛錟錠錢錦錨錫錮錯錳錶錸鍀"
+    "鍃鍇鍋鍍鍔鍘鍛鍤鍥鍬鍰鍵鍶鍾鎂鎄鎇鎊鎔鎖鎗鎘鎢鎦鎬鎮鎰鎳鎵鏃鏇鏈鏌鏍鏑鏗鏘鏜鏝鏞"
+    "鏟鏡鏢鏤鏵鏷鏽鐃鐋鐐鐓鐔鐘鐙鐠鐦鐧鐨鐫鐮鐲鐳鐵鐶鐸鐺鐿鑄鑊鑌鑑鑒鑔鑞鑠鑣鑥鑭鑰鑱"
+    "鑲鑷鑹鑼鑽鑾鑿長門閃閉開閏閑閒間閔閘閡閣閤閥閨閩閭閱閹閻閾闆闈闊闋闌闍闐闓闔闕闖"
+    "關闡闢陘陝陣陰陳陸陽隉隊階隕際隨險隱隴隻雋雖雙雛雜雞離難雲電霑霧霽靂靄靈靜靦靨鞦"
+    "韆韋韌韓韻響頁頂頃項順須頌預頑頒頓頗領頜頡頤頭頰頷頸頹頻顆題額顎顏顓願顛類顢顥顧"
+    "顫顯顰顱顳顴風颮颯颱颳颶颺颼飄飛飢飩飪飯飲飼飽飾餃餅餉養餌餑餒餓餘餚餛餞餡館餳餵"
+    "餿饃饅饈饉饋饌饑饒饗饞馬馮駁駐駑駒駕駘駙駛駝駭駱駿騁騎騏騖騙騫騰騷騾驀驂驃驅驊驍"
+    "驕驗驚驛驟驢驥驪骯髏髒體髖髮鬆鬍鬚鬢鬥鬧鬩鬱魎魘魚魯鮑鮪鮭鮮鯉鯊鯛鯧鯨鯰鯽鰍鰓鰭"
+    "鰱鰲鰻鱈鱉鱒鱔鱖鱗鱘鱷鱸鱺鳥鳳鳴鴉鴕鴛鴣鴦鴨鴻鴿鵑鵝鵡鵬鵰鵲鶉鶩鶯鶴鶿鷂鷓鷗鷙鷥"
+    "鷲鷸鷹鷺鸕鸚鸛鸝鸞鹵鹹鹼鹽麗麥麩麵麼黃點黨黴黷黿鼴齊齋齏齒齜齡齣齦齧齪齷龍龐龔龕"
+    "龜"
+)
+
+SIMPLIFIED = (
+    "并乱亘亚伫布占并来仑侣局俣系侠伥俩仓个们幸伦伟侧侦伪杰伧伞备家佣传债伤倾仅佥侨仆"
+    "侥偾雇价仪侬亿侩俭傧俦侪尽偿优储俪傩傥俨凶兑儿兖内两册净冻凛凯别删刭则克刚剥剐创"
+    "划剧刘刽刿剑剂劲动务勋胜劳势劢勋励劝匀匦汇匮区协却厍厌厉参叁丛吴吕呙员呗念问哑启"
+    "唤丧乔单哟呛啬唝吗呜唢哔叹喽呕啧尝唛哗唠啸叽哓呒嘘哝嗳哙喷吨当咛吓哜尝噜啮咽咙向"
+    "喾严嗫嚣呓啰苏嘱囱囵国围园圆图团执坚垩尧报场块涂尘堑垫坠堕坟垦坛埙压垒圹垆坏垄坜"
+    "坝壮壶寿够梦伙夹奥奁夺奋妆奸娄妇娅娲妫妈妪妩娴婵娇嫱嫒嬷嫔婴婶娈孙学孪宫寝实宁审"
+    "写宽宠宝将专寻对导尴届尸屉屡屦属冈峰岘岛峡岗峥岚崭岖峣嵘岭屿岳峦巅岩巯帅师帐带帏"
+    "帼帻帜币帮帱干几库厕厢厩厦荫厨庙厂废广庐厅弑弪张强别弹弥弯汇彦后径从徕复征彻恒耻"
+    "悦怅闷凄恶恼恽恻爱惬悫怆忾栗态愠惨惭恸惯怄怂虑悭庆戚欲忧惫怜凭愦惮愤悯怃宪忆恳应"
+    "怿懔怼懑恹惩懒怀悬忏惧慑恋戆戋戗戬战戏户抛挟舍扪扫抡挣挂采拣扬换挥损摇捣抢掴搂挚"
+    "抟掺捞撑挠捻掸拨抚扑挞捡拥掳择击挡担据挤拟摈拧搁掷扩撷摆擞扰摅拢拦撄搀撺携摄攒挛"
+    "摊搅揽叙败叙敌数敛毙斓斩断于升时晋昼晕晖畅暂昵晔历晓暧旷晒书会胧东拐栅杆栀枧条枭"
+    "弃枨枣栋栈栖桠棕杨枫桢业极杩荣桤构枪杠梿椠椁桨桩乐枞梁楼标枢样朴树桦桡桥机椭横柽"
+    "档桧检樯台槟柠槛棹柜橹榈栉椟栎橱槠栌枥榇栊榉樱栏权栾榄棂叹欧欤欢岁历归殁残殇殚殓"
+    "殡歼杀壳毁殴毵毡氇气氢氩氲污决没冲况泄汹浃泾凉凄泪渌净沦渊浅涣减沨涡测浑凑浈涌汤"
+    "沩准沟温湿沧灭涤荥汇沪滞渗卤浒浐滚满渔沤汉涟渍涨渐浆颍泼洁潜润浔溃涠涩浇涝涧渑泽"
+    "滪浍淀浊浓湿泞蒙济涛滥潍滨溅泺滤滢渎泻沈浏濒泸沥潇潆潴泷濑弥潋澜沣滠洒漓滩灏湾滦"
+    "滟为乌烃无炼炜烟烦炀荧炝热炽烨焰灯炖烧烫焖营灿毁烛烩烬焘烁炉烂争为爷尔墙牍牵荦牦"
+    "犊牺状狭狈狰犹狲犸呆狱狮奖独狝狞获猎犷兽獭献猕猡猃珏现珐珲玮琐瑶莹玛玱琏玑瑷珰环"
+    "玙玺琼珑璎瓒瓯瓮产苏亩毕画异当畴叠痉酸疯疡痪瘗疮疟瘘疗痨痫瘅愈疠瘪痴痒疖症疬癞癣"
+    "瘿瘾痈瘫癫发皑疱皱杯盗盏尽监盘卢荡眦众困睁睐瞒睑眬瞩矫炮朱硁硖砗砚硕砀砜确码硙砖"
+    "碜碛矶硗硚础碍矿砺砾矾砻秘禄祸祯祎御禅礼祢祷籼税秆棱禀种称谷稣积颖秾穑秽稳获窝洼"
+    "穷窑窎窭窥窜窍窦窃竖竞笔笋笕个笺筝节范筑箧筼笃筛筚箦篓蓑箪简篑箫筜签帘篮筹箓箨籁"
+    "笼签笾簖篱箩吁妆粤糁粪粮团粝籴粜纠纪纣约红纡纥纨纫纹纳纽纾纯纱纸级纷纭纺扎细绅绍"
+    "绀绌终组绊绗结绝绦绔绞络给绒绖统丝绢绑绡绠绨绤绥经综绿绸绻绶维纲网缀纶绮绽绰绵绲"
+    "缁紧绯绪缃缄缂线缉缎缔缗缘缌编缓缅纬缑缈练致萦缙缢缒绉缞缚缜缟缛县缝缡缩纵缕缥总"
+    "绩绷缫缪缯织缮缭绕绣绳绘系缳缴绎继缤缱缬纩续缠缨才纤缵缆钵坛罂罚骂罢罗罴羁芈羟义"
+    "膻习翚翘耧圣闻联聪声耸聩聂职聍听聋肃胁脉胫唇脱胀肾胨脶脑肿脚肠腘肤胶腻胆脍脓脸脐"
+    "膑腊胪脏脔臜卧临台与兴举旧舱舣舰舻艰艳刍兹荆庄茎荚苋华苌莱万莴叶荭苇荤莼莳莅苍荪"
+    "盖莲苁莼荜卜蒌蒋葱茑荫荨蒇荞荬芸莸荛蒉荡芜萧蓣荟蓟芗姜蔷莶荐萨苎荠蓝荩艺药薮苈蔼"
+    "蔺萚蕲芦苏蕴苹藓蔹茏兰蓠萝处虚虏号亏虬蛱蚬蚀猬虾虱蜗蛳蚂萤蝼蛰蝈螨虮蝉蛲虫蛏蚁蝇"
+    "虿蝎蛴蝾蚝蜡蛎蟏蛊蚕蛮众蔑术卫冲衮袅里补装里制复裈袆裤裢褛亵裥袄裣裆褴袜摆衬袭见"
+    "规觅视觇觋觎亲觊觏觐觑觉览观觞觯触订讣计讯讧讦讱训讪讫托记讹讶讼诀讷访设许诉诃诊"
+    "注诂诋讵诈诒诏评诎诅词咏诩询诣试诗诟诡诠诘话该详诙诖诔夸志认诳诶诞诱语诚诫诬误诵"
+    "诲说说谁课诽谊调谄谆谈请诤诹诼谅论谂谀谍谝诨谔谛谐谏谕谘讳谙谌讽诸谚谖诺谋谒谓誊"
+    "诌谎谜谧谑谡谤谦谥讲谢谣谟谪谬讴谨谩哗证谲讥谮识谯谭谱谵译议谴护誉谫读变雠谗让谰"
+    "谶赞谠谳岂竖丰艳猪狸猫贝贞负财贡贫货贩贪贯责贮赀贵贬买贷费贴贻贸贺贲赂赁贿赅资贾"
+    "贼赈赊宾赇赒赉赐赏赔赓贤卖贱赋质账赌赖赗赚赙购赛赜贽赘赟赠赞赡赢赆赃赑赎赝赣赶赵"
+    "趋趱迹践踊跄跸迹跖蹒踪跷趸踌跻跃踯踬蹰跹蹑蹿躜躏躯车轧轨军轩轫轭软轴轺轲轶轼较辂"
+    "辁辀载轾辄挽辅轻辆辎辉辋辍辊辇辈轮辌辑辏输辐辗舆毂辖辕辘转辙轿辚轰辔轹轳办辞辫辩"
+    "农回迳这连周进游运过达违遥逊沓递远适迟迁选遗辽迈还迩边逻逦郏邮郓乡邹邬郧邓郑邻郸"
+    "邺郐邝郦腌丑酝医酱酿衅酾释厘钆钇钊钉钋针钓钐扣钏钒钗钯钫钭钚钠钝钤钣钞钮钧钙钬钛"
+    "铌铈铃钴钹铀钿钾巨铊铉刨铋铂钷钳铅钺钩钼钽铏铰铬银铳铜铣铨铢铭铫衔铑铱铟铵铕铯铐"
+    "锐销锑铝锒锌钡铤铗锋锄锇铺锆锂铽锍锯钢锞录锖锥锟锤锱铮锛锬锭钱锦锚锡锢错锰表铼锝"
+    "锪锴锅镀锷铡锻锸锲锹锾键锶钟镁锿镅镑镕锁枪镉钨镏镐镇镒镍镓镞镟链镆镙镝铿锵镗镘镛"
+    "铲镜镖镂铧镤锈铙铴镣镦镡钟镫镨锎锏镄镌镰镯镭铁镮铎铛镱铸镬镔鉴鉴镲镴铄镳镥镧钥镵"
+    "镶镊镩锣钻銮凿长门闪闭开闰闲闲间闵闸阂阁合阀闺闽闾阅阉阎阈板闱阔阕阑阇阗闿阖阙闯"
+    "关阐辟陉陕阵阴陈陆阳陧队阶陨际随险隐陇只隽虽双雏杂鸡离难云电沾雾霁雳霭灵静腼靥秋"
+    "千韦韧韩韵响页顶顷项顺须颂预顽颁顿颇领颌颉颐头颊颔颈颓频颗题额颚颜颛愿颠类颟颢顾"
+    "颤显颦颅颞颧风飑飒台刮飓飏飕飘飞饥饨饪饭饮饲饱饰饺饼饷养饵饽馁饿余肴馄饯馅馆饧喂"
+    "馊馍馒馐馑馈馔饥饶飨馋马冯驳驻驽驹驾骀驸驶驼骇骆骏骋骑骐骛骗骞腾骚骡蓦骖骠驱骅骁"
+    "骄验惊驿骤驴骥骊肮髅脏体髋发松胡须鬓斗闹阋郁魉魇鱼鲁鲍鲔鲑鲜鲤鲨鲷鲳鲸鲶鲫鳅鳃鳍"
+    "鲢鳌鳗鳕鳖鳟鳝鳜鳞鲟鳄鲈鲡鸟凤鸣鸦鸵鸳鸪鸯鸭鸿鸽鹃鹅鹉鹏雕鹊鹑鹜莺鹤鹚鹞鹧鸥鸷鸶"
+    "鹫鹬鹰鹭鸬鹦鹳鹂鸾卤咸碱盐丽麦麸面么黄点党霉黩鼋鼹齐斋齑齿龇龄出龈啮龊龌龙庞龚龛"
+    "龟"
+)
+
+SIMPLIFIED_ONLY = (
+    "专业丛东丝两严丧个临为丽举义乌乐乔习乡书买乱争亏亘亚产亩亲亵亿仅从仑仓仪们众会伞"
+    "伟传伤伥伦伧伪伫佥侠侣侥侦侧侨侩侪侬俣俦俨俩俪俭债倾偾偿傥傧储傩兑兖兰关兴兹养兽"
+    "内冈册写军农冯冲决况冻净凉减凑凛凤凭凯击凿刍刘则刚创删别刭刽刿剂剐剑剥剧劝办务劢"
+    "动励劲劳势勋匀匦匮区医华协单卖卢卤卧卫却厅历厉压厌厍厕厢厦厨厩县叁参双发变叙叠叶"
+    "号叹叽吓吕吗启吴呒呓呕呗员呙呛呜咏咙咛响哑哓哔哗哙哜哝哟唛唝唠唢唤啧啬啮啰啸喷喽"
+    "喾嗫嗳嘘嘱噜嚣团园囱围囵国图圆圹场块坚坛坜坝坟坠垄垆垒垦垩垫埙堑堕墙壮声壳壶处备"
+    "够头夹夺奁奋奖奥妆妇妈妩妪妫娄娅娇娈娲娴婴婵婶嫒嫔嫱嬷孙学孪宝实宠审宪宫宽宾寝对"
+    "寻导寿将尔尘尝尧尴尽屉届属屡屦屿岁岂岖岗岘岚岛峡峣峥峦崭嵘巅巯币帅师帏帐帜带帮帱"
+    "帻帼广庆庐库应庙庞废开弃弑张弥弪弯弹强归当录彦彻径徕忆忧忾态怂怃怄怅怆总怼怿恋恒"
+    "恳恶恸恹恻恼恽悦悫悬悭悯惧惨惩惫惬惭惮惯愠愤愦慑懑懒懔戆戋戏戗战戬户执扩扪扫扬抚"
+    "抛抟抡抢护报担拟拢拣拥拦拧拨择挚挛挞挟挠挡挣挤挥捞损捡换捣掳掴掷掸掺揽搀搁搂搅携"
+    "摄摅摆摇摈摊撄撑撷撺擞攒敌敛数斋斓斩断无旧时旷昼显晋晓晔晕晖暂暧术杀杂权条来杨杩"
+    "枞枢枣枥枧枨枪枫枭柠柽栀栅标栈栉栊栋栌栎栏树样栾桠桡桢档桤桥桦桧桨桩梦梿检棂椁椟"
+    "椠椭楼榄榇榈榉槛槟槠横樯樱橱橹欢欤欧歼殁殇残殓殚殡殴毁毂毕毙毡毵氇氢氩氲汇汉汤汹"
+    "沟没沣沤沥沦沧沨沩沪泪泷泸泺泻泼泽泾浃浅浆浇浈浊测浍济浏浐浑浒浓浔涛涝涟涠涡涣涤"
+    "润涧涨涩渊渌渍渎渐渑渔渗温湾湿溃溅滚滞滟滠满滢滤滥滦滨滩滪潆潇潋潍潜潴澜濑濒灏灭"
+    "灯灵灿炀炉炜炝点炼炽烁烂烃烛烟烦烧烨烩烫烬热焖焘爱爷牍牦牵牺犊状犷犸犹狈狝狞独狭"
+    "狮狰狱狲猃猎猕猡猪猫猬献獭玑玙玛玮环现玱玺珏珐珑珰珲琏琐琼瑶瑷璎瓒瓯电画畅畴疖疗"
+    "疟疠疡疬疮疯疱痈痉痨痪痫瘅瘗瘘瘪瘫瘾瘿癞癣癫皑皱盏盐监盖盗盘眦眬睁睐睑瞒瞩矫矶矾"
+    "矿砀码砖砗砚砜砺砻砾础硁硕硖硗硙硚碍碛碜碱礼祎祢祯祷祸禀禄禅秆积称秽秾税稣稳穑穷"
+    "窃窍窎窑窜窝窥窦窭竖竞笃笋笔笕笺笼笾筚筛筜筝筹筼签简箓箦箧箨箩箪箫篑篓篮簖籁籴类"
+    "籼粜粝粤粪粮糁紧纠纡红纣纤纥约级纨纩纪纫纬纭纯纱纲纳纵纶纷纸纹纺纽纾线绀练组绅细"
+    "织终绉绊绌绍绎经绑绒结绔绕绖绗绘给络绝绞统绠绡绢绣绤绥绦继绨绩绪续绮绯绰绲绳维绵"
+    "绶绷绸绻综绽绿缀缁缂缃缄缅缆缈缉缌缎缑缒缓缔缕编缗缘缙缚缛缜缝缞缟缠缡缢缤缥缨缩"
+    "缪缫缬缭缮缯缱缳缴缵罂罗罚罢罴羁羟翘翚耧耸耻聂聋职聍联聩聪肃肠肤肾肿胀胁胆胧胨胪"
+    "胫胶脉脍脏脐脑脓脔脚脱脶脸腘腻腼腾膑臜舆舣舰舱舻艰艳艺节芈芗芜芦苁苇苈苋苌苍苎苏"
+    "茎茏茑荆荚荛荜荞荟荠荡荣荤荥荦荧荨荩荪荫荬荭药莅莱莲莳莴莶获莸莹莺莼萚萝萤营萦萧"
+    "萨葱蒇蒉蒋蒌蓝蓟蓠蓣蓦蔷蔹蔺蔼蕲蕴薮藓虏虑虚虬虽虾虿蚀蚁蚂蚬蛊蛎蛏蛮蛰蛱蛲蛳蛴蜗"
+    "蝇蝈蝉蝼蝾螨蟏衅衔补衬衮袄袅袆袜袭装裆裈裢裣裤裥褛褴见观规觅视觇览觉觊觋觎觏觐觑"
+    "觞觯誉誊计订讣认讥讦讧让讪讫训议讯记讱讲讳讴讵讶讷许讹论讼讽设访诀证诂诃评诅识诈"
+    "诉诊诋诌词诎诏译诒诔试诖诗诘诙诚话诞诟诠诡询诣诤该详诨诩诫诬语误诱诲诳说诵诶请诸"
+    "诹诺读诼诽课谀谁谂调谄谅谆谈谊谋谌谍谎谏谐谑谒谓谔谕谖谗谘谙谚谛谜谝谟谠谡谢谣谤"
+    "谥谦谧谨谩谪谫谬谭谮谯谰谱谲谳谴谵谶贝贞负贡财责贤败账货质贩贪贫贬购贮贯贱贲贴贵"
+    "贷贸费贺贻贼贽贾贿赀赁赂赃资赅赆赇赈赉赊赋赌赎赏赐赑赒赓赔赖赗赘赙赚赛赜赝赞赟赠"
+    "赡赢赣赵趋趱趸跃跄践跷跸跹跻踌踪踬踯蹑蹒蹰蹿躏躜躯车轧轨轩轫转轭轮软轰轲轳轴轶轹"
+    "轺轻轼载轾轿辀辁辂较辄辅辆辇辈辉辊辋辌辍辎辏辐辑输辔辕辖辗辘辙辚辞辩辫边辽达迁过"
+    "迈运还这进远违连迟迩迳迹选逊递逦逻遗遥邓邝邬邮邹邺邻郏郐郑郓郦郧郸酝酱酾酿释鉴銮"
+    "钆钇针钉钊钋钏钐钒钓钗钙钚钛钝钞钟钠钡钢钣钤钥钧钨钩钫钬钭钮钯钱钳钴钵钷钹钺钻钼"
+    "钽钾钿铀铁铂铃铄铅铈铉铊铋铌铎铏铐铑铕铗铙铛铜铝铟铡铢铣铤铧铨铫铬铭铮铯铰铱铲铳"
+    "铴铵银铸铺铼铽链铿销锁锂锄锅锆锇锈锋锌锍锎锏锐锑锒锖错锚锛锝锞锟锡锢锣锤锥锦锪锬"
+    "锭键锯锰锱锲锴锵锶锷锸锹锻锾锿镀镁镂镄镅镆镇镉镊镌镍镏镐镑镒镓镔镕镖镗镘镙镛镜镝"
+    "镞镟镡镣镤镥镦镧镨镩镫镬镭镮镯镰镱镲镳镴镵镶长门闪闭问闯闰闱闲间闵闷闸闹闺闻闽闾"
+    "闿阀阁阂阅阇阈阉阋阎阐阑阔阕阖阗阙队阳阴阵阶际陆陇陈陉陕陧陨险随隐隽难雏雠雳雾霁"
+    "霭静靥韦韧韩韵页顶顷项顺须顽顾顿颁颂预颅领颇颈颉颊颌颍颐频颓颔颖颗题颚颛颜额颞颟"
+    "颠颢颤颦颧风飏飑飒飓飕飘飞飨饥饧饨饪饭饮饯饰饱饲饵饶饷饺饼饽饿馁馄馅馆馈馊馋馍馐"
+    "馑馒馔马驱驳驴驶驸驹驻驼驽驾驿骀骁骂骄骅骆骇骊骋验骏骐骑骖骗骚骛骞骠骡骤骥髅髋鬓"
+    "魇魉鱼鲁鲈鲍鲑鲔鲜鲟鲡鲢鲤鲨鲫鲳鲶鲷鲸鳃鳄鳅鳌鳍鳕鳖鳗鳜鳝鳞鳟鸟鸡鸣鸥鸦鸪鸬鸭鸯"
+    "鸳鸵鸶鸷鸽鸾鸿鹂鹃鹅鹉鹊鹏鹑鹚鹜鹞鹤鹦鹧鹫鹬鹭鹰鹳麦麸黄黩鼋鼹齐齑齿龄龇龈龊龌龙"
+    "龚龛龟"
+)
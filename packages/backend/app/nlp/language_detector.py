@@ -2,8 +2,13 @@
 Language detection utilities.
 """
 
-import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.metrics import time_stage
+from app.nlp.pattern_classifier import PatternClassifier
+from app.nlp.script import chinese_variant, fold_script
 
 # Unicode ranges for different scripts
 SCRIPT_RANGES = {
@@ -26,6 +31,48 @@ LANGUAGE_CODES = {
     "english": "en",
 }
 
+# Markers that suggest content was translated from a foreign source
+TRANSLATION_MARKERS = [
+    (r"据.*?外媒", "translation", 1.0),
+    (r"据.*?报[道导]", "translation", 1.0),  # 报导: Taiwan usage, 報導 folded
+    (r"翻译自", "translation", 1.0),
+    (r"原文来自", "translation", 1.0),
+    (r"(英|日|韩|法|德|俄)媒", "translation", 1.0),
+]
+
+TRANSLATION_CLASSIFIER = PatternClassifier(TRANSLATION_MARKERS)
+
+SCRIPT_NAMES = list(SCRIPT_RANGES)
+
+
+def _build_script_table() -> np.ndarray:
+    """
+    Build a code point -> script ID lookup table for the Basic Multilingual Plane.
+
+    ID 0 means "no tracked script"; script ``i`` in ``SCRIPT_NAMES`` gets ID
+    ``i + 1``. The last slot catches every code point outside the BMP.
+    """
+    table = np.zeros(0x10001, dtype=np.uint8)
+    # Fill in reverse so the first matching range wins, as in the original loop
+    for script_id in range(len(SCRIPT_NAMES), 0, -1):
+        start, end = SCRIPT_RANGES[SCRIPT_NAMES[script_id - 1]]
+        table[start : end + 1] = script_id
+    return table
+
+
+_SCRIPT_TABLE = _build_script_table()
+
+
+def _script_ids(text: str) -> np.ndarray:
+    """Map every character of ``text`` to its script ID in one vectorized pass."""
+    code_points = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    return _SCRIPT_TABLE[np.minimum(code_points, 0x10000)]
+
+
+def _histogram_to_counts(histogram: np.ndarray) -> Dict[str, int]:
+    """Convert a per-script-ID histogram into the ``count_script_chars`` dict shape."""
+    return dict(zip(SCRIPT_NAMES, histogram.tolist()[1:]))
+
 
 def count_script_chars(text: str) -> Dict[str, int]:
     """
@@ -37,24 +84,43 @@ def count_script_chars(text: str) -> Dict[str, int]:
     Returns:
         Dictionary mapping script names to character counts
     """
-    counts = {script: 0 for script in SCRIPT_RANGES}
+    histogram = np.bincount(_script_ids(text), minlength=len(SCRIPT_NAMES) + 1)
+    return _histogram_to_counts(histogram)
 
-    for char in text:
-        code_point = ord(char)
-        for script, (start, end) in SCRIPT_RANGES.items():
-            if start <= code_point <= end:
-                counts[script] += 1
-                break
 
-    return counts
+def count_script_chars_batch(texts: Sequence[str]) -> List[Dict[str, int]]:
+    """
+    Count script characters for many texts with a single vectorized pass.
+
+    Args:
+        texts: Input texts
+
+    Returns:
+        One ``count_script_chars``-style dictionary per text, in input order
+    """
+    if not texts:
+        return []
+
+    num_ids = len(SCRIPT_NAMES) + 1
+    ids = _script_ids("".join(texts)).astype(np.intp)
+    lengths = np.fromiter((len(text) for text in texts), dtype=np.intp, count=len(texts))
+
+    # Offset each text's IDs into its own row, then count everything at once
+    rows = np.repeat(np.arange(len(texts), dtype=np.intp) * num_ids, lengths)
+    histograms = np.bincount(rows + ids, minlength=len(texts) * num_ids)
+    histograms = histograms.reshape(len(texts), num_ids)
+
+    return [_histogram_to_counts(histogram) for histogram in histograms]
 
 
-def detect_language(text: str) -> Tuple[str, float]:
+@time_stage("language_detection")
+def detect_language(text: str, counts: Optional[Dict[str, int]] = None) -> Tuple[str, float]:
     """
     Detect the primary language of the text.
 
     Args:
         text: Input text
+        counts: Precomputed ``count_script_chars(text)`` result, to avoid recounting
 
     Returns:
         Tuple of (language_code, confidence)
@@ -62,7 +128,8 @@ def detect_language(text: str) -> Tuple[str, float]:
     if not text or not text.strip():
         return "unknown", 0.0
 
-    counts = count_script_chars(text)
+    if counts is None:
+        counts = count_script_chars(text)
     total_chars = sum(counts.values())
 
     if total_chars == 0:
@@ -77,7 +144,7 @@ def detect_language(text: str) -> Tuple[str, float]:
         # Could be Chinese or Japanese (which uses Chinese characters)
         if percentages["japanese_hiragana"] + percentages["japanese_katakana"] > 0.1:
             return "ja", percentages["japanese_hiragana"] + percentages["japanese_katakana"] + percentages["chinese"]
-        return "zh-CN", percentages["chinese"]
+        return chinese_variant(text), percentages["chinese"]
 
     if percentages["japanese_hiragana"] + percentages["japanese_katakana"] > 0.1:
         return "ja", percentages["japanese_hiragana"] + percentages["japanese_katakana"]
@@ -98,17 +165,21 @@ def detect_language(text: str) -> Tuple[str, float]:
     return "unknown", 0.0
 
 
-def detect_multiple_languages(text: str) -> List[Tuple[str, float]]:
+def detect_multiple_languages(
+    text: str, counts: Optional[Dict[str, int]] = None
+) -> List[Tuple[str, float]]:
     """
     Detect all languages present in the text.
 
     Args:
         text: Input text
+        counts: Precomputed ``count_script_chars(text)`` result, to avoid recounting
 
     Returns:
         List of (language_code, percentage) tuples, sorted by percentage
     """
-    counts = count_script_chars(text)
+    if counts is None:
+        counts = count_script_chars(text)
     total_chars = sum(counts.values())
 
     if total_chars == 0:
@@ -141,37 +212,52 @@ def detect_multiple_languages(text: str) -> List[Tuple[str, float]]:
     return sorted_langs
 
 
-def is_translation_content(text: str) -> bool:
+def is_translation_content(text: str, counts: Optional[Dict[str, int]] = None) -> bool:
     """
     Check if text appears to be translated content.
 
     Heuristics:
     - Contains multiple languages
-    - Contains translation markers
+    - Contains translation markers, matched on the Simplified form
+      (``fold_script``) so that Traditional text such as 據…報導 counts
     - Has awkward phrasing patterns
 
     Args:
         text: Input text
+        counts: Precomputed ``count_script_chars(text)`` result, to avoid recounting
 
     Returns:
         True if text appears to be translated
     """
     # Check for multiple languages
-    languages = detect_multiple_languages(text)
+    languages = detect_multiple_languages(text, counts)
     if len([l for l, p in languages if p > 0.1]) > 1:
         return True
 
     # Check for translation markers
-    translation_markers = [
-        r"据.*?外媒",
-        r"据.*?报道",
-        r"翻译自",
-        r"原文来自",
-        r"(英|日|韩|法|德|俄)媒",
-    ]
-
-    for pattern in translation_markers:
-        if re.search(pattern, text):
-            return True
-
-    return False
+    return TRANSLATION_CLASSIFIER.matches_any(fold_script(text))
+
+
+def analyze_languages_batch(
+    texts: Sequence[str],
+) -> List[Tuple[Tuple[str, float], List[Tuple[str, float]], bool]]:
+    """
+    Run all language checks for many texts, sharing one script histogram per text.
+
+    Args:
+        texts: Input texts
+
+    Returns:
+        One ``(detect_language, detect_multiple_languages, is_translation_content)``
+        result tuple per text, in input order
+    """
+    results = []
+    for text, counts in zip(texts, count_script_chars_batch(texts)):
+        results.append(
+            (
+                detect_language(text, counts),
+                detect_multiple_languages(text, counts),
+                is_translation_content(text, counts),
+            )
+        )
+    return results
@@ -0,0 +1,345 @@
+"""
+Precompiled multi-pattern classifier.
+
+All patterns are folded into one alternation where each pattern is wrapped
+in its own named group, so a sentence is scanned by a single compiled regex
+instead of one ``re.search`` per pattern. The alternation is guarded by a
+lookahead over the set of characters any pattern can start with, which lets
+the regex engine skip non-candidate positions without trying every
+alternative.
+
+The start characters are read off the pattern text by a small scanner that
+understands literals, escapes, classes, groups, alternation and quantifiers;
+anything else (``.``, anchors, lookarounds, inline flags, optional first
+atoms) means "may start anywhere" and disables the prefilter.
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+_CLASS_ESCAPES = {"d", "w", "s"}
+
+
+def _closing(pattern: str, pos: int) -> int:
+    """Index of the ``)`` closing the group opened at ``pattern[pos]``."""
+    depth = 0
+    i = pos
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "[":
+            i = _class_end(pattern, i)
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    raise ValueError(f"Unbalanced parenthesis in {pattern!r}")
+
+
+def _class_end(pattern: str, pos: int) -> int:
+    """Index of the ``]`` closing the character class opened at ``pattern[pos]``."""
+    i = pos + 1
+    if i < len(pattern) and pattern[i] == "^":
+        i += 1
+    if i < len(pattern) and pattern[i] == "]":  # a leading ] is a literal
+        i += 1
+    while i < len(pattern):
+        if pattern[i] == "\\":
+            i += 2
+            continue
+        if pattern[i] == "]":
+            return i
+        i += 1
+    raise ValueError(f"Unterminated character class in {pattern!r}")
+
+
+def _branches(pattern: str) -> List[str]:
+    """Split a pattern on its top-level ``|``."""
+    branches = []
+    depth = 0
+    last = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "[":
+            i = _class_end(pattern, i)
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            branches.append(pattern[last:i])
+            last = i + 1
+        i += 1
+    branches.append(pattern[last:])
+    return branches
+
+
+def _optional(pattern: str, pos: int) -> bool:
+    """Whether the quantifier at ``pattern[pos]``, if any, allows zero repetitions."""
+    if pos >= len(pattern):
+        return False
+    if pattern[pos] in "*?":
+        return True
+    if pattern[pos] == "{":
+        minimum = re.match(r"\{(\d*)", pattern[pos:]).group(1)
+        return not minimum or int(minimum) == 0
+    return False
+
+
+def _first_chars(pattern: str) -> Optional[Set[str]]:
+    """
+    Compute the character-class fragments a pattern can start with.
+
+    Returns None when the pattern may start with any character (or with an
+    empty match), in which case no prefilter can be built.
+    """
+    fragments: Set[str] = set()
+    for branch in _branches(pattern):
+        if not branch:
+            return None
+        char = branch[0]
+        if char == "\\":
+            escaped = branch[1:2]
+            if escaped in _CLASS_ESCAPES:
+                branch_chars = {f"\\{escaped}"}
+            elif not escaped or (escaped.isascii() and escaped.isalnum()):
+                # Assertions, backreferences, negated classes and \n-style escapes
+                return None
+            else:
+                branch_chars = {re.escape(escaped)}
+            end = 2
+        elif char == "[":
+            end = _class_end(branch, 0) + 1
+            body = branch[1 : end - 1]
+            if body.startswith("^"):
+                return None
+            branch_chars = {body}
+        elif char == "(":
+            close = _closing(branch, 0)
+            inner = branch[1:close]
+            if inner.startswith("?:"):
+                inner = inner[2:]
+            elif inner.startswith("?P<"):
+                inner = inner[inner.index(">") + 1 :]
+            elif inner.startswith("?"):
+                return None  # lookarounds, inline flags, conditionals
+            branch_chars = _first_chars(inner)
+            if branch_chars is None:
+                return None
+            end = close + 1
+        elif char in ".^$)*+?{":
+            return None
+        else:
+            branch_chars = {re.escape(char)}
+            end = 1
+        if _optional(branch, end):
+            return None
+        fragments |= branch_chars
+    return fragments
+
+
+def first_char_class(pattern: str) -> Optional[str]:
+    """
+    Build a ``[...]`` class of the characters a pattern can start with.
+
+    Args:
+        pattern: Raw regex pattern
+
+    Returns:
+        The character class, or None if one cannot be derived
+    """
+    chars = _first_chars(pattern)
+    if chars is None:
+        return None
+    return f"[{''.join(sorted(chars))}]"
+
+
+def build_prefilter(patterns: Sequence[str]) -> str:
+    """
+    Build a lookahead that only admits positions where some pattern can start.
+
+    Args:
+        patterns: Raw regex patterns
+
+    Returns:
+        A ``(?=...)`` lookahead, or an empty string if one cannot be derived
+    """
+    classes = [first_char_class(pattern) for pattern in patterns]
+    if not classes or None in classes:
+        return ""
+    # Merge the individual "[...]" classes into a single class
+    return f"(?=[{''.join(sorted({char_class[1:-1] for char_class in classes}))}])"
+
+
+class PatternHit(NamedTuple):
+    """A single pattern match inside a text."""
+
+    pattern_index: int
+    type: str
+    confidence: float
+    start: int
+    end: int
+
+
+class Classification(NamedTuple):
+    """All pattern hits for a text plus an aggregate verdict."""
+
+    type: str
+    score: float
+    hits: List[PatternHit]
+
+
+class PatternClassifier:
+    """
+    Classify text against an ordered list of ``(pattern, type, confidence)`` rules.
+
+    ``first_match`` keeps the historical semantics of walking the rules in
+    order and returning the first one that matches anywhere in the text.
+    ``classify`` reports every hit and folds the confidences into one score.
+    """
+
+    def __init__(
+        self,
+        patterns: Sequence[Tuple[str, str, float]],
+        default: Tuple[str, float] = ("factual", 0.5),
+    ) -> None:
+        self.patterns = list(patterns)
+        self.default = default
+
+        # Individually compiled rules, used for anchored re-checks at hit positions
+        self._compiled = [re.compile(pattern) for pattern, _, _ in self.patterns]
+
+        # One alternation, with every rule in a group named after its index
+        parts = [f"(?P<_rule{index}>{pattern})" for index, (pattern, _, _) in enumerate(patterns)]
+        self._group_to_index: Dict[str, int] = {
+            f"_rule{index}": index for index in range(len(self.patterns))
+        }
+        prefilter = build_prefilter([compiled.pattern for compiled in self._compiled])
+        self._combined = re.compile(f"{prefilter}(?:{'|'.join(parts)})")
+
+        # Per-rule start-character tests, so a hit position is only re-checked
+        # against rules that can actually start with the character found there
+        self._first_char = [
+            re.compile(char_class) if char_class else None
+            for char_class in (first_char_class(p.pattern) for p in self._compiled)
+        ]
+        self._candidates_by_char: Dict[str, Tuple[int, ...]] = {}
+
+    def _candidates(self, char: str) -> Tuple[int, ...]:
+        """Rule indices that may start with ``char`` (memoized per character)."""
+        candidates = self._candidates_by_char.get(char)
+        if candidates is None:
+            candidates = tuple(
+                index
+                for index, first in enumerate(self._first_char)
+                if first is None or first.match(char)
+            )
+            self._candidates_by_char[char] = candidates
+        return candidates
+
+    def _scan(self, text: str) -> List[PatternHit]:
+        """
+        Find every (rule, start) pair that matches in ``text``.
+
+        The combined regex locates the next position where any rule matches and
+        reports the highest-priority rule there; lower-priority rules are then
+        re-checked with an anchored ``match`` at that same position only, and only
+        if they can start with the character found there.
+        """
+        hits = []
+        search = self._combined.search
+        pos = 0
+
+        while True:
+            m = search(text, pos)
+            if m is None:
+                break
+
+            start = m.start()
+            index = self._group_to_index[m.lastgroup]
+            hits.append(self._hit(index, start, m.end()))
+
+            for other in self._candidates(text[start]):
+                if other <= index:
+                    continue
+                other_match = self._compiled[other].match(text, start)
+                if other_match is not None:
+                    hits.append(self._hit(other, start, other_match.end()))
+
+            pos = start + 1
+
+        return hits
+
+    def _hit(self, index: int, start: int, end: int) -> PatternHit:
+        _, claim_type, confidence = self.patterns[index]
+        return PatternHit(index, claim_type, confidence, start, end)
+
+    def matches_any(self, text: str) -> bool:
+        """Check whether any rule matches the text."""
+        return self._combined.search(text) is not None
+
+    def first_match(self, text: str) -> Optional[Tuple[str, float]]:
+        """
+        Return the ``(type, confidence)`` of the first rule, in list order, that matches.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Tuple of (type, confidence), or None if no rule matches
+        """
+        m = self._combined.search(text)
+        if m is None:
+            return None
+
+        # No rule matches before m.start(), and at m.start() no rule ranked
+        # above this one does, so only higher-ranked rules further on remain
+        best = self._group_to_index[m.lastgroup]
+        for index in range(best):
+            if self._compiled[index].search(text, m.start() + 1) is not None:
+                best = index
+                break
+
+        _, claim_type, confidence = self.patterns[best]
+        return claim_type, confidence
+
+    def classify(self, text: str) -> Classification:
+        """
+        Report every rule hit and an aggregate score.
+
+        Each distinct rule contributes once; confidences are combined with a
+        noisy-OR (``1 - prod(1 - c)``), per type and overall. The reported type
+        is the one with the highest combined score.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Classification with the winning type, overall score and all hits
+        """
+        hits = sorted(self._scan(text), key=lambda hit: (hit.start, hit.pattern_index))
+        if not hits:
+            default_type, default_confidence = self.default
+            return Classification(default_type, default_confidence, [])
+
+        seen = set()
+        miss_by_type: Dict[str, float] = {}
+        miss_overall = 1.0
+        for hit in hits:
+            if hit.pattern_index in seen:
+                continue
+            seen.add(hit.pattern_index)
+            miss_by_type[hit.type] = miss_by_type.get(hit.type, 1.0) * (1.0 - hit.confidence)
+            miss_overall *= 1.0 - hit.confidence
+
+        best_type = min(miss_by_type, key=miss_by_type.__getitem__)
+        return Classification(best_type, 1.0 - miss_overall, hits)
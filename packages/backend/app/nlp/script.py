@@ -0,0 +1,125 @@
+"""
+Chinese script normalization ahead of claim extraction.
+
+The same claim arrives in Simplified and Traditional characters, and with
+full-width letters, digits and punctuation from Chinese input methods.
+Folding every copy into one form lets them share cache keys and
+near-duplicate clusters, and lets the Simplified claim patterns and jieba's
+dictionary apply to Traditional text.
+
+Both foldings are a single ``str.translate`` over a table built once per
+process from the per-character NFKC mappings of the Basic Multilingual Plane
+and the pairs in ``hanzi_variants``:
+
+- ``fold_script`` keeps the length of the text, so offsets into the folded
+  text are offsets into the original: full-width to half-width, the other
+  one-character NFKC mappings and Traditional to Simplified. It leaves
+  ``！`` and ``？`` full-width, so sentences split as before.
+- ``normalize_script`` also applies the NFKC mappings that expand (``㎏`` to
+  ``kg``), and only runs ``unicodedata.normalize`` on text that is still not
+  NFKC-normalized after that, such as text with combining accents.
+
+``chinese_variant`` tells Traditional (zh-TW) from Simplified (zh-CN) text
+by counting the characters only one of the scripts uses, with a code point
+table like the language detector's.
+"""
+
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.nlp.hanzi_variants import SIMPLIFIED, SIMPLIFIED_ONLY, TRADITIONAL
+
+CHINESE_VARIANTS = ("zh-CN", "zh-TW")
+
+# Full-width terminators always end a Chinese sentence; their ASCII forms do not
+_TERMINATORS = "！？"
+
+
+def _build_variant_table() -> np.ndarray:
+    """Code point -> 1 for Traditional-only, 2 for Simplified-only, 0 otherwise (BMP)."""
+    table = np.zeros(0x10001, dtype=np.uint8)
+    table[[ord(char) for char in TRADITIONAL]] = 1
+    table[[ord(char) for char in SIMPLIFIED_ONLY]] = 2
+    return table
+
+
+_VARIANT_TABLE = _build_variant_table()
+
+
+@lru_cache(maxsize=None)
+def _tables() -> Tuple[Dict[int, str], Dict[int, str]]:
+    """The length-preserving folding table and the full normalization table."""
+    to_simplified = str.maketrans(TRADITIONAL, SIMPLIFIED)
+    fold = {ord(t): s for t, s in zip(TRADITIONAL, SIMPLIFIED)}
+    expand = {}
+    for code in range(0x80, 0x10000):
+        if 0xD800 <= code < 0xE000:
+            continue
+        char = chr(code)
+        normalized = unicodedata.normalize("NFKC", char)
+        if normalized != char:
+            # Compatibility ideographs normalize to Traditional forms; fold those too
+            normalized = normalized.translate(to_simplified)
+            (fold if len(normalized) == 1 else expand)[code] = normalized
+    normalize = {**fold, **expand}
+    for char in _TERMINATORS:
+        del fold[ord(char)]
+    return fold, normalize
+
+
+def fold_script(text: str) -> str:
+    """
+    Fold text to half-width, NFKC-compatible Simplified characters, keeping its length.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Folded text, of the same length as ``text``
+    """
+    if text.isascii():
+        return text
+    return text.translate(_tables()[0])
+
+
+def normalize_script(text: str) -> str:
+    """
+    NFKC-normalize text and fold Traditional characters to Simplified.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Normalized text; expanding compatibility characters may change its length
+    """
+    if text.isascii():
+        return text
+    text = text.translate(_tables()[1])
+    if not unicodedata.is_normalized("NFKC", text):
+        text = unicodedata.normalize("NFKC", text)
+    return text
+
+
+def chinese_variant(text: str) -> str:
+    """
+    ``"zh-TW"`` for text with more Traditional-only than Simplified-only characters.
+
+    Characters both scripts share are not counted, so text with neither
+    kind, or as many of each, is ``"zh-CN"``.
+    """
+    code_points = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    counts = np.bincount(_VARIANT_TABLE[np.minimum(code_points, 0x10000)], minlength=3)
+    return "zh-TW" if counts[1] > counts[2] else "zh-CN"
+
+
+def language_variants(language: str) -> List[str]:
+    """Languages whose text folds into the same script: both Chinese variants, or just one."""
+    return list(CHINESE_VARIANTS) if language.lower().startswith("zh") else [language]
+
+
+def warm_up_script_tables() -> None:
+    """Build the translation tables now instead of on the first non-ASCII text."""
+    _tables()
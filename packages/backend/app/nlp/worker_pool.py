@@ -0,0 +1,88 @@
+"""
+Process pool for CPU-bound NLP work.
+
+jieba segmentation holds the GIL, so running it inside the event loop stalls
+every other request. This module owns a shared ProcessPoolExecutor whose
+workers load the jieba dictionaries once at start-up.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional
+
+from app.config import settings
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _warm_up_worker() -> None:
+    """Initializer run once in every worker process."""
+    import jieba
+
+    from app.nlp.script import warm_up_script_tables
+    from app.nlp.tokenizer import initialize_tokenizer
+
+    jieba.setLogLevel(jieba.logging.WARNING)
+    initialize_tokenizer()
+    warm_up_script_tables()
+
+
+def get_pool_size() -> int:
+    """Resolve the configured worker count (0 means one per CPU core)."""
+    if settings.nlp_pool_workers > 0:
+        return settings.nlp_pool_workers
+    return os.cpu_count() or 1
+
+
+def create_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Create a process pool whose workers preload the jieba dictionaries."""
+    return ProcessPoolExecutor(max_workers=max_workers, initializer=_warm_up_worker)
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Get the shared NLP process pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = create_pool(get_pool_size())
+    return _pool
+
+
+def _wait_for_all(barrier: Any) -> int:
+    """Warm-up task: hold this worker until every other worker runs one too."""
+    barrier.wait()
+    return os.getpid()
+
+
+def warm_up_pool(timeout: float = 120.0) -> None:
+    """
+    Force every worker to start and finish loading its dictionaries.
+
+    Each of the pool's workers must pick up one warm-up task, because a task
+    blocks its worker at a barrier until all of them have started; a worker
+    that finishes early can't take a second one while another still loads.
+    Does nothing for a single-worker pool, which the batch functions bypass.
+
+    Args:
+        timeout: Seconds to wait for the slowest worker
+
+    Raises:
+        threading.BrokenBarrierError: If not every worker started within ``timeout``
+    """
+    size = get_pool_size()
+    if size <= 1:
+        return
+    pool = get_pool()
+    with multiprocessing.Manager() as manager:
+        barrier = manager.Barrier(size, timeout=timeout)
+        futures = [pool.submit(_wait_for_all, barrier) for _ in range(size)]
+        for future in futures:
+            future.result()
+
+
+def shutdown_pool() -> None:
+    """Shut down the shared pool, if it was started."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
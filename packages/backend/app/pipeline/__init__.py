@@ -0,0 +1,44 @@
+"""Verification pipeline module."""
+
+from app.pipeline.backends import (
+    CorpusSourceFinder,
+    CrossEncoderReranker,
+    FallbackLLM,
+    IdentityTranslator,
+    LLMBackend,
+    ProviderLLM,
+    Reranker,
+    Retriever,
+    SourceFinder,
+    Translator,
+    VectorStoreRetriever,
+)
+from app.pipeline.orchestrator import StageTimeouts, VerificationOrchestrator
+from app.pipeline.types import (
+    LLMChunk,
+    OriginalSourceMatch,
+    PipelineEvent,
+    RetrievedEvidence,
+    VerificationOutcome,
+)
+
+__all__ = [
+    "CorpusSourceFinder",
+    "CrossEncoderReranker",
+    "FallbackLLM",
+    "IdentityTranslator",
+    "LLMBackend",
+    "LLMChunk",
+    "OriginalSourceMatch",
+    "PipelineEvent",
+    "ProviderLLM",
+    "Reranker",
+    "RetrievedEvidence",
+    "Retriever",
+    "SourceFinder",
+    "StageTimeouts",
+    "Translator",
+    "VectorStoreRetriever",
+    "VerificationOrchestrator",
+    "VerificationOutcome",
+]
@@ -0,0 +1,181 @@
+"""
+Pluggable pipeline backends.
+"""
+
+import asyncio
+from dataclasses import replace
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Protocol, Sequence
+
+from app.pipeline.types import LLMChunk, OriginalSourceMatch, RetrievedEvidence
+
+if TYPE_CHECKING:
+    from app.llm import LLMClient
+
+
+class Retriever(Protocol):
+    """Fetches evidence passages for a query in a given language."""
+
+    async def retrieve(self, query: str, language: str, limit: int) -> List[RetrievedEvidence]: ...
+
+
+class LLMBackend(Protocol):
+    """Analyzes a claim against evidence, streaming the summary as it is generated."""
+
+    def stream_verdict(
+        self, claim: str, evidence: Sequence[RetrievedEvidence]
+    ) -> AsyncIterator[LLMChunk]: ...
+
+
+class Translator(Protocol):
+    """Translates a query so it can be searched in another language."""
+
+    async def translate(self, text: str, source_language: str, target_language: str) -> str: ...
+
+
+class SourceFinder(Protocol):
+    """Looks up the foreign-language original of a translated text."""
+
+    async def find(
+        self, text: str, claims: Sequence[str], language: str
+    ) -> Optional[OriginalSourceMatch]: ...
+
+
+class Reranker(Protocol):
+    """Reorders candidate passages by relevance to a claim."""
+
+    async def rerank(
+        self, claim: str, evidence: Sequence[RetrievedEvidence], top_k: int
+    ) -> List[RetrievedEvidence]: ...
+
+
+class VectorStoreRetriever:
+    """Retriever backed by the embedding service and the configured vector store."""
+
+    async def retrieve(self, query: str, language: str, limit: int) -> List[RetrievedEvidence]:
+        from app.embeddings import get_embedding_service
+        from app.vectorstore import LocalVectorStore, get_vector_store
+
+        store = get_vector_store()
+        if isinstance(store, LocalVectorStore) and len(store) == 0:
+            return []
+
+        from app.nlp.script import language_variants
+
+        embedder = await get_embedding_service()
+        vector = await embedder.embed(query)
+        # Chinese passages count in either script
+        matches = await asyncio.to_thread(store.query, vector, limit, language_variants(language))
+
+        return [
+            RetrievedEvidence(
+                id=match.id,
+                source=match.metadata.get("source", ""),
+                source_url=match.metadata.get("url", ""),
+                title=match.metadata.get("title", ""),
+                snippet=match.metadata.get("snippet", ""),
+                language=match.metadata.get("language", language),
+                score=min(max(match.score, 0.0), 1.0),
+                published_at=match.metadata.get("published_at"),
+            )
+            for match in matches
+        ]
+
+
+class CrossEncoderReranker:
+    """
+    Reranker backed by the shared cross-encoder.
+
+    Returns the ``top_k`` most relevant passages, with ``score`` replaced by
+    the calibrated relevance.
+    """
+
+    async def rerank(
+        self, claim: str, evidence: Sequence[RetrievedEvidence], top_k: int
+    ) -> List[RetrievedEvidence]:
+        from app.rerank import get_reranker
+
+        reranker = await get_reranker()
+        passages = [(item.id, f"{item.title}\n{item.snippet}".strip()) for item in evidence]
+        ranked = await reranker.rerank(claim, passages, top_k)
+        return [replace(evidence[index], score=score) for index, score in ranked]
+
+
+class CorpusSourceFinder:
+    """
+    Source finder backed by the sentence index of the local source corpus.
+
+    Only Chinese texts that ``is_translation_content`` flags are looked up.
+    """
+
+    async def find(
+        self, text: str, claims: Sequence[str], language: str
+    ) -> Optional[OriginalSourceMatch]:
+        from app.embeddings import get_embedding_service
+        from app.nlp.language_detector import is_translation_content
+        from app.sources import get_source_finder
+
+        if not language.startswith("zh") or not is_translation_content(text):
+            return None
+        finder = get_source_finder()
+        if len(finder.index) == 0:
+            return None
+
+        claims = list(claims) or [text]
+        embedder = await get_embedding_service()
+        vectors = await embedder.embed_many(claims)
+        match = await asyncio.to_thread(finder.find, claims, vectors)
+        if match is None:
+            return None
+
+        return OriginalSourceMatch(
+            claim=match.claim,
+            url=match.sentence.url,
+            title=match.sentence.title,
+            language=match.sentence.language,
+            excerpt=match.sentence.text,
+            similarity=min(max(match.sentence.similarity, 0.0), 1.0),
+            discrepancies=[discrepancy.describe() for discrepancy in match.discrepancies],
+        )
+
+
+class ProviderLLM:
+    """
+    LLM backend that asks the configured providers for a JSON verdict.
+
+    Provider responses are not streamed: the summary is part of the JSON, so
+    it is emitted as one chunk once the answer is complete.
+    """
+
+    def __init__(self, client: "LLMClient") -> None:
+        self.client = client
+
+    async def stream_verdict(
+        self, claim: str, evidence: Sequence[RetrievedEvidence]
+    ) -> AsyncIterator[LLMChunk]:
+        from app.llm import build_verdict_request, parse_verdict
+
+        response = await self.client.complete(build_verdict_request(claim, evidence))
+        verdict = parse_verdict(response.text)
+        yield LLMChunk(text=verdict.summary, verdict=verdict.verdict, confidence=verdict.confidence)
+
+
+class FallbackLLM:
+    """Used when no LLM provider is configured: always returns ``unverified``."""
+
+    async def stream_verdict(
+        self, claim: str, evidence: Sequence[RetrievedEvidence]
+    ) -> AsyncIterator[LLMChunk]:
+        summary = f"该声明目前无法完全验证。输入文本：'{claim[:50]}...'"
+        yield LLMChunk(text=summary, verdict="unverified", confidence=0.0)
+
+
+class IdentityTranslator:
+    """
+    Passes queries through unchanged.
+
+    The default embedding model is multilingual, so an untranslated query
+    still retrieves passages in the target language.
+    """
+
+    async def translate(self, text: str, source_language: str, target_language: str) -> str:
+        return text
@@ -0,0 +1,293 @@
+"""
+Async verification pipeline orchestrator.
+
+Stages: claim extraction -> translation + retrieval + reranking (fanned out
+over every claim and target language concurrently, alongside the
+original-source lookup for translated texts) -> LLM analysis. Each stage has
+its own timeout, and all of them are clipped to an overall latency budget. A
+stage that misses its deadline or fails is cut short and the run finishes
+with whatever it has, reporting ``verdict="unverified"``.
+
+Progress is emitted as ``PipelineEvent``s, so callers can forward claims
+within the claim-extraction latency and evidence as soon as each retrieval
+finishes instead of waiting for the whole run.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Set
+
+from app.config import settings
+from app.metrics import STAGE_DURATION
+from app.nlp.claim_extractor import extract_claims
+from app.pipeline.backends import LLMBackend, Reranker, Retriever, SourceFinder, Translator
+from app.pipeline.types import (
+    OriginalSourceMatch,
+    PipelineEvent,
+    RetrievedEvidence,
+    VerificationOutcome,
+)
+
+logger = logging.getLogger(__name__)
+
+# Claims retrieved for per request; the rest only appear in the claims event
+MAX_QUERY_CLAIMS = 5
+
+PARTIAL_NOTICE = "（部分验证步骤超时或失败，结果不完整。）"
+
+
+@dataclass
+class StageTimeouts:
+    """Per-stage timeouts in seconds."""
+
+    extraction: float = 1.0
+    retrieval: float = 3.0
+    llm: float = 5.0
+
+    @classmethod
+    def from_settings(cls) -> "StageTimeouts":
+        return cls(
+            extraction=settings.pipeline_extraction_timeout_ms / 1000,
+            retrieval=settings.pipeline_retrieval_timeout_ms / 1000,
+            llm=settings.pipeline_llm_timeout_ms / 1000,
+        )
+
+
+class _Deadline:
+    """Overall latency budget shared by all stages."""
+
+    def __init__(self, budget: float) -> None:
+        self.expires_at = time.monotonic() + budget
+
+    def clip(self, stage_timeout: float) -> float:
+        """Time allowed for a stage: its own timeout or what is left of the budget."""
+        return max(0.0, min(stage_timeout, self.expires_at - time.monotonic()))
+
+
+class VerificationOrchestrator:
+    """
+    Run the verification stages with concurrent fan-out and deadlines.
+
+    Args:
+        retriever: Evidence retriever
+        llm: LLM backend
+        translator: Translates claims into other target languages
+        timeouts: Per-stage timeouts
+        cross_lingual_languages: Extra languages searched when ``cross_lingual`` is set
+        source_finder: Looks up the original of translated texts, if set
+        reranker: Reorders each retrieval's candidates by relevance, if set
+        rerank_candidates: Passages retrieved per claim and language for the reranker
+    """
+
+    def __init__(
+        self,
+        retriever: Retriever,
+        llm: LLMBackend,
+        translator: Translator,
+        timeouts: Optional[StageTimeouts] = None,
+        cross_lingual_languages: Sequence[str] = (),
+        source_finder: Optional[SourceFinder] = None,
+        reranker: Optional[Reranker] = None,
+        rerank_candidates: int = 50,
+    ) -> None:
+        self.retriever = retriever
+        self.llm = llm
+        self.translator = translator
+        self.timeouts = timeouts or StageTimeouts.from_settings()
+        self.cross_lingual_languages = list(cross_lingual_languages)
+        self.source_finder = source_finder
+        self.reranker = reranker
+        self.rerank_candidates = rerank_candidates
+
+    def target_languages(self, language: str, cross_lingual: bool) -> List[str]:
+        """The request language first, then any cross-lingual targets."""
+        languages = [language]
+        if cross_lingual:
+            languages += [lang for lang in self.cross_lingual_languages if lang != language]
+        return languages
+
+    async def _retrieve(
+        self, query: str, source_language: str, target_language: str, limit: int
+    ) -> List[RetrievedEvidence]:
+        search_query = query
+        if target_language != source_language:
+            search_query = await self.translator.translate(query, source_language, target_language)
+        if self.reranker is None:
+            return await self.retriever.retrieve(search_query, target_language, limit)
+
+        candidates = await self.retriever.retrieve(
+            search_query, target_language, max(limit, self.rerank_candidates)
+        )
+        if not candidates:
+            return []
+        # The cross-encoder is multilingual: score against the untranslated claim
+        try:
+            return await self.reranker.rerank(query, candidates, limit)
+        except Exception as exc:
+            logger.warning("Reranking failed, keeping retrieval order: %s", exc)
+            return candidates[:limit]
+
+    async def stream(
+        self,
+        text: str,
+        language: str,
+        max_sources: int,
+        cross_lingual: bool = True,
+        budget: Optional[float] = None,
+    ) -> AsyncIterator[PipelineEvent]:
+        """
+        Run every stage, yielding progress events.
+
+        Args:
+            text: Text to verify
+            language: Language code of the text
+            max_sources: Maximum evidence items passed to the LLM
+            cross_lingual: Also search the configured cross-lingual languages
+            budget: Overall latency budget in seconds (default from settings)
+
+        Yields:
+            ``claims``, then ``evidence`` per item and ``original_source`` if
+            one was found, ``summary`` per token delta, and a final ``outcome``
+            event
+        """
+        deadline = _Deadline(budget or settings.pipeline_budget_ms / 1000)
+        missed: Set[str] = set()
+
+        # Stage 1: claim extraction
+        try:
+            claims = await asyncio.wait_for(
+                asyncio.to_thread(extract_claims, text, language),
+                deadline.clip(self.timeouts.extraction),
+            )
+        except asyncio.TimeoutError:
+            claims = []
+            missed.add("extraction")
+        yield PipelineEvent("claims", {"claims": [claim.model_dump() for claim in claims]})
+
+        # Stage 2: translation + retrieval + reranking, one task per (claim, language)
+        queries = [claim.text for claim in claims[:MAX_QUERY_CLAIMS]] or [text]
+        tasks = [
+            asyncio.ensure_future(self._retrieve(query, language, target, max_sources))
+            for query in queries
+            for target in self.target_languages(language, cross_lingual)
+        ]
+
+        # The source lookup shares the retrieval deadline but is best effort:
+        # missing it leaves the verdict complete, just without a mistranslation check
+        source_task = None
+        if self.source_finder is not None and cross_lingual:
+            source_task = asyncio.ensure_future(self.source_finder.find(text, queries, language))
+
+        evidence: Dict[str, RetrievedEvidence] = {}
+        original_source: Optional[OriginalSourceMatch] = None
+        retrieval_started = time.monotonic()
+        retrieval_deadline = retrieval_started + deadline.clip(self.timeouts.retrieval)
+        pending = set(tasks)
+        if source_task is not None:
+            pending.add(source_task)
+        try:
+            while pending:
+                remaining = retrieval_deadline - time.monotonic()
+                if remaining <= 0:
+                    if pending != {source_task}:
+                        missed.add("retrieval")
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task is source_task:
+                        if task.exception() is not None:
+                            logger.warning("Source lookup failed: %s", task.exception())
+                        elif task.result() is not None:
+                            original_source = task.result()
+                            yield PipelineEvent(
+                                "original_source", {"original_source": original_source.__dict__}
+                            )
+                        continue
+                    if task.exception() is not None:
+                        logger.warning("Retrieval failed: %s", task.exception())
+                        missed.add("retrieval")
+                        continue
+                    for item in task.result():
+                        if item.id not in evidence:
+                            evidence[item.id] = item
+                            yield PipelineEvent("evidence", {"evidence": item.__dict__})
+        finally:
+            for task in pending:
+                task.cancel()
+
+        STAGE_DURATION.labels("retrieval").observe(time.monotonic() - retrieval_started)
+
+        selected = sorted(evidence.values(), key=lambda item: item.score, reverse=True)
+        selected = selected[:max_sources]
+
+        # Stage 3: LLM analysis, streamed
+        summary_parts: List[str] = []
+        verdict, confidence = "unverified", 0.0
+        llm_started = time.monotonic()
+        llm_deadline = llm_started + deadline.clip(self.timeouts.llm)
+        chunks = self.llm.stream_verdict(text, selected).__aiter__()
+        try:
+            while True:
+                remaining = llm_deadline - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                try:
+                    chunk = await asyncio.wait_for(chunks.__anext__(), remaining)
+                except StopAsyncIteration:
+                    break
+                if chunk.text:
+                    summary_parts.append(chunk.text)
+                    yield PipelineEvent("summary", {"delta": chunk.text})
+                if chunk.verdict is not None:
+                    verdict = chunk.verdict
+                    confidence = chunk.confidence or 0.0
+        except asyncio.TimeoutError:
+            missed.add("llm")
+        except Exception as exc:
+            logger.warning("LLM analysis failed: %s", exc)
+            missed.add("llm")
+        finally:
+            aclose = getattr(chunks, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        STAGE_DURATION.labels("llm").observe(time.monotonic() - llm_started)
+
+        summary = "".join(summary_parts)
+        if missed:
+            verdict, confidence = "unverified", min(confidence, 0.5)
+            summary += PARTIAL_NOTICE
+
+        yield PipelineEvent(
+            "outcome",
+            {
+                "outcome": VerificationOutcome(
+                    verdict=verdict,
+                    confidence=confidence,
+                    summary=summary,
+                    claims=[claim.text for claim in claims],
+                    evidence=selected,
+                    missed_stages=sorted(missed),
+                    original_source=original_source,
+                )
+            },
+        )
+
+    async def run(
+        self,
+        text: str,
+        language: str,
+        max_sources: int,
+        cross_lingual: bool = True,
+        budget: Optional[float] = None,
+    ) -> VerificationOutcome:
+        """Run every stage and return only the final outcome."""
+        outcome = None
+        async for event in self.stream(text, language, max_sources, cross_lingual, budget):
+            if event.type == "outcome":
+                outcome = event.data["outcome"]
+        return outcome
@@ -0,0 +1,89 @@
+"""
+Data types passed between verification pipeline stages.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class RetrievedEvidence:
+    """A passage returned by a retriever."""
+
+    id: str
+    source: str
+    source_url: str
+    title: str
+    snippet: str
+    language: str
+    score: float
+    published_at: Optional[str] = None
+
+
+@dataclass
+class OriginalSourceMatch:
+    """
+    The original-language sentence a translated claim was aligned to.
+
+    ``discrepancies`` describes each number or entity the translation got
+    wrong; it is empty when the claim agrees with its source.
+    """
+
+    claim: str
+    url: str
+    title: str
+    language: str
+    excerpt: str
+    similarity: float
+    discrepancies: List[str] = field(default_factory=list)
+
+
+@dataclass
+class LLMChunk:
+    """
+    One streamed piece of LLM output.
+
+    Intermediate chunks carry summary ``text``; the final chunk also carries
+    the ``verdict`` and ``confidence``.
+    """
+
+    text: str = ""
+    verdict: Optional[str] = None
+    confidence: Optional[float] = None
+
+
+@dataclass
+class VerificationOutcome:
+    """
+    Everything the pipeline produced for one request.
+
+    ``missed_stages`` names the stages that timed out or failed; when it is
+    non-empty the result is partial and the verdict is ``unverified``.
+    """
+
+    verdict: str
+    confidence: float
+    summary: str
+    claims: List[str] = field(default_factory=list)
+    evidence: List[RetrievedEvidence] = field(default_factory=list)
+    missed_stages: List[str] = field(default_factory=list)
+    original_source: Optional[OriginalSourceMatch] = None
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.missed_stages)
+
+
+@dataclass
+class PipelineEvent:
+    """
+    A progress event emitted while the pipeline runs.
+
+    Types, in order: ``claims``, ``evidence`` (one per item) interleaved with
+    at most one ``original_source``, ``summary`` (one per token delta) and
+    finally ``outcome``, whose ``data`` holds the ``VerificationOutcome``
+    under ``"outcome"``.
+    """
+
+    type: str
+    data: Dict[str, Any] = field(default_factory=dict)
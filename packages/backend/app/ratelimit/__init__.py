@@ -0,0 +1,51 @@
+"""Request rate limiting module."""
+
+from typing import Optional
+
+from app.config import settings
+from app.ratelimit.limiters import (
+    InMemoryRateLimiter,
+    RateLimitDecision,
+    RateLimiter,
+    RedisRateLimiter,
+)
+from app.ratelimit.middleware import RateLimitMiddleware, client_key
+
+_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """
+    Get the shared rate limiter.
+
+    None when ``RATE_LIMIT_BACKEND=none`` or ``RATE_LIMIT_PER_MINUTE`` is 0 (no limit).
+    """
+    global _limiter
+    if _limiter is None and settings.rate_limit_per_minute > 0:
+        rate = settings.rate_limit_per_minute / 60
+        burst = settings.rate_limit_burst or settings.rate_limit_per_minute
+        if settings.rate_limit_backend == "redis":
+            _limiter = RedisRateLimiter(settings.redis_url, rate, burst)
+        elif settings.rate_limit_backend == "memory":
+            _limiter = InMemoryRateLimiter(rate, burst)
+    return _limiter
+
+
+async def close_rate_limiter() -> None:
+    """Close the shared limiter, if it was created."""
+    global _limiter
+    if _limiter is not None:
+        await _limiter.close()
+        _limiter = None
+
+
+__all__ = [
+    "InMemoryRateLimiter",
+    "RateLimitDecision",
+    "RateLimitMiddleware",
+    "RateLimiter",
+    "RedisRateLimiter",
+    "client_key",
+    "close_rate_limiter",
+    "get_rate_limiter",
+]
@@ -0,0 +1,197 @@
+"""
+Token-bucket rate limiters.
+
+Each client key owns a bucket holding up to ``burst`` tokens that refills at
+``rate`` tokens per second; a request spends one token or is rejected with the
+time until one is available. This absorbs the extension's bursts (a page load
+fires several requests at once) while holding the sustained rate to
+``RATE_LIMIT_PER_MINUTE``.
+
+A bucket is two numbers, so state is O(1) per key. A bucket left idle long
+enough to refill completely is indistinguishable from a new one and is
+dropped.
+"""
+
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Callable, List, NamedTuple, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitDecision(NamedTuple):
+    """Outcome of one rate-limit check."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float  # seconds until a token is available; 0 when allowed
+
+
+class RateLimiter(Protocol):
+    """Spends a token from a client's bucket."""
+
+    async def acquire(self, key: str) -> RateLimitDecision: ...
+
+    async def close(self) -> None: ...
+
+
+def _check_bucket(rate: float, burst: int) -> None:
+    if rate <= 0 or burst <= 0:
+        raise ValueError(f"Rate limit needs a positive rate and burst, got {rate} and {burst}")
+
+
+class InMemoryRateLimiter:
+    """
+    Per-process token buckets.
+
+    Buckets live in an ``OrderedDict`` kept in last-use order, so expired ones
+    are always at the front and are removed in amortized O(1) per call.
+
+    Args:
+        rate: Refill rate in tokens per second
+        burst: Bucket capacity
+        max_keys: Hard cap on tracked keys; the least recently used are dropped first
+        clock: Monotonic time source
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        _check_bucket(rate, burst)
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._clock = clock
+        self._idle_expiry = burst / rate
+        # key -> [tokens, last update]
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _evict(self, now: float) -> None:
+        buckets = self._buckets
+        while buckets:
+            key, (_, updated) = next(iter(buckets.items()))
+            if now - updated < self._idle_expiry and len(buckets) <= self.max_keys:
+                break
+            del buckets[key]
+
+    def check(self, key: str) -> RateLimitDecision:
+        """Synchronous ``acquire``, for callers outside the event loop."""
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(self.burst), now]
+        else:
+            self._buckets.move_to_end(key)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        self._evict(now)
+
+        if bucket[0] >= 1.0:
+            bucket[0] -= 1.0
+            return RateLimitDecision(True, self.burst, int(bucket[0]), 0.0)
+        return RateLimitDecision(False, self.burst, 0, (1.0 - bucket[0]) / self.rate)
+
+    async def acquire(self, key: str) -> RateLimitDecision:
+        return self.check(key)
+
+    async def close(self) -> None:
+        self._buckets.clear()
+
+
+# KEYS[1] bucket hash; ARGV: rate (tokens/s), burst, ttl (ms)
+# Returns {allowed, remaining, retry_after_ms}. Uses the Redis clock so that
+# workers with skewed clocks share one notion of time (needs Redis >= 5 for
+# writes after TIME).
+TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil then
+  tokens = burst
+else
+  tokens = math.min(burst, tokens + (now - ts) * rate / 1000)
+end
+
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+else
+  retry_after = math.ceil((1 - tokens) * 1000 / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], ARGV[3])
+return {allowed, math.floor(tokens), retry_after}
+"""
+
+
+class RedisRateLimiter:
+    """
+    Token buckets shared by every worker, updated atomically by a Lua script.
+
+    The script is sent once and then invoked by SHA (``EVALSHA``). If Redis is
+    unreachable the request is allowed: a limiter outage must not take the
+    API down with it.
+
+    Args:
+        url: Redis URL
+        rate: Refill rate in tokens per second
+        burst: Bucket capacity
+        prefix: Key prefix
+        timeout: Socket timeout in seconds
+    """
+
+    def __init__(
+        self,
+        url: str,
+        rate: float,
+        burst: int,
+        prefix: str = "ratelimit:",
+        timeout: float = 0.5,
+    ) -> None:
+        import redis.asyncio as redis
+
+        _check_bucket(rate, burst)
+        self.rate = rate
+        self.burst = burst
+        self.prefix = prefix
+        self._ttl_ms = math.ceil(burst / rate * 1000)
+        self._client = redis.from_url(
+            url,
+            decode_responses=True,
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout,
+        )
+        self._script = self._client.register_script(TOKEN_BUCKET_LUA)
+
+    async def acquire(self, key: str) -> RateLimitDecision:
+        try:
+            allowed, remaining, retry_after_ms = await self._script(
+                keys=[self.prefix + key], args=[self.rate, self.burst, self._ttl_ms]
+            )
+        except Exception as exc:
+            logger.warning("Rate limiter backend failed, allowing request: %s", exc)
+            return RateLimitDecision(True, self.burst, self.burst, 0.0)
+        return RateLimitDecision(
+            bool(allowed), self.burst, int(remaining), int(retry_after_ms) / 1000
+        )
+
+    async def close(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,54 @@
+"""Cross-encoder reranking module."""
+
+import asyncio
+from typing import Optional
+
+from app.cache.lru import TTLCache
+from app.config import settings
+from app.rerank.calibration import PlattCalibrator
+from app.rerank.model import RERANK_BACKENDS, CrossEncoderModel
+from app.rerank.reranker import Reranker, claim_hash
+
+_reranker: Optional[Reranker] = None
+_reranker_lock: Optional[asyncio.Lock] = None
+
+
+def _build_reranker() -> Reranker:
+    model = CrossEncoderModel(
+        settings.rerank_model,
+        backend=settings.rerank_backend,
+        batch_size=settings.rerank_batch_size,
+        max_length=settings.rerank_max_length,
+    )
+    cache = None
+    if settings.rerank_cache_max_entries > 0:
+        cache = TTLCache(settings.rerank_cache_max_entries, settings.rerank_cache_ttl_seconds)
+    return Reranker(
+        model,
+        cache,
+        PlattCalibrator(settings.rerank_calibration_slope, settings.rerank_calibration_intercept),
+        batch_size=settings.rerank_batch_size,
+        patience=settings.rerank_patience,
+    )
+
+
+async def get_reranker() -> Reranker:
+    """Get the shared reranker, loading the cross-encoder on first use."""
+    global _reranker, _reranker_lock
+    if _reranker is None:
+        if _reranker_lock is None:
+            _reranker_lock = asyncio.Lock()
+        async with _reranker_lock:
+            if _reranker is None:
+                _reranker = await asyncio.to_thread(_build_reranker)
+    return _reranker
+
+
+__all__ = [
+    "CrossEncoderModel",
+    "PlattCalibrator",
+    "RERANK_BACKENDS",
+    "Reranker",
+    "claim_hash",
+    "get_reranker",
+]
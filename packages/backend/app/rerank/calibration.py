@@ -0,0 +1,86 @@
+"""
+Platt scaling of cross-encoder scores.
+
+Raw cross-encoder probabilities are over-confident on passages unlike the
+model's training data. A logistic map ``sigmoid(slope * logit(p) + intercept)``
+fitted on a few hundred labelled (claim, passage) pairs turns them into
+relevance scores that mean what they say: of the passages scored 0.8, about
+80% are relevant. The identity map (slope 1, intercept 0) is the default.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+_EPSILON = 1e-6
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    # exp(-log(1 + exp(-z))) never overflows
+    return np.exp(-np.logaddexp(0.0, -z))
+
+
+def _logit(probabilities: np.ndarray) -> np.ndarray:
+    p = np.clip(np.asarray(probabilities, dtype=np.float64), _EPSILON, 1 - _EPSILON)
+    return np.log(p / (1 - p))
+
+
+class PlattCalibrator:
+    """
+    Logistic recalibration of probabilities.
+
+    Args:
+        slope: Multiplies the logit of the raw score
+        intercept: Added to the scaled logit
+    """
+
+    def __init__(self, slope: float = 1.0, intercept: float = 0.0) -> None:
+        self.slope = slope
+        self.intercept = intercept
+
+    def __call__(self, scores: np.ndarray) -> np.ndarray:
+        """Map raw probabilities to calibrated ones."""
+        return _sigmoid(self.slope * _logit(scores) + self.intercept).astype(np.float32)
+
+    @classmethod
+    def fit(
+        cls, scores: Sequence[float], labels: Sequence[int], iterations: int = 50
+    ) -> "PlattCalibrator":
+        """
+        Fit the slope and intercept to relevance labels by Newton's method.
+
+        Args:
+            scores: Raw model probabilities
+            labels: 1 for relevant pairs, 0 otherwise
+            iterations: Newton steps; a handful usually suffices
+
+        Returns:
+            The fitted calibrator
+        """
+        x = _logit(np.asarray(scores))
+        y = np.asarray(labels, dtype=np.float64)
+        features = np.stack([x, np.ones_like(x)], axis=1)
+
+        def loss(weights: np.ndarray) -> float:
+            z = features @ weights
+            return float(np.sum(np.logaddexp(0.0, z) - y * z))
+
+        # Start from the flat model, where the Hessian is well conditioned,
+        # and halve Newton steps that would increase the loss
+        weights = np.zeros(2)
+        current = loss(weights)
+        for _ in range(iterations):
+            p = _sigmoid(features @ weights)
+            gradient = features.T @ (p - y)
+            # Small ridge term keeps the Hessian invertible on separable data
+            hessian = (features * (p * (1 - p))[:, None]).T @ features + 1e-6 * np.eye(2)
+            step = np.linalg.solve(hessian, gradient)
+            while True:
+                candidate = loss(weights - step)
+                if candidate <= current or np.abs(step).max() < 1e-10:
+                    break
+                step /= 2
+            weights, improvement, current = weights - step, current - candidate, candidate
+            if improvement < 1e-9 * max(current, 1.0):
+                break
+        return cls(slope=float(weights[0]), intercept=float(weights[1]))
@@ -0,0 +1,74 @@
+"""
+Cross-encoder model loading for CPU inference.
+
+Backends:
+    torch  - plain float32 PyTorch model
+    int8   - PyTorch with dynamic int8 quantization of the Linear layers
+
+``sentence_transformers`` and ``torch`` are imported lazily, as for the
+embedding model, so the API can start without paying for them.
+"""
+
+from typing import Any, List, Tuple
+
+import numpy as np
+
+RERANK_BACKENDS = ("torch", "int8")
+
+
+class CrossEncoderModel:
+    """A loaded sentence-transformers cross-encoder with a batch ``score`` method."""
+
+    def __init__(
+        self,
+        model_name: str,
+        backend: str = "torch",
+        batch_size: int = 16,
+        max_length: int = 256,
+    ) -> None:
+        if backend not in RERANK_BACKENDS:
+            raise ValueError(
+                f"Unknown rerank backend {backend!r}; expected one of {RERANK_BACKENDS}"
+            )
+        self.model_name = model_name
+        self.backend = backend
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self._activation: Any = None
+        self._model = self._load()
+
+    def _load(self) -> Any:
+        import torch
+        from sentence_transformers import CrossEncoder
+
+        model = CrossEncoder(self.model_name, device="cpu", max_length=self.max_length)
+        if self.backend == "int8":
+            model.model = torch.quantization.quantize_dynamic(
+                model.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        model.model.eval()
+        # Many cross-encoder configs default to the identity activation, which
+        # returns raw logits; calibration and thresholds expect probabilities
+        if model.config.num_labels == 1:
+            self._activation = torch.nn.Sigmoid()
+        return model
+
+    def score(self, pairs: List[Tuple[str, str]]) -> np.ndarray:
+        """
+        Score (query, passage) pairs in one forward pass per ``batch_size`` chunk.
+
+        Args:
+            pairs: Query and passage texts
+
+        Returns:
+            float32 array of shape (len(pairs),); single-label models return a
+            sigmoid probability, whatever activation the model config names
+        """
+        scores = self._model.predict(
+            pairs,
+            batch_size=self.batch_size,
+            activation_fct=self._activation,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return np.asarray(scores, dtype=np.float32).reshape(len(pairs))
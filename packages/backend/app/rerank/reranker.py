@@ -0,0 +1,142 @@
+"""
+Cross-encoder reranking with a score cache and an adaptive cutoff.
+
+Candidates arrive in first-stage order (vector or fused rank), so the best
+passages tend to come early. They are scored in batches of ``batch_size``
+pairs; once ``patience`` consecutive batches leave the ``top_k`` set
+unchanged, the remaining candidates are assumed not to displace it and are
+left unscored. Raw scores are cached per (claim hash, passage ID), so a
+claim seen again only sends the passages it has not scored before to the
+model.
+"""
+
+import asyncio
+import hashlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.cache.keys import normalize_claim_text
+from app.cache.lru import TTLCache
+from app.metrics import CACHE_LOOKUPS, time_stage
+from app.rerank.calibration import PlattCalibrator
+
+
+def claim_hash(claim: str, model_name: str) -> str:
+    """Hash of a normalized claim together with the model that scores it."""
+    payload = f"{model_name}\0{normalize_claim_text(claim)}".encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+class Reranker:
+    """
+    Rerank passages against a claim with a cross-encoder.
+
+    ``model`` is anything with ``model_name`` and a batch
+    ``score(List[Tuple[str, str]]) -> np.ndarray`` method, so benchmarks can
+    plug in a stand-in.
+
+    Args:
+        model: Cross-encoder
+        cache: Raw scores by ``"<claim hash>:<passage id>"``; None disables caching
+        calibrator: Maps raw scores to calibrated relevance (default: identity)
+        batch_size: Pairs scored per model call
+        patience: Unchanged batches after which scoring stops
+    """
+
+    def __init__(
+        self,
+        model: object,
+        cache: Optional[TTLCache[float]] = None,
+        calibrator: Optional[PlattCalibrator] = None,
+        batch_size: int = 16,
+        patience: int = 1,
+    ) -> None:
+        self.model = model
+        self.cache = cache
+        self.calibrator = calibrator or PlattCalibrator()
+        self.batch_size = batch_size
+        self.patience = patience
+
+    async def rerank(
+        self,
+        claim: str,
+        passages: Sequence[Tuple[str, str]],
+        top_k: int,
+        score_all: bool = False,
+    ) -> List[Tuple[int, float]]:
+        """
+        Pick the ``top_k`` passages most relevant to a claim.
+
+        Args:
+            claim: Claim or query text
+            passages: ``(id, text)`` pairs, best first by first-stage rank
+            top_k: Number of passages to return
+            score_all: Disable the adaptive cutoff
+
+        Returns:
+            ``(index into passages, calibrated score)`` pairs, best first
+        """
+        with time_stage("rerank"):
+            raw = await self._score(claim, passages, top_k, score_all)
+        if not raw:
+            return []
+        indices = np.fromiter(raw, dtype=np.int64, count=len(raw))
+        calibrated = self.calibrator(np.fromiter(raw.values(), dtype=np.float32, count=len(raw)))
+        # Stable sort: ties keep first-stage order
+        order = np.argsort(-calibrated, kind="stable")[:top_k]
+        return [(int(indices[i]), float(calibrated[i])) for i in order]
+
+    async def _score(
+        self,
+        claim: str,
+        passages: Sequence[Tuple[str, str]],
+        top_k: int,
+        score_all: bool,
+    ) -> Dict[int, float]:
+        """Raw scores by passage index, for the passages up to the cutoff."""
+        key_prefix = claim_hash(claim, getattr(self.model, "model_name", ""))
+        scores: Dict[int, float] = {}
+        top: frozenset = frozenset()
+        unchanged = hits = misses = 0
+
+        # Cached scores go through the same batches, so a repeated claim stops
+        # at the same cutoff without calling the model
+        for start in range(0, len(passages), self.batch_size):
+            batch = range(start, min(start + self.batch_size, len(passages)))
+            unscored = []
+            for index in batch:
+                cached = None
+                if self.cache is not None:
+                    cached = self.cache.get(f"{key_prefix}:{passages[index][0]}")
+                if cached is None:
+                    unscored.append(index)
+                else:
+                    scores[index] = cached
+            hits += len(batch) - len(unscored)
+            misses += len(unscored)
+
+            if unscored:
+                pairs = [(claim, passages[index][1]) for index in unscored]
+                batch_scores = await asyncio.to_thread(self.model.score, pairs)
+                for index, score in zip(unscored, batch_scores):
+                    scores[index] = float(score)
+                    if self.cache is not None:
+                        self.cache.set(f"{key_prefix}:{passages[index][0]}", float(score))
+
+            if score_all:
+                continue
+            new_top = self._top(scores, top_k)
+            unchanged = unchanged + 1 if new_top == top and len(scores) >= top_k else 0
+            top = new_top
+            if unchanged >= self.patience:
+                break
+
+        if self.cache is not None:
+            CACHE_LOOKUPS.labels("rerank", "hit").inc(hits)
+            CACHE_LOOKUPS.labels("rerank", "miss").inc(misses)
+        return scores
+
+    @staticmethod
+    def _top(scores: Dict[int, float], top_k: int) -> frozenset:
+        return frozenset(sorted(scores, key=scores.__getitem__, reverse=True)[:top_k])
@@ -0,0 +1,33 @@
+"""Passive page scanning module."""
+
+from typing import Optional
+
+from app.config import settings
+from app.scan.scanner import BlockScan, Highlight, block_hash, scan_block, scan_blocks
+from app.scan.sessions import ScanSession, ScanSessionStore
+
+_sessions: Optional[ScanSessionStore] = None
+
+
+def get_scan_sessions() -> ScanSessionStore:
+    """Get the shared scan session store, creating it on first use."""
+    global _sessions
+    if _sessions is None:
+        _sessions = ScanSessionStore(
+            max_sessions=settings.scan_max_sessions,
+            ttl=settings.scan_session_ttl_seconds,
+            max_blocks=settings.scan_session_max_blocks,
+        )
+    return _sessions
+
+
+__all__ = [
+    "BlockScan",
+    "Highlight",
+    "ScanSession",
+    "ScanSessionStore",
+    "block_hash",
+    "get_scan_sessions",
+    "scan_block",
+    "scan_blocks",
+]
@@ -0,0 +1,65 @@
+"""
+Claim highlighting for page text blocks.
+
+A block is one chunk of page text as the extension sees it (a post, a
+paragraph). Scanning a block locates its sentences, classifies each with the
+claim patterns and flags the block when it looks translated. Everything here
+is regex and table work, with no jieba, so a whole page fits in a few tens
+of milliseconds.
+"""
+
+import hashlib
+from typing import List, NamedTuple, Sequence
+
+from app.nlp.claim_extractor import detect_claim_type, sentence_spans
+from app.nlp.language_detector import is_translation_content
+from app.nlp.script import fold_script
+
+
+class Highlight(NamedTuple):
+    """A claim-like sentence within a block."""
+
+    start: int
+    end: int
+    type: str
+    confidence: float
+
+
+class BlockScan(NamedTuple):
+    """Scan result for one block."""
+
+    highlights: List[Highlight]
+    translated: bool
+
+
+def block_hash(text: str) -> str:
+    """Short content hash identifying a block's text."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def scan_block(text: str, min_confidence: float = 0.6) -> BlockScan:
+    """
+    Find the sentences of a block worth highlighting.
+
+    Args:
+        text: Block text
+        min_confidence: Minimum claim-pattern confidence; sentences matching
+            no pattern score 0.5
+
+    Returns:
+        Highlights as offsets into ``text``, and whether the block looks
+        translated (only checked for blocks that have highlights)
+    """
+    highlights = []
+    # Match on the Simplified form, as extract_claims does; folding keeps offsets
+    folded = fold_script(text)
+    for start, end in sentence_spans(folded):
+        claim_type, confidence = detect_claim_type(folded[start:end])
+        if confidence >= min_confidence:
+            highlights.append(Highlight(start, end, claim_type, confidence))
+    return BlockScan(highlights, bool(highlights) and is_translation_content(text))
+
+
+def scan_blocks(texts: Sequence[str], min_confidence: float = 0.6) -> List[BlockScan]:
+    """``scan_block`` for several blocks, in order."""
+    return [scan_block(text, min_confidence) for text in texts]
@@ -0,0 +1,103 @@
+"""
+Per-session memory of the page blocks already scanned.
+
+Infinite-scroll feeds re-send mostly the same blocks every few seconds. Each
+scan session remembers the ID and content hash of every block it has already
+returned results for, so a repeated block is skipped and only new or edited
+ones are scanned. The client keeps highlights per block ID, so a new block
+whose text matches an earlier one is still scanned, and a change of
+``min_confidence`` forgets every block, since their highlights no longer
+apply. Both the sessions and each session's blocks are bounded LRUs: idle
+sessions expire and a long scroll forgets its oldest blocks first.
+
+Sessions live in the worker that served them; a session whose requests are
+spread over several workers just rescans some blocks.
+"""
+
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+from app.cache.lru import TTLCache
+
+
+class ScanSession:
+    """
+    Rolling map of block ID to the hash of its text last scanned, for one session.
+
+    Args:
+        max_blocks: Blocks remembered; the least recently seen are dropped
+    """
+
+    def __init__(self, max_blocks: int = 5_000) -> None:
+        self.max_blocks = max_blocks
+        self.min_confidence: Optional[float] = None
+        self._seen: "OrderedDict[str, str]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, block: Tuple[str, str]) -> bool:
+        block_id, block_hash = block
+        return self._seen.get(block_id) == block_hash
+
+    def use_threshold(self, min_confidence: float) -> None:
+        """Forget every block if they were scanned with a different ``min_confidence``."""
+        if min_confidence != self.min_confidence:
+            self._seen.clear()
+            self.min_confidence = min_confidence
+
+    def unseen(self, blocks: Iterable[Tuple[str, str]]) -> List[int]:
+        """
+        Positions of the blocks not seen before; the seen ones are refreshed.
+
+        Args:
+            blocks: ``(block ID, hash)`` pairs of one request, in order
+
+        Returns:
+            Indexes into ``blocks`` of the new or edited blocks, which need scanning
+        """
+        positions = []
+        for position, (block_id, block_hash) in enumerate(blocks):
+            if self._seen.get(block_id) == block_hash:
+                self._seen.move_to_end(block_id)
+            else:
+                positions.append(position)
+        return positions
+
+    def add(self, blocks: Iterable[Tuple[str, str]]) -> None:
+        """Remember scanned blocks as ``(block ID, hash)`` pairs."""
+        for block_id, block_hash in blocks:
+            self._seen[block_id] = block_hash
+            self._seen.move_to_end(block_id)
+        while len(self._seen) > self.max_blocks:
+            self._seen.popitem(last=False)
+
+
+class ScanSessionStore:
+    """
+    Scan sessions by ID, expiring after ``ttl`` seconds without a request.
+
+    Args:
+        max_sessions: Sessions kept; the least recently used are dropped
+        ttl: Idle lifetime of a session in seconds
+        max_blocks: Blocks remembered per session
+    """
+
+    def __init__(
+        self, max_sessions: int = 10_000, ttl: float = 600.0, max_blocks: int = 5_000
+    ) -> None:
+        self.max_blocks = max_blocks
+        self._sessions: TTLCache[ScanSession] = TTLCache(max_sessions, ttl)
+
+    def get(self, session_id: str) -> ScanSession:
+        """Return the session, starting a new one if it is unknown or expired."""
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = ScanSession(self.max_blocks)
+        # Re-set on every request so the idle timeout restarts
+        self._sessions.set(session_id, session)
+        return session
+
+    def reset(self, session_id: str) -> None:
+        """Forget a session's blocks."""
+        self._sessions.delete(session_id)
@@ -0,0 +1,13 @@
+"""Multi-worker serving: preload once in a parent process, fork the workers."""
+
+from app.serve.launcher import preload, serve
+from app.serve.memory import ProcessMemory, child_pids, format_memory_report, process_memory
+
+__all__ = [
+    "ProcessMemory",
+    "child_pids",
+    "format_memory_report",
+    "preload",
+    "process_memory",
+    "serve",
+]
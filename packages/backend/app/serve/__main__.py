@@ -0,0 +1,39 @@
+"""
+Serve the API from several workers that share one copy of the loaded models.
+
+Usage:
+    python -m app.serve [--workers 4] [--host 0.0.0.0] [--port 8000] [--no-preload-embeddings]
+
+Send SIGUSR1 to the parent process to log each worker's memory.
+"""
+
+import argparse
+import logging
+import sys
+
+from app.config import settings
+from app.serve import serve
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--workers", type=int, default=settings.workers, help="0 = one per core")
+    parser.add_argument("--host", default=settings.host)
+    parser.add_argument("--port", type=int, default=settings.port)
+    parser.add_argument(
+        "--no-preload-embeddings",
+        dest="preload_embeddings",
+        action="store_false",
+        default=settings.preload_embeddings,
+        help="let each worker load the embedding model on first use",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(process)d] %(message)s")
+    sys.exit(serve(args.workers, args.host, args.port, args.preload_embeddings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Production launcher: load the models once, then fork the serving workers.
+
+Every worker started by ``uvicorn --workers`` imports the app and loads the
+jieba dictionaries, the script tables, the credibility registry, the indexes
+and later the embedding model on its own, so resident memory grows with the
+worker count and every worker starts cold. ``serve`` loads all of that once
+in the parent process and then forks the workers, which share the loaded
+pages copy-on-write. The parent also indexes the source corpus, which every
+worker's start-up would otherwise embed and snapshot at the same time, and
+splits the CPU cores between the workers' NLP pools.
+
+As the ``gc`` module recommends for fork without exec, the parent keeps the
+cyclic collector off while loading and freezes everything it loaded before
+forking, so a collection in a worker never writes to the GC headers of the
+shared objects; workers turn the collector back on at once. Reference
+counting still copies the pages of objects a worker touches, so the parent
+logs each worker's unique memory ``settings.memory_report_seconds`` after
+start and whenever it receives SIGUSR1.
+
+The parent binds the listening socket, which the workers accept on, restarts
+workers that exit, and stops them all on SIGTERM or SIGINT. It clears
+``settings.metrics_dir`` of files left by an earlier run before forking.
+Workers inherit the parent's snapshot paths, so only the first worker slot
+writes the claim index back on shutdown; the others would replace the same
+directory at the same time.
+"""
+
+import asyncio
+import gc
+import logging
+import os
+import signal
+import socket
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+from app.serve.memory import child_pids, format_memory_report, process_memory
+
+logger = logging.getLogger(__name__)
+
+# A worker exiting this soon after it was forked failed to start; restarting won't help
+_BOOT_SECONDS = 10.0
+
+
+def preload(embeddings: bool = True) -> None:
+    """Load the models, tables and indexes that workers would otherwise each load."""
+    from app.credibility import get_credibility_registry
+    from app.dedup import get_claim_index
+    from app.lexical import get_lexical_index
+    from app.nlp.script import warm_up_script_tables
+    from app.nlp.tokenizer import initialize_tokenizer
+    from app.sources import get_source_finder
+    from app.vectorstore import get_vector_store
+
+    logger.info("Tokenizer loaded in %.2fs", initialize_tokenizer())
+    warm_up_script_tables()
+    get_credibility_registry()
+    get_claim_index()
+    get_lexical_index()
+    get_source_finder()
+    # A Pinecone client holds connections, which must not be shared across a fork
+    if settings.vector_store_backend == "local":
+        get_vector_store()
+
+    preloaded = False
+    if embeddings:
+        from app.embeddings import preload_embedding_service
+
+        try:
+            preload_embedding_service()
+            preloaded = True
+        except Exception as exc:
+            logger.warning("Embedding model not preloaded; workers load it on first use: %s", exc)
+
+    try:
+        indexed = asyncio.run(_index_source_corpus(keep_embeddings=preloaded))
+        if indexed:
+            logger.info("Indexed %d source sentences", indexed)
+    except Exception as exc:
+        logger.warning("Source corpus not indexed: %s", exc)
+
+
+async def _index_source_corpus(keep_embeddings: bool) -> int:
+    """Index the source corpus if it isn't yet, leaving no task behind in this event loop."""
+    from app.embeddings import close_embedding_service, preload_embedding_service
+    from app.sources import load_source_corpus
+
+    try:
+        return await load_source_corpus()
+    finally:
+        if keep_embeddings:
+            # Stop the batching task; each worker starts its own in its event loop
+            await preload_embedding_service().close()
+        else:
+            await close_embedding_service()
+
+
+def _configure_worker(slot: int) -> None:
+    """
+    Set up a freshly forked worker.
+
+    Args:
+        slot: Index of the worker, kept by its replacement when it exits
+    """
+    gc.enable()
+    for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGALRM):
+        signal.signal(signum, signal.SIG_DFL)
+    # Only the parent reports memory
+    signal.signal(signal.SIGUSR1, signal.SIG_IGN)
+    if slot > 0:
+        # Only one worker snapshots the claim index, to the path they all inherited
+        settings.dedup_index_path = ""
+
+
+def _run_worker(config: Any, sock: socket.socket, slot: int) -> None:
+    """Serve in a forked worker until uvicorn exits; never returns to the parent's code."""
+    code = 1
+    try:
+        _configure_worker(slot)
+
+        import uvicorn
+
+        uvicorn.Server(config).run(sockets=[sock])
+        code = 0
+    finally:
+        os._exit(code)
+
+
+def serve(
+    workers: Optional[int] = None,
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    preload_embeddings: Optional[bool] = None,
+) -> int:
+    """
+    Preload the app, fork ``workers`` uvicorn workers and supervise them.
+
+    Args:
+        workers: Worker processes; 0 means one per CPU core (default: settings)
+        host: Address to listen on (default: settings)
+        port: Port to listen on (default: settings)
+        preload_embeddings: Load the embedding model before forking (default: settings)
+
+    Returns:
+        Exit status: 0 after a requested shutdown, non-zero if a worker failed to start
+    """
+    workers = settings.workers if workers is None else workers
+    workers = workers or os.cpu_count() or 1
+    if preload_embeddings is None:
+        preload_embeddings = settings.preload_embeddings
+    if workers > 1 and not settings.metrics_dir:
+        logger.warning("METRICS_DIR is not set: /metrics only reports the worker serving it")
+    if settings.nlp_pool_workers <= 0:
+        # One NLP process per core in every worker would oversubscribe the cores
+        settings.nlp_pool_workers = max(1, (os.cpu_count() or 1) // workers)
+
+    # Off before the app is imported, so the loaded objects aren't interleaved with freed ones
+    gc.disable()
+    start = time.perf_counter()
+
+    import uvicorn
+
+    from app.main import app
+    from app.metrics import REGISTRY
+
+    # Metric files of an earlier run would be summed into this one's
+    REGISTRY.store.remove_other_files()
+    preload(preload_embeddings)
+    config = uvicorn.Config(
+        app,
+        host=host or settings.host,
+        port=port or settings.port,
+        lifespan="on",
+    )
+    sock = config.bind_socket()
+    logger.info("Preloaded in %.2fs; starting %d workers", time.perf_counter() - start, workers)
+
+    # PID -> (worker slot, start time)
+    children: Dict[int, Tuple[int, float]] = {}
+    stopping = False
+    exit_code = 0
+
+    def spawn(slot: int) -> None:
+        gc.freeze()
+        pid = os.fork()
+        if pid == 0:
+            _run_worker(config, sock, slot)
+        children[pid] = (slot, time.monotonic())
+
+    def stop(signum: int = signal.SIGTERM, frame: Any = None) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def report(signum: int = signal.SIGUSR1, frame: Any = None) -> None:
+        rows = [("parent", os.getpid())]
+        try:
+            for i, pid in enumerate(sorted(children)):
+                rows.append((f"worker {i}", pid))
+                rows += [(f"worker {i} pool", child) for child in child_pids(pid)]
+            usage = [(label, process_memory(pid)) for label, pid in rows]
+        except OSError as exc:
+            logger.warning("Memory report unavailable: %s", exc)
+            return
+        logger.info("Memory in MiB (USS = unique to the process)\n%s", format_memory_report(usage))
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGUSR1, report)
+    signal.signal(signal.SIGALRM, report)
+
+    for slot in range(workers):
+        spawn(slot)
+    if settings.memory_report_seconds > 0:
+        signal.setitimer(signal.ITIMER_REAL, settings.memory_report_seconds)
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        # Libraries may run subprocesses of their own in the parent
+        child = children.pop(pid, None)
+        code = os.waitstatus_to_exitcode(status)
+        if child is None or stopping:
+            continue
+        slot, started = child
+        if code != 0 and time.monotonic() - started < _BOOT_SECONDS:
+            logger.error("Worker %d failed to start (exit code %d); shutting down", pid, code)
+            exit_code = code if code > 0 else 1
+            stop()
+        else:
+            logger.warning("Worker %d exited with code %d; starting another", pid, code)
+            spawn(slot)
+
+    sock.close()
+    return exit_code
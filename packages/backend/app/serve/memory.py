@@ -0,0 +1,88 @@
+"""
+Per-process memory accounting from ``/proc/<pid>/smaps_rollup`` (Linux).
+
+RSS counts every resident page a process maps, so summing it over forked
+workers counts the pages they share once per worker. PSS divides each
+shared page between the processes mapping it, so the PSS of a process tree
+adds up to its real footprint, and USS (the private pages) is what a worker
+costs on its own: the memory that would be freed if it exited.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+_FIELDS = ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty")
+
+
+@dataclass(frozen=True)
+class ProcessMemory:
+    """Memory of one process, in bytes."""
+
+    pid: int
+    rss: int
+    pss: int
+    shared: int
+    uss: int
+
+
+def _read_smaps(pid: int) -> Dict[str, int]:
+    """Sum the fields of interest over a process's mappings, in bytes."""
+    totals = dict.fromkeys(_FIELDS, 0)
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", encoding="ascii") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        # Kernels before 4.14 only have the per-mapping file
+        with open(f"/proc/{pid}/smaps", encoding="ascii") as f:
+            lines = f.readlines()
+    for line in lines:
+        field, _, value = line.partition(":")
+        if field in totals:
+            totals[field] += int(value.split()[0]) * 1024
+    return totals
+
+
+def process_memory(pid: int) -> ProcessMemory:
+    """
+    RSS, PSS, shared and unique memory of a process.
+
+    Raises:
+        OSError: The process doesn't exist or its memory maps aren't readable
+    """
+    totals = _read_smaps(pid)
+    return ProcessMemory(
+        pid=pid,
+        rss=totals["Rss"],
+        pss=totals["Pss"],
+        shared=totals["Shared_Clean"] + totals["Shared_Dirty"],
+        uss=totals["Private_Clean"] + totals["Private_Dirty"],
+    )
+
+
+def child_pids(pid: int) -> List[int]:
+    """PIDs of a process's children, such as a worker's NLP pool processes."""
+    children: List[int] = []
+    for task in os.listdir(f"/proc/{pid}/task"):
+        with open(f"/proc/{pid}/task/{task}/children", encoding="ascii") as f:
+            children += [int(child) for child in f.read().split()]
+    return children
+
+
+def format_memory_report(processes: Sequence[Tuple[str, ProcessMemory]]) -> str:
+    """A table of labelled processes with totals, in MiB."""
+    mib = 1 << 20
+    header = ("RSS", "PSS", "shared", "USS")
+    lines: List[str] = [f"{'process':<16} {'pid':>8} " + " ".join(f"{h:>9}" for h in header)]
+    for label, usage in processes:
+        lines.append(
+            f"{label:<16} {usage.pid:>8} {usage.rss / mib:9.1f} {usage.pss / mib:9.1f} "
+            f"{usage.shared / mib:9.1f} {usage.uss / mib:9.1f}"
+        )
+    rss = sum(usage.rss for _, usage in processes)
+    pss = sum(usage.pss for _, usage in processes)
+    uss = sum(usage.uss for _, usage in processes)
+    lines.append(
+        f"{'total':<16} {'':>8} {rss / mib:9.1f} {pss / mib:9.1f} {'':>9} {uss / mib:9.1f}"
+    )
+    return "\n".join(lines)
@@ -0,0 +1,103 @@
+"""Original-source lookup module for mistranslation detection."""
+
+import asyncio
+import logging
+import os
+from typing import Optional
+
+from app.config import settings
+from app.sources.facts import (
+    ENTITY_ALIASES,
+    Discrepancy,
+    Quantity,
+    compare_facts,
+    extract_entities,
+    extract_quantities,
+)
+from app.sources.finder import OriginalSourceFinder, SourceMatch
+from app.sources.index import (
+    SourceDocument,
+    SourceIndex,
+    SourceSentence,
+    load_documents,
+    sentence_records,
+)
+from app.vectorstore import LocalVectorStore
+
+logger = logging.getLogger(__name__)
+
+_finder: Optional[OriginalSourceFinder] = None
+
+
+def get_source_finder() -> OriginalSourceFinder:
+    """
+    Get the shared source finder, creating it on first use.
+
+    Restores the index snapshot at ``settings.source_index_path`` when one
+    exists; otherwise the index starts empty until ``load_source_corpus`` runs.
+    """
+    global _finder
+    if _finder is None:
+        path = settings.source_index_path
+        if path and os.path.exists(os.path.join(path, "manifest.json")):
+            index = SourceIndex.restore(path)
+        else:
+            index = SourceIndex(
+                LocalVectorStore(dim=settings.vector_store_dim, dtype=settings.vector_store_dtype)
+            )
+        _finder = OriginalSourceFinder(
+            index,
+            languages=settings.source_languages_list,
+            min_similarity=settings.source_min_similarity,
+            top_k=settings.source_top_k,
+        )
+    return _finder
+
+
+async def load_source_corpus() -> int:
+    """
+    Index ``settings.source_corpus_path`` if the index is still empty.
+
+    The sentences are embedded with the shared embedding service and the
+    index is snapshotted to ``settings.source_index_path``, so later starts
+    just restore it.
+
+    Returns:
+        Number of sentences indexed
+    """
+    from app.embeddings import get_embedding_service
+
+    finder = get_source_finder()
+    path = settings.source_corpus_path
+    if len(finder.index) or not path or not os.path.exists(path):
+        return 0
+
+    ids, texts, metadata = await asyncio.to_thread(
+        lambda: sentence_records(load_documents(path))
+    )
+    embedder = await get_embedding_service()
+    vectors = await embedder.embed_many(texts)
+    await asyncio.to_thread(finder.index.add, ids, vectors, metadata)
+    if settings.source_index_path:
+        await asyncio.to_thread(finder.index.snapshot, settings.source_index_path)
+    logger.info("Indexed %d source sentences from %s", len(ids), path)
+    return len(ids)
+
+
+__all__ = [
+    "Discrepancy",
+    "ENTITY_ALIASES",
+    "OriginalSourceFinder",
+    "Quantity",
+    "SourceDocument",
+    "SourceIndex",
+    "SourceMatch",
+    "SourceSentence",
+    "compare_facts",
+    "extract_entities",
+    "extract_quantities",
+    "get_source_finder",
+    "load_documents",
+    "load_source_corpus",
+    "sentence_records",
+]
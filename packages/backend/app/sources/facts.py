@@ -0,0 +1,299 @@
+"""
+Numbers and named entities that a translation must preserve.
+
+A translated claim and its original can be compared fact by fact, whatever
+the two languages are, if every quantity is read as a value and every entity
+as a language-independent key:
+
+- "6.9亿吨", "690 million tonnes" and "690,000,000" are all 6.9e8.
+- "30%", "百分之三十" and "三成" are all 30 percent.
+- "世卫组织" and "WHO" are both the entity ``who``.
+
+Values are compared only to the precision they were written with, so "约7亿"
+agrees with "690 million" while "3%" does not agree with "30%".
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Tuple
+
+
+class Quantity(NamedTuple):
+    """A number found in a text, with its unit multiplier applied."""
+
+    value: float
+    percent: bool
+    tolerance: float  # half a unit in the last written digit
+    text: str
+
+
+@dataclass
+class Discrepancy:
+    """A fact stated differently in a claim and in its original source."""
+
+    kind: str  # "number" or "entity"
+    claim: str
+    source: str
+    note: str = ""
+
+    def describe(self) -> str:
+        """One-line description for ``mistranslation_details``."""
+        label = "数字" if self.kind == "number" else "主体"
+        return f"{label}不符：译文为“{self.claim}”，原文为“{self.source}”" + self.note
+
+
+# ---------------------------------------------------------------------------
+# Quantities
+# ---------------------------------------------------------------------------
+
+_MULTIPLIERS = {
+    "万亿": 1e12,
+    "亿": 1e8,
+    "万": 1e4,
+    "千": 1e3,
+    "trillion": 1e12,
+    "billion": 1e9,
+    "bn": 1e9,
+    "million": 1e6,
+    "thousand": 1e3,
+}
+
+_CHINESE_DIGITS = {
+    "零": 0, "〇": 0, "一": 1, "二": 2, "两": 2, "三": 3, "四": 4,
+    "五": 5, "六": 6, "七": 7, "八": 8, "九": 9,
+}
+_CHINESE_UNITS = {"十": 10, "百": 100, "千": 1000}
+
+_NUMBER = r"\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?"
+_CHINESE_NUMBER = r"[零〇一二两三四五六七八九十百千]+"
+
+_QUANTITY = re.compile(
+    rf"百分之(?P<zh_percent>{_NUMBER}|{_CHINESE_NUMBER})"
+    rf"|(?P<tenths>{_NUMBER}|[一二三四五六七八九十])成"
+    rf"|(?<![A-Za-z0-9.,])(?P<number>(?>{_NUMBER}))\s*"
+    r"(?:(?P<percent>%|％|percent\b|per cent\b)"
+    r"|(?P<multiplier>万亿|亿|万|千|(?:trillion|billion|bn|million|thousand)\b))?"
+    # Month and day numbers are left out: they rarely survive translation as digits
+    r"(?![月日号])",
+    re.IGNORECASE,
+)
+
+
+def _parse_chinese_number(text: str) -> float:
+    """Value of a Chinese numeral below ten thousand, e.g. "三十" or "二百五十"."""
+    total, digit = 0, 0
+    for char in text:
+        if char in _CHINESE_DIGITS:
+            digit = _CHINESE_DIGITS[char]
+        else:
+            total += (digit or 1) * _CHINESE_UNITS[char]
+            digit = 0
+    return float(total + digit)
+
+
+def _parse_number(text: str, rounded: bool = False) -> Tuple[float, float]:
+    """
+    Value and half-unit tolerance of a written number such as "1,200" or "6.9".
+
+    With ``rounded``, the trailing zeros of an integer are taken as rounding,
+    as in "300 million"; percentages are compared to their last digit.
+    """
+    if not text[0].isdigit():
+        return _parse_chinese_number(text), 0.5
+    digits = text.replace(",", "")
+    if "." in digits:
+        return float(digits), 0.5 * 10.0 ** -len(digits.split(".")[1])
+    zeros = len(digits) - len(digits.rstrip("0")) if rounded and digits.strip("0") else 0
+    return float(digits), 0.5 * 10.0**zeros
+
+
+def extract_quantities(text: str) -> List[Quantity]:
+    """
+    Find the numbers in a Chinese or English text.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Quantities in order of appearance
+    """
+    quantities = []
+    for match in _QUANTITY.finditer(text):
+        if match["zh_percent"]:
+            value, tolerance = _parse_number(match["zh_percent"])
+            percent = True
+        elif match["tenths"]:
+            value, tolerance = _parse_number(match["tenths"])
+            value, tolerance, percent = value * 10, tolerance * 10, True
+        else:
+            percent = match["percent"] is not None
+            value, tolerance = _parse_number(match["number"], rounded=not percent)
+            if match["multiplier"]:
+                scale = _MULTIPLIERS[match["multiplier"].lower()]
+                value, tolerance = value * scale, tolerance * scale
+        quantities.append(Quantity(value, percent, tolerance, match.group().strip()))
+    return quantities
+
+
+def _agrees(a: Quantity, b: Quantity) -> bool:
+    return a.percent == b.percent and abs(a.value - b.value) <= max(a.tolerance, b.tolerance)
+
+
+def _scale_note(claim: Quantity, source: Quantity) -> str:
+    """Flag the power-of-ten slips typical of 万/亿 and million/billion conversions."""
+    if claim.value <= 0 or source.value <= 0:
+        return ""
+    exponent = math.log10(max(claim.value, source.value) / min(claim.value, source.value))
+    if exponent >= 0.99 and abs(exponent - round(exponent)) < 0.01:
+        return f"（相差{10 ** round(exponent):,}倍）"
+    return ""
+
+
+def compare_quantities(claim: List[Quantity], source: List[Quantity]) -> List[Discrepancy]:
+    """
+    Pair up the quantities of a claim and its source that disagree.
+
+    Quantities that agree with one on the other side are set aside first. The
+    rest are paired in order of appearance, within the same kind (percentages
+    or plain numbers), since a translation keeps the order of facts. A number
+    with no counterpart is not flagged, as translations often drop details.
+    """
+    unmatched_source = list(source)
+    unmatched_claim = []
+    for quantity in claim:
+        for i, candidate in enumerate(unmatched_source):
+            if _agrees(quantity, candidate):
+                del unmatched_source[i]
+                break
+        else:
+            unmatched_claim.append(quantity)
+
+    discrepancies = []
+    for percent in (True, False):
+        claims = [q for q in unmatched_claim if q.percent == percent]
+        sources = [q for q in unmatched_source if q.percent == percent]
+        for claimed, original in zip(claims, sources):
+            discrepancies.append(
+                Discrepancy("number", claimed.text, original.text, _scale_note(claimed, original))
+            )
+    return discrepancies
+
+
+# ---------------------------------------------------------------------------
+# Entities
+# ---------------------------------------------------------------------------
+
+# Entity key -> surface forms in any language. Latin forms match whole words.
+ENTITY_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "us": ("美国", "United States", "U.S.", "US", "USA", "America"),
+    "china": ("中国", "China"),
+    "japan": ("日本", "Japan"),
+    "uk": ("英国", "United Kingdom", "Britain", "UK"),
+    "russia": ("俄罗斯", "Russia"),
+    "germany": ("德国", "Germany"),
+    "france": ("法国", "France"),
+    "south_korea": ("韩国", "South Korea"),
+    "india": ("印度", "India"),
+    "ukraine": ("乌克兰", "Ukraine"),
+    "who": ("世界卫生组织", "世卫组织", "World Health Organization", "WHO"),
+    "un": ("联合国", "United Nations", "UN"),
+    "eu": ("欧盟", "European Union", "EU"),
+    "nato": ("北约", "NATO"),
+    "imf": ("国际货币基金组织", "International Monetary Fund", "IMF"),
+    "world_bank": ("世界银行", "World Bank"),
+    "fed": ("美联储", "Federal Reserve", "Fed"),
+    "cdc": ("美国疾控中心", "疾控中心", "Centers for Disease Control", "CDC"),
+    "nasa": ("美国航天局", "美国国家航空航天局", "NASA"),
+    "nyt": ("纽约时报", "New York Times"),
+    "wsj": ("华尔街日报", "Wall Street Journal"),
+    "reuters": ("路透社", "Reuters"),
+    "ap": ("美联社", "Associated Press", "AP"),
+    "bloomberg": ("彭博社", "彭博", "Bloomberg"),
+    "bbc": ("英国广播公司", "BBC"),
+    "apple": ("苹果公司", "Apple"),
+    "google": ("谷歌", "Google"),
+    "microsoft": ("微软", "Microsoft"),
+    "tesla": ("特斯拉", "Tesla"),
+    "biden": ("拜登", "Biden"),
+    "trump": ("特朗普", "Trump"),
+    "putin": ("普京", "Putin"),
+    "musk": ("马斯克", "Musk"),
+}
+
+
+def _build_entity_pattern(aliases: Dict[str, Tuple[str, ...]]) -> Tuple[re.Pattern, Dict[str, str]]:
+    """One alternation over every surface form, longest first, and a form -> key map."""
+    keys = {}
+    for key, forms in aliases.items():
+        for form in forms:
+            keys[form.lower()] = key
+    forms = sorted(keys, key=len, reverse=True)
+    alternatives = [
+        rf"(?<![A-Za-z]){re.escape(form)}(?![A-Za-z])" if form.isascii() else re.escape(form)
+        for form in forms
+    ]
+    return re.compile("|".join(alternatives), re.IGNORECASE), keys
+
+
+_ENTITY_PATTERN, _ENTITY_KEYS = _build_entity_pattern(ENTITY_ALIASES)
+
+# Short all-caps aliases ("US", "UN", "AP") only count when written in capitals
+_CASE_SENSITIVE = {
+    form.lower()
+    for forms in ENTITY_ALIASES.values()
+    for form in forms
+    if form.isascii() and form.isupper() and len(form) <= 3
+}
+
+
+def extract_entities(text: str) -> Dict[str, str]:
+    """
+    Find known named entities in a text.
+
+    Args:
+        text: Input text in any language
+
+    Returns:
+        Entity key -> surface form of its first mention
+    """
+    entities: Dict[str, str] = {}
+    for match in _ENTITY_PATTERN.finditer(text):
+        form = match.group()
+        lowered = form.lower()
+        if lowered in _CASE_SENSITIVE and not form.isupper():
+            continue
+        entities.setdefault(_ENTITY_KEYS[lowered], form)
+    return entities
+
+
+def compare_entities(claim: Dict[str, str], source: Dict[str, str]) -> List[Discrepancy]:
+    """
+    Flag an entity swapped for another one.
+
+    Only reported when the claim names an entity the source does not and the
+    source names one the claim does not; one-sided differences are usually
+    just omitted or added context.
+    """
+    claim_only = [form for key, form in claim.items() if key not in source]
+    source_only = [form for key, form in source.items() if key not in claim]
+    return [
+        Discrepancy("entity", claimed, original)
+        for claimed, original in zip(claim_only, source_only)
+    ]
+
+
+def compare_facts(claim: str, source: str) -> List[Discrepancy]:
+    """
+    Compare the numbers and entities of a translated claim and its original.
+
+    Args:
+        claim: Translated claim
+        source: Aligned sentence of the original source
+
+    Returns:
+        Discrepancies, numbers first
+    """
+    return compare_quantities(
+        extract_quantities(claim), extract_quantities(source)
+    ) + compare_entities(extract_entities(claim), extract_entities(source))
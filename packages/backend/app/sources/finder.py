@@ -0,0 +1,129 @@
+"""
+Find the original of a translated claim and check it for mistranslations.
+
+Candidate sentences in the source languages are retrieved by embedding
+similarity. The closest candidates are then aligned to the claim by the facts
+they share: a sentence naming the same entities and agreeing on the other
+numbers is the likely original even when a mistranslated figure makes it
+score slightly lower. The aligned sentence's numbers and entities are then
+compared with the claim's.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from app.sources.facts import (
+    Discrepancy,
+    compare_entities,
+    compare_quantities,
+    extract_entities,
+    extract_quantities,
+)
+from app.sources.index import SourceIndex, SourceSentence
+
+# Alignment score added per entity or number a candidate shares with the claim
+SHARED_FACT_WEIGHT = 0.05
+
+
+@dataclass
+class SourceMatch:
+    """A claim aligned to a sentence of its original source."""
+
+    claim: str
+    sentence: SourceSentence
+    discrepancies: List[Discrepancy] = field(default_factory=list)
+
+    @property
+    def mistranslated(self) -> bool:
+        return bool(self.discrepancies)
+
+
+class OriginalSourceFinder:
+    """
+    Align translated claims to source sentences in other languages.
+
+    Args:
+        index: Source sentence index
+        languages: Languages originals are searched in
+        min_similarity: Cosine similarity a candidate needs to count as the original
+        top_k: Candidates aligned per claim
+    """
+
+    def __init__(
+        self,
+        index: SourceIndex,
+        languages: Sequence[str] = ("en",),
+        min_similarity: float = 0.6,
+        top_k: int = 5,
+    ) -> None:
+        self.index = index
+        self.languages = list(languages)
+        self.min_similarity = min_similarity
+        self.top_k = top_k
+
+    def align(self, claim: str, vector: np.ndarray) -> Optional[SourceMatch]:
+        """
+        Align one claim to its most likely source sentence.
+
+        Args:
+            claim: Translated claim
+            vector: Embedding of the claim
+
+        Returns:
+            The aligned sentence with any discrepancies, or None if no
+            candidate is similar enough
+        """
+        candidates = [
+            sentence
+            for sentence in self.index.search(vector, self.languages, self.top_k)
+            if sentence.similarity >= self.min_similarity
+        ]
+        if not candidates:
+            return None
+
+        quantities = extract_quantities(claim)
+        entities = extract_entities(claim)
+
+        best: Optional[SourceMatch] = None
+        best_score = float("-inf")
+        for sentence in candidates:
+            source_quantities = extract_quantities(sentence.text)
+            source_entities = extract_entities(sentence.text)
+            number_discrepancies = compare_quantities(quantities, source_quantities)
+            shared = (
+                len(entities.keys() & source_entities.keys())
+                + min(len(quantities), len(source_quantities))
+                - len(number_discrepancies)
+            )
+            score = sentence.similarity + SHARED_FACT_WEIGHT * shared
+            if score > best_score:
+                best_score = score
+                best = SourceMatch(
+                    claim,
+                    sentence,
+                    number_discrepancies + compare_entities(entities, source_entities),
+                )
+        return best
+
+    def find(self, claims: Sequence[str], vectors: np.ndarray) -> Optional[SourceMatch]:
+        """
+        Best source match over several claims of one text.
+
+        Args:
+            claims: Translated claims
+            vectors: One embedding per claim
+
+        Returns:
+            A mistranslated match if any claim has one, else the most similar
+            match, or None if no claim has a source
+        """
+        matches = [
+            match
+            for claim, vector in zip(claims, vectors)
+            if (match := self.align(claim, vector)) is not None
+        ]
+        if not matches:
+            return None
+        return max(matches, key=lambda match: (match.mistranslated, match.sentence.similarity))
@@ -0,0 +1,145 @@
+"""
+Sentence-level index of original-language source articles.
+
+Every sentence of every source document is one record of a
+``LocalVectorStore``, embedded with the multilingual model, so a translated
+claim retrieves the individual sentences it may have been translated from
+rather than whole articles. Record metadata carries the sentence text and
+its document's URL, title and language.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.nlp.claim_extractor import sentence_spans
+from app.vectorstore import LocalVectorStore
+
+
+@dataclass
+class SourceDocument:
+    """An article in the source corpus."""
+
+    id: str
+    url: str
+    title: str
+    language: str
+    text: str
+    source: str = ""
+    published_at: Optional[str] = None
+
+
+@dataclass
+class SourceSentence:
+    """One retrieved source sentence and its cosine similarity to the query."""
+
+    text: str
+    url: str
+    title: str
+    language: str
+    similarity: float
+
+
+def load_documents(path: str) -> Iterator[SourceDocument]:
+    """
+    Read a JSONL corpus, one ``SourceDocument`` object per line.
+
+    Args:
+        path: Corpus file; blank lines are skipped
+
+    Yields:
+        Documents in file order
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield SourceDocument(**json.loads(line))
+
+
+def sentence_records(
+    documents: Iterable[SourceDocument],
+) -> Tuple[List[str], List[str], List[Dict[str, Any]]]:
+    """
+    Split documents into the sentence records stored in a ``SourceIndex``.
+
+    Args:
+        documents: Source documents
+
+    Returns:
+        Record IDs, sentence texts to embed and record metadata, aligned
+    """
+    ids: List[str] = []
+    texts: List[str] = []
+    metadata: List[Dict[str, Any]] = []
+    for document in documents:
+        for start, end in sentence_spans(document.text):
+            ids.append(f"{document.id}:{start}")
+            texts.append(document.text[start:end])
+            metadata.append(
+                {
+                    "language": document.language,
+                    "source": document.source,
+                    "url": document.url,
+                    "title": document.title,
+                    "text": texts[-1],
+                }
+            )
+    return ids, texts, metadata
+
+
+class SourceIndex:
+    """
+    Source sentences searchable by embedding.
+
+    Args:
+        store: Vector store holding one record per sentence
+    """
+
+    def __init__(self, store: LocalVectorStore) -> None:
+        self.store = store
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def add(
+        self, ids: Sequence[str], vectors: np.ndarray, metadata: Sequence[Dict[str, Any]]
+    ) -> None:
+        """Add sentence records from ``sentence_records``; existing IDs are replaced."""
+        if len(ids):
+            self.store.upsert(ids, vectors, metadata)
+
+    def search(
+        self, vector: np.ndarray, languages: Sequence[str], top_k: int = 5
+    ) -> List[SourceSentence]:
+        """
+        Sentences in the given languages most similar to a claim embedding.
+
+        Args:
+            vector: Claim embedding
+            languages: Languages the original may be written in
+            top_k: Number of sentences
+
+        Returns:
+            Sentences, most similar first
+        """
+        return [
+            SourceSentence(
+                text=match.metadata["text"],
+                url=match.metadata.get("url", ""),
+                title=match.metadata.get("title", ""),
+                language=match.metadata.get("language", ""),
+                similarity=match.score,
+            )
+            for match in self.store.query(vector, top_k, list(languages))
+        ]
+
+    def snapshot(self, path: str) -> None:
+        """Write the index to ``path``; see ``LocalVectorStore.snapshot``."""
+        self.store.snapshot(path)
+
+    @classmethod
+    def restore(cls, path: str) -> "SourceIndex":
+        """Load a snapshot written by ``snapshot``."""
+        return cls(LocalVectorStore.restore(path))
@@ -0,0 +1,51 @@
+"""Vector store module."""
+
+import os
+from typing import Optional
+
+from app.config import settings
+from app.vectorstore.base import VectorMatch, VectorStore
+from app.vectorstore.local import LocalVectorStore
+
+_store: Optional[VectorStore] = None
+
+
+def get_vector_store() -> VectorStore:
+    """
+    Get the configured vector store, creating it on first use.
+
+    The local backend restores its snapshot from ``settings.vector_store_path``
+    when one exists.
+    """
+    global _store
+    if _store is None:
+        if settings.vector_store_backend == "pinecone":
+            from app.vectorstore.pinecone import PineconeVectorStore
+
+            _store = PineconeVectorStore(settings.pinecone_api_key, settings.pinecone_index)
+        elif settings.vector_store_path and os.path.exists(
+            os.path.join(settings.vector_store_path, "manifest.json")
+        ):
+            _store = LocalVectorStore.restore(settings.vector_store_path)
+        else:
+            _store = LocalVectorStore(
+                dim=settings.vector_store_dim,
+                dtype=settings.vector_store_dtype,
+                nprobe=settings.vector_store_nprobe,
+            )
+    return _store
+
+
+def save_vector_store() -> None:
+    """Snapshot the local store to ``settings.vector_store_path``, if configured."""
+    if isinstance(_store, LocalVectorStore) and settings.vector_store_path:
+        _store.snapshot(settings.vector_store_path)
+
+
+__all__ = [
+    "LocalVectorStore",
+    "VectorMatch",
+    "VectorStore",
+    "get_vector_store",
+    "save_vector_store",
+]
@@ -0,0 +1,59 @@
+"""
+Vector store interface.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+@dataclass
+class VectorMatch:
+    """A single query result."""
+
+    id: str
+    score: float
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class VectorStore(ABC):
+    """
+    Minimal vector store interface shared by the local index and Pinecone.
+
+    Vectors are compared by cosine similarity. Every record's metadata should
+    carry ``language`` and ``source`` so queries can be filtered the way
+    ``SearchRequest`` exposes.
+    """
+
+    @abstractmethod
+    def upsert(
+        self,
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        metadata: Sequence[Dict[str, Any]],
+    ) -> None:
+        """Insert new records or replace existing ones with the same ID."""
+
+    @abstractmethod
+    def query(
+        self,
+        vector: np.ndarray,
+        top_k: int = 10,
+        languages: Optional[Sequence[str]] = None,
+        sources: Optional[Sequence[str]] = None,
+    ) -> List[VectorMatch]:
+        """Return the ``top_k`` most similar records that pass the filters."""
+
+    @abstractmethod
+    def fetch(self, ids: Sequence[str]) -> List[VectorMatch]:
+        """Return stored records by ID, with a score of 0; unknown IDs are skipped."""
+
+    @abstractmethod
+    def delete(self, ids: Sequence[str]) -> None:
+        """Remove records by ID; unknown IDs are ignored."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of live records."""
@@ -0,0 +1,427 @@
+"""
+In-process IVF-flat vector index.
+
+Vectors live in one contiguous float16 or float32 matrix. Once enough records
+exist, a spherical k-means splits them into ``nlist`` inverted lists; a query
+scores the centroids first and then only the rows of the ``nprobe`` closest
+lists. Below the training threshold every query is an exact brute-force scan.
+
+Snapshots are plain ``.npy`` / JSON files, and ``restore`` maps the vector
+matrix copy-on-write, so a large index opens instantly and its pages are
+shared between worker processes until something is written.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.vectorstore.base import VectorMatch, VectorStore
+
+SNAPSHOT_VERSION = 1
+
+# Rows scored per block in brute-force scans, bounding temporary memory
+_SCAN_BLOCK = 65_536
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class _Vocabulary:
+    """Dense integer codes for metadata values, used for vectorized filtering."""
+
+    def __init__(self, values: Sequence[str] = ()) -> None:
+        self.values: List[str] = list(values)
+        self.codes: Dict[str, int] = {value: i for i, value in enumerate(self.values)}
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self.codes[value] = code
+        return code
+
+    def lookup(self, values: Sequence[str]) -> np.ndarray:
+        return np.array([self.codes[v] for v in values if v in self.codes], dtype=np.int32)
+
+
+class LocalVectorStore(VectorStore):
+    """
+    IVF-flat index over an in-memory or memory-mapped matrix.
+
+    Args:
+        dim: Vector dimension
+        dtype: Storage dtype, "float16" or "float32"
+        nprobe: Inverted lists scanned per query
+        min_train_size: Record count at which the IVF index is first trained
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        dtype: str = "float16",
+        nprobe: int = 8,
+        min_train_size: int = 10_000,
+    ) -> None:
+        self.dim = dim
+        self.dtype = np.dtype(dtype)
+        self.nprobe = nprobe
+        self.min_train_size = min_train_size
+        self._lock = threading.RLock()
+
+        self._size = 0
+        self._vectors = np.zeros((0, dim), dtype=self.dtype)
+        self._alive = np.zeros(0, dtype=bool)
+        self._language_codes = np.zeros(0, dtype=np.int32)
+        self._source_codes = np.zeros(0, dtype=np.int32)
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._ids: List[str] = []
+        self._metadata: List[Dict[str, Any]] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._languages = _Vocabulary()
+        self._sources = _Vocabulary()
+
+        # IVF state
+        self._centroids: Optional[np.ndarray] = None
+        self._trained_size = 0
+        self._list_rows: List[np.ndarray] = []
+        self._list_sizes = np.zeros(0, dtype=np.int64)
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._row_by_id)
+
+    def _reserve(self, extra: int) -> None:
+        """Grow the row arrays geometrically so appends are amortized O(1)."""
+        needed = self._size + extra
+        capacity = len(self._vectors)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2, 1024)
+
+        def grow(array: np.ndarray, fill: Any = 0) -> np.ndarray:
+            shape = (new_capacity,) + array.shape[1:]
+            grown = np.full(shape, fill, dtype=array.dtype)
+            grown[: self._size] = array[: self._size]
+            return grown
+
+        self._vectors = grow(self._vectors)
+        self._alive = grow(self._alive, False)
+        self._language_codes = grow(self._language_codes, -1)
+        self._source_codes = grow(self._source_codes, -1)
+        self._assignments = grow(self._assignments, -1)
+
+    def upsert(
+        self,
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        metadata: Sequence[Dict[str, Any]],
+    ) -> None:
+        vectors = _normalize(vectors).reshape(len(ids), self.dim)
+
+        with self._lock:
+            self._reserve(len(ids))
+            rows = np.empty(len(ids), dtype=np.int64)
+            for i, (record_id, meta) in enumerate(zip(ids, metadata)):
+                row = self._row_by_id.get(record_id)
+                if row is None:
+                    row = self._size
+                    self._size += 1
+                    self._ids.append(record_id)
+                    self._metadata.append(meta)
+                    self._row_by_id[record_id] = row
+                else:
+                    self._metadata[row] = meta
+                rows[i] = row
+                self._language_codes[row] = self._languages.encode(str(meta.get("language", "")))
+                self._source_codes[row] = self._sources.encode(str(meta.get("source", "")))
+
+            self._vectors[rows] = vectors
+            self._alive[rows] = True
+
+            if self._centroids is not None:
+                # An ID repeated within the batch keeps its last vector
+                rows = np.unique(rows)
+                self._assign(rows, self._vectors[rows].astype(np.float32))
+            elif self._size >= self.min_train_size:
+                self.build_index()
+
+    def fetch(self, ids: Sequence[str]) -> List[VectorMatch]:
+        with self._lock:
+            rows = [self._row_by_id[i] for i in ids if i in self._row_by_id]
+            return [
+                VectorMatch(id=self._ids[row], score=0.0, metadata=self._metadata[row])
+                for row in rows
+            ]
+
+    def delete(self, ids: Sequence[str]) -> None:
+        with self._lock:
+            for record_id in ids:
+                row = self._row_by_id.pop(record_id, None)
+                if row is not None:
+                    self._alive[row] = False
+                    self._metadata[row] = {}
+
+    # ------------------------------------------------------------------
+    # IVF index
+    # ------------------------------------------------------------------
+
+    def build_index(self, nlist: Optional[int] = None, iterations: int = 10, seed: int = 0) -> None:
+        """
+        Train the coarse quantizer and rebuild the inverted lists.
+
+        Called automatically once ``min_train_size`` records exist; call it
+        again after large ingests to keep the lists balanced.
+
+        Args:
+            nlist: Number of inverted lists (default: about sqrt of the record count)
+            iterations: k-means iterations
+            seed: Random seed for centroid initialisation and sampling
+        """
+        with self._lock:
+            live_rows = np.flatnonzero(self._alive[: self._size])
+            if len(live_rows) == 0:
+                return
+            nlist = nlist or max(1, int(np.sqrt(len(live_rows))))
+            nlist = min(nlist, len(live_rows))
+
+            rng = np.random.default_rng(seed)
+            sample_size = min(len(live_rows), 32 * nlist)
+            sample = self._vectors[rng.choice(live_rows, sample_size, replace=False)]
+            sample = sample.astype(np.float32)
+
+            centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+            for _ in range(iterations):
+                labels = np.argmax(sample @ centroids.T, axis=1)
+                order = np.argsort(labels, kind="stable")
+                counts = np.bincount(labels, minlength=nlist)
+                starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+                sums = np.zeros_like(centroids)
+                nonempty = counts > 0
+                sums[nonempty] = np.add.reduceat(sample[order], starts[nonempty], axis=0)
+                empty = ~nonempty
+                # Re-seed empty clusters from random sample points
+                sums[empty] = sample[rng.choice(sample_size, int(empty.sum()))]
+                centroids = _normalize(sums)
+
+            self._centroids = centroids
+            self._trained_size = len(live_rows)
+            self._list_rows = [np.zeros(0, dtype=np.int64) for _ in range(nlist)]
+            self._list_sizes = np.zeros(nlist, dtype=np.int64)
+            self._assignments[: self._size] = -1
+
+            for start in range(0, len(live_rows), _SCAN_BLOCK):
+                block = live_rows[start : start + _SCAN_BLOCK]
+                self._assign(block, self._vectors[block].astype(np.float32))
+
+    def _assign(self, rows: np.ndarray, vectors: np.ndarray) -> None:
+        """Append rows to the inverted list of their nearest centroid, unless already in it."""
+        labels = np.argmax(vectors @ self._centroids.T, axis=1).astype(np.int32)
+        moved = self._assignments[rows] != labels
+        rows, labels = rows[moved], labels[moved]
+        self._assignments[rows] = labels
+
+        order = np.argsort(labels, kind="stable")
+        boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+        for group in np.split(order, boundaries):
+            if len(group) == 0:
+                continue
+            label = int(labels[group[0]])
+            new_rows = rows[group]
+            size = self._list_sizes[label]
+            list_rows = self._list_rows[label]
+            if size + len(new_rows) > len(list_rows):
+                grown = np.zeros(max(2 * len(list_rows), size + len(new_rows), 16), dtype=np.int64)
+                grown[:size] = list_rows[:size]
+                self._list_rows[label] = list_rows = grown
+            list_rows[size : size + len(new_rows)] = new_rows
+            self._list_sizes[label] = size + len(new_rows)
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+
+    def _filter_mask(
+        self,
+        rows: np.ndarray,
+        languages: Optional[Sequence[str]],
+        sources: Optional[Sequence[str]],
+    ) -> np.ndarray:
+        mask = self._alive[rows]
+        if languages:
+            mask &= np.isin(self._language_codes[rows], self._languages.lookup(languages))
+        if sources:
+            mask &= np.isin(self._source_codes[rows], self._sources.lookup(sources))
+        return mask
+
+    def _candidate_rows(self, query: np.ndarray) -> Optional[np.ndarray]:
+        """Rows from the nprobe closest lists, or None for an exhaustive scan."""
+        if self._centroids is None or self.nprobe >= len(self._centroids):
+            return None
+
+        probes = np.argpartition(-(self._centroids @ query), self.nprobe)[: self.nprobe]
+        rows = np.concatenate([self._list_rows[p][: self._list_sizes[p]] for p in probes])
+        # A row re-assigned by an upsert may still sit in its old list, or twice in one
+        # after moving back to it
+        return np.unique(rows[np.isin(self._assignments[rows], probes)])
+
+    def _score(self, rows: np.ndarray, query: np.ndarray) -> np.ndarray:
+        return self._vectors[rows].astype(np.float32) @ query
+
+    def query(
+        self,
+        vector: np.ndarray,
+        top_k: int = 10,
+        languages: Optional[Sequence[str]] = None,
+        sources: Optional[Sequence[str]] = None,
+        exact: bool = False,
+    ) -> List[VectorMatch]:
+        """
+        Return the ``top_k`` most similar records that pass the filters.
+
+        Args:
+            vector: Query vector
+            top_k: Number of results
+            languages: Only return records whose ``language`` is in this list
+            sources: Only return records whose ``source`` is in this list
+            exact: Force a brute-force scan (used as ground truth in benchmarks)
+        """
+        query = _normalize(vector).reshape(self.dim)
+
+        with self._lock:
+            candidates = None if exact else self._candidate_rows(query)
+            if candidates is None:
+                blocks = (
+                    np.arange(start, min(start + _SCAN_BLOCK, self._size))
+                    for start in range(0, self._size, _SCAN_BLOCK)
+                )
+            else:
+                blocks = iter([candidates])
+
+            best_rows = np.zeros(0, dtype=np.int64)
+            best_scores = np.zeros(0, dtype=np.float32)
+            for rows in blocks:
+                rows = rows[self._filter_mask(rows, languages, sources)]
+                if len(rows) == 0:
+                    continue
+                rows = np.concatenate([best_rows, rows])
+                scores = np.concatenate([best_scores, self._score(rows[len(best_rows) :], query)])
+                if len(rows) > top_k:
+                    keep = np.argpartition(-scores, top_k)[:top_k]
+                    rows, scores = rows[keep], scores[keep]
+                best_rows, best_scores = rows, scores
+
+            order = np.argsort(-best_scores)
+            return [
+                VectorMatch(
+                    id=self._ids[best_rows[i]],
+                    score=float(best_scores[i]),
+                    metadata=self._metadata[best_rows[i]],
+                )
+                for i in order
+            ]
+
+    # ------------------------------------------------------------------
+    # Snapshot / restore
+    # ------------------------------------------------------------------
+
+    def snapshot(self, path: str) -> None:
+        """
+        Write the index to ``path`` (a directory), replacing any previous snapshot.
+
+        Deleted rows are compacted away.
+        """
+        with self._lock:
+            live_rows = np.flatnonzero(self._alive[: self._size])
+            tmp = f"{path}.tmp"
+            os.makedirs(tmp, exist_ok=True)
+
+            np.save(os.path.join(tmp, "vectors.npy"), self._vectors[live_rows])
+            np.save(os.path.join(tmp, "assignments.npy"), self._assignments[live_rows])
+            if self._centroids is not None:
+                np.save(os.path.join(tmp, "centroids.npy"), self._centroids)
+
+            with open(os.path.join(tmp, "records.jsonl"), "w", encoding="utf-8") as f:
+                for row in live_rows:
+                    record = {"id": self._ids[row], "metadata": self._metadata[row]}
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+            manifest = {
+                "version": SNAPSHOT_VERSION,
+                "dim": self.dim,
+                "dtype": self.dtype.name,
+                "count": int(len(live_rows)),
+                "nprobe": self.nprobe,
+                "min_train_size": self.min_train_size,
+                "trained_size": self._trained_size,
+            }
+            with open(os.path.join(tmp, "manifest.json"), "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+
+            if os.path.isdir(path):
+                old = f"{path}.old"
+                os.replace(path, old)
+                os.replace(tmp, path)
+                for name in os.listdir(old):
+                    os.remove(os.path.join(old, name))
+                os.rmdir(old)
+            else:
+                os.replace(tmp, path)
+
+    @classmethod
+    def restore(cls, path: str) -> "LocalVectorStore":
+        """
+        Load a snapshot written by ``snapshot``.
+
+        The vector matrix is memory-mapped copy-on-write rather than read.
+        """
+        with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest["version"] != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported vector store snapshot version {manifest['version']}")
+
+        store = cls(
+            dim=manifest["dim"],
+            dtype=manifest["dtype"],
+            nprobe=manifest["nprobe"],
+            min_train_size=manifest["min_train_size"],
+        )
+
+        count = manifest["count"]
+        store._vectors = np.load(os.path.join(path, "vectors.npy"), mmap_mode="c")
+        store._size = count
+        store._alive = np.ones(count, dtype=bool)
+        store._language_codes = np.empty(count, dtype=np.int32)
+        store._source_codes = np.empty(count, dtype=np.int32)
+
+        with open(os.path.join(path, "records.jsonl"), encoding="utf-8") as f:
+            for row, line in enumerate(f):
+                record = json.loads(line)
+                meta = record["metadata"]
+                store._ids.append(record["id"])
+                store._metadata.append(meta)
+                store._row_by_id[record["id"]] = row
+                store._language_codes[row] = store._languages.encode(str(meta.get("language", "")))
+                store._source_codes[row] = store._sources.encode(str(meta.get("source", "")))
+
+        store._assignments = np.load(os.path.join(path, "assignments.npy"))
+        centroids_path = os.path.join(path, "centroids.npy")
+        if os.path.exists(centroids_path):
+            store._centroids = np.load(centroids_path)
+            store._trained_size = manifest["trained_size"]
+            nlist = len(store._centroids)
+            order = np.argsort(store._assignments, kind="stable")
+            counts = np.bincount(store._assignments, minlength=nlist)
+            store._list_rows = np.split(order.astype(np.int64), np.cumsum(counts)[:-1])
+            store._list_sizes = counts.astype(np.int64)
+
+        return store
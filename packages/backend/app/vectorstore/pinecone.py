@@ -0,0 +1,70 @@
+"""
+Pinecone-backed vector store.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.vectorstore.base import VectorMatch, VectorStore
+
+
+class PineconeVectorStore(VectorStore):
+    """Thin adapter from the ``VectorStore`` interface to a Pinecone index."""
+
+    def __init__(self, api_key: str, index_name: str, batch_size: int = 100) -> None:
+        from pinecone import Pinecone
+
+        self._index = Pinecone(api_key=api_key).Index(index_name)
+        self.batch_size = batch_size
+
+    def upsert(
+        self,
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        metadata: Sequence[Dict[str, Any]],
+    ) -> None:
+        records = [
+            {"id": record_id, "values": vector.tolist(), "metadata": meta}
+            for record_id, vector, meta in zip(ids, np.asarray(vectors, dtype=np.float32), metadata)
+        ]
+        for start in range(0, len(records), self.batch_size):
+            self._index.upsert(vectors=records[start : start + self.batch_size])
+
+    def query(
+        self,
+        vector: np.ndarray,
+        top_k: int = 10,
+        languages: Optional[Sequence[str]] = None,
+        sources: Optional[Sequence[str]] = None,
+    ) -> List[VectorMatch]:
+        metadata_filter: Dict[str, Any] = {}
+        if languages:
+            metadata_filter["language"] = {"$in": list(languages)}
+        if sources:
+            metadata_filter["source"] = {"$in": list(sources)}
+
+        response = self._index.query(
+            vector=np.asarray(vector, dtype=np.float32).tolist(),
+            top_k=top_k,
+            filter=metadata_filter or None,
+            include_metadata=True,
+        )
+        return [
+            VectorMatch(id=match["id"], score=float(match["score"]), metadata=match.get("metadata") or {})
+            for match in response["matches"]
+        ]
+
+    def fetch(self, ids: Sequence[str]) -> List[VectorMatch]:
+        records = self._index.fetch(ids=list(ids))["vectors"]
+        return [
+            VectorMatch(id=record_id, score=0.0, metadata=records[record_id].get("metadata") or {})
+            for record_id in ids
+            if record_id in records
+        ]
+
+    def delete(self, ids: Sequence[str]) -> None:
+        self._index.delete(ids=list(ids))
+
+    def __len__(self) -> int:
+        return int(self._index.describe_index_stats()["total_vector_count"])
@@ -0,0 +1,51 @@
+"""
+Throughput of extract_claims_batch as the process pool grows.
+
+Usage:
+    python -m benchmarks.bench_claim_batch [--texts 2000] [--max-workers 8]
+"""
+
+import argparse
+import os
+import time
+
+from app.nlp.claim_extractor import extract_claims, extract_claims_batch
+from app.nlp.worker_pool import create_pool
+from benchmarks.corpus import make_texts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--texts", type=int, default=2000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    texts = make_texts(args.texts)
+
+    # Warm up jieba in this process before timing the serial baseline
+    extract_claims(texts[0])
+    start = time.perf_counter()
+    for text in texts:
+        extract_claims(text)
+    serial = time.perf_counter() - start
+    print(f"{'serial':>10}: {len(texts) / serial:8.1f} texts/s")
+
+    workers = 1
+    while workers <= args.max_workers:
+        pool = create_pool(workers)
+        extract_claims_batch(texts[:workers], executor=pool)  # start and warm workers
+
+        start = time.perf_counter()
+        extract_claims_batch(texts, executor=pool)
+        elapsed = time.perf_counter() - start
+        pool.shutdown()
+
+        print(
+            f"{workers:>3} worker{'s' if workers > 1 else ' '}: "
+            f"{len(texts) / elapsed:8.1f} texts/s  (x{serial / elapsed:.2f} vs serial)"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Precompiled claim classifier versus the per-pattern re.search loop.
+
+Usage:
+    python -m benchmarks.bench_claim_patterns [--sentences 100000]
+"""
+
+import argparse
+import re
+import time
+
+from app.nlp.claim_extractor import CLAIM_PATTERNS, classify_claim, detect_claim_type
+from benchmarks.corpus import make_sentences
+
+
+def detect_claim_type_loop(text: str) -> tuple:
+    """The original implementation, kept here as the baseline."""
+    for pattern, claim_type, confidence in CLAIM_PATTERNS:
+        if re.search(pattern, text):
+            return claim_type, confidence
+    return "factual", 0.5
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sentences", type=int, default=100_000)
+    args = parser.parse_args()
+
+    sentences = make_sentences(args.sentences)
+
+    mismatches = sum(
+        detect_claim_type(s) != detect_claim_type_loop(s) for s in sentences[:5000]
+    )
+    print(f"first-match mismatches vs baseline (5000 sampled): {mismatches}")
+
+    for name, func in (
+        ("re.search loop", detect_claim_type_loop),
+        ("first-match", detect_claim_type),
+        ("all-matches", classify_claim),
+    ):
+        start = time.perf_counter()
+        for sentence in sentences:
+            func(sentence)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:>15}: {elapsed:.3f}s  "
+            f"({elapsed / len(sentences) * 1e6:.2f} µs/sentence)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Credibility registry lookups per second.
+
+Builds a registry of ``--outlets`` synthetic outlets (one to three domains
+each, under a mix of top-level domains) on top of the bundled one, writes it
+to a temporary file and loads it back. Evidence URLs are drawn from a pool of
+``--hosts`` hosts: registered domains and subdomains of them (``www.``,
+``news.``, ...) and unregistered hosts, with random paths.
+
+Reports the load time, the registry's Python heap size, and lookups per
+second for: trie walks on hosts with the memo bypassed, ``lookup`` on full
+URLs with a warm host memo, ``score`` by URL with the outlet name as
+fallback, and the per-call cost of ``get_credibility_registry`` between
+reload checks.
+
+Usage:
+    python -m benchmarks.bench_credibility [--outlets 100000] [--urls 1000000]
+        [--hosts 20000]
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, List
+
+from app.config import settings
+from app.credibility import BUNDLED_REGISTRY_PATH, CredibilityRegistry, get_credibility_registry
+
+_SUFFIXES = ("com", "cn", "com.cn", "org", "net", "co.uk", "com.tw", "de", "fr", "co.jp")
+_SUBDOMAINS = ("", "", "www.", "news.", "m.", "en.", "world.news.")
+
+
+def make_registry_file(path: str, rng: random.Random, outlets: int) -> List[str]:
+    """Write the bundled registry plus synthetic outlets; returns their domains."""
+    with open(BUNDLED_REGISTRY_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+    domains = []
+    for i in range(outlets):
+        names = [f"outlet{i}x{j}.{rng.choice(_SUFFIXES)}" for j in range(rng.randint(1, 3))]
+        domains += names
+        data["sources"].append(
+            {
+                "name": f"Outlet {i}",
+                "domains": names,
+                "score": round(rng.random(), 2),
+                "languages": ["zh"],
+                "bias": "unrated",
+            }
+        )
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    return domains
+
+
+def make_urls(rng: random.Random, domains: List[str], hosts: int, urls: int) -> List[str]:
+    """URLs on a pool of hosts: three in five on registered domains."""
+    pool = []
+    for i in range(hosts):
+        if rng.random() < 0.6:
+            pool.append(rng.choice(_SUBDOMAINS) + rng.choice(domains))
+        else:
+            pool.append(f"{rng.choice(_SUBDOMAINS)}site{i}.{rng.choice(_SUFFIXES)}")
+    return [
+        f"https://{rng.choice(pool)}/{rng.randrange(2020, 2027)}/{rng.randrange(10**6)}.html"
+        for _ in range(urls)
+    ]
+
+
+def rate(label: str, calls: int, fn: Callable[[], None]) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<44} {calls / elapsed / 1e6:6.2f} M/s  ({elapsed / calls * 1e9:5.0f} ns)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--outlets", type=int, default=100_000)
+    parser.add_argument("--urls", type=int, default=1_000_000)
+    parser.add_argument("--hosts", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sources.json")
+        domains = make_registry_file(path, rng, args.outlets)
+
+        start = time.perf_counter()
+        registry = CredibilityRegistry.load(path)
+        load_seconds = time.perf_counter() - start
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        tracemalloc.start()
+        traced = CredibilityRegistry.from_dict(data)
+        heap = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del data, traced
+
+        urls = make_urls(rng, domains, args.hosts, args.urls)
+        hosts = [url.split("/")[2] for url in urls]
+        sources = [f"Outlet {rng.randrange(args.outlets)}" for _ in urls]
+        hits = sum(registry.lookup(url) is not None for url in urls)
+
+        print(
+            f"{len(registry)} outlets, {len(domains)} domains, loaded in {load_seconds:.2f}s, "
+            f"{heap / 2**20:.0f} MiB heap; {args.urls} URLs on {args.hosts} hosts, "
+            f"{hits / args.urls:.0%} registered"
+        )
+
+        match = registry._match
+        rate("trie walk, no memo (host)", len(hosts), lambda: [match(h) for h in hosts])
+        lookup = registry.lookup
+        rate("lookup, warm memo (URL)", len(urls), lambda: [lookup(u) for u in urls])
+        score = registry.score
+        rate(
+            "score, URL then outlet name",
+            len(urls),
+            lambda: [score(u, s) for u, s in zip(urls, sources)],
+        )
+
+        settings.credibility_registry_path = path
+        get_credibility_registry()
+        calls = 1_000_000
+        rate(
+            "get_credibility_registry between reloads",
+            calls,
+            lambda: [get_credibility_registry() for _ in range(calls)],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Near-duplicate claim index at scale.
+
+Fills a ClaimIndex with synthetic claims (random word sequences), then
+measures lookup latency and accuracy for lightly edited copies of stored
+claims and for unseen claims, memory use, and snapshot/restore time. A final
+section times ``assign`` end to end, including jieba, on real sentences.
+
+Usage:
+    python -m benchmarks.bench_dedup [--claims 1000000] [--queries 5000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import List
+
+import numpy as np
+
+from app.dedup import ClaimFeatures, ClaimIndex
+from app.nlp.tokenizer import initialize_tokenizer
+from benchmarks.corpus import SAMPLE_SENTENCES
+
+VOCABULARY = [f"w{i}" for i in range(50_000)]
+
+
+def features(tokens: List[str]) -> ClaimFeatures:
+    return ClaimFeatures(tokens, guard=0, fingerprint=hash(" ".join(tokens)) & (2**64 - 1))
+
+
+def edit(rng: random.Random, tokens: List[str]) -> List[str]:
+    """Replace, insert or drop one word, the typical edit between copies."""
+    tokens = list(tokens)
+    position = rng.randrange(len(tokens))
+    operation = rng.choice(("replace", "insert", "drop"))
+    if operation == "replace":
+        tokens[position] = rng.choice(VOCABULARY)
+    elif operation == "insert":
+        tokens.insert(position, rng.choice(VOCABULARY))
+    else:
+        del tokens[position]
+    return tokens
+
+
+def percentile_us(samples: List[float], q: float) -> float:
+    return float(np.percentile(samples, q) * 1e6)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--claims", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=5_000)
+    parser.add_argument("--threshold", type=float, default=0.7)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    index = ClaimIndex(capacity=args.claims, threshold=args.threshold)
+    stored: List[List[str]] = []
+    clusters: List[str] = []
+
+    start = time.perf_counter()
+    for _ in range(args.claims):
+        tokens = rng.sample(VOCABULARY, rng.randint(12, 24))
+        match = index.assign_features(features(tokens))
+        if len(stored) < args.queries:
+            stored.append(tokens)
+            clusters.append(match.cluster_id)
+    elapsed = time.perf_counter() - start
+    per_claim = elapsed / args.claims * 1e6
+    print(f"Indexed {len(index):,} claims in {elapsed:.1f}s ({per_claim:.1f} µs each)")
+    print(f"Index memory: {index.nbytes / 2**20:.1f} MiB")
+
+    latencies, found = [], 0
+    for tokens, cluster in zip(stored, clusters):
+        query = features(edit(rng, tokens))
+        start = time.perf_counter()
+        match = index.assign_features(query)
+        latencies.append(time.perf_counter() - start)
+        found += match.cluster_id == cluster
+    print(
+        f"Edited copies:  p50 {percentile_us(latencies, 50):6.1f} µs  "
+        f"p99 {percentile_us(latencies, 99):6.1f} µs  matched {found / len(stored):.1%}"
+    )
+
+    latencies, false_matches = [], 0
+    for _ in range(args.queries):
+        query = features(rng.sample(VOCABULARY, rng.randint(12, 24)))
+        start = time.perf_counter()
+        match = index.assign_features(query)
+        latencies.append(time.perf_counter() - start)
+        false_matches += not match.new_cluster
+    print(
+        f"Unseen claims:  p50 {percentile_us(latencies, 50):6.1f} µs  "
+        f"p99 {percentile_us(latencies, 99):6.1f} µs  "
+        f"false matches {false_matches / args.queries:.2%}"
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "claim_index")
+        start = time.perf_counter()
+        index.snapshot(path)
+        saved = time.perf_counter() - start
+        start = time.perf_counter()
+        ClaimIndex.restore(path)
+        print(f"Snapshot {saved:.2f}s, restore {time.perf_counter() - start:.2f}s")
+
+    initialize_tokenizer()
+    sentences = [text + suffix for text in SAMPLE_SENTENCES for suffix in ("", "！！😱", " ")]
+    start = time.perf_counter()
+    for sentence in sentences * 20:
+        index.assign(sentence)
+    elapsed = time.perf_counter() - start
+    print(f"assign() with jieba: {elapsed / (len(sentences) * 20) * 1e6:.1f} µs per sentence")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Embedding service throughput: micro-batching and the on-disk cache.
+
+By default a fake encoder with a fixed per-call overhead stands in for the
+model, which isolates the batching and caching effects. Pass ``--real`` to
+load the configured sentence-transformers model instead.
+
+Usage:
+    python -m benchmarks.bench_embeddings [--requests 2000] [--concurrency 64] [--real]
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from typing import List
+
+import numpy as np
+
+from app.config import settings
+from app.embeddings import EmbeddingCache, EmbeddingModel, EmbeddingService
+from benchmarks.corpus import make_sentences
+
+
+class FakeEncoder:
+    """Encoder whose cost is a fixed per-call overhead plus a per-text cost."""
+
+    model_name = "fake"
+    dim = 384
+
+    def __init__(self, call_ms: float = 8.0, per_text_ms: float = 0.3) -> None:
+        self.call_ms = call_ms
+        self.per_text_ms = per_text_ms
+        self.calls = 0
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        self.calls += 1
+        time.sleep((self.call_ms + self.per_text_ms * len(texts)) / 1000)
+        rng = np.random.default_rng(abs(hash(texts[0])) % (2**32))
+        return rng.standard_normal((len(texts), self.dim)).astype(np.float32)
+
+
+async def drive(service: EmbeddingService, texts: List[str], concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(text: str) -> None:
+        async with semaphore:
+            await service.embed(text)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(text) for text in texts))
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--real", action="store_true")
+    args = parser.parse_args()
+
+    texts = make_sentences(args.requests)
+    model = (
+        EmbeddingModel(settings.embedding_model, settings.embedding_backend)
+        if args.real
+        else FakeEncoder()
+    )
+
+    for label, batch_size in (("no batching", 1), ("micro-batched", 32)):
+        service = EmbeddingService(model, cache=None, max_batch_size=batch_size)
+        elapsed = await drive(service, texts, args.concurrency)
+        await service.close()
+        print(f"{label:>16}: {len(texts) / elapsed:9.1f} texts/s")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = EmbeddingCache(cache_dir, model.model_name, model.dim, capacity=len(texts))
+        service = EmbeddingService(model, cache=cache, max_batch_size=32)
+        cold = await drive(service, texts, args.concurrency)
+        warm = await drive(service, texts, args.concurrency)
+        await service.close()
+        print(f"{'cache cold':>16}: {len(texts) / cold:9.1f} texts/s")
+        print(f"{'cache warm':>16}: {len(texts) / warm:9.1f} texts/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
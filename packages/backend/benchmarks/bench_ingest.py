@@ -0,0 +1,161 @@
+"""
+Bulk ingestion throughput, memory profile and resume after interruption.
+
+Writes a synthetic JSONL dump (a tenth of the articles are re-crawled copies)
+and ingests it with a stand-in encoder that derives vectors from a hash, so
+the numbers isolate the pipeline: reading, chunking, language detection,
+keyword extraction, dedup and IPC. Records go to a store that only counts
+them, so resident memory reflects the pipeline alone; it is sampled at every
+checkpoint and should stay flat as the dump grows.
+
+A second run is interrupted part-way and resumed from its checkpoint, and
+must end with exactly the records of an uninterrupted run.
+
+Usage:
+    python -m benchmarks.bench_ingest [--articles 20000] [--nlp-workers 2]
+        [--embed-workers 1]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.ingest import Ingestor
+from app.vectorstore import VectorMatch, VectorStore
+from benchmarks.corpus import make_sentences
+
+
+class HashEncoder:
+    """Stand-in for the embedding model: a pseudo-random unit vector per text."""
+
+    dim = 384
+
+    def __call__(self) -> "HashEncoder":
+        return self
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        vectors = np.empty((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+            vectors[row] = np.random.default_rng(seed).standard_normal(self.dim)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+class CountingStore(VectorStore):
+    """Keeps only record IDs, optionally interrupting after ``fail_after`` upserts."""
+
+    def __init__(self, fail_after: Optional[int] = None) -> None:
+        self.ids: set = set()
+        self.upserts = 0
+        self.fail_after = fail_after
+
+    def upsert(self, ids: Sequence[str], vectors: np.ndarray, metadata: Sequence[Dict]) -> None:
+        if self.fail_after is not None and self.upserts == self.fail_after:
+            raise KeyboardInterrupt
+        self.upserts += 1
+        self.ids.update(ids)
+
+    def query(self, vector: np.ndarray, top_k: int = 10, **filters: Any) -> List[VectorMatch]:
+        return []
+
+    def fetch(self, ids: Sequence[str]) -> List[VectorMatch]:
+        return [VectorMatch(id=i, score=0.0) for i in ids if i in self.ids]
+
+    def delete(self, ids: Sequence[str]) -> None:
+        self.ids.difference_update(ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def write_dump(path: str, articles: int) -> None:
+    rng = random.Random(0)
+    written: List[Dict[str, str]] = []
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(articles):
+            if written and rng.random() < 0.1:
+                record = dict(rng.choice(written), id=f"copy-{i}")
+            else:
+                text = "".join(make_sentences(rng.randint(10, 40), seed=i))
+                record = {"id": str(i), "url": f"https://example.com/{i}", "text": text}
+                if len(written) < 1_000:
+                    written.append(record)
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def rss_mib() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=20_000)
+    parser.add_argument("--nlp-workers", type=int, default=2)
+    parser.add_argument("--embed-workers", type=int, default=1)
+    parser.add_argument("--dedup-capacity", type=int, default=1 << 22)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        dump = os.path.join(directory, "dump.jsonl")
+        write_dump(dump, args.articles)
+        print(f"Dump: {args.articles:,} articles, {os.path.getsize(dump) / 2**20:.0f} MiB")
+
+        def make_ingestor(store: CountingStore, checkpoint_dir: str, snapshot: Any) -> Ingestor:
+            return Ingestor(
+                store,
+                snapshot=snapshot,
+                checkpoint_dir=checkpoint_dir,
+                encoder_factory=HashEncoder(),
+                nlp_workers=args.nlp_workers,
+                embed_workers=args.embed_workers,
+                dedup_capacity=args.dedup_capacity,
+                checkpoint_every=max(args.articles // 4, 1),
+            )
+
+        samples: List[str] = []
+        store = CountingStore()
+        ingestor = make_ingestor(
+            store,
+            os.path.join(directory, "full"),
+            lambda: samples.append(f"{ingestor.stats.chunks:,}: {rss_mib():.0f} MiB"),
+        )
+        start = time.perf_counter()
+        stats = ingestor.run(dump)
+        elapsed = time.perf_counter() - start
+        print(
+            f"Ingested {stats.chunks:,} chunks ({stats.duplicates:,} duplicates skipped) in "
+            f"{elapsed:.1f}s: {stats.articles / elapsed:,.0f} articles/s, "
+            f"{stats.chunks / elapsed:,.0f} chunks/s"
+        )
+        print("RSS at checkpoints (chunks: RSS): " + ", ".join(samples))
+
+        checkpoint_dir = os.path.join(directory, "resumed")
+        # Interrupt about halfway: one upsert per batch of 64 articles
+        interrupted = CountingStore(fail_after=max(args.articles // 64 // 2, 1))
+        try:
+            make_ingestor(interrupted, checkpoint_dir, None).run(dump)
+        except KeyboardInterrupt:
+            pass
+        resumed = CountingStore()
+        resumed.ids = set(interrupted.ids)
+        final = make_ingestor(resumed, checkpoint_dir, None).run(dump)
+        print(
+            f"Interrupted after {len(interrupted):,} records, resumed: {len(resumed):,} records, "
+            f"{final.chunks:,} chunks counted "
+            f"({'matches' if resumed.ids == store.ids else 'DIFFERS FROM'} the full run)"
+        )
+
+
+if __name__ == "__main__":
+    main()
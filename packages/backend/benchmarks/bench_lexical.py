@@ -0,0 +1,122 @@
+"""
+Build time, index size and query latency of the BM25 lexical index.
+
+Documents are bags of terms drawn from a Zipf-distributed vocabulary, which
+matches how term frequencies fall off in real text; they are generated
+pre-tokenized so the numbers cover the index alone, not jieba. The size is
+compared with uncompressed postings (a uint32 row plus a uint16 term
+frequency each), and queries mix frequent and rare terms.
+
+Usage:
+    python -m benchmarks.bench_lexical [--docs 1000000] [--vocabulary 200000]
+        [--doc-terms 80]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List
+
+import numpy as np
+
+from app.lexical import LexicalIndex, reciprocal_rank_fusion
+
+LANGUAGES = ["zh-CN", "en", "ja", "ko"]
+
+
+def percentile_ms(samples: list, q: float) -> float:
+    return float(np.percentile(samples, q) * 1e3)
+
+
+def directory_bytes(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def zipf_terms(rng: np.random.Generator, count: int, vocabulary: int) -> np.ndarray:
+    """Term numbers with frequency proportional to 1 / rank."""
+    ranks = rng.zipf(1.1, count)
+    return np.where(ranks <= vocabulary, ranks - 1, rng.integers(0, vocabulary, count))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=1_000_000)
+    parser.add_argument("--vocabulary", type=int, default=200_000)
+    parser.add_argument("--doc-terms", type=int, default=80)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=10_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    words = [f"w{i}" for i in range(args.vocabulary)]
+    index = LexicalIndex()
+
+    postings = 0
+    start = time.perf_counter()
+    for offset in range(0, args.docs, args.batch):
+        count = min(args.batch, args.docs - offset)
+        lengths = rng.poisson(args.doc_terms, count) + 1
+        terms = zipf_terms(rng, int(lengths.sum()), args.vocabulary)
+        tokens: List[List[str]] = [
+            [words[t] for t in doc] for doc in np.split(terms, np.cumsum(lengths)[:-1])
+        ]
+        postings += sum(len(set(doc)) for doc in tokens)
+        index.upsert(
+            [str(i) for i in range(offset, offset + count)],
+            tokens,
+            [{"language": LANGUAGES[i % 4], "source": f"s{i % 20}"} for i in range(count)],
+        )
+    index.flush()
+    build = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "lexical")
+        start = time.perf_counter()
+        index.snapshot(path)
+        snapshot = time.perf_counter() - start
+        on_disk = directory_bytes(path)
+        start = time.perf_counter()
+        index = LexicalIndex.restore(path)
+        restore = time.perf_counter() - start
+
+        print(f"docs={args.docs:,} vocabulary={args.vocabulary:,} ~{args.doc_terms} terms/doc")
+        print(f"  build {build:.1f}s ({args.docs / build:,.0f} docs/s), {postings:,} postings")
+        print(f"  snapshot {snapshot:.1f}s, restore {restore:.2f}s")
+        segment = index._segments[0]
+        raw = postings * 6
+        print(
+            f"  postings {segment.nbytes / 2**20:.1f} MiB vs {raw / 2**20:.1f} MiB uncompressed "
+            f"({segment.data.nbytes / postings:.2f} bytes/row, "
+            f"{segment.nbytes / postings:.2f} bytes/posting with tf); "
+            f"arrays {index.nbytes / 2**20:.1f} MiB, on disk {on_disk / 2**20:.1f} MiB"
+        )
+
+        samples = {"2 terms": [], "4 terms": [], "4 terms+filter": [], "rrf fusion": []}
+        for _ in range(args.queries):
+            # One frequent term and the rest from the long tail, like a real query
+            head = [words[t] for t in zipf_terms(rng, 1, 100)]
+            tail = [words[t] for t in rng.integers(100, args.vocabulary, 3)]
+            t0 = time.perf_counter()
+            short = index.search(head + tail[:1], 30)
+            t1 = time.perf_counter()
+            hits = index.search(head + tail, 30)
+            t2 = time.perf_counter()
+            index.search(head + tail, 30, languages=["zh-CN"], sources=["s1", "s2"])
+            t3 = time.perf_counter()
+            reciprocal_rank_fusion([[i for i, _ in short], [i for i, _ in hits]])
+            t4 = time.perf_counter()
+            samples["2 terms"].append(t1 - t0)
+            samples["4 terms"].append(t2 - t1)
+            samples["4 terms+filter"].append(t3 - t2)
+            samples["rrf fusion"].append(t4 - t3)
+
+        for label, values in samples.items():
+            print(
+                f"  {label:>15}: p50 {percentile_ms(values, 50):7.2f} ms"
+                f"  p99 {percentile_ms(values, 99):7.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+LLM client throughput against the local mock provider server.
+
+Starts two mock servers (benchmarks.mock_llm) on localhost, then measures:
+
+- pooled:    the shared LLMClient, unique prompts, with rate-limited responses
+- unpooled:  a fresh httpx.AsyncClient per request and no retries (baseline)
+- duplicates: a prompt mix with repeats, served by coalescing and the cache
+- failover:  the primary always answers 429, so every request fails over
+
+httpcore's pool scans every connection whenever a request is queued or
+released, so per-request client CPU grows with pool size; beyond ~32
+connections per process, scale with more workers rather than a larger pool.
+
+Usage:
+    python -m benchmarks.bench_llm_client [--requests 1000] [--concurrency 32]
+        [--latency-ms 100] [--rate-limit 0.1]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+import httpx
+import numpy as np
+
+from app.llm import AnthropicProvider, LLMClient, LLMError, LLMRequest, OpenAIProvider
+from app.llm.prompts import VERDICT_SYSTEM_PROMPT
+
+
+def start_server(env: Dict[str, str]) -> Tuple[str, subprocess.Popen]:
+    """Run the mock server in its own process so it does not share our event loop."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "benchmarks.mock_llm:app",
+            "--port", str(port), "--log-level", "error", "--backlog", "4096",
+        ],
+        env={**os.environ, **env},
+    )
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(200):
+        try:
+            httpx.get(url + "/docs")
+            return url, process
+        except httpx.TransportError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("mock server did not start")
+
+
+def make_request(i: int) -> LLMRequest:
+    return LLMRequest(system=VERDICT_SYSTEM_PROMPT, prompt=f"声明：测试声明编号{i}")
+
+
+async def drive(
+    call: Callable[[LLMRequest], Awaitable[object]],
+    requests: List[LLMRequest],
+    concurrency: int,
+) -> Tuple[float, np.ndarray, int]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def one(request: LLMRequest) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await call(request)
+            except (LLMError, httpx.HTTPError):
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(request) for request in requests))
+    return time.perf_counter() - start, np.array(latencies) * 1e3, errors
+
+
+def report(name: str, count: int, result: Tuple[float, np.ndarray, int], extra: str = "") -> None:
+    elapsed, ms, errors = result
+    print(
+        f"  {name:<10} {count / elapsed:8.1f} req/s  p50 {np.percentile(ms, 50):7.1f} ms"
+        f"  p99 {np.percentile(ms, 99):7.1f} ms  errors {errors:4d}  {extra}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=100)
+    parser.add_argument("--rate-limit", type=float, default=0.1)
+    args = parser.parse_args()
+    logging.getLogger("app.llm").setLevel(logging.ERROR)
+
+    flaky_url, flaky = start_server(
+        {
+            "MOCK_LLM_LATENCY_MS": str(args.latency_ms),
+            "MOCK_LLM_JITTER_MS": str(args.latency_ms),
+            "MOCK_LLM_RATE_LIMIT_RATIO": str(args.rate_limit),
+        }
+    )
+    down_url, down = start_server(
+        {"MOCK_LLM_LATENCY_MS": "0", "MOCK_LLM_RATE_LIMIT_RATIO": "1", "MOCK_LLM_RETRY_AFTER": "0"}
+    )
+
+    def client(primary_url: str, cache: bool) -> LLMClient:
+        providers = [
+            AnthropicProvider("test", "mock", primary_url, max_connections=args.concurrency),
+            OpenAIProvider("test", "mock", flaky_url, max_connections=args.concurrency),
+        ]
+        return LLMClient(
+            providers,
+            max_concurrency=args.concurrency,
+            max_backoff=0.5,
+            cache_max_entries=10_000 if cache else 0,
+        )
+
+    unique = [make_request(i) for i in range(args.requests)]
+    rng = np.random.default_rng(0)
+    repeated = [make_request(int(i)) for i in rng.zipf(1.5, args.requests) % 200]
+
+    print(
+        f"requests={args.requests} concurrency={args.concurrency} "
+        f"latency={args.latency_ms}+{args.latency_ms}ms 429 ratio={args.rate_limit}"
+    )
+
+    pooled = client(flaky_url, cache=False)
+    result = await drive(pooled.complete, unique, args.concurrency)
+    report("pooled", args.requests, result, f"retries {pooled.retries}")
+    await pooled.aclose()
+
+    provider = AnthropicProvider("test", "mock", flaky_url)
+
+    async def unpooled(request: LLMRequest) -> None:
+        headers = provider._headers("test")
+        async with httpx.AsyncClient(base_url=flaky_url, headers=headers) as http:
+            response = await http.post(provider.path, json=provider._payload(request))
+            response.raise_for_status()
+
+    result = await drive(unpooled, unique, args.concurrency)
+    report("unpooled", args.requests, result)
+    await provider.aclose()
+
+    cached = client(flaky_url, cache=True)
+    result = await drive(cached.complete, repeated, args.concurrency)
+    report(
+        "duplicates",
+        args.requests,
+        result,
+        f"calls {cached.calls}  coalesced {cached.coalesced}  cache hits {cached.cache_hits}",
+    )
+    await cached.aclose()
+
+    failover = client(down_url, cache=False)
+    result = await drive(failover.complete, unique, args.concurrency)
+    report("failover", args.requests, result, f"failovers {failover.failovers}")
+    await failover.aclose()
+
+    flaky.terminate()
+    down.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,189 @@
+"""
+In-process load generator for the API, with fake retrieval and LLM backends.
+
+Drives POST /api/v1/verify, POST /api/v1/search and GET /api/v1/health, one
+after another, each at ``--rps`` requests per second for ``--duration``
+seconds through httpx's ASGI transport, and reports p50/p95/p99 latency per
+endpoint. Requests go out on schedule whether or not earlier ones have
+finished, and latency is measured from the scheduled send time, so a server
+that falls behind shows up in the tail instead of slowing the generator
+down. Generator and app share one event loop, so results are comparable
+between runs on the same machine rather than absolute capacity figures.
+
+Request bodies come from the checked-in corpus. /search runs against a BM25
+index of the corpus; the vector store is left empty, so no embedding model
+is loaded. Caching and rate limiting are off, so every request does the work.
+
+Usage:
+    python -m benchmarks.bench_load [--rps 50] [--duration 10]
+        [--endpoints verify,search,health] [--retrieval-ms 20] [--llm-ms 50]
+        [--json .benchmarks/load.json]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+import numpy as np
+
+from app.api.deps import get_llm, get_reranker, get_retriever
+from app.config import settings
+from app.lexical import get_lexical_index, lexical_tokens
+from app.main import create_app
+from app.nlp.script import warm_up_script_tables
+from app.nlp.tokenizer import initialize_tokenizer
+from app.ratelimit import close_rate_limiter
+from benchmarks.corpus import load_corpus
+from tests.fakes import FakeLLM, FakeRetriever
+
+# Endpoint name -> (method, path)
+ENDPOINTS: Dict[str, Tuple[str, str]] = {
+    "verify": ("POST", "/api/v1/verify"),
+    "search": ("POST", "/api/v1/search"),
+    "health": ("GET", "/api/v1/health"),
+}
+
+
+def request_bodies(documents: List[Dict[str, str]]) -> Dict[str, List[Optional[Dict[str, Any]]]]:
+    """JSON bodies each endpoint cycles through."""
+    return {
+        "verify": [
+            {
+                "text": doc["text"][:2000],
+                "language": doc["language"],
+                "options": {"force_refresh": True},
+            }
+            for doc in documents
+        ],
+        "search": [{"query": doc["text"][:40], "limit": 10} for doc in documents],
+        "health": [None],
+    }
+
+
+def index_corpus(documents: List[Dict[str, str]]) -> None:
+    """Add the corpus to the lexical index /search queries."""
+    get_lexical_index().upsert(
+        [doc["id"] for doc in documents],
+        [lexical_tokens(doc["text"]) for doc in documents],
+        [{"language": doc["language"], "source": doc["kind"]} for doc in documents],
+    )
+
+
+async def drive(
+    send: Callable[[Optional[Dict[str, Any]]], Any],
+    bodies: List[Optional[Dict[str, Any]]],
+    rps: float,
+    duration: float,
+) -> Dict[str, float]:
+    """Send ``rps * duration`` requests at a fixed rate; latency stats in milliseconds."""
+    count = max(1, int(rps * duration))
+    latencies = np.empty(count)
+    failures = 0
+
+    async def one(i: int, scheduled: float) -> None:
+        nonlocal failures
+        try:
+            response = await send(bodies[i % len(bodies)])
+            if response.status_code >= 400:
+                failures += 1
+        except Exception:
+            failures += 1
+        latencies[i] = time.perf_counter() - scheduled
+
+    tasks = []
+    start = time.perf_counter()
+    for i in range(count):
+        scheduled = start + i / rps
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(i, scheduled)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1e3
+    return {
+        "requests": count,
+        "achieved_rps": count / elapsed,
+        "error_rate": failures / count,
+        "p50_ms": p50,
+        "p95_ms": p95,
+        "p99_ms": p99,
+        "max_ms": latencies.max() * 1e3,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rps", type=float, default=50)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS))
+    parser.add_argument("--retrieval-ms", type=float, default=20)
+    parser.add_argument("--llm-ms", type=float, default=50)
+    parser.add_argument("--warmup", type=int, default=5, help="untimed requests per endpoint")
+    parser.add_argument("--json", default="", help="write results for benchmarks.compare")
+    args = parser.parse_args()
+
+    settings.cache_backend = "none"
+    settings.rate_limit_backend = "none"
+    settings.rerank_enabled = False
+    settings.lexical_index_path = ""
+    settings.vector_store_path = ""
+    await close_rate_limiter()
+    app = create_app()
+
+    retriever = FakeRetriever(latency=args.retrieval_ms / 1000, jitter=args.retrieval_ms / 2000)
+    llm = FakeLLM(token_delay=0.0, first_token_delay=args.llm_ms / 1000)
+    app.dependency_overrides[get_retriever] = lambda: retriever
+    app.dependency_overrides[get_llm] = lambda: llm
+    app.dependency_overrides[get_reranker] = lambda: None
+
+    initialize_tokenizer()
+    warm_up_script_tables()
+    documents = load_corpus()
+    index_corpus(documents)
+    bodies = request_bodies(documents)
+
+    results: Dict[str, Dict[str, float]] = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        for name in args.endpoints.split(","):
+            method, path = ENDPOINTS[name]
+
+            async def send(body: Optional[Dict[str, Any]], method: str = method, path: str = path):
+                return await client.request(method, path, json=body)
+
+            for body in bodies[name][: args.warmup]:
+                (await send(body)).raise_for_status()
+            results[name] = await drive(send, bodies[name], args.rps, args.duration)
+
+    print(
+        f"rps={args.rps:g} duration={args.duration:g}s "
+        f"retrieval={args.retrieval_ms:g}ms llm first token={args.llm_ms:g}ms"
+    )
+    for name, stats in results.items():
+        print(
+            f"  {name:<7} {stats['achieved_rps']:6.1f} req/s  p50 {stats['p50_ms']:7.1f} ms  "
+            f"p95 {stats['p95_ms']:7.1f} ms  p99 {stats['p99_ms']:7.1f} ms  "
+            f"errors {stats['error_rate']:.1%}"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "kind": "load",
+                    "rps": args.rps,
+                    "duration": args.duration,
+                    "endpoints": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,158 @@
+"""
+Microbenchmarks of the NLP functions on the request path, for regression checks.
+
+Each benchmark runs one function over every document of the checked-in
+corpus (``benchmarks/data/corpus.jsonl``) per round: ``extract_claims``,
+``detect_language``, ``count_script_chars`` and ``split_sentences`` on all
+of it, ``tokenize_chinese`` and ``extract_noun_phrases`` on the Chinese
+documents. Run them with pytest-benchmark:
+
+    pytest benchmarks/bench_micro.py --benchmark-json=.benchmarks/micro.json
+
+or, where pytest-benchmark isn't installed, with a plain timer that writes
+the same JSON layout:
+
+    python -m benchmarks.bench_micro [--rounds 20] [--json .benchmarks/micro.json]
+
+Check either file against the baseline with ``benchmarks.compare``.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import pytest
+
+from app.nlp.claim_extractor import extract_claims, split_sentences
+from app.nlp.language_detector import count_script_chars, detect_language
+from app.nlp.script import warm_up_script_tables
+from app.nlp.tokenizer import extract_noun_phrases, initialize_tokenizer, tokenize_chinese
+from benchmarks.corpus import load_corpus
+
+try:
+    import pytest_benchmark
+except ImportError:
+    pytest_benchmark = None
+
+# Benchmark name -> (function, whether it only runs on Chinese documents)
+CASES: Dict[str, Tuple[Callable[[str], Any], bool]] = {
+    "extract_claims": (extract_claims, False),
+    "detect_language": (detect_language, False),
+    "count_script_chars": (count_script_chars, False),
+    "split_sentences": (split_sentences, False),
+    "tokenize_chinese": (tokenize_chinese, True),
+    "extract_noun_phrases": (extract_noun_phrases, True),
+}
+
+
+def corpus_texts(chinese_only: bool) -> List[str]:
+    documents = load_corpus()
+    return [doc["text"] for doc in documents if not chinese_only or doc["language"][:2] == "zh"]
+
+
+def corpus_pass(name: str) -> Callable[[], None]:
+    """One round of benchmark ``name``: its function over the corpus."""
+    fn, chinese_only = CASES[name]
+    texts = corpus_texts(chinese_only)
+
+    def run() -> None:
+        for text in texts:
+            fn(text)
+
+    return run
+
+
+def warm_up() -> None:
+    """Load jieba and build the script tables, which the first call would otherwise pay for."""
+    initialize_tokenizer()
+    warm_up_script_tables()
+
+
+pytestmark = pytest.mark.skipif(pytest_benchmark is None, reason="needs pytest-benchmark")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _warm() -> None:
+    warm_up()
+
+
+def test_extract_claims(benchmark: Any) -> None:
+    benchmark(corpus_pass("extract_claims"))
+
+
+def test_detect_language(benchmark: Any) -> None:
+    benchmark(corpus_pass("detect_language"))
+
+
+def test_count_script_chars(benchmark: Any) -> None:
+    benchmark(corpus_pass("count_script_chars"))
+
+
+def test_split_sentences(benchmark: Any) -> None:
+    benchmark(corpus_pass("split_sentences"))
+
+
+def test_tokenize_chinese(benchmark: Any) -> None:
+    benchmark(corpus_pass("tokenize_chinese"))
+
+
+def test_extract_noun_phrases(benchmark: Any) -> None:
+    benchmark(corpus_pass("extract_noun_phrases"))
+
+
+def time_rounds(run: Callable[[], None], rounds: int) -> Dict[str, float]:
+    """pytest-benchmark's ``stats`` fields, in seconds, for ``rounds`` timed calls."""
+    run()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    return {
+        "min": min(samples),
+        "max": max(samples),
+        "mean": statistics.fmean(samples),
+        "median": statistics.median(samples),
+        "stddev": statistics.stdev(samples) if rounds > 1 else 0.0,
+        "rounds": rounds,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--json", default="", help="write results in pytest-benchmark's layout")
+    args = parser.parse_args()
+
+    warm_up()
+    documents = load_corpus()
+    print(f"{len(documents)} documents, {sum(len(doc['text']) for doc in documents)} characters")
+    results = []
+    for name in CASES:
+        stats = time_rounds(corpus_pass(name), args.rounds)
+        results.append({"group": None, "name": f"test_{name}", "stats": stats})
+        print(
+            f"  {name:<22} min {stats['min'] * 1e6:9.1f} us  "
+            f"median {stats['median'] * 1e6:9.1f} us  per corpus pass"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "machine_info": {
+                        "python_version": platform.python_version(),
+                        "machine": platform.machine(),
+                    },
+                    "benchmarks": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
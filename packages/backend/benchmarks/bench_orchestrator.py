@@ -0,0 +1,85 @@
+"""
+Load test for the verification orchestrator with stub backends.
+
+Runs many verifications concurrently against FakeRetriever (with a jittered
+latency tail), FakeTranslator and FakeLLM, and reports throughput, latency
+percentiles and the fraction of runs that hit a deadline and came back
+partial. Lower ``--budget-ms`` to watch the orchestrator trade completeness
+for latency.
+
+Usage:
+    python -m benchmarks.bench_orchestrator [--requests 500] [--concurrency 50]
+        [--budget-ms 1000] [--retrieval-ms 50] [--jitter-ms 200] [--llm-ms 200]
+        [--languages en,ja]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+import numpy as np
+
+from app.nlp.claim_extractor import extract_claims
+from app.pipeline import StageTimeouts, VerificationOrchestrator
+from benchmarks.corpus import make_texts
+from tests.fakes import FakeLLM, FakeRetriever, FakeTranslator
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--budget-ms", type=float, default=1000)
+    parser.add_argument("--retrieval-ms", type=float, default=50)
+    parser.add_argument("--jitter-ms", type=float, default=200)
+    parser.add_argument("--llm-ms", type=float, default=200)
+    parser.add_argument("--languages", default="en,ja")
+    args = parser.parse_args()
+
+    retriever = FakeRetriever(latency=args.retrieval_ms / 1000, jitter=args.jitter_ms / 1000)
+    translator = FakeTranslator()
+    llm = FakeLLM(first_token_delay=args.llm_ms / 1000)
+    orchestrator = VerificationOrchestrator(
+        retriever,
+        llm,
+        translator,
+        timeouts=StageTimeouts(extraction=1.0, retrieval=0.3, llm=1.0),
+        cross_lingual_languages=args.languages.split(","),
+    )
+
+    texts = make_texts(args.requests, sentences_per_text=3)
+    extract_claims(texts[0])  # load jieba before timing
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: List[float] = []
+    partial = 0
+
+    async def one(text: str) -> None:
+        nonlocal partial
+        async with semaphore:
+            start = time.perf_counter()
+            outcome = await orchestrator.run(
+                text, "zh-CN", max_sources=5, budget=args.budget_ms / 1000
+            )
+            latencies.append(time.perf_counter() - start)
+            partial += outcome.partial
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(text) for text in texts))
+    elapsed = time.perf_counter() - start
+
+    ms = np.array(latencies) * 1e3
+    print(
+        f"requests={args.requests} concurrency={args.concurrency} budget={args.budget_ms}ms "
+        f"retrieval={args.retrieval_ms}+{args.jitter_ms}ms llm={args.llm_ms}ms "
+        f"languages=zh-CN,{args.languages}"
+    )
+    print(f"  throughput: {args.requests / elapsed:8.1f} req/s")
+    print(f"  latency p50: {np.percentile(ms, 50):7.1f} ms  p99: {np.percentile(ms, 99):7.1f} ms")
+    print(f"  retrievals: {retriever.calls}  translations: {translator.calls}")
+    print(f"  partial:    {partial / args.requests:8.1%}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,165 @@
+"""
+Original-source lookup: latency per claim and mistranslation detection rate.
+
+Builds a corpus of English source articles from templates, together with a
+Chinese translation of one sentence of each: faithful, with a percentage off
+by ten ("30%" -> "3%"), with 万 used for million, or with the agency swapped.
+Each claim is aligned against the sentence index and checked; the benchmark
+reports alignment latency (search, alignment and fact comparison, without
+embedding) and how many mistranslations were caught or falsely reported.
+
+Without ``--model`` the multilingual embeddings are simulated: a translation
+gets its source sentence's vector plus noise. With ``--model`` every sentence
+and claim is embedded by that sentence-transformers model instead.
+
+Usage:
+    python -m benchmarks.bench_original_source [--documents 20000] [--claims 2000]
+        [--model paraphrase-multilingual-MiniLM-L12-v2]
+"""
+
+import argparse
+import random
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.sources import OriginalSourceFinder, SourceDocument, SourceIndex, sentence_records
+from app.vectorstore import LocalVectorStore
+
+AGENCIES = [
+    ("Reuters", "路透社"),
+    ("Bloomberg", "彭博社"),
+    ("the Associated Press", "美联社"),
+    ("the World Health Organization", "世界卫生组织"),
+]
+COUNTRIES = [("Japan", "日本"), ("Germany", "德国"), ("France", "法国"), ("India", "印度")]
+TOPICS = [
+    ("adults do not get enough exercise", "的成年人运动不足"),
+    ("households own an electric car", "的家庭拥有电动汽车"),
+    ("workers expect a pay rise this year", "的上班族预计今年加薪"),
+]
+FILLER = [
+    "The findings were published on Tuesday.",
+    "Officials did not respond to requests for comment.",
+    "Analysts said the trend was likely to continue.",
+    "The survey was carried out over several months.",
+]
+
+KINDS = ("faithful", "percent", "unit", "entity")
+
+
+def make_pair(rng: random.Random, doc_id: int, kind: str) -> Tuple[SourceDocument, str, str]:
+    """A source article and a (possibly mistranslated) Chinese rendering of its key sentence."""
+    (agency, agency_zh), (country, country_zh) = rng.choice(AGENCIES), rng.choice(COUNTRIES)
+    topic, topic_zh = rng.choice(TOPICS)
+    percent = rng.randrange(2, 10) * 10
+    millions = rng.randrange(2, 90)
+
+    key = (
+        f"{agency} reported that {percent}% of {topic} in {country}, "
+        f"a group of about {millions} million people."
+    )
+    if kind == "entity":
+        agency_zh = next(zh for en, zh in AGENCIES if en != agency)
+    shown_percent = percent // 10 if kind == "percent" else percent
+    people = f"{millions}万" if kind == "unit" else f"{millions * 100}万"
+    claim = f"据外媒报道，{agency_zh}称{country_zh}有{shown_percent}%{topic_zh}，约{people}人。"
+
+    text = " ".join(rng.sample(FILLER, 2) + [key] + rng.sample(FILLER, 1))
+    document = SourceDocument(
+        id=f"doc-{doc_id}",
+        url=f"https://example.com/{doc_id}",
+        title=key[:40],
+        language="en",
+        text=text,
+    )
+    return document, key, claim
+
+
+def simulated_vectors(
+    texts: List[str], dim: int, rng: np.random.Generator, base: Dict[str, np.ndarray]
+) -> np.ndarray:
+    """
+    Clustered random vectors standing in for sentence embeddings.
+
+    Each is remembered per text, so a translation can be placed near it.
+    """
+    centers = rng.standard_normal((max(len(texts) // 500, 8), dim)).astype(np.float32)
+    labels = rng.integers(0, len(centers), len(texts))
+    vectors = centers[labels] + 0.6 * rng.standard_normal((len(texts), dim)).astype(np.float32)
+    for text, vector in zip(texts, vectors):
+        base[text] = vector
+    return vectors
+
+
+def near(vector: np.ndarray, rng: np.random.Generator, noise: float = 0.6) -> np.ndarray:
+    """A translation's simulated embedding: cosine similarity about 0.85 to the source."""
+    unit = vector / np.linalg.norm(vector)
+    jitter = rng.standard_normal(len(vector)).astype(np.float32)
+    return unit + noise * jitter / np.sqrt(len(vector))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=20_000)
+    parser.add_argument("--claims", type=int, default=2_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--model", default=None)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    np_rng = np.random.default_rng(0)
+    pairs = [make_pair(rng, i, KINDS[i % len(KINDS)]) for i in range(args.documents)]
+
+    model = None
+    if args.model:
+        from app.embeddings import EmbeddingModel
+
+        model = EmbeddingModel(args.model)
+        args.dim = model.dim
+
+    ids, texts, metadata = sentence_records(document for document, _, _ in pairs)
+    base: Dict[str, np.ndarray] = {}
+    start = time.perf_counter()
+    vectors = (
+        model.encode(texts) if model else simulated_vectors(texts, args.dim, np_rng, base)
+    )
+    index = SourceIndex(LocalVectorStore(args.dim, dtype="float16"))
+    index.add(ids, vectors, metadata)
+    print(
+        f"Indexed {len(index):,} sentences of {args.documents:,} documents "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+
+    finder = OriginalSourceFinder(index, languages=["en"])
+    sample = pairs[: args.claims]
+    claims = [claim for _, _, claim in sample]
+    if model:
+        claim_vectors = model.encode(claims)
+    else:
+        claim_vectors = np.stack([near(base[key], np_rng) for _, key, _ in sample])
+
+    latencies: List[float] = []
+    outcomes: Counter = Counter()
+    for i, ((_, key, claim), vector) in enumerate(zip(sample, claim_vectors)):
+        kind = KINDS[i % len(KINDS)]
+        start = time.perf_counter()
+        match = finder.align(claim, vector)
+        latencies.append(time.perf_counter() - start)
+        if match is None or match.sentence.text != key:
+            outcomes[kind, "misaligned"] += 1
+        else:
+            outcomes[kind, "flagged" if match.mistranslated else "clean"] += 1
+
+    p50, p99 = (float(np.percentile(latencies, q) * 1e3) for q in (50, 99))
+    print(f"align() per claim: p50 {p50:.2f} ms  p99 {p99:.2f} ms\n")
+    print(f"{'translation':<10} {'flagged':>8} {'clean':>8} {'misaligned':>11}")
+    for kind in KINDS:
+        counts = [outcomes[kind, outcome] for outcome in ("flagged", "clean", "misaligned")]
+        print(f"{kind:<10} {counts[0]:>8} {counts[1]:>8} {counts[2]:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Rate limiter overhead microbenchmark.
+
+Measures, per request:
+
+- the in-process token bucket on its own (one hot key and many keys)
+- RateLimitMiddleware around a no-op ASGI app, minus the bare app
+- the Redis Lua backend, when ``--redis-url`` points at a reachable server
+
+and checks that a burst is cut off at the bucket size with a sane Retry-After.
+
+Usage:
+    python -m benchmarks.bench_rate_limit [--requests 200000] [--keys 10000]
+        [--redis-url redis://localhost:6379]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List
+
+from app.ratelimit import InMemoryRateLimiter, RateLimitMiddleware, RedisRateLimiter
+
+
+async def noop_app(scope: Dict[str, Any], receive: Any, send: Any) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def receive() -> Dict[str, Any]:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message: Dict[str, Any]) -> None:
+    pass
+
+
+def make_scopes(count: int, keys: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "type": "http",
+            "method": "POST",
+            "path": "/api/v1/verify",
+            "headers": [(b"content-type", b"application/json")],
+            "client": (f"10.0.{(i % keys) // 256}.{(i % keys) % 256}", 50000),
+        }
+        for i in range(count)
+    ]
+
+
+async def time_app(app: Any, scopes: List[Dict[str, Any]]) -> float:
+    start = time.perf_counter()
+    for scope in scopes:
+        await app(scope, receive, send)
+    return (time.perf_counter() - start) / len(scopes) * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--keys", type=int, default=10_000)
+    parser.add_argument("--redis-url", default="")
+    args = parser.parse_args()
+
+    # Generous limits so every request takes the allowed path
+    rate, burst = 1e9, 1_000_000_000
+
+    limiter = InMemoryRateLimiter(rate, burst)
+    start = time.perf_counter()
+    for _ in range(args.requests):
+        limiter.check("10.0.0.1")
+    hot = (time.perf_counter() - start) / args.requests * 1e6
+
+    keys = [f"10.0.{i // 256}.{i % 256}" for i in range(args.keys)]
+    limiter = InMemoryRateLimiter(rate, burst)
+    start = time.perf_counter()
+    for i in range(args.requests):
+        limiter.check(keys[i % args.keys])
+    spread = (time.perf_counter() - start) / args.requests * 1e6
+
+    scopes = make_scopes(args.requests, args.keys)
+    middleware = RateLimitMiddleware(noop_app, InMemoryRateLimiter(rate, burst))
+    bare = await time_app(noop_app, scopes)
+    wrapped = await time_app(middleware, scopes)
+
+    print(f"requests={args.requests} keys={args.keys}")
+    print(f"  {'token bucket, 1 key':<30} {hot:6.2f} µs/request")
+    print(f"  {f'token bucket, {args.keys} keys':<30} {spread:6.2f} µs/request")
+    print(f"  {'middleware overhead':<30} {wrapped - bare:6.2f} µs/request")
+
+    # Burst behaviour: 60/min with a burst of 10
+    limiter = InMemoryRateLimiter(1.0, 10)
+    decisions = [limiter.check("burst") for _ in range(12)]
+    allowed = sum(d.allowed for d in decisions)
+    assert allowed == 10, allowed
+    assert 0.9 < decisions[-1].retry_after <= 1.0, decisions[-1]
+    retry_after = decisions[-1].retry_after
+    print(f"  12 requests at 60/min, burst 10: {allowed} allowed, Retry-After {retry_after:.2f}s")
+
+    if args.redis_url:
+        redis_limiter = RedisRateLimiter(args.redis_url, rate, burst)
+        count = min(args.requests, 10_000)
+        start = time.perf_counter()
+        for i in range(count):
+            await redis_limiter.acquire(keys[i % args.keys])
+        per_call = (time.perf_counter() - start) / count * 1e6
+        print(f"  {'redis lua, sequential':<30} {per_call:6.1f} µs/request")
+        await redis_limiter.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,183 @@
+"""
+Cross-encoder reranking latency for 100 candidates per claim.
+
+Each claim gets ``--candidates`` passages in first-stage order. Every
+passage has a hidden relevance that falls off with its first-stage rank,
+noisily, as vector and BM25 ranks do. Without ``--model`` a stand-in
+cross-encoder returns an over-confident probability of that relevance and
+sleeps ``--pair-ms`` per pair plus ``--batch-ms`` per forward pass, which is
+what a small multilingual MiniLM cross-encoder costs on one CPU core. With
+``--model`` the real sentence-transformers cross-encoder scores synthetic
+texts instead and only the latencies are meaningful.
+
+Reports p50/p99 latency per claim for exhaustive scoring, the adaptive
+cutoff (with how many pairs it scored and how often it kept the exhaustive
+top ``--top-k``) and a warm score cache, plus the expected calibration error
+of raw and Platt-scaled scores.
+
+Usage:
+    python -m benchmarks.bench_rerank [--claims 200] [--candidates 100] [--top-k 5]
+        [--pair-ms 4] [--model cross-encoder/mmarco-mMiniLMv2-L12-H384-v1]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.cache.lru import TTLCache
+from app.rerank import CrossEncoderModel, PlattCalibrator, Reranker
+
+
+class SimulatedCrossEncoder:
+    """Returns precomputed scores for each passage, at a cross-encoder's cost."""
+
+    model_name = "simulated"
+
+    def __init__(self, scores: Dict[str, float], pair_ms: float, batch_ms: float) -> None:
+        self.scores = scores
+        self.pair_ms = pair_ms
+        self.batch_ms = batch_ms
+        self.pairs = 0
+
+    def score(self, pairs: List[Tuple[str, str]]) -> np.ndarray:
+        self.pairs += len(pairs)
+        time.sleep((self.batch_ms + self.pair_ms * len(pairs)) / 1000)
+        return np.array([self.scores[passage] for _, passage in pairs], dtype=np.float32)
+
+
+def make_claims(
+    rng: np.random.Generator, claims: int, candidates: int
+) -> Tuple[List[Tuple[str, List[Tuple[str, str]]]], Dict[str, float], Dict[str, float]]:
+    """
+    Claims with first-stage candidate lists.
+
+    Also returns every passage's true relevance logit and the stand-in
+    model's score: an over-confident probability, three times the true
+    logit plus model noise.
+    """
+    relevance: Dict[str, float] = {}
+    scores: Dict[str, float] = {}
+    dataset = []
+    for c in range(claims):
+        ranks = np.arange(candidates)
+        logits = 1.5 - 0.06 * ranks + rng.normal(0.0, 1.0, candidates)
+        noisy = 3.0 * logits + rng.normal(0.0, 0.5, candidates)
+        passages = []
+        for rank, logit, model_logit in zip(ranks, logits, noisy):
+            text = f"claim {c} passage {rank}"
+            relevance[text] = float(logit)
+            scores[text] = float(1.0 / (1.0 + np.exp(-model_logit)))
+            passages.append((f"{c}-{rank}", text))
+        dataset.append((f"claim {c}", passages))
+    return dataset, relevance, scores
+
+
+def expected_calibration_error(scores: np.ndarray, labels: np.ndarray, bins: int = 10) -> float:
+    which = np.minimum((scores * bins).astype(int), bins - 1)
+    error = 0.0
+    for b in range(bins):
+        mask = which == b
+        if mask.any():
+            error += mask.mean() * abs(scores[mask].mean() - labels[mask].mean())
+    return float(error)
+
+
+def percentile_ms(samples: list, q: float) -> float:
+    return float(np.percentile(samples, q) * 1e3)
+
+
+async def timed(reranker: Reranker, dataset: list, top_k: int, score_all: bool) -> tuple:
+    latencies, tops = [], []
+    for claim, passages in dataset:
+        start = time.perf_counter()
+        ranked = await reranker.rerank(claim, passages, top_k, score_all=score_all)
+        latencies.append(time.perf_counter() - start)
+        tops.append({index for index, _ in ranked})
+    return latencies, tops
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = np.random.default_rng(0)
+    dataset, relevance, scores = make_claims(rng, args.claims, args.candidates)
+    if args.model:
+        model = CrossEncoderModel(args.model, batch_size=args.batch_size)
+    else:
+        model = SimulatedCrossEncoder(scores, args.pair_ms, args.batch_ms)
+
+    def reranker(cache: bool = False) -> Reranker:
+        return Reranker(
+            model,
+            TTLCache(1_000_000, 3600.0) if cache else None,
+            batch_size=args.batch_size,
+            patience=args.patience,
+        )
+
+    def count_pairs() -> int:
+        return getattr(model, "pairs", 0)
+
+    before = count_pairs()
+    full, full_tops = await timed(reranker(), dataset, args.top_k, score_all=True)
+    full_pairs = count_pairs() - before
+
+    before = count_pairs()
+    adaptive, adaptive_tops = await timed(reranker(), dataset, args.top_k, score_all=False)
+    adaptive_pairs = count_pairs() - before
+    overlap = np.mean([len(a & f) / args.top_k for a, f in zip(adaptive_tops, full_tops)])
+
+    cached = reranker(cache=True)
+    await timed(cached, dataset, args.top_k, score_all=False)
+    warm, _ = await timed(cached, dataset, args.top_k, score_all=False)
+
+    print(
+        f"{args.claims} claims x {args.candidates} candidates, top {args.top_k}, "
+        f"batch {args.batch_size}, patience {args.patience}, "
+        f"model {args.model or f'simulated ({args.pair_ms} ms/pair)'}"
+    )
+    for label, samples, extra in (
+        ("exhaustive", full, f"{full_pairs / args.claims:.0f} pairs/claim"),
+        (
+            "adaptive",
+            adaptive,
+            f"{adaptive_pairs / args.claims:.0f} pairs/claim, "
+            f"top-{args.top_k} overlap with exhaustive {overlap:.1%}",
+        ),
+        ("warm cache", warm, "0 pairs/claim"),
+    ):
+        print(
+            f"  {label:>10}: p50 {percentile_ms(samples, 50):7.1f} ms"
+            f"  p99 {percentile_ms(samples, 99):7.1f} ms  ({extra})"
+        )
+
+    if not args.model:
+        # Labels drawn from the true relevance; fit on half the passages, measure on the rest
+        logits = np.array(list(relevance.values()))
+        raw = np.array(list(scores.values()))
+        labels = (rng.random(len(logits)) < 1.0 / (1.0 + np.exp(-logits))).astype(int)
+        half = len(logits) // 2
+        calibrator = PlattCalibrator.fit(raw[:half], labels[:half])
+        raw_error = expected_calibration_error(raw[half:], labels[half:])
+        scaled_error = expected_calibration_error(calibrator(raw[half:]), labels[half:])
+        print(
+            f"  calibration error (ECE): raw {raw_error:.3f}, Platt-scaled {scaled_error:.3f} "
+            f"(slope {calibrator.slope:.2f}, intercept {calibrator.intercept:.2f})"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--claims", type=int, default=200)
+    parser.add_argument("--candidates", type=int, default=100)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--patience", type=int, default=1)
+    parser.add_argument("--pair-ms", type=float, default=4.0)
+    parser.add_argument("--batch-ms", type=float, default=2.0)
+    parser.add_argument("--model", default="")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
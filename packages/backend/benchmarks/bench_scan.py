@@ -0,0 +1,87 @@
+"""
+Page scan throughput: a full page, then infinite-scroll rescans.
+
+Builds a page of text blocks (about 200 KB of UTF-8 by default) and times:
+scanning every block directly, the first POST /api/v1/scan of the page, and
+follow-up requests that re-send the page with a few new blocks appended, as
+an infinite-scroll feed does.
+
+Usage:
+    python -m benchmarks.bench_scan [--page-kb 200] [--scrolls 10] [--new-blocks 20]
+"""
+
+import argparse
+import asyncio
+import time
+from statistics import median
+from typing import Dict, List
+
+import httpx
+
+from app.main import app
+from app.scan import scan_blocks
+from benchmarks.corpus import make_sentences
+
+
+def make_blocks(page_kb: int, offset: int = 0) -> List[Dict[str, str]]:
+    """Blocks of 3-6 sentences until the page reaches ``page_kb`` kilobytes."""
+    blocks: List[Dict[str, str]] = []
+    size = 0
+    index = offset
+    while size < page_kb * 1024:
+        text = "".join(make_sentences(3 + index % 4, seed=index))
+        blocks.append({"id": f"post-{index}", "text": text})
+        size += len(text.encode("utf-8"))
+        index += 1
+    return blocks
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-kb", type=int, default=200)
+    parser.add_argument("--scrolls", type=int, default=10)
+    parser.add_argument("--new-blocks", type=int, default=20)
+    args = parser.parse_args()
+
+    blocks = make_blocks(args.page_kb)
+    texts = [block["text"] for block in blocks]
+    print(f"Page: {len(blocks)} blocks, {sum(len(t.encode()) for t in texts) / 1024:.0f} KB")
+
+    scan_blocks(texts[:10])  # warm up regex caches
+    start = time.perf_counter()
+    scans = scan_blocks(texts)
+    elapsed = time.perf_counter() - start
+    highlights = sum(len(scan.highlights) for scan in scans)
+    print(f"scan_blocks (direct):  {elapsed * 1e3:7.1f} ms, {highlights} highlights")
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        response = await client.post(
+            "/api/v1/scan", json={"session_id": "bench", "blocks": blocks}
+        )
+        response.raise_for_status()
+        print(f"POST /scan full page:  {(time.perf_counter() - start) * 1e3:7.1f} ms")
+
+        latencies = []
+        for scroll in range(args.scrolls):
+            seed = -len(blocks)
+            new_blocks = [
+                {"id": f"new-{scroll}-{i}", "text": "".join(make_sentences(4, seed=seed - i))}
+                for i in range(args.new_blocks)
+            ]
+            blocks = blocks + new_blocks
+            start = time.perf_counter()
+            response = await client.post(
+                "/api/v1/scan", json={"session_id": "bench", "blocks": blocks}
+            )
+            latencies.append(time.perf_counter() - start)
+            body = response.json()
+        print(
+            f"POST /scan rescroll:    {median(latencies) * 1e3:7.1f} ms median "
+            f"({body['scanned']} scanned, {len(body['unchanged'])} unchanged)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
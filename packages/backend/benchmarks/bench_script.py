@@ -0,0 +1,111 @@
+"""
+Cost of Chinese script normalization per claim.
+
+Times ``fold_script``, ``normalize_script`` and ``chinese_variant`` on
+``--texts`` claims of about ``--chars`` characters each, a quarter each in
+Simplified, Traditional, full-width and mixed Chinese/English text, against
+``unicodedata.normalize("NFKC")`` (what cache keys used before) and a
+per-character dict lookup. ``extract_claims`` on the same texts gives the
+stage it runs ahead of, for scale.
+
+Usage:
+    python -m benchmarks.bench_script [--texts 20000] [--chars 200]
+"""
+
+import argparse
+import random
+import time
+import unicodedata
+from typing import Callable, List
+
+import numpy as np
+
+from app.nlp.claim_extractor import extract_claims
+from app.nlp.hanzi_variants import SIMPLIFIED, TRADITIONAL
+from app.nlp.script import _tables, chinese_variant, fold_script, normalize_script
+from app.nlp.tokenizer import initialize_tokenizer
+
+SIMPLIFIED_SAMPLES = [
+    "据路透社报道，国家统计局数据显示，今年一季度国内生产总值同比增长5.3%。",
+    "专家表示，这种疫苗的保护效果在六个月后会明显下降，建议老年人接种加强针。",
+    "网传某市将于下月起全面禁止燃油车上路，市交通局已经辟谣称该消息不实。",
+]
+TRADITIONAL_SAMPLES = [
+    s.translate(str.maketrans(SIMPLIFIED, TRADITIONAL)) for s in SIMPLIFIED_SAMPLES
+]
+MIXED_SAMPLES = [
+    "According to Reuters，美联储周三宣布维持利率不变，符合市场预期（CPI 3.1%）。",
+    "WHO 官员称 COVID-19 仍是全球卫生威胁，但 Omicron 变种的重症率较低。",
+]
+
+
+def full_width(text: str) -> str:
+    """Full-width forms of the ASCII characters in ``text``, as some input methods type them."""
+    return "".join(chr(ord(c) + 0xFEE0) if "!" <= c <= "~" else c for c in text)
+
+
+def make_texts(rng: random.Random, count: int, chars: int) -> List[str]:
+    styles = [
+        lambda: rng.choice(SIMPLIFIED_SAMPLES),
+        lambda: rng.choice(TRADITIONAL_SAMPLES),
+        lambda: full_width(rng.choice(SIMPLIFIED_SAMPLES + MIXED_SAMPLES)),
+        lambda: rng.choice(MIXED_SAMPLES),
+    ]
+    texts = []
+    for i in range(count):
+        style = styles[i % len(styles)]
+        text = ""
+        while len(text) < chars:
+            text += style()
+        texts.append(text[:chars])
+    return texts
+
+
+def per_text_us(texts: List[str], fn: Callable[[str], object]) -> np.ndarray:
+    samples = np.empty(len(texts))
+    for i, text in enumerate(texts):
+        start = time.perf_counter()
+        fn(text)
+        samples[i] = time.perf_counter() - start
+    return samples * 1e6
+
+
+def report(label: str, samples: np.ndarray, chars: int) -> None:
+    print(
+        f"  {label:<32} mean {samples.mean():7.2f} us  p99 {np.percentile(samples, 99):7.2f} us"
+        f"  ({chars / samples.mean():6.1f} chars/us)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--texts", type=int, default=20_000)
+    parser.add_argument("--chars", type=int, default=200)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    fold_table, normalize_table = _tables()
+    print(
+        f"tables built in {(time.perf_counter() - start) * 1e3:.1f} ms "
+        f"({len(fold_table)} folded, {len(normalize_table) - len(fold_table)} more normalized)"
+    )
+
+    texts = make_texts(random.Random(0), args.texts, args.chars)
+    naive = {chr(code): value for code, value in normalize_table.items()}
+    print(f"{args.texts} texts of {args.chars} characters")
+    for label, fn in (
+        ("fold_script", fold_script),
+        ("normalize_script", normalize_script),
+        ("chinese_variant", chinese_variant),
+        ("unicodedata NFKC only", lambda text: unicodedata.normalize("NFKC", text)),
+        ("per-character dict lookup", lambda text: "".join(naive.get(c, c) for c in text)),
+    ):
+        report(label, per_text_us(texts, fn), args.chars)
+
+    initialize_tokenizer()
+    sample = texts[: min(len(texts), 2_000)]
+    report("extract_claims (for scale)", per_text_us(sample, extract_claims), args.chars)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Vectorized script counting versus the per-character range loop.
+
+Usage:
+    python -m benchmarks.bench_script_counting [--kb 50] [--repeat 200]
+"""
+
+import argparse
+import time
+from typing import Dict
+
+from app.nlp.language_detector import (
+    SCRIPT_RANGES,
+    analyze_languages_batch,
+    count_script_chars,
+    count_script_chars_batch,
+)
+from benchmarks.corpus import make_texts
+
+
+def count_script_chars_loop(text: str) -> Dict[str, int]:
+    """The original implementation, kept here as the baseline."""
+    counts = {script: 0 for script in SCRIPT_RANGES}
+    for char in text:
+        code_point = ord(char)
+        for script, (start, end) in SCRIPT_RANGES.items():
+            if start <= code_point <= end:
+                counts[script] += 1
+                break
+    return counts
+
+
+def timed(label: str, func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    per_call = (time.perf_counter() - start) / repeat
+    print(f"{label:>28}: {per_call * 1e3:8.3f} ms/call")
+    return per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--kb", type=int, default=50, help="page payload size in KB")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    page = ""
+    for text in make_texts(10_000):
+        page += text
+        if len(page.encode("utf-8")) >= args.kb * 1024:
+            break
+
+    assert count_script_chars(page) == count_script_chars_loop(page)
+    print(f"payload: {len(page)} chars / {len(page.encode('utf-8')) // 1024} KB")
+
+    loop = timed("per-character loop", lambda: count_script_chars_loop(page), args.repeat)
+    fast = timed("lookup table", lambda: count_script_chars(page), args.repeat)
+    print(f"{'speedup':>28}: x{loop / fast:.1f}")
+
+    posts = make_texts(1000)
+    assert count_script_chars_batch(posts) == [count_script_chars(p) for p in posts]
+    timed("1000 posts, one call each", lambda: [count_script_chars(p) for p in posts], 20)
+    timed("1000 posts, batch", lambda: count_script_chars_batch(posts), 20)
+    timed("1000 posts, full analysis", lambda: analyze_languages_batch(posts), 20)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Sentence splitting on long articles: offsets generator vs. the old re.split.
+
+The old splitter split with ``re.split`` and stripped every piece twice,
+materializing several strings per sentence, and could only give positions by
+searching for each sentence again. ``sentence_spans`` yields offsets and
+creates no substrings. For each approach this reports latency per article
+and peak traced memory while splitting one article after another.
+
+Usage:
+    python -m benchmarks.bench_sentence_split [--articles 200] [--sentences 300]
+"""
+
+import argparse
+import re
+import time
+import tracemalloc
+from typing import Callable, Iterable, List, Tuple
+
+from app.nlp.claim_extractor import sentence_spans
+from benchmarks.corpus import make_texts
+
+
+def legacy_split_sentences(text: str) -> List[str]:
+    """The previous implementation, kept here as the baseline."""
+    delimiters = r"[。！？\.\!\?]"
+    sentences = re.split(delimiters, text)
+    return [s.strip() for s in sentences if s.strip() and len(s.strip()) >= 10]
+
+
+def legacy_spans(text: str) -> List[Tuple[int, int]]:
+    """Offsets with the old splitter: search the text for every sentence."""
+    spans = []
+    position = 0
+    for sentence in legacy_split_sentences(text):
+        start = text.index(sentence, position)
+        position = start + len(sentence)
+        spans.append((start, position))
+    return spans
+
+
+def best_of(runs: int, fn: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def measure(name: str, split: Callable[[str], Iterable], articles: List[str]) -> None:
+    def consume() -> None:
+        for article in articles:
+            for _ in split(article):
+                pass
+
+    latency = best_of(5, consume) / len(articles)
+
+    tracemalloc.start()
+    consume()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<26} {latency * 1e6:8.1f} µs  {peak / 1024:8.1f} KiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--sentences", type=int, default=300)
+    args = parser.parse_args()
+
+    articles = make_texts(args.articles, sentences_per_text=args.sentences)
+    average = sum(map(len, articles)) / len(articles)
+    print(f"{len(articles)} articles of {average:,.0f} characters\n")
+    print(f"{'':<26} {'latency':>11}  {'peak':>12}")
+
+    measure("re.split + strip (old)", legacy_split_sentences, articles)
+    measure("old + str.index offsets", legacy_spans, articles)
+    measure("sentence_spans", sentence_spans, articles)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Memory and cold start of ``--workers`` worker processes: uvicorn vs ``app.serve``.
+
+Starts the API twice on a free local port, as ``uvicorn app.main:app
+--workers N`` (every worker imports the app and loads the models itself) and
+as ``python -m app.serve --workers N`` (loaded once, then forked). For each
+it reports the cold start, from launch until every worker has printed that
+its warm-up is complete, then sends ``--requests`` POST /api/v1/scan and
+GET /api/v1/health requests so the workers touch their data, and reads the
+memory of the whole process tree, NLP pool processes included: total RSS
+(shared pages counted once per process), total PSS (the real footprint) and
+the unique memory (USS) of each worker.
+
+Usage:
+    python -m benchmarks.bench_serve [--workers 4] [--requests 200]
+"""
+
+import argparse
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Tuple
+
+import httpx
+
+from app.serve import ProcessMemory, child_pids, format_memory_report, process_memory
+from benchmarks.corpus import load_corpus
+
+READY_LINE = "Warm-up complete"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def process_tree(pid: int) -> List[Tuple[str, int]]:
+    """The server's processes: parent, workers and each worker's NLP pool."""
+    rows = [("parent", pid)]
+    workers = 0
+    for child in child_pids(pid):
+        with open(f"/proc/{child}/cmdline", "rb") as f:
+            if b"resource_tracker" in f.read():
+                rows.append(("resource tracker", child))
+                continue
+        label = f"worker {workers}"
+        workers += 1
+        rows.append((label, child))
+        rows += [(f"{label} pool", grandchild) for grandchild in child_pids(child)]
+    return rows
+
+
+def wait_ready(process: subprocess.Popen, workers: int, timeout: float) -> float:
+    """Seconds until every worker has reported its warm-up complete."""
+    start = time.perf_counter()
+    ready = threading.Event()
+    seen = 0
+
+    def read() -> None:
+        nonlocal seen
+        for line in process.stdout:
+            if READY_LINE in line:
+                seen += 1
+                if seen == workers:
+                    ready.set()
+
+    threading.Thread(target=read, daemon=True).start()
+    if not ready.wait(timeout):
+        raise RuntimeError(f"only {seen} of {workers} workers ready after {timeout:.0f}s")
+    return time.perf_counter() - start
+
+
+def send_traffic(port: int, requests: int) -> None:
+    blocks = [{"id": doc["id"], "text": doc["text"]} for doc in load_corpus()]
+    with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=30) as client:
+        for i in range(requests):
+            if i % 2:
+                client.get("/api/v1/health").raise_for_status()
+            else:
+                body = {"session_id": f"bench-{i}", "blocks": blocks}
+                client.post("/api/v1/scan", json=body).raise_for_status()
+
+
+def measure(command: List[str], workers: int, requests: int, env: Dict[str, str]) -> None:
+    port = free_port()
+    process = subprocess.Popen(
+        [*command, "--port", str(port)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        env=env,
+        start_new_session=True,
+    )
+    try:
+        cold_start = wait_ready(process, workers, timeout=300)
+        send_traffic(port, requests)
+        time.sleep(1)
+        usage: List[Tuple[str, ProcessMemory]] = [
+            (label, process_memory(pid)) for label, pid in process_tree(process.pid)
+        ]
+    finally:
+        os.killpg(process.pid, signal.SIGTERM)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+
+    mib = 1 << 20
+    worker_uss = [u.uss for label, u in usage if label.startswith("worker") and "pool" not in label]
+    print(f"  cold start {cold_start:6.2f} s")
+    print(
+        f"  total RSS {sum(u.rss for _, u in usage) / mib:8.1f} MiB  "
+        f"total PSS {sum(u.pss for _, u in usage) / mib:8.1f} MiB  "
+        f"mean worker USS {sum(worker_uss) / max(len(worker_uss), 1) / mib:7.1f} MiB"
+    )
+    print("    " + format_memory_report(usage).replace("\n", "\n    "))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as metrics_dir:
+        env = {
+            **os.environ,
+            "PYTHONUNBUFFERED": "1",
+            "RATE_LIMIT_BACKEND": "none",
+            "CACHE_BACKEND": "memory",
+            "METRICS_DIR": metrics_dir,
+            "MEMORY_REPORT_SECONDS": "0",
+        }
+        options = ["--workers", str(args.workers), "--host", "127.0.0.1"]
+        for label, command in (
+            ("uvicorn (each worker loads everything)", ["uvicorn", "app.main:app"]),
+            ("app.serve (loaded once, then forked)", ["app.serve"]),
+        ):
+            print(f"{label}, {args.workers} workers")
+            measure([sys.executable, "-m", *command, *options], args.workers, args.requests, env)
+
+
+if __name__ == "__main__":
+    main()
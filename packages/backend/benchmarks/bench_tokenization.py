@@ -0,0 +1,55 @@
+"""
+Single-pass tokenization versus separate noun-phrase and keyword passes.
+
+Usage:
+    python -m benchmarks.bench_tokenization [--sentences 5000]
+"""
+
+import argparse
+import time
+
+from app.nlp.claim_extractor import split_sentences
+from app.nlp.tokenizer import extract_keywords, extract_noun_phrases, tokenize_sentence
+from benchmarks.corpus import make_texts
+
+
+def run_two_pass(sentences: list) -> None:
+    for sentence in sentences:
+        extract_noun_phrases(sentence)
+        extract_keywords(sentence, top_k=5)
+
+
+def run_single_pass(sentences: list) -> None:
+    for sentence in sentences:
+        tokenized = tokenize_sentence(sentence)
+        tokenized.noun_phrases()
+        tokenized.keywords(top_k=5)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sentences", type=int, default=5000)
+    args = parser.parse_args()
+
+    sentences = []
+    for text in make_texts(args.sentences):
+        sentences.extend(split_sentences(text))
+    sentences = sentences[: args.sentences]
+
+    # Load dictionaries and IDF tables before timing
+    run_two_pass(sentences[:1])
+    run_single_pass(sentences[:1])
+
+    timings = {}
+    for name, func in (("two-pass", run_two_pass), ("single-pass", run_single_pass)):
+        start = time.perf_counter()
+        func(sentences)
+        timings[name] = time.perf_counter() - start
+        per_sentence = timings[name] / len(sentences) * 1e6
+        print(f"{name:>12}: {timings[name]:.3f}s  ({per_sentence:.1f} µs/sentence)")
+
+    print(f"     speedup: x{timings['two-pass'] / timings['single-pass']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
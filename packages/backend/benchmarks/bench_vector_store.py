@@ -0,0 +1,92 @@
+"""
+Recall and latency of the local IVF-flat index against brute-force search.
+
+Synthetic clustered vectors stand in for sentence embeddings.
+
+Usage:
+    python -m benchmarks.bench_vector_store [--sizes 100000 1000000] [--dim 384]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from app.vectorstore import LocalVectorStore
+
+LANGUAGES = ["zh-CN", "en", "ja", "ko"]
+
+
+def make_vectors(rng: np.random.Generator, count: int, centers: np.ndarray) -> np.ndarray:
+    dim = centers.shape[1]
+    labels = rng.integers(0, len(centers), count)
+    return centers[labels] + 0.6 * rng.standard_normal((count, dim)).astype(np.float32)
+
+
+def percentile_ms(samples: list, q: float) -> float:
+    return float(np.percentile(samples, q) * 1e3)
+
+
+def run(size: int, dim: int, queries: int, nprobe: int, batch: int) -> None:
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((max(size // 500, 8), dim)).astype(np.float32)
+    store = LocalVectorStore(dim, dtype="float16", nprobe=nprobe, min_train_size=size + 1)
+
+    start = time.perf_counter()
+    for offset in range(0, size, batch):
+        count = min(batch, size - offset)
+        store.upsert(
+            [str(i) for i in range(offset, offset + count)],
+            make_vectors(rng, count, centers),
+            [{"language": LANGUAGES[i % 4], "source": f"s{i % 20}"} for i in range(count)],
+        )
+    ingest = time.perf_counter() - start
+
+    start = time.perf_counter()
+    store.build_index()
+    train = time.perf_counter() - start
+
+    query_vectors = make_vectors(rng, queries, centers)
+    exact_ms, ivf_ms, filtered_ms, recall = [], [], [], 0.0
+    for vector in query_vectors:
+        t0 = time.perf_counter()
+        truth = {m.id for m in store.query(vector, 10, exact=True)}
+        t1 = time.perf_counter()
+        found = {m.id for m in store.query(vector, 10)}
+        t2 = time.perf_counter()
+        store.query(vector, 10, languages=["zh-CN"], sources=["s1", "s2"])
+        t3 = time.perf_counter()
+        exact_ms.append(t1 - t0)
+        ivf_ms.append(t2 - t1)
+        filtered_ms.append(t3 - t2)
+        recall += len(truth & found) / len(truth)
+
+    print(f"n={size:,} dim={dim} nprobe={nprobe}")
+    print(f"  ingest {ingest:.1f}s, train {train:.1f}s")
+    print(f"  recall@10 vs brute force: {recall / queries:.3f}")
+    for label, samples in (
+        ("brute force", exact_ms),
+        ("ivf", ivf_ms),
+        ("ivf+filter", filtered_ms),
+    ):
+        print(
+            f"  {label:>12}: p50 {percentile_ms(samples, 50):7.2f} ms"
+            f"  p99 {percentile_ms(samples, 99):7.2f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--nprobe", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=10_000)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run(size, args.dim, args.queries, args.nprobe, args.batch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Streaming verification harness with a fake LLM and a fake retriever.
+
+Drives POST /api/v1/verify/stream in-process, checks the event sequence and
+reports when each event type first arrives, next to the latency of the
+blocking POST /api/v1/verify endpoint. The stream is read straight off the
+ASGI ``send`` channel because httpx's ASGI transport buffers whole bodies.
+
+Usage:
+    python -m benchmarks.bench_verify_stream [--runs 20] [--retrieval-ms 50] [--llm-ms 200]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from statistics import median
+from typing import Any, Dict, List
+
+import httpx
+
+from app.api.deps import get_llm, get_retriever
+from app.config import settings
+from app.main import app
+from app.nlp.claim_extractor import extract_claims
+from benchmarks.corpus import make_texts
+from tests.fakes import FakeLLM, FakeRetriever
+
+EXPECTED_ORDER = ["claims", "evidence", "summary", "verdict"]
+
+
+def parse_events(chunk: str) -> List[str]:
+    return [line[len("event: ") :] for line in chunk.splitlines() if line.startswith("event: ")]
+
+
+async def stream_once(text: str) -> Dict[str, float]:
+    first_seen: Dict[str, float] = {}
+    order: List[str] = []
+    body = json.dumps({"text": text, "options": {"force_refresh": True}}).encode("utf-8")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/api/v1/verify/stream",
+        "raw_path": b"/api/v1/verify/stream",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json"), (b"host", b"test")],
+        "client": ("127.0.0.1", 0),
+        "server": ("test", 80),
+    }
+    sent_request = False
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal sent_request
+        if not sent_request:
+            sent_request = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.Event().wait()  # never disconnect
+
+    async def send(message: Dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message
+        elif message["type"] == "http.response.body":
+            for event in parse_events(message.get("body", b"").decode("utf-8")):
+                first_seen.setdefault(event, time.perf_counter() - start)
+                if not order or order[-1] != event:
+                    order.append(event)
+
+    start = time.perf_counter()
+    await app(scope, receive, send)
+
+    assert order == EXPECTED_ORDER, f"unexpected event order: {order}"
+    return first_seen
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--retrieval-ms", type=float, default=50)
+    parser.add_argument("--llm-ms", type=float, default=200)
+    args = parser.parse_args()
+
+    settings.cache_backend = "none"
+    settings.rerank_enabled = False
+    retriever = FakeRetriever(latency=args.retrieval_ms / 1000)
+    llm = FakeLLM(first_token_delay=args.llm_ms / 1000)
+    app.dependency_overrides[get_retriever] = lambda: retriever
+    app.dependency_overrides[get_llm] = lambda: llm
+
+    texts = make_texts(args.runs, sentences_per_text=3)
+    extract_claims(texts[0])  # load jieba before timing
+
+    streamed = [await stream_once(text) for text in texts]
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        blocking = []
+        for text in texts:
+            start = time.perf_counter()
+            response = await client.post(
+                "/api/v1/verify", json={"text": text, "options": {"force_refresh": True}}
+            )
+            response.raise_for_status()
+            blocking.append(time.perf_counter() - start)
+
+    print(f"runs={args.runs} retrieval={args.retrieval_ms}ms llm first token={args.llm_ms}ms")
+    for event in EXPECTED_ORDER:
+        print(f"  first {event:>8} event: {median(s[event] for s in streamed) * 1e3:8.1f} ms (p50)")
+    print(f"  blocking /verify:      {median(blocking) * 1e3:8.1f} ms (p50)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
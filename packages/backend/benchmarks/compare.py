@@ -0,0 +1,117 @@
+"""
+Compare benchmark results against the checked-in baseline.
+
+Reads pytest-benchmark JSON (from ``bench_micro``) and load-test JSON (from
+``bench_load``), flattens them into metrics where lower is better, and
+compares each with ``baseline.json``:
+
+- ``micro.<function>.min_us``: fastest pass over the corpus, the statistic
+  least affected by other load on the machine
+- ``load.<endpoint>.p50_ms``, ``p95_ms``, ``p99_ms``: request latency
+- ``load.<endpoint>.error_rate``: share of failed requests
+
+A metric regresses when it exceeds its baseline by more than the tolerance
+for its kind (``micro`` or ``load``) in the baseline file, or
+``--tolerance``. Exits with status 1 on any regression, so it can gate a
+deploy. ``--update`` writes the results into the baseline instead; do that
+on the machine the gate runs on, since timings don't carry across hardware.
+
+Usage:
+    python -m benchmarks.compare .benchmarks/micro.json .benchmarks/load.json
+        [--baseline benchmarks/baseline.json] [--tolerance 0.2] [--update]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+BASELINE_FORMAT = 1
+
+_LATENCY_FIELDS = ("p50_ms", "p95_ms", "p99_ms", "error_rate")
+
+
+def flatten(results: Dict[str, Any]) -> Dict[str, float]:
+    """Metrics of one results file, by name."""
+    metrics = {}
+    if "benchmarks" in results:
+        for bench in results["benchmarks"]:
+            name = bench["name"].removeprefix("test_")
+            metrics[f"micro.{name}.min_us"] = bench["stats"]["min"] * 1e6
+    elif results.get("kind") == "load":
+        for endpoint, stats in results["endpoints"].items():
+            for field in _LATENCY_FIELDS:
+                metrics[f"load.{endpoint}.{field}"] = stats[field]
+    else:
+        raise ValueError("Not a pytest-benchmark or bench_load results file")
+    return metrics
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, float], tolerance: Optional[float] = None
+) -> List[str]:
+    """Print a table of every metric and return the names of those that regressed."""
+    regressions = []
+    print(f"{'metric':<40} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name in sorted(set(baseline["metrics"]) | set(current)):
+        base = baseline["metrics"].get(name)
+        value = current.get(name)
+        if base is None or value is None:
+            status = "new" if base is None else "missing"
+            shown = ["-" if v is None else f"{v:.2f}" for v in (base, value)]
+            print(f"{name:<40} {shown[0]:>12} {shown[1]:>12} {status:>8}")
+            continue
+        limit = tolerance if tolerance is not None else baseline["tolerance"][name.split(".")[0]]
+        change = (value - base) / base if base else (float("inf") if value else 0.0)
+        regressed = value > base * (1 + limit)
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<40} {base:12.2f} {value:12.2f} {change:+8.1%}"
+            f"{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("results", nargs="+", help="bench_micro and bench_load JSON files")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=None, help="overrides the baseline's")
+    parser.add_argument("--update", action="store_true", help="write the results as the baseline")
+    args = parser.parse_args()
+
+    current: Dict[str, float] = {}
+    for path in args.results:
+        with open(path, encoding="utf-8") as f:
+            current.update(flatten(json.load(f)))
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("format") != BASELINE_FORMAT:
+        sys.exit(f"Unsupported baseline format {baseline.get('format')!r}")
+
+    if args.update:
+        baseline["metrics"].update({name: round(value, 4) for name, value in current.items()})
+        baseline["updated"] = date.today().isoformat()
+        baseline["machine"] = (
+            f"{platform.machine()}, {os.cpu_count()} CPU, Python {platform.python_version()}"
+        )
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Updated {len(current)} metrics in {args.baseline}")
+        return
+
+    regressions = compare(baseline, current, args.tolerance)
+    if regressions:
+        sys.exit(f"{len(regressions)} regressed: {', '.join(regressions)}")
+    print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Local mock of the Anthropic and OpenAI completion endpoints.
+
+Simulates response latency and rate limiting so the LLM client can be
+load-tested without network access or API keys. Every response is a
+valid verdict JSON.
+
+Usage:
+    MOCK_LLM_LATENCY_MS=200 MOCK_LLM_RATE_LIMIT_RATIO=0.1 \
+        uvicorn benchmarks.mock_llm:app --port 8100
+    CLAUDE_BASE_URL=http://127.0.0.1:8100 CLAUDE_API_KEY=test uvicorn app.main:app
+"""
+
+import asyncio
+import json
+import os
+import random
+from dataclasses import dataclass
+from typing import Any, Dict
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+MOCK_ANSWER = json.dumps(
+    {"verdict": "partly_true", "confidence": 0.7, "summary": "模拟回答：证据部分支持该声明 [1]。"},
+    ensure_ascii=False,
+)
+
+
+@dataclass
+class MockLLMConfig:
+    """
+    Mock server behaviour.
+
+    Args:
+        latency: Base response latency in seconds
+        jitter: Extra uniform random latency in seconds
+        rate_limit_ratio: Fraction of requests answered with HTTP 429
+        retry_after: ``Retry-After`` value sent with a 429, in seconds
+    """
+
+    latency: float = 0.05
+    jitter: float = 0.0
+    rate_limit_ratio: float = 0.0
+    retry_after: float = 0.1
+
+    @classmethod
+    def from_env(cls) -> "MockLLMConfig":
+        """Read the ``MOCK_LLM_*`` environment variables."""
+        return cls(
+            latency=float(os.environ.get("MOCK_LLM_LATENCY_MS", 50)) / 1000,
+            jitter=float(os.environ.get("MOCK_LLM_JITTER_MS", 0)) / 1000,
+            rate_limit_ratio=float(os.environ.get("MOCK_LLM_RATE_LIMIT_RATIO", 0)),
+            retry_after=float(os.environ.get("MOCK_LLM_RETRY_AFTER", 0.1)),
+        )
+
+
+def create_mock_app(config: MockLLMConfig) -> FastAPI:
+    """
+    Build the mock API app.
+
+    Request counters are kept on ``app.state.stats``.
+    """
+    app = FastAPI(title="Mock LLM API")
+    app.state.stats = {"requests": 0, "rate_limited": 0}
+
+    async def respond(body: Dict[str, Any]) -> Any:
+        app.state.stats["requests"] += 1
+        await asyncio.sleep(config.latency + random.uniform(0.0, config.jitter))
+        if random.random() < config.rate_limit_ratio:
+            app.state.stats["rate_limited"] += 1
+            return JSONResponse(
+                {"error": {"type": "rate_limit_error", "message": "rate limited"}},
+                status_code=429,
+                headers={"retry-after": str(config.retry_after)},
+            )
+        return body
+
+    @app.post("/v1/messages")
+    async def messages(request: Request) -> Any:
+        payload = await request.json()
+        return await respond(
+            {
+                "type": "message",
+                "role": "assistant",
+                "model": payload.get("model", ""),
+                "content": [{"type": "text", "text": MOCK_ANSWER}],
+                "stop_reason": "end_turn",
+            }
+        )
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request) -> Any:
+        payload = await request.json()
+        return await respond(
+            {
+                "object": "chat.completion",
+                "model": payload.get("model", ""),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": MOCK_ANSWER},
+                        "finish_reason": "stop",
+                    }
+                ],
+            }
+        )
+
+    @app.get("/v1/models")
+    async def models() -> Any:
+        return {"data": [{"id": "mock", "object": "model"}]}
+
+    return app
+
+
+app = create_mock_app(MockLLMConfig.from_env())
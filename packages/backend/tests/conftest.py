@@ -0,0 +1,48 @@
+"""Shared fixtures: the API wired to fake pipeline backends."""
+
+from typing import AsyncIterator, NamedTuple
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.api.deps import get_llm, get_reranker, get_retriever
+from app.cache import close_verification_cache
+from app.config import settings
+from app.main import create_app
+from app.nlp.tokenizer import initialize_tokenizer
+from app.ratelimit import close_rate_limiter
+from tests.fakes import FakeLLM, FakeRetriever
+
+
+class Api(NamedTuple):
+    app: FastAPI
+    client: httpx.AsyncClient
+    retriever: FakeRetriever
+    llm: FakeLLM
+
+
+@pytest.fixture
+async def api(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[Api]:
+    """An in-process client of the app with fake retrieval and LLM and an in-memory cache."""
+    monkeypatch.setattr(settings, "cache_backend", "memory")
+    monkeypatch.setattr(settings, "rate_limit_backend", "none")
+    monkeypatch.setattr(settings, "rerank_enabled", False)
+    # Loading jieba inside a request would overrun the extraction deadline
+    initialize_tokenizer()
+    await close_verification_cache()
+    await close_rate_limiter()
+
+    retriever = FakeRetriever(latency=0.01)
+    llm = FakeLLM(token_delay=0.0, first_token_delay=0.01)
+    app = create_app()
+    app.dependency_overrides[get_retriever] = lambda: retriever
+    app.dependency_overrides[get_llm] = lambda: llm
+    app.dependency_overrides[get_reranker] = lambda: None
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield Api(app, client, retriever, llm)
+
+    await close_verification_cache()
+    await close_rate_limiter()
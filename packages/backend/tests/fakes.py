@@ -0,0 +1,83 @@
+"""
+Fake pipeline backends for tests, benchmarks and local load testing.
+"""
+
+import asyncio
+import hashlib
+import random
+from typing import AsyncIterator, List, Sequence
+
+from app.pipeline.types import LLMChunk, RetrievedEvidence
+
+
+class FakeRetriever:
+    """
+    Returns deterministic synthetic evidence after a delay.
+
+    The delay is ``latency`` plus up to ``jitter`` seconds drawn uniformly,
+    which gives load tests a realistic latency tail.
+    """
+
+    def __init__(self, latency: float = 0.05, items: int = 3, jitter: float = 0.0) -> None:
+        self.latency = latency
+        self.items = items
+        self.jitter = jitter
+        self.calls = 0
+
+    async def retrieve(self, query: str, language: str, limit: int) -> List[RetrievedEvidence]:
+        self.calls += 1
+        await asyncio.sleep(self.latency + random.uniform(0.0, self.jitter))
+        digest = hashlib.sha1(f"{query}|{language}".encode("utf-8")).hexdigest()[:8]
+        return [
+            RetrievedEvidence(
+                id=f"{digest}-{i}",
+                source="测试来源",
+                source_url=f"https://example.com/{language}/{digest}/{i}",
+                title=f"Evidence {i} for {query[:20]}",
+                snippet=query[:100],
+                language=language,
+                score=round(0.9 - 0.1 * i, 2),
+            )
+            for i in range(min(self.items, limit))
+        ]
+
+
+class FakeTranslator:
+    """Tags the text with the target language after a fixed delay."""
+
+    def __init__(self, latency: float = 0.02) -> None:
+        self.latency = latency
+        self.calls = 0
+
+    async def translate(self, text: str, source_language: str, target_language: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return f"[{target_language}] {text}"
+
+
+class FakeLLM:
+    """Streams a canned summary token by token, then a fixed verdict."""
+
+    def __init__(
+        self,
+        token_delay: float = 0.01,
+        first_token_delay: float = 0.2,
+        verdict: str = "partly_true",
+        confidence: float = 0.7,
+    ) -> None:
+        self.token_delay = token_delay
+        self.first_token_delay = first_token_delay
+        self.verdict = verdict
+        self.confidence = confidence
+        self.calls = 0
+
+    async def stream_verdict(
+        self, claim: str, evidence: Sequence[RetrievedEvidence]
+    ) -> AsyncIterator[LLMChunk]:
+        self.calls += 1
+        await asyncio.sleep(self.first_token_delay)
+        tokens = ["根据", f"{len(evidence)}条", "证据，", "该声明", "部分", "属实。"]
+        for token in tokens:
+            yield LLMChunk(text=token)
+            await asyncio.sleep(self.token_delay)
+        yield LLMChunk(verdict=self.verdict, confidence=self.confidence)
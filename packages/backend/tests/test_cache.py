@@ -0,0 +1,191 @@
+"""Tests for the two-tier verification cache."""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.cache import InMemoryBackend, VerificationCache
+from app.health.probes import CircuitBreaker
+from app.models.schemas import CacheEntry
+
+
+class CountingBackend(InMemoryBackend):
+    """In-memory stand-in for Redis that counts reads and writes."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gets = 0
+        self.sets = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        self.gets += 1
+        return await super().get(key)
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        self.sets += 1
+        await super().set(key, value, ttl)
+
+
+class DownBackend(CountingBackend):
+    """A backend whose every call fails, like Redis during an outage."""
+
+    async def get(self, key: str) -> Optional[str]:
+        self.gets += 1
+        raise ConnectionError("connection refused")
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        self.sets += 1
+        raise ConnectionError("connection refused")
+
+
+async def test_l1_hit_skips_the_backend() -> None:
+    backend = CountingBackend()
+    cache = VerificationCache(backend)
+    await cache.set("k", '{"v": 1}')
+
+    assert await cache.get("k") == '{"v": 1}'
+    assert backend.gets == 0
+
+
+async def test_l2_hit_is_promoted_to_l1() -> None:
+    backend = CountingBackend()
+    await VerificationCache(backend).set("k", '{"v": 1}')
+    other_worker = VerificationCache(backend)
+
+    assert await other_worker.get("k") == '{"v": 1}'
+    assert await other_worker.get("k") == '{"v": 1}'
+    assert backend.gets == 1
+    assert other_worker.hits == 2
+
+
+async def test_expired_entries_are_misses() -> None:
+    backend = CountingBackend()
+    past = datetime.now() - timedelta(seconds=1)
+    # A naive timestamp, as entries stored by older versions have
+    stale = CacheEntry(key="k", value="{}", created_at=past, expires_at=past)
+    await backend.set("k", stale.model_dump_json(), 60)
+    cache = VerificationCache(backend, l1_ttl=0.05)
+
+    assert await cache.get("k") is None
+
+    await cache.set("fresh", "{}")
+    await backend.delete("fresh")
+    await asyncio.sleep(0.06)
+    assert await cache.get("fresh") is None
+    assert cache.misses == 2
+
+
+async def test_concurrent_misses_compute_once() -> None:
+    cache = VerificationCache(CountingBackend())
+    calls = 0
+
+    async def compute() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return '{"v": 1}'
+
+    results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(5)))
+
+    assert results == ['{"v": 1}'] * 5
+    assert calls == 1
+    assert await cache.get_or_compute("k", compute) == '{"v": 1}'
+    assert calls == 1
+
+
+async def test_get_by_id_across_workers() -> None:
+    backend = CountingBackend()
+    await VerificationCache(backend).set("k", '{"id": "r1"}', result_id="r1")
+
+    other_worker = VerificationCache(backend)
+    assert await other_worker.get_by_id("r1") == '{"id": "r1"}'
+    assert await other_worker.get_by_id("unknown") is None
+
+
+async def test_backend_outage_opens_the_breaker() -> None:
+    backend = DownBackend()
+    cache = VerificationCache(backend, breaker=CircuitBreaker(2, reset_timeout=60))
+
+    assert await cache.get("a") is None
+    await cache.set("a", "{}")
+    calls = backend.gets + backend.sets
+    for i in range(5):
+        assert await cache.get(f"b{i}") is None
+        await cache.set(f"b{i}", "{}")
+
+    assert backend.gets + backend.sets == calls == 2
+    # L1 still serves what was set during the outage
+    assert await cache.get("b0") == "{}"
+
+
+async def test_breaker_retries_the_backend_after_the_reset_timeout() -> None:
+    now = [0.0]
+    backend = DownBackend()
+    cache = VerificationCache(backend, breaker=CircuitBreaker(1, 30, clock=lambda: now[0]))
+    await cache.get("a")
+    await cache.get("a")
+    assert backend.gets == 1
+
+    now[0] = 31.0
+    await cache.get("a")
+    assert backend.gets == 2
+
+
+def stored_entry(backend: InMemoryBackend, key: str) -> CacheEntry:
+    return CacheEntry.model_validate_json(backend._data[key][1])
+
+
+async def test_access_count_includes_backend_tier_hits() -> None:
+    backend = CountingBackend()
+    await VerificationCache(backend).set("k", "{}")
+    worker = VerificationCache(backend)
+
+    await worker.get("k")  # L2 hit
+    await worker.get("k")  # L1 hit
+    assert worker._l1.get("k").access_count == 2
+    assert stored_entry(backend, "k").access_count == 1
+
+    await VerificationCache(backend).get("k")
+    assert stored_entry(backend, "k").access_count == 2
+
+
+async def test_waiters_take_over_from_a_cancelled_leader() -> None:
+    cache = VerificationCache(None)
+    started = asyncio.Event()
+    calls = 0
+
+    async def compute() -> str:
+        nonlocal calls
+        calls += 1
+        started.set()
+        await asyncio.sleep(0.05)
+        return '{"v": 1}'
+
+    leader = asyncio.create_task(cache.get_or_compute("k", compute))
+    await started.wait()
+    waiters = [asyncio.create_task(cache.get_or_compute("k", compute)) for _ in range(3)]
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await asyncio.gather(*waiters) == ['{"v": 1}'] * 3
+    assert leader.cancelled()
+    assert calls == 2
+
+
+async def test_cancelled_waiter_leaves_the_leader_running() -> None:
+    cache = VerificationCache(None)
+    started = asyncio.Event()
+
+    async def compute() -> str:
+        started.set()
+        await asyncio.sleep(0.05)
+        return '{"v": 1}'
+
+    leader = asyncio.create_task(cache.get_or_compute("k", compute))
+    await started.wait()
+    waiter = asyncio.create_task(cache.get_or_compute("k", compute))
+    await asyncio.sleep(0)
+    waiter.cancel()
+
+    assert await leader == '{"v": 1}'
+    assert waiter.cancelled()
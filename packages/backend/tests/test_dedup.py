@@ -0,0 +1,81 @@
+"""Tests for near-duplicate claim clustering."""
+
+import pytest
+
+from app.api.v1.verify import VerifyRequest, verification_cache_key
+from app.dedup import ClaimIndex, claim_features
+
+CLAIM = "特朗普宣布美国将在明年退出世界卫生组织，并停止所有相关拨款。"
+
+
+@pytest.fixture
+def index() -> ClaimIndex:
+    index = ClaimIndex(capacity=1000)
+    index.assign(CLAIM)
+    return index
+
+
+@pytest.mark.parametrize(
+    "variant",
+    [
+        "特朗普宣布美国将在明年退出世界卫生组织, 并停止所有相关拨款!!🔥",
+        "特朗普宣布美國將在明年退出世界衛生組織，並停止所有相關撥款。",
+        "特朗普宣布美国将在明年退出世界卫生组织，并停止所有的相关拨款。",
+    ],
+)
+def test_copies_and_light_edits_join_the_cluster(index: ClaimIndex, variant: str) -> None:
+    match = index.assign(variant)
+
+    assert not match.new_cluster
+    assert match.cluster_id == index.assign(CLAIM).cluster_id
+
+
+@pytest.mark.parametrize(
+    "changed",
+    [
+        "拜登宣布美国将在明年退出世界卫生组织，并停止所有相关拨款。",  # entity swapped
+        "特朗普宣布美国将在2026年退出世界卫生组织，并停止所有相关拨款。",  # number added
+        "特朗普宣布美国不会在明年退出世界卫生组织，并停止所有相关拨款。",  # negated
+    ],
+)
+def test_changed_facts_found_a_new_cluster(index: ClaimIndex, changed: str) -> None:
+    assert index.assign(changed).new_cluster
+
+
+def test_entity_aliases_share_a_guard() -> None:
+    a = claim_features("世卫组织称新冠病毒的源头仍未查明。")
+    b = claim_features("世界卫生组织称新冠病毒的源头仍未查明。")
+    swapped = claim_features("联合国称新冠病毒的源头仍未查明。")
+
+    assert a.guard == b.guard
+    assert a.guard != swapped.guard
+
+
+def test_entity_swap_does_not_share_a_cached_verdict(index: ClaimIndex) -> None:
+    swapped = CLAIM.replace("特朗普", "拜登")
+    keys = {
+        verification_cache_key(VerifyRequest(text=text), index.assign(text))
+        for text in (CLAIM, swapped)
+    }
+
+    assert len(keys) == 2
+
+
+def test_snapshot_round_trip(index: ClaimIndex, tmp_path) -> None:
+    cluster = index.assign(CLAIM).cluster_id
+    index.snapshot(str(tmp_path / "claims"))
+
+    restored = ClaimIndex.restore(str(tmp_path / "claims"))
+
+    assert len(restored) == len(index)
+    assert restored.assign(CLAIM + "！").cluster_id == cluster
+
+
+def test_oldest_claims_are_overwritten_when_full() -> None:
+    index = ClaimIndex(capacity=4)
+    assert index.assign("第1条消息说股市今天上涨。").new_cluster
+    for i in range(2, 10):
+        index.assign(f"第{i}条消息说股市今天上涨。")
+
+    assert len(index) == 4
+    assert index.assign("第1条消息说股市今天上涨。").new_cluster
@@ -0,0 +1,135 @@
+"""Tests for the embedding cache and the micro-batcher."""
+
+import asyncio
+import os
+from typing import List
+
+import numpy as np
+
+from app.embeddings.batcher import MicroBatcher
+from app.embeddings.cache import EmbeddingCache
+
+DIM = 8
+
+
+def vector_for(text: str) -> np.ndarray:
+    """A vector that can only belong to ``text``."""
+    rng = np.random.default_rng(list(text.encode("utf-8")))
+    return rng.standard_normal(DIM).astype(np.float16)
+
+
+def put(cache: EmbeddingCache, texts: List[str]) -> None:
+    cache.put_many(texts, np.stack([vector_for(text) for text in texts]))
+
+
+def test_cache_round_trip_and_reopen(tmp_path) -> None:
+    cache = EmbeddingCache(str(tmp_path), "model", DIM, capacity=16)
+    put(cache, ["一", "二"])
+    cache.flush()
+
+    reopened = EmbeddingCache(str(tmp_path), "model", DIM, capacity=16)
+    assert len(reopened) == 2
+    np.testing.assert_array_equal(reopened.get("二"), vector_for("二"))
+    assert reopened.get("三") is None
+
+
+def test_cache_evicts_oldest_rows_when_full(tmp_path) -> None:
+    cache = EmbeddingCache(str(tmp_path), "model", DIM, capacity=3)
+    put(cache, ["a", "b", "c", "d"])
+
+    assert len(cache) == 3
+    assert cache.get("a") is None
+    np.testing.assert_array_equal(cache.get("d"), vector_for("d"))
+
+
+def test_cache_resets_when_the_model_changes(tmp_path) -> None:
+    put(EmbeddingCache(str(tmp_path), "model", DIM, capacity=4), ["a"])
+
+    assert EmbeddingCache(str(tmp_path), "other-model", DIM, capacity=4).get("a") is None
+
+
+def test_forked_writers_never_share_a_row(tmp_path) -> None:
+    cache = EmbeddingCache(str(tmp_path), "model", DIM, capacity=1000)
+    put(cache, ["parent"])
+
+    children = []
+    for worker in range(3):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                for batch in range(20):
+                    put(cache, [f"worker {worker} text {batch} {i}" for i in range(5)])
+                    cache.get("parent")
+            finally:
+                os._exit(0)
+        children.append(pid)
+    for pid in children:
+        assert os.waitpid(pid, 0)[1] == 0
+
+    texts = ["parent"] + [
+        f"worker {worker} text {batch} {i}"
+        for worker in range(3)
+        for batch in range(20)
+        for i in range(5)
+    ]
+    for reader in (cache, EmbeddingCache(str(tmp_path), "model", DIM, capacity=1000)):
+        assert len(reader) == len(texts)
+        for text in texts:
+            np.testing.assert_array_equal(reader.get(text), vector_for(text))
+
+
+class CountingEncoder:
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: List[List[str]] = []
+        self.fail = fail
+
+    def __call__(self, texts: List[str]) -> np.ndarray:
+        self.batches.append(texts)
+        if self.fail:
+            raise RuntimeError("encoder down")
+        return np.stack([vector_for(text) for text in texts])
+
+
+async def test_batcher_coalesces_concurrent_submits() -> None:
+    encoder = CountingEncoder()
+    batcher = MicroBatcher(encoder, max_batch_size=4, max_wait_ms=50)
+
+    texts = [f"text {i}" for i in range(10)]
+    vectors = await batcher.submit_many(texts)
+    await batcher.close()
+
+    assert [len(batch) for batch in encoder.batches] == [4, 4, 2]
+    for text, vector in zip(texts, vectors):
+        np.testing.assert_array_equal(vector, vector_for(text))
+
+
+async def test_batcher_fails_every_waiter_of_a_failed_batch() -> None:
+    batcher = MicroBatcher(CountingEncoder(fail=True), max_batch_size=8, max_wait_ms=10)
+
+    results = await asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True)
+    await batcher.close()
+
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+
+
+def test_batcher_restarts_in_a_new_event_loop() -> None:
+    encoder = CountingEncoder()
+    batcher = MicroBatcher(encoder, max_batch_size=8, max_wait_ms=1)
+
+    async def once() -> np.ndarray:
+        vector = await batcher.submit("text")
+        await batcher.close()
+        return vector
+
+    for _ in range(2):
+        np.testing.assert_array_equal(asyncio.run(once()), vector_for("text"))
+    assert len(encoder.batches) == 2
+
+
+def test_cache_skips_texts_already_cached(tmp_path) -> None:
+    cache = EmbeddingCache(str(tmp_path), "model", DIM, capacity=2)
+    put(cache, ["a"])
+    put(cache, ["a", "b"])
+
+    assert len(cache) == 2
+    np.testing.assert_array_equal(cache.get("a"), vector_for("a"))
@@ -0,0 +1,184 @@
+"""Tests for the circuit breaker, the background health monitor and the health route."""
+
+import asyncio
+from typing import List, Union
+
+import pytest
+
+import app.api.v1.health
+from app.health import CircuitBreaker, HealthMonitor, Probe
+from app.health.probes import CLOSED, HALF_OPEN, OPEN
+from tests.conftest import Api
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeCheck:
+    """A dependency check whose outcome the test sets, counting its calls."""
+
+    def __init__(self, healthy: Union[bool, Exception] = True, delay: float = 0.0) -> None:
+        self.healthy = healthy
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self) -> bool:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if isinstance(self.healthy, Exception):
+            raise self.healthy
+        return self.healthy
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def test_breaker_opens_after_consecutive_failures(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED and breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+
+def test_half_open_breaker_admits_a_single_trial_call(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+    breaker.record_failure()
+    clock.now = 30.0
+
+    assert breaker.state == HALF_OPEN
+    admitted: List[bool] = [breaker.allow() for _ in range(5)]
+    assert admitted == [True, False, False, False, False]
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert all(breaker.allow() for _ in range(3))
+
+
+def test_failed_trial_reopens_the_circuit(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now = 30.0
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == OPEN and not breaker.allow()
+    clock.now = 60.0
+    assert breaker.allow()
+    assert not breaker.allow()
+
+
+def test_trial_that_never_reports_is_replaced_after_the_reset_timeout(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+    breaker.record_failure()
+    clock.now = 30.0
+    assert breaker.allow()
+
+    clock.now = 59.0
+    assert not breaker.allow()
+    clock.now = 60.0
+    assert breaker.allow()
+
+
+async def test_probes_run_concurrently_and_report_failures() -> None:
+    up = FakeCheck(delay=0.05)
+    down = FakeCheck(healthy=False, delay=0.05)
+    broken = FakeCheck(healthy=ConnectionError("refused"))
+    slow = FakeCheck(delay=1.0)
+    monitor = HealthMonitor(
+        [
+            Probe("up", up),
+            Probe("down", down),
+            Probe("broken", broken),
+            Probe("slow", slow, timeout=0.05),
+        ]
+    )
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    results = await monitor.probe_all()
+
+    assert loop.time() - start < 0.5
+    assert results["up"].healthy and results["up"].last_success is not None
+    assert results["up"].latency_ms >= 40
+    assert not results["down"].healthy and results["down"].error == "check failed"
+    assert "refused" in results["broken"].error
+    assert results["slow"].error == "timed out after 0.05s"
+
+
+async def test_open_circuit_skips_the_check(clock: FakeClock) -> None:
+    check = FakeCheck(healthy=False)
+    probe = Probe("cache", check, breaker=CircuitBreaker(2, reset_timeout=30, clock=clock))
+    monitor = HealthMonitor([probe])
+
+    for _ in range(5):
+        await monitor.probe_all()
+    assert check.calls == 2
+    assert monitor.snapshot()["cache"].circuit == OPEN
+
+    check.healthy = True
+    clock.now = 30.0
+    result = (await monitor.probe_all())["cache"]
+    assert check.calls == 3
+    assert result.healthy and result.circuit == CLOSED
+
+
+async def test_dependencies_count_as_up_until_first_probed() -> None:
+    check = FakeCheck(healthy=False)
+    monitor = HealthMonitor([Probe("vector_db", check)])
+
+    assert monitor.snapshot()["vector_db"].healthy
+    await monitor.probe_all()
+    assert not monitor.snapshot()["vector_db"].healthy
+
+
+async def test_monitor_probes_in_the_background_until_stopped() -> None:
+    check = FakeCheck()
+    monitor = HealthMonitor([Probe("vector_db", check)], interval=0.01)
+
+    monitor.start()
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+    calls = check.calls
+    await asyncio.sleep(0.03)
+
+    assert calls >= 2
+    assert check.calls == calls
+
+
+async def test_health_route_reports_the_latest_probe_results(
+    api: Api, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monitor = HealthMonitor(
+        [
+            Probe("vector_db", FakeCheck()),
+            Probe("cache", FakeCheck(healthy=False)),
+            Probe("llm.claude", FakeCheck(healthy=False)),
+            Probe("llm.openai", FakeCheck()),
+        ]
+    )
+    monkeypatch.setattr(app.api.v1.health, "get_health_monitor", lambda: monitor)
+
+    before = (await api.client.get("/api/v1/health")).json()
+    await monitor.probe_all()
+    after = (await api.client.get("/api/v1/health")).json()
+
+    assert before["status"] == "healthy"
+    assert after["status"] == "degraded"
+    assert after["services"] == {"llm": True, "vector_db": True, "cache": False}
+    assert after["probes"]["cache"]["error"] == "check failed"
+    assert after["probes"]["llm.openai"]["last_success"] is not None
@@ -0,0 +1,55 @@
+"""Tests for vectorized script counting and the language checks built on it."""
+
+from typing import Dict
+
+import pytest
+
+from app.nlp.language_detector import (
+    SCRIPT_RANGES,
+    analyze_languages_batch,
+    count_script_chars,
+    count_script_chars_batch,
+    detect_language,
+    detect_multiple_languages,
+    is_translation_content,
+)
+
+TEXTS = [
+    "",
+    "国家统计局发布数据显示，GDP同比增长5.2%。",
+    "東京は晴れです。カタカナもあります",
+    "서울의 날씨는 맑습니다 hello",
+    "Привет, мир! مرحبا",
+    "emoji 🔥😀 and 𠀀, beyond the Basic Multilingual Plane",
+    "Latin edges: @AZ[`az{ ~",
+]
+
+
+def reference_counts(text: str) -> Dict[str, int]:
+    """The per-character loop the lookup table replaced."""
+    counts = {script: 0 for script in SCRIPT_RANGES}
+    for char in text:
+        for script, (start, end) in SCRIPT_RANGES.items():
+            if start <= ord(char) <= end:
+                counts[script] += 1
+                break
+    return counts
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_counts_match_the_per_character_loop(text: str) -> None:
+    assert count_script_chars(text) == reference_counts(text)
+
+
+def test_batch_counts_match_single_counts() -> None:
+    assert count_script_chars_batch(TEXTS) == [reference_counts(text) for text in TEXTS]
+    assert count_script_chars_batch([]) == []
+
+
+def test_batch_analysis_matches_single_checks() -> None:
+    texts = TEXTS + ["据外媒报道，该公司股价大跌。"]
+
+    assert analyze_languages_batch(texts) == [
+        (detect_language(text), detect_multiple_languages(text), is_translation_content(text))
+        for text in texts
+    ]
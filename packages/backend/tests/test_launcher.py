@@ -0,0 +1,137 @@
+"""Tests for preloading in the launcher's parent process and the workers it forks."""
+
+import asyncio
+import hashlib
+import json
+import os
+from typing import Iterator, List
+
+import numpy as np
+import pytest
+
+import app.dedup
+import app.embeddings.service
+import app.lexical
+import app.sources
+import app.vectorstore
+from app.config import settings
+from app.dedup import ClaimIndex, get_claim_index, save_claim_index
+from app.embeddings import EmbeddingCache, close_embedding_service, get_embedding_service
+from app.serve import launcher
+from app.sources import get_source_finder
+
+DOCUMENTS = [
+    {
+        "id": "doc-0",
+        "url": "https://example.com/0",
+        "title": "Growth",
+        "language": "en",
+        "text": "GDP grew 5.2% in the first three quarters. Consumption drove most of it.",
+    },
+    {
+        "id": "doc-1",
+        "url": "https://example.com/1",
+        "title": "Cars",
+        "language": "en",
+        "text": "The city denied that it would ban petrol cars next month.",
+    },
+]
+
+
+class FakeEmbeddingModel:
+    """Deterministic vectors, built in place of the sentence-transformers model."""
+
+    def __init__(self, name: str, backend: str = "", batch_size: int = 32) -> None:
+        self.model_name = name
+        self.dim = settings.vector_store_dim
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        return np.stack([self.vector(text) for text in texts])
+
+    def vector(self, text: str) -> np.ndarray:
+        seed = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+        rng = np.random.default_rng(int.from_bytes(seed, "little"))
+        return rng.standard_normal(self.dim).astype(np.float32)
+
+
+@pytest.fixture
+def preloaded(tmp_path, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """Run the parent's preload against a small corpus, with every path under ``tmp_path``."""
+    corpus = tmp_path / "corpus.jsonl"
+    corpus.write_text("\n".join(json.dumps(doc) for doc in DOCUMENTS), encoding="utf-8")
+    for name, value in {
+        "source_corpus_path": str(corpus),
+        "source_index_path": str(tmp_path / "source_index"),
+        "dedup_index_path": str(tmp_path / "claim_index"),
+        "embedding_cache_path": str(tmp_path / "embeddings"),
+        "vector_store_backend": "local",
+        "vector_store_path": str(tmp_path / "vector_store"),
+        "lexical_index_path": str(tmp_path / "lexical_index"),
+    }.items():
+        monkeypatch.setattr(settings, name, value)
+    for module, name in [
+        (app.dedup, "_index"),
+        (app.sources, "_finder"),
+        (app.lexical, "_index"),
+        (app.vectorstore, "_store"),
+        (app.embeddings.service, "_service"),
+        (app.embeddings.service, "_service_lock"),
+    ]:
+        monkeypatch.setattr(module, name, None)
+    monkeypatch.setattr(app.embeddings.service, "EmbeddingModel", FakeEmbeddingModel)
+
+    launcher.preload()
+    yield str(tmp_path)
+    asyncio.run(close_embedding_service())
+
+
+def test_preload_indexes_the_corpus_and_leaves_no_task_behind(preloaded: str) -> None:
+    service = app.embeddings.service._service
+
+    assert len(get_source_finder().index) > 0
+    assert service is not None
+    assert service._batcher._worker is None
+    assert len(service.cache) == len(get_source_finder().index)
+
+
+def test_forked_workers_share_the_cache_and_one_saves_the_claim_index(preloaded: str) -> None:
+    async def work(slot: int) -> None:
+        service = await get_embedding_service()
+        await service.embed_many([f"worker {slot} sentence {i}" for i in range(20)])
+        get_claim_index().assign(f"第{slot}号工人提出的说法：今年粮食产量增长了{slot + 3}%。")
+        save_claim_index()
+        await close_embedding_service()
+
+    children = []
+    for slot in range(2):
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                launcher._configure_worker(slot)
+                asyncio.run(work(slot))
+                code = 0
+            finally:
+                os._exit(code)
+        children.append(pid)
+    assert [os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1]) for pid in children] == [0, 0]
+
+    model = FakeEmbeddingModel("fake")
+    cache = EmbeddingCache(
+        settings.embedding_cache_path,
+        model_name=f"{settings.embedding_model}:{settings.embedding_backend}",
+        dim=model.dim,
+        capacity=settings.embedding_cache_capacity,
+    )
+    for slot in range(2):
+        for i in range(20):
+            text = f"worker {slot} sentence {i}"
+            np.testing.assert_allclose(cache.get(text), model.vector(text), atol=1e-2)
+
+    # Only worker slot 0 wrote the snapshot, so no worker replaced it mid-write
+    restored = ClaimIndex.restore(settings.dedup_index_path)
+    assert not restored.assign("第0号工人提出的说法：今年粮食产量增长了3%。").new_cluster
+    assert restored.assign("第1号工人提出的说法：今年粮食产量增长了4%。").new_cluster
+    assert sorted(name for name in os.listdir(preloaded) if "claim_index" in name) == [
+        "claim_index"
+    ]
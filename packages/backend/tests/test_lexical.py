@@ -0,0 +1,189 @@
+"""Tests for BM25 lexical search and its reciprocal-rank fusion with vector search."""
+
+import math
+import random
+from collections import Counter
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pytest
+
+import app.api.v1.search
+from app.lexical import (
+    LexicalIndex,
+    decode_rows,
+    encode_rows,
+    lexical_tokens,
+    reciprocal_rank_fusion,
+    varint_decode,
+    varint_encode,
+)
+from app.nlp.tokenizer import initialize_tokenizer
+from app.vectorstore import LocalVectorStore
+from tests.conftest import Api
+
+VOCABULARY = [f"t{i}" for i in range(40)]
+
+
+@pytest.fixture(autouse=True, scope="module")
+def tokenizer() -> None:
+    initialize_tokenizer()
+
+
+def test_tokens_keep_numbers_whole_and_fold_scripts() -> None:
+    assert lexical_tokens("今年粮食產量６.９亿吨，增长了30%") == [
+        "今年",
+        "粮食产量",
+        "6.9亿",
+        "吨",
+        "增长",
+        "30%",
+    ]
+    assert lexical_tokens("The GDP of the U.S. grew 1,200 points") == [
+        "gdp",
+        "u",
+        "s",
+        "grew",
+        "1200",
+        "points",
+    ]
+
+
+def test_varint_round_trip() -> None:
+    values = np.array([0, 1, 127, 128, 16383, 16384, 2**21, 2**28 - 1, 2**28, 2**32 - 1])
+
+    encoded = varint_encode(values)
+
+    assert encoded.dtype == np.uint8
+    assert len(varint_encode(np.array([5, 127]))) == 2
+    np.testing.assert_array_equal(varint_decode(encoded), values)
+
+
+def test_rows_are_delta_encoded() -> None:
+    rows = np.array([3, 4, 5, 1000, 1_000_000])
+
+    encoded = encode_rows(rows)
+
+    assert len(encoded) == 1 + 1 + 1 + 2 + 3
+    np.testing.assert_array_equal(decode_rows(encoded), rows)
+
+
+def random_corpus(size: int, seed: int = 0) -> List[List[str]]:
+    rng = random.Random(seed)
+    return [rng.choices(VOCABULARY, k=rng.randint(1, 30)) for _ in range(size)]
+
+
+def reference_bm25(
+    corpus: Sequence[Sequence[str]], query: Sequence[str], k1: float = 1.2, b: float = 0.75
+) -> Dict[int, float]:
+    """BM25 computed document by document, as a check on the vectorized index."""
+    average = sum(len(doc) for doc in corpus) / len(corpus)
+    df = Counter(term for doc in corpus for term in set(doc))
+    scores: Dict[int, float] = {}
+    for i, doc in enumerate(corpus):
+        counts = Counter(doc)
+        score = 0.0
+        for term in set(query):
+            if counts[term]:
+                idf = math.log(1 + (len(corpus) - df[term] + 0.5) / (df[term] + 0.5))
+                norm = k1 * (1 - b + b * len(doc) / average)
+                score += idf * counts[term] * (k1 + 1) / (counts[term] + norm)
+        if score:
+            scores[i] = score
+    return scores
+
+
+@pytest.mark.parametrize("segment_size, max_segments", [(1000, 8), (7, 8), (7, 2)])
+def test_scores_match_reference_bm25(segment_size: int, max_segments: int) -> None:
+    corpus = random_corpus(100)
+    index = LexicalIndex(segment_size=segment_size, max_segments=max_segments)
+    for start in range(0, len(corpus), 10):
+        batch = range(start, start + 10)
+        index.upsert([f"d{i}" for i in batch], corpus[start : start + 10], [{}] * 10)
+
+    for query in (["t0"], ["t1", "t2", "t1"], ["t3", "t39", "unknown"]):
+        expected = sorted(reference_bm25(corpus, query).items(), key=lambda item: -item[1])[:10]
+        hits = index.search(query, top_k=10)
+
+        assert [score for _, score in hits] == pytest.approx([score for _, score in expected])
+        assert {doc_id for doc_id, _ in hits} == {f"d{i}" for i, _ in expected}
+
+
+def test_deleted_and_filtered_documents_are_not_returned(tmp_path) -> None:
+    index = LexicalIndex(segment_size=2)
+    index.upsert(
+        ["zh", "en", "gone", "tail"],
+        [["粮食"], ["粮食", "grain"], ["粮食"], ["粮食"]],
+        [{"language": "zh-CN"}, {"language": "en"}, {"language": "zh-CN"}, {"language": "en"}],
+    )
+    index.delete(["gone"])
+
+    assert {doc_id for doc_id, _ in index.search(["粮食"])} == {"zh", "en", "tail"}
+    assert {doc_id for doc_id, _ in index.search(["粮食"], languages=["en"])} == {"en", "tail"}
+    assert index.search(["粮食"], languages=["fr"]) == []
+
+    index.snapshot(str(tmp_path / "lexical"))
+    restored = LexicalIndex.restore(str(tmp_path / "lexical"))
+
+    assert len(restored) == 3
+    assert restored.search(["grain"]) == index.search(["grain"])
+
+
+def test_reciprocal_rank_fusion() -> None:
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "d"]], k=60)
+
+    assert [doc_id for doc_id, _ in fused] == ["b", "a", "d", "c"]
+    assert fused[0][1] == pytest.approx(1 / 62 + 1 / 61)
+    assert [score for _, score in fused[1:]] == pytest.approx([1 / 61, 1 / 62, 1 / 63])
+
+
+class FakeEmbedder:
+    def __init__(self, vector: np.ndarray) -> None:
+        self.vector = vector
+
+    async def embed(self, text: str) -> np.ndarray:
+        return self.vector
+
+
+async def test_search_fuses_vector_and_lexical_rankings(
+    api: Api, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    texts = [
+        "美国宣布退出世界卫生组织。",
+        "今年粮食产量创下新高。",
+        "股市今天大幅上涨。",
+        "新冠病毒的源头仍未查明。",
+        "粮食产量达到6.9亿吨，粮食产量创下新高。",
+    ]
+    # Vector ranking: doc 1 first, doc 4 last
+    similarities = [0.8, 0.9, 0.7, 0.6, 0.1]
+    store = LocalVectorStore(dim=2, dtype="float32")
+    store.upsert(
+        [f"d{i}" for i in range(len(texts))],
+        np.array([[s, math.sqrt(1 - s * s)] for s in similarities], dtype=np.float32),
+        [{"title": f"t{i}", "snippet": text, "language": "zh-CN"} for i, text in enumerate(texts)],
+    )
+    index = LexicalIndex()
+    index.upsert(
+        [f"d{i}" for i in range(len(texts))],
+        [lexical_tokens(text) for text in texts],
+        [{"language": "zh-CN"}] * len(texts),
+    )
+
+    async def embedding_service() -> FakeEmbedder:
+        return FakeEmbedder(np.array([1.0, 0.0], dtype=np.float32))
+
+    monkeypatch.setattr(app.api.v1.search, "get_vector_store", lambda: store)
+    monkeypatch.setattr(app.api.v1.search, "get_lexical_index", lambda: index)
+    monkeypatch.setattr(app.api.v1.search, "get_embedding_service", embedding_service)
+    # Only as many nearest vectors as results are candidates, so doc 4 is a lexical-only hit
+    monkeypatch.setattr(app.api.v1.search, "_FUSION_DEPTH", 1)
+
+    response = await api.client.post(
+        "/api/v1/search", json={"query": "粮食产量6.9亿吨", "limit": 2}
+    )
+    results = response.json()["results"]
+
+    assert [r["id"] for r in results] == ["d1", "d4"]
+    assert results[0]["relevance_score"] == pytest.approx((1 / 61 + 1 / 62) / (2 / 61))
+    assert results[1]["snippet"] == texts[4]
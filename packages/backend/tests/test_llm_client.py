@@ -0,0 +1,145 @@
+"""Tests for the LLM client's retries, failover, coalescing and cache."""
+
+import asyncio
+import json
+from typing import Any, List
+
+import httpx
+import pytest
+
+from app.llm import (
+    AnthropicProvider,
+    LLMClient,
+    LLMError,
+    LLMProvider,
+    LLMRequest,
+    OpenAIProvider,
+)
+
+REQUEST = LLMRequest(system="You are a fact checker.", prompt="Is the sky blue?")
+
+
+def anthropic_reply(text: str) -> httpx.Response:
+    return httpx.Response(200, json={"content": [{"type": "text", "text": text}]})
+
+
+def openai_reply(text: str) -> httpx.Response:
+    return httpx.Response(200, json={"choices": [{"message": {"content": text}}]})
+
+
+def scripted(responses: List[httpx.Response], seen: List[httpx.Request]) -> httpx.MockTransport:
+    """A transport answering each request with the next scripted response."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return responses[min(len(seen), len(responses)) - 1]
+
+    return httpx.MockTransport(handler)
+
+
+def make_client(*transports: httpx.MockTransport, **kwargs: Any) -> LLMClient:
+    providers = [
+        cls("key", "model", transport=transport)
+        for cls, transport in zip((AnthropicProvider, OpenAIProvider), transports)
+    ]
+    return LLMClient(providers, max_backoff=0.01, **kwargs)
+
+
+async def test_retryable_status_is_retried() -> None:
+    seen: List[httpx.Request] = []
+    busy = httpx.Response(529, headers={"retry-after": "0"})
+    client = make_client(scripted([busy, busy, anthropic_reply("yes")], seen))
+
+    response = await client.complete(REQUEST)
+
+    assert (response.text, response.provider) == ("yes", "claude")
+    assert len(seen) == 3
+    assert client.retries == 2
+    assert json.loads(seen[0].content)["messages"][0]["content"] == REQUEST.prompt
+
+
+async def test_fails_over_after_exhausting_retries() -> None:
+    claude: List[httpx.Request] = []
+    openai: List[httpx.Request] = []
+    client = make_client(
+        scripted([httpx.Response(503)], claude),
+        scripted([openai_reply("yes")], openai),
+        max_attempts=2,
+    )
+
+    response = await client.complete(REQUEST)
+
+    assert (response.text, response.provider) == ("yes", "openai")
+    assert (len(claude), len(openai)) == (2, 1)
+    assert client.failovers == 1
+
+
+async def test_permanent_error_fails_over_without_retrying() -> None:
+    claude: List[httpx.Request] = []
+    openai: List[httpx.Request] = []
+    client = make_client(
+        scripted([httpx.Response(400, text="bad request")], claude),
+        scripted([openai_reply("yes")], openai),
+    )
+
+    assert (await client.complete(REQUEST)).provider == "openai"
+    assert len(claude) == 1
+    assert client.retries == 0
+
+
+async def test_last_error_is_raised_when_every_provider_fails() -> None:
+    def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = make_client(
+        scripted([httpx.Response(401)], []), httpx.MockTransport(refuse), max_attempts=2
+    )
+
+    with pytest.raises(LLMError) as info:
+        await client.complete(REQUEST)
+    assert info.value.provider == "openai"
+
+
+async def test_identical_concurrent_requests_share_one_call() -> None:
+    seen: List[httpx.Request] = []
+    release = asyncio.Event()
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        await release.wait()
+        return anthropic_reply("yes")
+
+    client = make_client(httpx.MockTransport(slow))
+    request = LLMRequest(system=REQUEST.system, prompt=REQUEST.prompt, temperature=0.7)
+    tasks = [asyncio.create_task(client.complete(request)) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    release.set()
+
+    responses = await asyncio.gather(*tasks)
+
+    assert [r.text for r in responses] == ["yes"] * 5
+    assert len(seen) == 1
+    assert client.coalesced == 4
+
+
+@pytest.mark.parametrize(
+    "temperature, calls", [(0.0, 1), (0.7, 2)], ids=["deterministic", "sampled"]
+)
+async def test_only_deterministic_requests_are_cached(temperature: float, calls: int) -> None:
+    seen: List[httpx.Request] = []
+    client = make_client(scripted([anthropic_reply("yes")], seen))
+    request = LLMRequest(system=REQUEST.system, prompt=REQUEST.prompt, temperature=temperature)
+
+    for _ in range(2):
+        assert (await client.complete(request)).text == "yes"
+
+    assert len(seen) == calls
+
+
+def test_provider_must_implement_the_request_format() -> None:
+    class Incomplete(LLMProvider):
+        def _headers(self, api_key: str) -> dict:
+            return {}
+
+    with pytest.raises(TypeError):
+        Incomplete("incomplete", "key", "model", "http://test")
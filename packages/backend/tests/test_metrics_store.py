@@ -0,0 +1,52 @@
+"""Tests for the multi-process metric files."""
+
+import os
+
+from app.metrics.registry import MetricsRegistry
+from app.metrics.store import ValueStore
+
+
+def run_in_dead_child(registry: MetricsRegistry, fn) -> None:
+    """Run ``fn`` in a forked child that has exited by the time this returns."""
+    pid = os.fork()
+    if pid == 0:
+        try:
+            registry.store.reset_after_fork()
+            fn()
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+
+
+def test_exited_process_counters_are_merged_and_gauges_dropped(tmp_path) -> None:
+    registry = MetricsRegistry(str(tmp_path))
+    requests = registry.counter("requests_total", "Requests.")
+    in_flight = registry.gauge("in_flight", "In flight.")
+    requests.inc(2)
+
+    def work() -> None:
+        requests.inc(3)
+        in_flight.inc(4)
+
+    run_in_dead_child(registry, work)
+    run_in_dead_child(registry, work)
+
+    for _ in range(2):
+        totals = registry.aggregate()
+        assert totals[("requests_total", (), "")] == 8
+        assert ("in_flight", (), "") not in totals
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        [".lock", "merged.keys", "merged.values", f"{os.getpid()}.keys", f"{os.getpid()}.values"]
+    )
+
+
+def test_remove_other_files_keeps_only_own(tmp_path) -> None:
+    (tmp_path / "12345.keys").write_text('0\t["in_flight", [], ""]\n')
+    (tmp_path / "12345.values").write_bytes(bytes(8))
+    store = ValueStore(str(tmp_path))
+    store.set(("in_flight", (), ""), 1)
+
+    store.remove_other_files()
+
+    assert [key for _, _, key, _ in store.read_all()] == [("in_flight", (), "")]
+    assert not (tmp_path / "12345.keys").exists()
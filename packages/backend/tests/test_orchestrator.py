@@ -0,0 +1,124 @@
+"""Tests for the verification orchestrator's fan-out and stage deadlines."""
+
+import asyncio
+import time
+from typing import List, Optional, Sequence
+
+import pytest
+
+from app.nlp.tokenizer import initialize_tokenizer
+from app.pipeline import VerificationOrchestrator
+from app.pipeline.orchestrator import PARTIAL_NOTICE, StageTimeouts
+from app.pipeline.types import OriginalSourceMatch, RetrievedEvidence
+from tests.fakes import FakeLLM, FakeRetriever, FakeTranslator
+
+TEXT = "国家统计局发布数据显示，今年前三季度国内生产总值同比增长5.2%。美国宣布退出世界卫生组织。"
+
+
+class FailingRetriever(FakeRetriever):
+    async def retrieve(self, query: str, language: str, limit: int) -> List[RetrievedEvidence]:
+        self.calls += 1
+        raise ConnectionError("vector store unavailable")
+
+
+class SlowSourceFinder:
+    """Source lookup that takes ``latency`` seconds and then finds an original."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    async def find(
+        self, text: str, claims: Sequence[str], language: str
+    ) -> Optional[OriginalSourceMatch]:
+        await asyncio.sleep(self.latency)
+        return OriginalSourceMatch(
+            claim=claims[0],
+            url="https://example.com",
+            title="t",
+            language="en",
+            excerpt="e",
+            similarity=0.9,
+        )
+
+
+@pytest.fixture(autouse=True, scope="module")
+def tokenizer() -> None:
+    initialize_tokenizer()
+
+
+def orchestrator(
+    retriever: Optional[FakeRetriever] = None,
+    llm: Optional[FakeLLM] = None,
+    **kwargs,
+) -> VerificationOrchestrator:
+    return VerificationOrchestrator(
+        retriever or FakeRetriever(latency=0.05),
+        llm or FakeLLM(token_delay=0.0, first_token_delay=0.0),
+        FakeTranslator(latency=0.02),
+        timeouts=StageTimeouts(extraction=2.0, retrieval=0.3, llm=0.3),
+        cross_lingual_languages=["en", "ja"],
+        **kwargs,
+    )
+
+
+async def test_retrievals_fan_out_concurrently() -> None:
+    retriever = FakeRetriever(latency=0.1)
+    start = time.monotonic()
+
+    events = [event async for event in orchestrator(retriever).stream(TEXT, "zh-CN", 5)]
+
+    # 2 claims x 3 languages, each 0.1s, finish together
+    assert retriever.calls == 6
+    assert time.monotonic() - start < 0.5
+    assert [event.type for event in events][:2] == ["claims", "evidence"]
+    outcome = events[-1].data["outcome"]
+    assert outcome.verdict == "partly_true" and not outcome.partial
+    assert len(outcome.claims) == 2 and len(outcome.evidence) == 5
+
+
+async def test_slow_retrieval_is_cut_at_its_deadline() -> None:
+    start = time.monotonic()
+
+    outcome = await orchestrator(FakeRetriever(latency=5.0)).run(TEXT, "zh-CN", 5)
+
+    assert time.monotonic() - start < 1.0
+    assert outcome.missed_stages == ["retrieval"]
+    assert outcome.verdict == "unverified"
+    assert outcome.summary.endswith(PARTIAL_NOTICE)
+
+
+async def test_failed_retrieval_is_reported_as_missed() -> None:
+    outcome = await orchestrator(FailingRetriever()).run(TEXT, "zh-CN", 5, cross_lingual=False)
+
+    assert outcome.missed_stages == ["retrieval"]
+    assert outcome.evidence == []
+
+
+async def test_slow_llm_is_cut_and_its_confidence_capped() -> None:
+    llm = FakeLLM(token_delay=0.2, first_token_delay=0.0, confidence=0.9)
+
+    outcome = await orchestrator(llm=llm).run(TEXT, "zh-CN", 5)
+
+    assert outcome.missed_stages == ["llm"]
+    assert outcome.verdict == "unverified" and outcome.confidence <= 0.5
+    assert outcome.summary.startswith("根据")
+
+
+async def test_overall_budget_clips_every_stage() -> None:
+    start = time.monotonic()
+
+    outcome = await orchestrator(FakeRetriever(latency=0.2)).run(TEXT, "zh-CN", 5, budget=0.1)
+
+    assert time.monotonic() - start < 0.5
+    assert outcome.missed_stages == ["llm", "retrieval"]
+
+
+async def test_a_late_source_lookup_does_not_make_the_result_partial() -> None:
+    late = orchestrator(source_finder=SlowSourceFinder(latency=5.0))
+    found = orchestrator(source_finder=SlowSourceFinder(latency=0.0))
+
+    late_outcome = await late.run(TEXT, "zh-CN", 5)
+    found_outcome = await found.run(TEXT, "zh-CN", 5)
+
+    assert not late_outcome.partial and late_outcome.original_source is None
+    assert not found_outcome.partial and found_outcome.original_source is not None
@@ -0,0 +1,48 @@
+"""Tests for the precompiled multi-pattern classifier."""
+
+import re
+
+import pytest
+
+from app.nlp.claim_extractor import CLAIM_PATTERNS
+from app.nlp.pattern_classifier import PatternClassifier, first_char_class
+from benchmarks.corpus import make_sentences
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        (r"据.*?报道", "[据]"),
+        (r"(去年|今年)", "[今去]"),
+        (r"\d+(万|亿)", r"[\d]"),
+        (r"(?P<unit>ab|cd)+", "[ac]"),
+        (r"[0-9a-f]{2}", "[0-9a-f]"),
+        (r"\.5", r"[\.]"),
+    ],
+)
+def test_first_char_class(pattern: str, expected: str) -> None:
+    assert first_char_class(pattern) == expected
+
+
+@pytest.mark.parametrize(
+    "pattern", [r"a?b", r"x{0,2}y", r"[^a]x", r"\bword", r"\n", r".*a", r"(?=a)b", r"(?i)abc", "a|"]
+)
+def test_first_char_class_gives_up_when_unsure(pattern: str) -> None:
+    assert first_char_class(pattern) is None
+
+
+def test_first_match_agrees_with_a_search_per_pattern() -> None:
+    classifier = PatternClassifier(CLAIM_PATTERNS)
+
+    for sentence in make_sentences(2_000):
+        matching = [
+            (kind, conf) for pattern, kind, conf in CLAIM_PATTERNS if re.search(pattern, sentence)
+        ]
+        assert classifier.first_match(sentence) == (matching[0] if matching else None)
+
+
+def test_rules_with_their_own_groups() -> None:
+    classifier = PatternClassifier([(r"(a)(b)", "x", 0.5), (r"(?P<c>c)d", "y", 0.7)])
+
+    assert classifier.first_match("zzcd ab") == ("x", 0.5)
+    assert [hit.type for hit in classifier.classify("cd ab").hits] == ["y", "x"]
@@ -0,0 +1,138 @@
+"""Tests for the token-bucket limiters, client keys and the rate-limit middleware."""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.config import settings
+from app.ratelimit import (
+    InMemoryRateLimiter,
+    RateLimitMiddleware,
+    client_key,
+    close_rate_limiter,
+    get_rate_limiter,
+)
+
+
+async def test_zero_rate_disables_limiting(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "rate_limit_backend", "memory")
+    monkeypatch.setattr(settings, "rate_limit_per_minute", 0)
+    await close_rate_limiter()
+
+    assert get_rate_limiter() is None
+
+
+@pytest.mark.parametrize("rate, burst", [(0, 10), (1, 0), (-1, 10)])
+def test_limiter_rejects_empty_buckets(rate: float, burst: int) -> None:
+    with pytest.raises(ValueError):
+        InMemoryRateLimiter(rate, burst)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_allows_a_burst_then_refills_at_the_rate() -> None:
+    clock = FakeClock()
+    limiter = InMemoryRateLimiter(rate=2.0, burst=3, clock=clock)
+
+    assert [limiter.check("a").remaining for _ in range(3)] == [2, 1, 0]
+    rejected = limiter.check("a")
+    assert not rejected.allowed
+    assert rejected.retry_after == pytest.approx(0.5)
+    assert limiter.check("b").allowed  # buckets are per key
+
+    clock.now += 0.5
+    assert limiter.check("a").allowed
+    assert not limiter.check("a").allowed
+
+    clock.now += 60  # refills up to the burst, no further
+    assert [limiter.check("a").allowed for _ in range(4)] == [True, True, True, False]
+
+
+def test_idle_buckets_are_dropped() -> None:
+    clock = FakeClock()
+    limiter = InMemoryRateLimiter(rate=1.0, burst=2, clock=clock)
+    limiter.check("a")
+    clock.now += 3
+    limiter.check("b")
+
+    assert len(limiter) == 1
+
+
+def scope(headers=(), client=("10.0.0.1", 5000)) -> dict:
+    return {"type": "http", "headers": list(headers), "client": client}
+
+
+@pytest.mark.parametrize(
+    "forwarded, trusted_proxies, expected",
+    [
+        ([b"1.1.1.1"], 0, "10.0.0.1"),
+        ([b"1.1.1.1"], 1, "1.1.1.1"),
+        # The client wrote the leftmost entry; the proxy appended the real address
+        ([b"6.6.6.6, 1.1.1.1"], 1, "1.1.1.1"),
+        ([b"6.6.6.6, 1.1.1.1, 172.16.0.2"], 2, "1.1.1.1"),
+        ([b"6.6.6.6", b"1.1.1.1"], 1, "1.1.1.1"),
+        ([b"1.1.1.1"], 2, "1.1.1.1"),
+        ([], 1, "10.0.0.1"),
+    ],
+)
+def test_client_key_trusts_only_proxy_appended_entries(
+    forwarded, trusted_proxies: int, expected: str
+) -> None:
+    headers = [(b"x-forwarded-for", value) for value in forwarded]
+
+    assert client_key(scope(headers), trusted_proxies) == expected
+
+
+def limited_client(limiter: InMemoryRateLimiter, trusted_proxies: int = 0) -> httpx.AsyncClient:
+    app = FastAPI()
+
+    @app.get("/api/v1/ping")
+    async def ping() -> dict:
+        return {"ok": True}
+
+    @app.get("/api/v1/verify")
+    async def verify() -> dict:
+        return {"ok": True}
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=limiter,
+        exempt_paths=("/api/v1/ping",),
+        trusted_proxies=trusted_proxies,
+    )
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def test_middleware_rejects_over_the_limit_with_retry_after() -> None:
+    limiter = InMemoryRateLimiter(rate=0.5, burst=2, clock=FakeClock())
+    async with limited_client(limiter) as client:
+        responses = [await client.get("/api/v1/verify") for _ in range(3)]
+        exempt = await client.get("/api/v1/ping")
+
+    assert [r.status_code for r in responses] == [200, 200, 429]
+    assert [r.headers["x-ratelimit-remaining"] for r in responses] == ["1", "0", "0"]
+    assert responses[2].headers["retry-after"] == "2"
+    assert responses[2].json() == {"detail": "Rate limit exceeded"}
+    assert exempt.status_code == 200
+    assert "x-ratelimit-limit" not in exempt.headers
+
+
+async def test_middleware_ignores_forged_forwarded_addresses() -> None:
+    limiter = InMemoryRateLimiter(rate=0.5, burst=1, clock=FakeClock())
+    async with limited_client(limiter, trusted_proxies=1) as client:
+        statuses = [
+            (
+                await client.get(
+                    "/api/v1/verify", headers={"X-Forwarded-For": f"6.6.6.{i}, 1.1.1.1"}
+                )
+            ).status_code
+            for i in range(2)
+        ]
+
+    assert statuses == [200, 429]
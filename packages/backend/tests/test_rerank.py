@@ -0,0 +1,140 @@
+"""Tests for cross-encoder reranking, its score cache and calibration."""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pytest
+
+from app.cache.lru import TTLCache
+from app.nlp.tokenizer import initialize_tokenizer
+from app.pipeline import VerificationOrchestrator
+from app.pipeline.orchestrator import StageTimeouts
+from app.pipeline.types import RetrievedEvidence
+from app.rerank import CrossEncoderModel, PlattCalibrator, Reranker
+from tests.fakes import FakeLLM, FakeRetriever, FakeTranslator
+
+PASSAGES = [(f"p{i}", f"passage {i}") for i in range(8)]
+
+
+class FakeCrossEncoder:
+    """Scores each passage from a table, recording the pairs it was asked to score."""
+
+    def __init__(self, scores: Dict[str, float], model_name: str = "fake-cross-encoder") -> None:
+        self.scores = scores
+        self.model_name = model_name
+        self.scored: List[Tuple[str, str]] = []
+
+    def score(self, pairs: List[Tuple[str, str]]) -> np.ndarray:
+        self.scored += pairs
+        return np.array([self.scores[passage] for _, passage in pairs], dtype=np.float32)
+
+
+def scores(*values: float) -> Dict[str, float]:
+    return {f"passage {i}": value for i, value in enumerate(values)}
+
+
+async def test_passages_are_ordered_by_score_and_ties_keep_first_stage_order() -> None:
+    model = FakeCrossEncoder(scores(0.2, 0.9, 0.5, 0.9, 0.1, 0.3, 0.4, 0.6))
+    reranker = Reranker(model, batch_size=4, patience=10)
+
+    ranked = await reranker.rerank("claim", PASSAGES, top_k=3)
+
+    assert [index for index, _ in ranked] == [1, 3, 7]
+    assert [score for _, score in ranked] == pytest.approx([0.9, 0.9, 0.6])
+
+
+async def test_scoring_stops_once_the_top_set_settles() -> None:
+    model = FakeCrossEncoder(scores(0.9, 0.8, 0.1, 0.2, 0.3, 0.1, 0.2, 0.95))
+    reranker = Reranker(model, batch_size=2, patience=1)
+
+    ranked = await reranker.rerank("claim", PASSAGES, top_k=2)
+
+    # The second batch left the top 2 unchanged, so the late 0.95 is never seen
+    assert len(model.scored) == 4
+    assert [index for index, _ in ranked] == [0, 1]
+
+    model.scored.clear()
+    ranked = await reranker.rerank("claim", PASSAGES, top_k=2, score_all=True)
+    assert len(model.scored) == 8
+    assert [index for index, _ in ranked] == [7, 0]
+
+
+async def test_cached_scores_are_reused_per_claim_and_model() -> None:
+    model = FakeCrossEncoder(scores(*np.linspace(0.9, 0.1, 8)))
+    cache: TTLCache[float] = TTLCache(100, 60)
+    reranker = Reranker(model, cache, batch_size=4, patience=10)
+
+    first = await reranker.rerank("某市明年将禁止燃油车。", PASSAGES, top_k=3)
+    assert len(model.scored) == 8
+
+    # Traditional characters and extra spaces normalize to the same claim; one passage is new
+    passages = PASSAGES[:7] + [("p8", "passage 7")]
+    second = await reranker.rerank("  某市明年將禁止燃油車。", passages, top_k=3)
+    assert len(model.scored) == 9
+    assert second == first
+
+    other_model = Reranker(FakeCrossEncoder(model.scores, "other-model"), cache, batch_size=4)
+    await other_model.rerank("某市明年将禁止燃油车。", PASSAGES, top_k=3)
+    assert len(other_model.model.scored) > 0
+
+
+def test_calibration_defaults_to_identity_and_fits_labels() -> None:
+    raw = np.array([0.1, 0.5, 0.9], dtype=np.float32)
+    np.testing.assert_allclose(PlattCalibrator()(raw), raw, rtol=1e-5)
+
+    # Labels drawn so that raw scores are twice as confident as they should be, and too high
+    rng = np.random.default_rng(0)
+    probabilities = rng.uniform(0.01, 0.99, 5000)
+    logits = np.log(probabilities / (1 - probabilities))
+    labels = rng.uniform(size=5000) < 1 / (1 + np.exp(-(0.5 * logits - 1.0)))
+
+    fitted = PlattCalibrator.fit(probabilities, labels)
+
+    assert fitted.slope == pytest.approx(0.5, abs=0.1)
+    assert fitted.intercept == pytest.approx(-1.0, abs=0.1)
+    assert np.all(np.diff(fitted(np.sort(raw))) > 0)
+
+
+def test_unknown_backend_is_rejected_before_loading() -> None:
+    with pytest.raises(ValueError, match="Unknown rerank backend"):
+        CrossEncoderModel("any", backend="onnx")
+
+
+class ReversingReranker:
+    """Reranks by reversing the candidates, recording the claim it was given."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.claims: List[str] = []
+
+    async def rerank(
+        self, claim: str, evidence: Sequence[RetrievedEvidence], top_k: int
+    ) -> List[RetrievedEvidence]:
+        self.claims.append(claim)
+        if self.fail:
+            raise RuntimeError("model not loaded")
+        return list(reversed(evidence))[:top_k]
+
+
+@pytest.mark.parametrize("fail", [False, True])
+async def test_orchestrator_reranks_candidates_against_the_untranslated_claim(fail: bool) -> None:
+    initialize_tokenizer()
+    text = "国家统计局发布数据显示，今年前三季度国内生产总值同比增长5.2%。"
+    reranker = ReversingReranker(fail)
+    orchestrator = VerificationOrchestrator(
+        FakeRetriever(latency=0.0, items=10),
+        FakeLLM(token_delay=0.0, first_token_delay=0.0),
+        FakeTranslator(latency=0.0),
+        timeouts=StageTimeouts(extraction=2.0, retrieval=1.0, llm=1.0),
+        cross_lingual_languages=["en"],
+        reranker=reranker,
+        rerank_candidates=10,
+    )
+
+    outcome = await orchestrator.run(text, "zh-CN", 2)
+
+    assert reranker.claims == [text, text]
+    assert not outcome.partial
+    # Reranked: the last of the 10 candidates come out; on failure, the first ones
+    ranks = [int(item.id.split("-")[1]) for item in outcome.evidence]
+    assert all(rank < 2 for rank in ranks) if fail else all(rank >= 8 for rank in ranks)
@@ -0,0 +1,48 @@
+"""Tests for the page scan endpoint's session memory."""
+
+import uuid
+
+from app.api.v1.scan import ScanRequest, scan_page
+
+CLAIM = "据统计，2023年全国失业率为5.2%。"
+
+
+async def scan(session_id: str, blocks: dict, min_confidence: float = 0.6) -> tuple:
+    request = ScanRequest(
+        session_id=session_id,
+        blocks=[{"id": block_id, "text": text} for block_id, text in blocks.items()],
+        min_confidence=min_confidence,
+    )
+    response = await scan_page(request)
+    return [block.id for block in response.results], response.unchanged
+
+
+async def test_repeated_block_is_unchanged() -> None:
+    session_id = uuid.uuid4().hex
+    await scan(session_id, {"a": CLAIM})
+
+    assert await scan(session_id, {"a": CLAIM}) == ([], ["a"])
+
+
+async def test_new_block_with_seen_text_is_scanned() -> None:
+    session_id = uuid.uuid4().hex
+    await scan(session_id, {"a": CLAIM})
+
+    results, unchanged = await scan(session_id, {"a": CLAIM, "b": CLAIM})
+
+    assert (results, unchanged) == (["b"], ["a"])
+
+
+async def test_edited_block_is_rescanned() -> None:
+    session_id = uuid.uuid4().hex
+    await scan(session_id, {"a": CLAIM})
+
+    assert await scan(session_id, {"a": CLAIM + "专家表示"}) == (["a"], [])
+
+
+async def test_new_min_confidence_rescans_every_block() -> None:
+    session_id = uuid.uuid4().hex
+    await scan(session_id, {"a": CLAIM}, min_confidence=0.6)
+
+    assert await scan(session_id, {"a": CLAIM}, min_confidence=0.9) == (["a"], [])
+    assert await scan(session_id, {"a": CLAIM}, min_confidence=0.9) == ([], ["a"])
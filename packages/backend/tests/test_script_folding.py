@@ -0,0 +1,53 @@
+"""Tests for claim and translation matching on Traditional and full-width text."""
+
+from typing import List
+
+import pytest
+
+import app.sources
+from app.nlp.claim_extractor import extract_claims
+from app.nlp.language_detector import is_translation_content
+from app.pipeline.backends import CorpusSourceFinder
+from app.scan import scan_block
+
+TRADITIONAL = "官方數據顯示，今年的失業率為５.２%，較去年下降。"
+
+
+def test_scan_block_highlights_traditional_text() -> None:
+    scan = scan_block(TRADITIONAL)
+
+    assert [(h.start, h.end, h.type) for h in scan.highlights] == [(0, len(TRADITIONAL), "factual")]
+
+
+def test_extract_claims_returns_claim_text_as_written() -> None:
+    claims = extract_claims(TRADITIONAL)
+
+    assert [(c.text, c.type, c.confidence) for c in claims] == [(TRADITIONAL, "factual", 0.8)]
+    assert TRADITIONAL[claims[0].start : claims[0].end] == claims[0].text
+
+
+@pytest.mark.parametrize(
+    "text", ["據路透社報導，美國上月失業率升至4.1%。", "韓媒報導，三星今年的營收下降了15%。"]
+)
+def test_traditional_translation_markers_are_detected(text: str) -> None:
+    assert is_translation_content(text)
+    assert scan_block(text).translated
+
+
+async def test_source_finder_looks_up_traditional_translations(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    looked_up: List[bool] = []
+
+    class EmptyFinder:
+        @property
+        def index(self) -> list:
+            looked_up.append(True)
+            return []
+
+    monkeypatch.setattr(app.sources, "get_source_finder", lambda: EmptyFinder())
+
+    match = await CorpusSourceFinder().find("據路透社報導，美國上月失業率升至4.1%。", [], "zh-TW")
+
+    assert match is None
+    assert looked_up
@@ -0,0 +1,54 @@
+"""Tests for lazy sentence splitting into character offsets."""
+
+import pytest
+
+from app.nlp.claim_extractor import extract_claims, sentence_spans, split_sentences
+
+
+def test_sentences_keep_their_terminators_and_closing_quotes() -> None:
+    text = "他说：“今年粮食增产了3.5%。” 真的吗？！  据新华社报道，产量创下新高。"
+
+    assert split_sentences(text) == [
+        "他说：“今年粮食增产了3.5%。”",
+        "据新华社报道，产量创下新高。",
+    ]
+    start = text.index("真的吗")
+    assert list(sentence_spans(text, min_length=1))[1] == (start, start + len("真的吗？！"))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "GDP grew 3.5% in the U.S. last year, says example.com today.",
+        "See https://example.com/report?id=1 for the full figures!",
+        "J. Smith said the figure was 1.3 million last month.",
+    ],
+)
+def test_latin_periods_inside_a_sentence_do_not_split_it(text: str) -> None:
+    assert split_sentences(text) == [text]
+
+
+def test_offsets_index_the_original_text() -> None:
+    text = "  第一句话说股市今天上涨了。\n第二句没有结束标点但也够长了   "
+    spans = list(sentence_spans(text))
+
+    assert [text[start:end] for start, end in spans] == [
+        "第一句话说股市今天上涨了。",
+        "第二句没有结束标点但也够长了",
+    ]
+
+
+def test_short_sentences_are_skipped() -> None:
+    assert split_sentences("好的。今年前三季度国内生产总值增长5.2%。") == [
+        "今年前三季度国内生产总值增长5.2%。"
+    ]
+    assert split_sentences("") == []
+
+
+def test_claim_offsets_cover_each_sentence() -> None:
+    text = "据新华社报道，今年粮食产量增长了1.3%。官方表示，明年将继续增加补贴。"
+
+    claims = extract_claims(text)
+
+    assert [text[claim.start : claim.end] for claim in claims] == [claim.text for claim in claims]
+    assert [claim.text for claim in claims] == split_sentences(text)
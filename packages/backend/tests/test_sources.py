@@ -0,0 +1,107 @@
+"""Tests for fact comparison and original-source alignment of translated claims."""
+
+import math
+from typing import List, Sequence
+
+import numpy as np
+import pytest
+
+from app.sources import OriginalSourceFinder, SourceIndex, compare_facts
+from app.sources.facts import extract_entities, extract_quantities
+from app.vectorstore import LocalVectorStore
+
+
+@pytest.mark.parametrize(
+    "text, value, percent",
+    [
+        ("产量为6.9亿吨", 6.9e8, False),
+        ("output of 690 million tonnes", 6.9e8, False),
+        ("690,000,000 tonnes", 6.9e8, False),
+        ("增长了百分之三十", 30.0, True),
+        ("增长了三成", 30.0, True),
+        ("grew 30 per cent", 30.0, True),
+    ],
+)
+def test_quantities_are_read_as_values(text: str, value: float, percent: bool) -> None:
+    [quantity] = extract_quantities(text)
+
+    assert quantity.value == pytest.approx(value)
+    assert quantity.percent == percent
+
+
+def test_month_and_day_numbers_are_not_quantities() -> None:
+    assert [q.text for q in extract_quantities("3月5日股价涨了3%")] == ["3%"]
+
+
+@pytest.mark.parametrize(
+    "claim, source",
+    [
+        ("中国去年粮食产量约7亿吨。", "China's grain output was 690 million tonnes last year."),
+        ("世卫组织称，病例增加了三成。", "The WHO said cases rose 30%."),
+        ("美国失业率为4.1%。", "Unemployment in the US was 4.1 percent."),
+    ],
+)
+def test_faithful_translations_have_no_discrepancies(claim: str, source: str) -> None:
+    assert compare_facts(claim, source) == []
+
+
+def test_scale_slips_and_swapped_entities_are_flagged() -> None:
+    discrepancies = compare_facts(
+        "拜登称中国粮食产量为69亿吨。", "Trump said China produced 690 million tonnes."
+    )
+
+    assert [d.describe() for d in discrepancies] == [
+        "数字不符：译文为“69亿”，原文为“690 million”（相差10倍）",
+        "主体不符：译文为“拜登”，原文为“Trump”",
+    ]
+
+
+def test_short_capitalised_aliases_only_match_in_capitals() -> None:
+    assert extract_entities("The US and the WHO") == {"us": "US", "who": "WHO"}
+    assert extract_entities("let us know who won") == {}
+
+
+def unit(similarity: float, axis: int) -> np.ndarray:
+    """A 4-d unit vector with the given cosine similarity to the first axis."""
+    vector = np.zeros(4, dtype=np.float32)
+    vector[0] = similarity
+    vector[axis] = math.sqrt(1 - similarity**2)
+    return vector
+
+
+def finder(sentences: Sequence[tuple]) -> OriginalSourceFinder:
+    index = SourceIndex(LocalVectorStore(dim=4, dtype="float32"))
+    ids: List[str] = []
+    vectors: List[np.ndarray] = []
+    metadata: List[dict] = []
+    for i, (text, language, similarity) in enumerate(sentences):
+        ids.append(f"doc:{i}")
+        vectors.append(unit(similarity, axis=i % 3 + 1))
+        metadata.append({"text": text, "language": language, "url": f"https://example.com/{i}"})
+    index.add(ids, np.stack(vectors), metadata)
+    return OriginalSourceFinder(index, languages=["en"], min_similarity=0.6)
+
+
+def test_alignment_prefers_the_sentence_sharing_the_claims_facts() -> None:
+    source = finder(
+        [
+            ("Japan's GDP grew 1.9% in 2023.", "en", 0.97),
+            ("China's GDP grew 5.2% in 2023, the statistics bureau said.", "en", 0.95),
+            ("中国2023年GDP增长了5.2%。", "zh", 0.99),
+        ]
+    )
+
+    match = source.align("国家统计局称，中国2023年GDP增长了52%。", unit(1.0, axis=1))
+
+    assert match.sentence.text.startswith("China's GDP")
+    assert match.mistranslated
+    assert [d.describe() for d in match.discrepancies] == [
+        "数字不符：译文为“52%”，原文为“5.2%”（相差10倍）"
+    ]
+
+
+def test_no_match_below_the_similarity_threshold() -> None:
+    source = finder([("China's GDP grew 5.2% in 2023.", "en", 0.5)])
+
+    assert source.align("中国2023年GDP增长了5.2%。", unit(1.0, axis=1)) is None
+    assert source.find(["中国2023年GDP增长了5.2%。"], np.stack([unit(1.0, axis=1)])) is None
@@ -0,0 +1,97 @@
+"""Tests for lazy jieba loading and the shared POS-tagged segmentation."""
+
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+import pytest
+
+import app.nlp.tokenizer
+from app.nlp.claim_extractor import extract_claims
+from app.nlp.tokenizer import (
+    extract_keywords,
+    extract_noun_phrases,
+    initialize_tokenizer,
+    tokenize_sentence,
+    tokenize_with_pos,
+)
+
+SENTENCES = [
+    "国家统计局发布数据显示，今年前三季度国内生产总值同比增长百分之五。",
+    "美国总统特朗普宣布退出世界卫生组织并停止拨款。",
+]
+
+
+@pytest.fixture(autouse=True, scope="module")
+def tokenizer() -> None:
+    initialize_tokenizer()
+
+
+@pytest.mark.parametrize("sentence", SENTENCES)
+def test_keywords_match_extract_tags(sentence: str) -> None:
+    keywords = tokenize_sentence(sentence).keywords(top_k=5)
+
+    assert [word for word, _ in keywords] == [word for word, _ in extract_keywords(sentence, 5)]
+    assert [weight for _, weight in keywords] == pytest.approx(
+        [weight for _, weight in extract_keywords(sentence, 5)]
+    )
+
+
+def test_noun_phrases_join_consecutive_nouns() -> None:
+    tokenized = tokenize_sentence(SENTENCES[1])
+
+    assert tokenized.noun_phrases() == ["美国总统特朗普", "世界卫生组织"]
+    assert extract_noun_phrases(SENTENCES[1]) == tokenized.noun_phrases()
+    assert tokenized.words == [word for word, _ in tokenize_with_pos(SENTENCES[1])]
+
+
+def test_claim_extraction_segments_each_sentence_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: List[str] = []
+
+    def counting(text: str) -> List[Tuple[str, str]]:
+        calls.append(text)
+        return tokenize_with_pos(text)
+
+    monkeypatch.setattr(app.nlp.tokenizer, "tokenize_with_pos", counting)
+    claims = extract_claims(SENTENCES[0] + SENTENCES[1])
+
+    assert len(claims) == 2
+    assert len(calls) == 2
+    assert "国家统计局" in claims[0].entities
+    assert "特朗普" in claims[1].entities
+
+
+def run_python(code: str, **env: str) -> str:
+    """Run ``code`` in a fresh interpreter, where jieba has not been imported yet."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env={**os.environ, **env},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_importing_the_app_does_not_load_jieba() -> None:
+    code = "import sys, app.main; print(any(m.startswith('jieba') for m in sys.modules))"
+
+    assert run_python(code) == "False"
+
+
+def test_initialize_tokenizer_writes_and_reuses_the_dict_cache(tmp_path) -> None:
+    cache = tmp_path / "nested" / "jieba.cache"
+    code = (
+        "from app.nlp.tokenizer import initialize_tokenizer, is_tokenizer_ready\n"
+        "assert not is_tokenizer_ready()\n"
+        "seconds = initialize_tokenizer()\n"
+        "assert is_tokenizer_ready() and initialize_tokenizer() == seconds\n"
+        "import jieba; print(jieba.dt.cache_file)"
+    )
+
+    assert run_python(code, JIEBA_CACHE_PATH=str(cache)) == str(cache)
+    built = cache.stat().st_mtime_ns
+    run_python(code, JIEBA_CACHE_PATH=str(cache))
+    assert cache.stat().st_mtime_ns == built
@@ -0,0 +1,45 @@
+"""Tests for the in-process IVF vector store."""
+
+import numpy as np
+
+from app.vectorstore import LocalVectorStore
+
+
+def make_store(rows: int = 400, dim: int = 16) -> tuple:
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((rows, dim)).astype(np.float32)
+    store = LocalVectorStore(dim=dim, dtype="float32", nprobe=2, min_train_size=200)
+    store.upsert([str(i) for i in range(rows)], vectors, [{"language": "zh"}] * rows)
+    return store, vectors
+
+
+def test_reupserting_an_id_returns_it_once() -> None:
+    store, vectors = make_store()
+    for _ in range(3):
+        store.upsert(["5"], vectors[5:6], [{"language": "zh"}])
+
+    ids = [match.id for match in store.query(vectors[5], 5)]
+
+    assert ids[0] == "5"
+    assert len(ids) == len(set(ids))
+
+
+def test_vector_moving_between_lists_and_back_is_returned_once() -> None:
+    store, vectors = make_store()
+    for vector in (vectors[7], vectors[5], vectors[7], vectors[5]):
+        store.upsert(["5"], vector[None, :], [{"language": "zh"}])
+
+    ids = [match.id for match in store.query(vectors[5], 5)]
+
+    assert ids.count("5") == 1
+    assert len(store) == 400
+
+
+def test_duplicate_ids_in_one_batch_keep_the_last_vector() -> None:
+    store, vectors = make_store()
+    store.upsert(["5", "5"], np.stack([vectors[7], vectors[9]]), [{}, {}])
+
+    ids = [match.id for match in store.query(vectors[9], 3)]
+
+    assert ids.count("5") == 1
+    assert ids.index("5") <= 1
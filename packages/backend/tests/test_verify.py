@@ -0,0 +1,74 @@
+"""Tests for the verification endpoint and its result cache."""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from app.api.v1.verify import VerifyResponse
+from tests.conftest import Api
+
+CLAIM = "据新华社报道，2023年全国粮食总产量达到13908亿斤，比上年增长1.3%。"
+
+
+async def verify(api: Api, text: str = CLAIM, **options: Any) -> Dict[str, Any]:
+    response = await api.client.post("/api/v1/verify", json={"text": text, "options": options})
+    assert response.status_code == 200
+    return response.json()
+
+
+async def test_result_is_cached_and_retrievable_by_id(api: Api) -> None:
+    first = await verify(api)
+    calls = api.llm.calls
+
+    second = await verify(api)
+    stored = await api.client.get(f"/api/v1/verify/{first['id']}")
+
+    assert second["id"] == first["id"]
+    assert api.llm.calls == calls
+    assert stored.json()["id"] == first["id"]
+
+
+async def test_concurrent_requests_share_one_run(api: Api) -> None:
+    results = await asyncio.gather(*(verify(api) for _ in range(5)))
+
+    assert len({result["id"] for result in results}) == 1
+    assert api.llm.calls == 1
+
+
+async def test_near_duplicate_reports_its_own_text(api: Api) -> None:
+    first = await verify(api)
+    copy = CLAIM.replace("，", ", ")
+
+    second = await verify(api, copy)
+
+    assert second["id"] == first["id"]
+    assert second["original_claim"] == copy
+
+
+async def test_partial_result_is_not_cached(api: Api) -> None:
+    api.retriever.latency = 1.0
+
+    first = await verify(api, max_latency_ms=200)
+    second = await verify(api, max_latency_ms=200)
+
+    assert first["partial"] is True
+    assert second["id"] != first["id"]
+
+
+async def test_result_is_parsed_only_when_read_from_the_cache(
+    api: Api, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    parsed: List[str] = []
+    parse = VerifyResponse.model_validate_json
+
+    def counting_parse(value: str) -> VerifyResponse:
+        parsed.append(value)
+        return parse(value)
+
+    monkeypatch.setattr(VerifyResponse, "model_validate_json", counting_parse)
+
+    await verify(api)
+    assert len(parsed) == 0
+    await verify(api)
+    assert len(parsed) == 1
@@ -0,0 +1,86 @@
+"""Tests for the streaming verification endpoint."""
+
+import json
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+from app.api.deps import get_orchestrator
+from tests.conftest import Api
+
+CLAIM = "据新华社报道，2023年全国粮食总产量达到13908亿斤，比上年增长1.3%。"
+
+
+def parse_sse(body: str) -> List[Tuple[str, Dict[str, Any]]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+async def stream(api: Api, **options: Any) -> List[Tuple[str, Dict[str, Any]]]:
+    response = await api.client.post(
+        "/api/v1/verify/stream", json={"text": CLAIM, "options": options}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    return parse_sse(response.text)
+
+
+def collapse(events: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+    """Event types in order, with runs of the same type collapsed."""
+    order: List[str] = []
+    for event, _ in events:
+        if not order or order[-1] != event:
+            order.append(event)
+    return order
+
+
+async def test_events_arrive_in_order(api: Api) -> None:
+    events = await stream(api, force_refresh=True, cross_lingual=False)
+
+    assert collapse(events) == ["claims", "evidence", "summary", "verdict"]
+    assert len([e for e, _ in events if e == "evidence"]) == api.retriever.items
+    verdict = events[-1][1]
+    assert verdict["verdict"] == "partly_true"
+    assert verdict["partial"] is False
+    assert len(verdict["evidence_chain"]) == api.retriever.items
+
+
+async def test_deadline_yields_partial_verdict(api: Api) -> None:
+    api.retriever.latency = 1.0
+
+    events = await stream(api, max_latency_ms=200)
+    calls = api.retriever.calls
+
+    assert events[-1][0] == "verdict"
+    verdict = events[-1][1]
+    assert verdict["partial"] is True
+    assert verdict["verdict"] == "unverified"
+    # A partial result is not cached, so the next request runs the pipeline again
+    assert collapse(await stream(api, max_latency_ms=200))[0] == "claims"
+    assert api.retriever.calls == 2 * calls
+
+
+async def test_cached_result_is_a_single_verdict_event(api: Api) -> None:
+    first = await stream(api)
+    calls = (api.retriever.calls, api.llm.calls)
+
+    events = await stream(api)
+
+    assert [event for event, _ in events] == ["verdict"]
+    assert events[0][1]["id"] == first[-1][1]["id"]
+    assert (api.retriever.calls, api.llm.calls) == calls
+
+
+class BrokenOrchestrator:
+    async def stream(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        raise RuntimeError("connect to redis://:hunter2@10.0.0.5:6379 failed")
+        yield
+
+
+async def test_failure_is_reported_without_internals(api: Api) -> None:
+    api.app.dependency_overrides[get_orchestrator] = BrokenOrchestrator
+
+    events = await stream(api, force_refresh=True)
+
+    assert events == [("error", {"detail": "Verification failed"})]
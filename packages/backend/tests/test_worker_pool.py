@@ -0,0 +1,59 @@
+"""Tests for the NLP process pool and the batch claim extraction on it."""
+
+from typing import Iterator
+
+import pytest
+
+from app.config import settings
+from app.nlp import claim_extractor, worker_pool
+from app.nlp.claim_extractor import extract_claims, extract_claims_batch_async
+
+TEXTS = [
+    "据新华社报道，2023年全国粮食总产量达到13908亿斤。",
+    "研究发现，每天步行一万步可以降低死亡风险。",
+]
+
+
+@pytest.fixture
+def pool_workers(monkeypatch: pytest.MonkeyPatch) -> Iterator[int]:
+    monkeypatch.setattr(settings, "nlp_pool_workers", 3)
+    # Skip loading jieba in every worker; the pool mechanics are under test
+    monkeypatch.setattr(worker_pool, "_warm_up_worker", lambda: None)
+    worker_pool.shutdown_pool()
+    yield 3
+    worker_pool.shutdown_pool()
+
+
+def test_warm_up_starts_every_worker(pool_workers: int) -> None:
+    worker_pool.warm_up_pool(timeout=30)
+
+    processes = worker_pool.get_pool()._processes
+    assert len(processes) == pool_workers
+    assert all(process.is_alive() for process in processes.values())
+
+
+def test_warm_up_skips_a_single_worker_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "nlp_pool_workers", 1)
+    worker_pool.shutdown_pool()
+
+    worker_pool.warm_up_pool()
+
+    assert worker_pool._pool is None
+
+
+@pytest.mark.parametrize("workers, texts", [(1, TEXTS), (4, TEXTS[:1])])
+async def test_async_batch_runs_inline_when_the_pool_would_not_help(
+    monkeypatch: pytest.MonkeyPatch, workers: int, texts: list
+) -> None:
+    monkeypatch.setattr(settings, "nlp_pool_workers", workers)
+
+    def no_pool() -> None:
+        raise AssertionError("the process pool was used")
+
+    monkeypatch.setattr(claim_extractor, "get_pool", no_pool)
+
+    batch = await extract_claims_batch_async(texts)
+
+    assert [[c.text for c in claims] for claims in batch] == [
+        [c.text for c in extract_claims(text)] for text in texts
+    ]